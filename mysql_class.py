@@ -5,18 +5,40 @@
     Description:  Class holding MySQL server definitions.
 
     Functions:
+        compare_fleet
         fetch_global_var
+        fetch_slv_status
         fetch_sys_var
+        fetch_sys_vars
         flush_logs
+        format_rows
+        frozen_gtidset
+        get_driver
         show_master_stat
         show_slave_hosts
         show_slave_stat
         slave_start
         slave_stop
+        sys_var_name
 
     Classes:
         Position
+        FleetCompare
+        GTIDIntervals
         GTIDSet
+            FrozenGTIDSet
+        ConnectionPool
+        Driver
+            DBAPIDriver
+        DBAPIConn
+        DBAPICursor
+        StatementCache
+        FetchedCursor
+        RawHeader
+        RawRow
+        ServerSnapshot
+        StatusSampler
+        StatusPoller
         Server
             Rep
                 MasterRep
@@ -27,10 +49,28 @@
 # Libraries and Global Variables
 
 # Standard
-import copy
+import array
+import bisect
 import collections
+import collections.abc
+import contextlib
+import decimal
+import queue
+import re
+import sys
+import threading
+import time
+import types
+import weakref
 import mysql.connector
 
+# Third party
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
 # Local
 try:
     from .lib import gen_libs
@@ -44,6 +84,66 @@ __version__ = version.__version__
 
 # Global
 SHOW = "show "
+GTID_CACHE_SIZE = 128
+GTID_CACHE = collections.OrderedDict()
+GTID_CACHE_LOCK = threading.Lock()
+GTID_RANGES = re.compile(r"\d+(?:-\d+)?(?::\d+(?:-\d+)?)*")
+GTID_FORMAT = 1
+UUID_FORMAT = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+UUID_TABLE = {}
+ROW_TYPES = {}
+ROW_TYPES_SIZE = 256
+
+# Statements the server cannot prepare with placeholders (SHOW ... LIKE ?
+#   fails to parse), which Server.sql runs with the text protocol.
+NOT_PREPARED = re.compile(r"\s*show\b", re.IGNORECASE)
+
+# Column types the binary protocol decodes with the connection's character
+#   set, which breaks on binary data, see StatementCache.
+FIELD_TYPE = mysql.connector.constants.FieldType
+BINARY_TYPES = frozenset(
+    FIELD_TYPE.get_string_types() + FIELD_TYPE.get_binary_types()
+    + [FIELD_TYPE.BIT, FIELD_TYPE.GEOMETRY])
+BINARY_CHARSET = 63
+
+# System variables renamed in MySQL 8.0.26 (MySQL 8.0.22 only renamed the
+#   replication statements and status columns).
+VAR_RENAME_VERSION = (8, 0, 26)
+REPLICA_VARS = {
+    "init_slave": "init_replica",
+    "log_slave_updates": "log_replica_updates",
+    "log_slow_slave_statements": "log_slow_replica_statements",
+    "master_verify_checksum": "source_verify_checksum",
+    "rpl_stop_slave_timeout": "rpl_stop_replica_timeout",
+    "skip_slave_start": "skip_replica_start",
+    "slave_checkpoint_group": "replica_checkpoint_group",
+    "slave_checkpoint_period": "replica_checkpoint_period",
+    "slave_compressed_protocol": "replica_compressed_protocol",
+    "slave_exec_mode": "replica_exec_mode",
+    "slave_load_tmpdir": "replica_load_tmpdir",
+    "slave_max_allowed_packet": "replica_max_allowed_packet",
+    "slave_net_timeout": "replica_net_timeout",
+    "slave_parallel_type": "replica_parallel_type",
+    "slave_parallel_workers": "replica_parallel_workers",
+    "slave_pending_jobs_size_max": "replica_pending_jobs_size_max",
+    "slave_preserve_commit_order": "replica_preserve_commit_order",
+    "slave_skip_errors": "replica_skip_errors",
+    "slave_sql_verify_checksum": "replica_sql_verify_checksum",
+    "slave_transaction_retries": "replica_transaction_retries",
+    "slave_type_conversions": "replica_type_conversions",
+    "sql_slave_skip_counter": "sql_replica_skip_counter",
+    "sync_master_info": "sync_source_info"}
+SOURCE_VARS = {value: key for key, value in REPLICA_VARS.items()}
+
+# mysql.connector connection arguments passed on to DB-API drivers.
+DBAPI_KEYS = {"host": "host", "user": "user", "port": "port",
+              "database": "database", "passwd": "password"}
+
+# Seconds the static server variables are cached by Server.cached_sys_var.
+VAR_CACHE_TTL = {
+    "server_id": 3600, "server_uuid": 3600, "gtid_mode": 600,
+    "binlog_checksum": 600}
 
 
 def fetch_global_var(server, var):
@@ -64,6 +164,44 @@ def fetch_global_var(server, var):
     return server.vert_sql(cmd, (var,))
 
 
+def fetch_slv_status(server):
+
+    """Function:  fetch_slv_status
+
+    Description:  Return the slave status, the applier status, the open temp
+        tables status and the read_only, gtid_purged and server_uuid
+        variables of a slave in one multi-statement request.
+
+    Arguments:
+        (input) server -> Server instance
+        (output) slv_stat -> Results of the show slave status command
+        (output) applier -> Results of the replication applier status select
+        (output) status -> Status variables in dictionary format
+        (output) sys_vars -> System variables in dictionary format
+
+    """
+
+    global SHOW                                     # pylint:disable=W0602
+
+    # Semantic change in MySQL 8.0.22
+    slave = "replica" if server.version >= (8, 0, 22) else "slave"
+
+    # Semantic change in MySQL 8.0.26
+    slave2 = "replica" if server.version >= (8, 0, 26) else "slave"
+
+    slv_stat, applier, status, sys_vars = server.multi_col_sql([
+        SHOW + slave + " status",
+        "select SERVICE_STATE, COUNT_TRANSACTIONS_RETRIES from"
+        " performance_schema.replication_applier_status",
+        SHOW + "global status like '" + slave2 + "_open_temp_tables'",
+        SHOW + "session variables where Variable_name in"
+        " ('read_only', 'gtid_purged', 'server_uuid')"])
+
+    return slv_stat, applier, \
+        {item["Variable_name"]: item["Value"] for item in status}, \
+        {item["Variable_name"]: item["Value"] for item in sys_vars}
+
+
 def fetch_sys_var(server, var, **kwargs):
 
     """Function:  fetch_sys_var
@@ -88,6 +226,47 @@ def fetch_sys_var(server, var, **kwargs):
     return server.vert_sql(cmd, (var,))
 
 
+def fetch_sys_vars(server, names, **kwargs):
+
+    """Function:  fetch_sys_vars
+
+    Description:  Returns the values for a list of variables in one query.
+        Can set the level at which to return the variables from:
+        global|session.  Variables renamed in MySQL 8.0.26 can be requested
+        by either name and are returned under the name requested.
+        NOTE:  Will use 'session' level by default.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) names -> List of variable names
+        (Input) **kwargs:
+            level - global|session - level at which command will run
+        (output) data -> Variables returned in dictionary format
+            (e.g. {name: value})
+
+    """
+
+    global SHOW                                     # pylint:disable=W0602
+
+    level = kwargs.get("level", "session")
+    srv_names = {sys_var_name(server, name).lower(): name for name in names}
+    holders = ", ".join(["%s"] * len(srv_names))
+
+    # The variables tables were added to performance_schema in MySQL 5.7.
+    if server.version >= (5, 7):
+        cmd = "select VARIABLE_NAME, VARIABLE_VALUE from performance_schema." \
+            + level + "_variables where VARIABLE_NAME in (" + holders + ")"
+
+    else:
+        cmd = SHOW + level + " variables where Variable_name in (" \
+            + holders + ")"
+
+    data = server.vert_sql(cmd, list(srv_names))
+
+    return {srv_names[name.lower()]: value for name, value in data.items()
+            if name.lower() in srv_names}
+
+
 def flush_logs(server):
 
     """Function:  flush_logs
@@ -102,6 +281,176 @@ def flush_logs(server):
     server.cmd_sql("flush logs")
 
 
+def format_rows(keys, rows, res_mode="dict", arrays=False):
+
+    """Function:  format_rows
+
+    Description:  Combine the column names with the rows of a result set.
+        The result modes are:
+            dict -> List of dictionaries, one per row (default).
+            row -> List of named tuples.  The rows share one row type per
+                column header, so the column names are held once and not
+                in every row.
+            column -> Dictionary of column names to lists of the column
+                values.
+        In column mode, arrays converts each numeric column without NULLs
+        into a NumPy array:  integer columns to int64 and float and decimal
+        columns to float64.
+        NOTE:  Arrays require the NumPy package.
+        NOTE:  Column names that are not valid identifiers are renamed to
+            their position (e.g. _0) in the named tuples.
+
+    Arguments:
+        (input) keys -> List of column names
+        (input) rows -> List of rows of column values
+        (input) res_mode -> dict|row|column - determines the result format
+        (input) arrays -> True|False - NumPy arrays for numeric columns
+        (output) Results of the sql in the format of the result mode
+
+    """
+
+    if res_mode == "row":
+        return list(map(_row_type(keys)._make, rows))
+
+    if res_mode == "column":
+        data = {key: [] for key in keys}
+
+        for key, col in zip(keys, zip(*rows)):
+            data[key] = list(col)
+
+        if arrays:
+            _numeric_arrays(data)
+
+        return data
+
+    return [dict(zip(keys, line)) for line in rows]
+
+
+def _row_type(keys):
+
+    """Function:  _row_type
+
+    Description:  Return the named tuple type for a column header.  The
+        types are kept in a process-wide table, so the rows of repeated
+        queries share one type.
+
+    Arguments:
+        (input) keys -> List of column names
+        (output) row_type -> Named tuple type for the column header
+
+    """
+
+    header = tuple(keys)
+    row_type = ROW_TYPES.get(header)
+
+    if row_type is None:
+        if len(ROW_TYPES) >= ROW_TYPES_SIZE:
+            ROW_TYPES.clear()
+
+        row_type = ROW_TYPES.setdefault(
+            header, collections.namedtuple("Row", header, rename=True))
+
+    return row_type
+
+
+def _numeric_arrays(data):
+
+    """Function:  _numeric_arrays
+
+    Description:  Replace the numeric columns of a columnar result set with
+        NumPy arrays.  Columns holding NULLs, booleans, non-numeric values or
+        integers out of the int64 range are left as lists.
+
+    Arguments:
+        (input) data -> Dictionary of column names to lists of values
+
+    """
+
+    if numpy is None:
+        raise ImportError("format_rows arrays require the numpy package.")
+
+    for key, col in data.items():
+        types = {type(item) for item in col}
+
+        if not col or not types <= {int, float, decimal.Decimal}:
+            continue
+
+        try:
+            data[key] = numpy.array(
+                col, dtype=numpy.int64 if types == {int} else numpy.float64)
+
+        except OverflowError:
+            continue
+
+
+def frozen_gtidset(raw, prev=None):
+
+    """Function:  frozen_gtidset
+
+    Description:  Returns a FrozenGTIDSet for a raw GTID set string.  The
+        instances are kept in a bounded LRU cache keyed on the raw string, so
+        repeated calls with an unchanged status string return the same
+        instance without parsing it again.  On a cache miss the previous set
+        of the same server, if passed, is advanced so only the changed UUID
+        segments are parsed.
+
+    Arguments:
+        (input) raw -> Raw GTID set string
+        (input) prev -> Previous GTIDSet instance from the same server
+        (output) data -> FrozenGTIDSet instance
+
+    """
+
+    with GTID_CACHE_LOCK:
+        data = GTID_CACHE.get(raw)
+
+        if data is not None:
+            GTID_CACHE.move_to_end(raw)
+            return data
+
+    if prev is not None:
+        data = GTIDSet(prev)
+        data.advance(raw)
+        data = FrozenGTIDSet(data, prev=prev)
+
+    else:
+        data = FrozenGTIDSet(raw)
+
+    with GTID_CACHE_LOCK:
+        GTID_CACHE[raw] = data
+
+        while len(GTID_CACHE) > GTID_CACHE_SIZE:
+            GTID_CACHE.popitem(last=False)
+
+    return data
+
+
+def get_driver(driver=None):
+
+    """Function:  get_driver
+
+    Description:  Return the database driver for a driver name:  connector
+        (mysql.connector default), pure (pure Python mysql.connector) or
+        cext (mysql.connector C extension).  A Driver instance is returned
+        as is.
+
+    Arguments:
+        (input) driver -> Driver name or Driver instance
+        (output) Driver instance
+
+    """
+
+    if isinstance(driver, Driver):
+        return driver
+
+    drivers = {None: None, "connector": None, "pure": True, "cext": False}
+
+    if driver not in drivers:
+        raise ValueError(f"Unknown database driver: {driver}")
+
+    return Driver(use_pure=drivers[driver])
+
+
 def show_master_stat(server):
 
     """Function:  show_master_stat
@@ -183,321 +532,3541 @@ def slave_stop(server):
     Arguments:
         (input) server -> Server instance
 
-    """
+    """
+
+    # Semantic change in MySQL 8.0.22
+    slave = "replica" if server.version >= (8, 0, 22) else "slave"
+
+    server.cmd_sql("stop " + slave)
+
+
+def sys_var_name(server, name):
+
+    """Function:  sys_var_name
+
+    Description:  Returns the name of a variable for the server's version,
+        mapping between the source/replica names of MySQL 8.0.26 and later
+        and the master/slave names of prior versions.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) name -> Variable name
+        (output) Variable name for the server
+
+    """
+
+    if server.version >= VAR_RENAME_VERSION:
+        return REPLICA_VARS.get(name.lower(), name)
+
+    return SOURCE_VARS.get(name.lower(), name)
+
+
+class Position(collections.namedtuple("Position", "file, pos")):
+
+    """Class:  Position
+
+    Description:  Class which holds a binary log position for a specific
+        server.  Positions are ordered by the number of the binary log file
+        and the position within the file, so the order holds when the log
+        numbering rolls past six digits.
+
+    Methods:
+        key
+        __lt__
+        __le__
+        __gt__
+        __ge__
+        cmp
+        distance
+
+    """
+
+    @property
+    def key(self):
+
+        """Method:  key
+
+        Description:  Return the sort key of the position.
+
+        Arguments:
+            (output) -> (log base name, log number, position)
+
+        """
+
+        return _binlog_number(self.file) + (int(self.pos),)
+
+    def __lt__(self, other):
+
+        """Method:  __lt__
+
+        Description:  Is the position before the other position.
+
+        Arguments:
+            (input) other -> Position instance
+            (output) -> True | False
+
+        """
+
+        return self.key < other.key
+
+    def __le__(self, other):
+
+        """Method:  __le__
+
+        Description:  Is the position before or at the other position.
+
+        Arguments:
+            (input) other -> Position instance
+            (output) -> True | False
+
+        """
+
+        return self.key <= other.key
+
+    def __gt__(self, other):
+
+        """Method:  __gt__
+
+        Description:  Is the position after the other position.
+
+        Arguments:
+            (input) other -> Position instance
+            (output) -> True | False
+
+        """
+
+        return self.key > other.key
+
+    def __ge__(self, other):
+
+        """Method:  __ge__
+
+        Description:  Is the position after or at the other position.
+
+        Arguments:
+            (input) other -> Position instance
+            (output) -> True | False
+
+        """
+
+        return self.key >= other.key
+
+    def cmp(self, other):
+
+        """Method: cmp
+
+        Description:  Compare two positions by binary log number and position.
+            Returns -1, 0 or 1.
+            Return values:
+                -1: self is before other
+                0: self and other are equal
+                1: self is after other
+
+        Arguments:
+            (input) other -> Second server to be compared with
+
+        """
+
+        return (self > other) - (self < other)
+
+    def distance(self, other, log_sizes):
+
+        """Method:  distance
+
+        Description:  Return the number of bytes of binary log from the
+            position to the other position.  The distance is negative if the
+            other position is before the position.
+
+        Arguments:
+            (input) other -> Position instance
+            (input) log_sizes -> Dictionary of binary log names and sizes or
+                the list of dictionaries from "show binary logs"
+            (output) -> Number of bytes
+
+        """
+
+        if isinstance(log_sizes, list):
+            log_sizes = {row["Log_name"]: row["File_size"]
+                         for row in log_sizes}
+
+        if other < self:
+            return -other.distance(self, log_sizes)
+
+        base, first, _ = self.key
+        other_base, last, _ = other.key
+
+        if base != other_base:
+            raise ValueError(
+                f"Binary logs {self.file} and {other.file} are not in the"
+                f" same sequence.")
+
+        sizes = {}
+
+        for name, size in log_sizes.items():
+            log_base, num = _binlog_number(name)
+
+            if log_base == base and first <= num < last:
+                sizes[num] = int(size)
+
+        if len(sizes) != last - first:
+            raise ValueError(
+                f"Missing binary log sizes between {self.file} and"
+                f" {other.file}.")
+
+        return sum(sizes.values()) - int(self.pos) + int(other.pos)
+
+
+def _binlog_number(name):
+
+    """Method:  _binlog_number
+
+    Description:  Split a binary log file name into its base name and log
+        number, e.g. "mysql-bin.000012" is ("mysql-bin", 12).  Names without
+        a number sort before numbered names with the same base.
+
+    Arguments:
+        (input) name -> Binary log file name
+        (output) -> (base name, log number)
+
+    """
+
+    base, _, num = name.rpartition(".")
+
+    return (base, int(num)) if num.isdigit() else (name, -1)
+
+
+class FleetCompare(collections.namedtuple(
+        "FleetCompare", "behind, ahead, diverged, equal, missing, extra")):
+
+    """Class:  FleetCompare
+
+    Description:  Class which holds the results of comparing a master GTID
+        set against the GTID sets of a list of replicas.  Each field is a
+        NumPy array with one entry per replica.
+            behind -> Replica is missing transactions of the master only
+            ahead -> Replica has transactions not on the master only
+            diverged -> Replica is both missing and has extra transactions
+            equal -> Replica has the same transactions as the master
+            missing -> Number of master transactions not on the replica
+            extra -> Number of replica transactions not on the master
+
+    """
+
+
+def compare_fleet(master, replicas):
+
+    """Method:  compare_fleet
+
+    Description:  Compare a master GTID set against the GTID sets of a list
+        of replicas in one pass.  The intervals of each UUID are gathered
+        from all replicas into NumPy arrays and the number of transactions
+        shared with the master is computed with a binary search over the
+        running totals of the master's intervals, so the cost per replica
+        is array work instead of a Python set comparison.
+        NOTE:  Requires the NumPy package.
+
+    Arguments:
+        (input) master -> GTIDSet instance of the master
+        (input) replicas -> List of GTIDSet instances of the replicas
+        (output) -> FleetCompare instance
+
+    """
+
+    if numpy is None:
+        raise ImportError("compare_fleet requires the numpy package.")
+
+    cnt = len(replicas)
+    shared = numpy.zeros(cnt, dtype=numpy.int64)
+    total = numpy.zeros(cnt, dtype=numpy.int64)
+    uuids = collections.defaultdict(
+        lambda: (array.array("q"), array.array("q"), [], []))
+
+    # Gather the intervals of each UUID and the replica they belong to.
+    for pos, gtidset in enumerate(replicas):
+        for uuid, rngs in gtidset.intervals.items():
+            if rngs:
+                starts, ends, owners, sizes = uuids[uuid]
+                starts.extend(rngs.starts)
+                ends.extend(rngs.ends)
+                owners.append(pos)
+                sizes.append(len(rngs))
+
+    # Each replica has one group of intervals per UUID, so the sums of the
+    #   groups can be added to the replicas' entries directly.
+    for uuid, (starts, ends, owners, sizes) in uuids.items():
+        starts = numpy.frombuffer(starts, dtype=numpy.int64)
+        ends = numpy.frombuffer(ends, dtype=numpy.int64)
+        owners = numpy.array(owners)
+        groups = numpy.cumsum(sizes) - sizes
+        total[owners] += numpy.add.reduceat(ends - starts + 1, groups)
+
+        if master.intervals.get(uuid):
+            covered = _fleet_covered(master.intervals[uuid])
+            shared[owners] += numpy.add.reduceat(
+                covered(ends) - covered(starts - 1), groups)
+
+    missing = master.count() - shared
+    extra = total - shared
+
+    return FleetCompare(
+        behind=(missing > 0) & (extra == 0),
+        ahead=(missing == 0) & (extra > 0),
+        diverged=(missing > 0) & (extra > 0),
+        equal=(missing == 0) & (extra == 0),
+        missing=missing, extra=extra)
+
+
+def _fleet_covered(rngs):
+
+    """Method:  _fleet_covered
+
+    Description:  Return a function which counts, for an array of
+        transaction numbers, the transactions of the interval list at or
+        below each number.
+
+    Arguments:
+        (input) rngs -> GTIDIntervals instance
+        (output) covered -> Function taking and returning a NumPy array
+
+    """
+
+    starts = numpy.frombuffer(rngs.starts, dtype=numpy.int64)
+    ends = numpy.frombuffer(rngs.ends, dtype=numpy.int64)
+    sizes = ends - starts + 1
+    before = numpy.concatenate(([0], numpy.cumsum(sizes)[:-1]))
+
+    def covered(gnos):
+
+        """Function:  covered
+
+        Description:  Count the transactions at or below each number.
+
+        Arguments:
+            (input) gnos -> NumPy array of transaction numbers
+            (output) -> NumPy array of counts
+
+        """
+
+        idx = numpy.searchsorted(starts, gnos, side="right") - 1
+        pos = numpy.maximum(idx, 0)
+        cnt = before[pos] + numpy.minimum(gnos, ends[pos]) - starts[pos] + 1
+
+        return numpy.where(idx >= 0, cnt, 0)
+
+    return covered
+
+
+def compare_sets(lhs, rhs):
+
+    """Method:  compare_sets
+
+    Description:  Compare two GTID sets.  Return a tuple (lhs, rhs) where lhs
+        is a boolean indication that the left hand side had at least one more
+        item than the right hand side and vice verse.  The interval lists of
+        each UUID are compared in a single merge walk without copying either
+        set.
+
+    Arguments:
+        (input) lhs -> Left hand side set
+        (input) rhs -> Right hand side set
+        (output) lcheck -> True | False for Left side check
+        (output) rcheck -> True | False for Right side check
+
+    """
+
+    lcheck, rcheck = False, False
+    lsets, rsets = lhs.intervals, rhs.intervals
+
+    for uuid, rngs in lsets.items():
+        # They are incomparable.
+        if lcheck and rcheck:
+            return lcheck, rcheck
+
+        if uuid in rsets:
+            lextra, rextra = _inner_compare(rngs, rsets[uuid])
+            lcheck = lcheck or lextra
+            rcheck = rcheck or rextra
+
+        # UUID not in rhs ==> left hand side has more
+        elif len(rngs):
+            lcheck = True
+
+    if not rcheck:
+        for uuid, rngs in rsets.items():
+            # UUID not in lhs ==> right hand side has more
+            if uuid not in lsets and len(rngs):
+                rcheck = True
+                break
+
+    return lcheck, rcheck
+
+
+def _inner_compare(lhs_rngs, rhs_rngs):
+
+    """Method:  inner_compare
+
+    Description:  Merge walk over two sorted interval lists of the same UUID
+        to detect transactions which are only in one of the lists.  Both
+        lists must be normalized, i.e. sorted, non-overlapping and
+        non-adjacent.
+
+    Arguments:
+        (input) lhs_rngs -> GTIDIntervals instance for left hand side
+        (input) rhs_rngs -> GTIDIntervals instance for right hand side
+        (output) lextra -> True|False if lhs has transactions not in rhs
+        (output) rextra -> True|False if rhs has transactions not in lhs
+
+    """
+
+    lextra, rextra = False, False
+    lstarts, lends = lhs_rngs.starts, lhs_rngs.ends
+    rstarts, rends = rhs_rngs.starts, rhs_rngs.ends
+    lcnt, rcnt = len(lstarts), len(rstarts)
+    lidx, ridx = 0, 0
+
+    while lidx < lcnt and ridx < rcnt and not (lextra and rextra):
+        lstart, lend = lstarts[lidx], lends[lidx]
+        rstart, rend = rstarts[ridx], rends[ridx]
+
+        # Interval is completely before the other side's interval.
+        if lend < rstart:
+            lextra = True
+            lidx += 1
+
+        elif rend < lstart:
+            rextra = True
+            ridx += 1
+
+        # Overlapping intervals, the side starting first has the extra items
+        #   and the side ending first moves on to its next interval.
+        else:
+            if lstart < rstart:
+                lextra = True
+
+            elif rstart < lstart:
+                rextra = True
+
+            if lend <= rend:
+                lidx += 1
+
+            if rend <= lend:
+                ridx += 1
+
+    return lextra or lidx < lcnt, rextra or ridx < rcnt
+
+
+def _split_gtid_str(raw):
+
+    """Method:  _split_gtid_str
+
+    Description:  Split a GTID set string into its UUID sets.  MySQL returns
+        the GTID sets with a newline after each comma, so the whitespace
+        around each UUID set is removed.
+
+    Arguments:
+        (input) raw -> Raw GTID set string
+        (output) -> List of UUID set strings
+
+    """
+
+    return [uuid_set.strip() for uuid_set in raw.split(",")] \
+        if raw and not raw.isspace() else []
+
+
+def _parse_uuid_set(uuid_set):
+
+    """Method:  _parse_uuid_set
+
+    Description:  Parse the UUID and ranges of a single UUID set of a GTID set
+        string (e.g. "uuid:1-5:7").  The ranges are validated with a single
+        regex match and then converted in one pass, merging each range into
+        the previous one as it comes in.  Ranges out of order are sorted
+        afterwards.
+
+    Arguments:
+        (input) uuid_set -> UUID set string
+        (output) uuid -> Universal Unique Identifier
+        (output) data -> GTIDIntervals instance of the ranges
+
+    """
+
+    uuid, _, rngs = uuid_set.partition(":")
+    uuid = sys.intern(uuid)
+
+    if not rngs:
+        raise ValueError("At least one range has to be provided.")
+
+    if GTID_RANGES.fullmatch(rngs) is None:
+        raise ValueError(f"Ranges '{rngs}' in '{uuid_set}' are not valid.")
+
+    starts, ends = [], []
+    last_start = last_end = -2
+    ordered = True
+
+    for rng in rngs.split(":"):
+        first, _, last = rng.partition("-")
+        start = int(first)
+        end = int(last) if last else start
+
+        if start > end:
+            raise ValueError(
+                f"Range {rng} in '{uuid_set}' is not a valid range.")
+
+        if start < last_start:
+            ordered = False
+
+        # MySQL returns the ranges sorted, merge them as they come in.
+        if ordered and start <= last_end + 1:
+            if end > last_end:
+                ends[-1] = last_end = end
+
+        else:
+            starts.append(start)
+            ends.append(end)
+            last_start, last_end = start, end
+
+    if not ordered:
+        return uuid, GTIDIntervals(list(zip(starts, ends)))
+
+    data = GTIDIntervals()
+    data.starts = array.array("q", starts)
+    data.ends = array.array("q", ends)
+
+    return uuid, data
+
+
+def _intern_uuid(packed):
+
+    """Method:  _intern_uuid
+
+    Description:  Return the UUID string for a UUID packed as a 128-bit
+        big-endian integer.  The strings are kept in a process-wide table, so
+        all GTID sets loaded from bytes share the same key objects.
+
+    Arguments:
+        (input) packed -> 16 bytes of the packed UUID
+        (output) uuid -> Universal Unique Identifier
+
+    """
+
+    uuid = UUID_TABLE.get(packed)
+
+    if uuid is None:
+        hexstr = packed.hex()
+        uuid = UUID_TABLE.setdefault(packed, sys.intern(
+            f"{hexstr[:8]}-{hexstr[8:12]}-{hexstr[12:16]}-{hexstr[16:20]}-"
+            f"{hexstr[20:]}"))
+
+    return uuid
+
+
+def _write_varint(buf, value):
+
+    """Method:  _write_varint
+
+    Description:  Append a non-negative integer to a buffer as a varint,
+        7 bits per byte with the high bit set on all but the last byte.
+
+    Arguments:
+        (input) buf -> Bytearray to append to
+        (input) value -> Non-negative integer
+
+    """
+
+    if value < 0:
+        raise ValueError(f"Can't encode negative value {value}.")
+
+    while value > 0x7f:
+        buf.append(value & 0x7f | 0x80)
+        value >>= 7
+
+    buf.append(value)
+
+
+def _read_varint(data, pos):
+
+    """Method:  _read_varint
+
+    Description:  Read a varint from a buffer.
+
+    Arguments:
+        (input) data -> Bytes to read from
+        (input) pos -> Position of the varint in data
+        (output) value -> Integer read
+        (output) pos -> Position after the varint
+
+    """
+
+    value = shift = 0
+
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+
+        if byte < 0x80:
+            return value, pos
+
+        shift += 7
+
+
+class GTIDIntervals():
+
+    """Class:  GTIDIntervals
+
+    Description:  Class which holds the transaction intervals for a single
+        UUID in a GTID set.  The intervals are kept sorted, non-overlapping
+        and non-adjacent, with the start and end of each interval stored in
+        parallel signed 64-bit arrays.
+
+    Methods:
+        __init__
+        __len__
+        __iter__
+        __eq__
+        __ne__
+        append
+        contains
+        count
+        union
+        difference
+        intersection
+        copy
+        to_list
+
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, rngs=None):
+
+        """Method:  __init__
+
+        Description:  Initialization an instance of the GTIDIntervals class.
+
+        Arguments:
+            (input) rngs -> List of (start, end) or (gno,) tuples
+
+        """
+
+        self.starts = array.array("q")
+        self.ends = array.array("q")
+
+        for rng in sorted(rngs or []):
+            self.append(rng[0], rng[-1])
+
+    def __len__(self):
+
+        """Method:  __len__
+
+        Description:  Return the number of intervals.
+
+        Arguments:
+            (output) -> Number of intervals
+
+        """
+
+        return len(self.starts)
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Iterate over the intervals as (start, end) tuples.
+
+        Arguments:
+            (output) -> Iterator of (start, end) tuples
+
+        """
+
+        return zip(self.starts, self.ends)
+
+    def __eq__(self, other):
+
+        """Method:  __eq__
+
+        Description:  Are both interval lists identical.
+
+        Arguments:
+            (input) other -> GTIDIntervals instance
+            (output) -> True | False
+
+        """
+
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __ne__(self, other):
+
+        """Method:  __ne__
+
+        Description:  Are the interval lists different.
+
+        Arguments:
+            (input) other -> GTIDIntervals instance
+            (output) -> True | False
+
+        """
+
+        return not self.__eq__(other)
+
+    def append(self, start, end):
+
+        """Method:  append
+
+        Description:  Add an interval to the end of the list, merging it into
+            the last interval if they overlap or are adjacent.
+            NOTE:  Intervals must be appended in order of their start value.
+
+        Arguments:
+            (input) start -> First transaction number in the interval
+            (input) end -> Last transaction number in the interval
+
+        """
+
+        if self.ends and self.ends[-1] >= start - 1:
+            if end > self.ends[-1]:
+                self.ends[-1] = end
+
+        else:
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def contains(self, gno):
+
+        """Method:  contains
+
+        Description:  Binary search for a transaction number.
+
+        Arguments:
+            (input) gno -> Transaction number
+            (output) -> True | False if transaction is in an interval
+
+        """
+
+        idx = bisect.bisect_right(self.starts, gno) - 1
+
+        return idx >= 0 and gno <= self.ends[idx]
+
+    def count(self):
+
+        """Method:  count
+
+        Description:  Return the number of transactions in the intervals.
+
+        Arguments:
+            (output) -> Number of transactions
+
+        """
+
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def union(self, other):
+
+        """Method:  union
+
+        Description:  Merge two interval lists in a single linear pass and
+            return the result as a new instance.
+
+        Arguments:
+            (input) other -> GTIDIntervals instance
+            (output) data -> GTIDIntervals instance of the merged intervals
+
+        """
+
+        data = GTIDIntervals()
+        lstarts, lends = self.starts, self.ends
+        rstarts, rends = other.starts, other.ends
+        lidx, ridx = 0, 0
+
+        while lidx < len(lstarts) and ridx < len(rstarts):
+            if lstarts[lidx] <= rstarts[ridx]:
+                data.append(lstarts[lidx], lends[lidx])
+                lidx += 1
+
+            else:
+                data.append(rstarts[ridx], rends[ridx])
+                ridx += 1
+
+        for idx in range(lidx, len(lstarts)):
+            data.append(lstarts[idx], lends[idx])
+
+        for idx in range(ridx, len(rstarts)):
+            data.append(rstarts[idx], rends[idx])
+
+        return data
+
+    def difference(self, other):
+
+        """Method:  difference
+
+        Description:  Return the intervals with the transactions in the other
+            intervals removed as a new instance.  Single linear pass over both
+            interval lists.
+
+        Arguments:
+            (input) other -> GTIDIntervals instance
+            (output) data -> GTIDIntervals instance of the difference
+
+        """
+
+        data = GTIDIntervals()
+        rstarts, rends = other.starts, other.ends
+        rcnt = len(rstarts)
+        ridx = 0
+
+        for start, end in zip(self.starts, self.ends):
+            cur = start
+
+            # Skip the other intervals ending before this interval.
+            while ridx < rcnt and rends[ridx] < cur:
+                ridx += 1
+
+            # Cut out the other intervals overlapping this interval.  The last
+            #   one may also overlap the next interval so ridx is not moved.
+            idx = ridx
+
+            while idx < rcnt and rstarts[idx] <= end and cur <= end:
+                if rstarts[idx] > cur:
+                    data.append(cur, rstarts[idx] - 1)
+
+                cur = max(cur, rends[idx] + 1)
+                idx += 1
+
+            if cur <= end:
+                data.append(cur, end)
+
+        return data
+
+    def intersection(self, other):
+
+        """Method:  intersection
+
+        Description:  Return the transactions in both interval lists as a new
+            instance.  Single linear pass over both interval lists.
+
+        Arguments:
+            (input) other -> GTIDIntervals instance
+            (output) data -> GTIDIntervals instance of the intersection
+
+        """
+
+        data = GTIDIntervals()
+        lstarts, lends = self.starts, self.ends
+        rstarts, rends = other.starts, other.ends
+        lidx, ridx = 0, 0
+
+        while lidx < len(lstarts) and ridx < len(rstarts):
+            start = max(lstarts[lidx], rstarts[ridx])
+            end = min(lends[lidx], rends[ridx])
+
+            if start <= end:
+                data.append(start, end)
+
+            if lends[lidx] < rends[ridx]:
+                lidx += 1
+
+            else:
+                ridx += 1
+
+        return data
+
+    def copy(self):
+
+        """Method:  copy
+
+        Description:  Return a copy of the interval list with its own arrays.
+
+        Arguments:
+            (output) data -> GTIDIntervals instance
+
+        """
+
+        data = GTIDIntervals()
+        data.starts = array.array("q", self.starts)
+        data.ends = array.array("q", self.ends)
+
+        return data
+
+    def to_list(self):
+
+        """Method:  to_list
+
+        Description:  Return the intervals as a list of tuples.
+
+        Arguments:
+            (output) -> List of (start, end) tuples
+
+        """
+
+        return list(zip(self.starts, self.ends))
+
+
+class GTIDSet():
+
+    """Class:  GTIDSet
+
+    Description:  Class which is a representation of a GTID set within the
+        MySQL database.  The GTIDSet object is used to contain and process
+        GTIDs.  The basic methods and attributes include comparing two
+        GTIDs using the rich comparsion operator methods, combine
+        GTID sets and converting GTIDs to strings.
+
+    Methods:
+        __init__
+        gtids
+        __str__
+        __reduce__
+        to_bytes
+        from_bytes
+        __contains__
+        contains
+        count
+        advance
+        union
+        difference
+        intersection
+        __lt__
+        __le__
+        __eq__
+        __ne__
+        __ge__
+        __gt__
+        __or__
+        __sub__
+        __and__
+
+    """
+
+    __slots__ = ("intervals", "segments")
+
+    def __init__(self, obj):
+
+        """Method:  __init__
+
+        Description:  Initialization an instance of the GTIDSet class.
+
+        Arguments:
+            (input) obj -> Raw GTID name and range
+
+        """
+
+        intervals = {}
+        segments = {}
+
+        # Copy of another GTID set, the interval lists are not modified
+        #   in-place so they can be shared.
+        if isinstance(obj, GTIDSet):
+            self.intervals = dict(obj.intervals)
+            self.segments = dict(obj.segments)
+            return
+
+        # Convert to string to parse
+        if not isinstance(obj, str):
+            obj = str(obj)
+
+        # Parse string and construct a GTID set.  An empty string is an empty
+        #   set, e.g. "Executed_Gtid_Set" of a new server.
+        for uuid_set in _split_gtid_str(obj):
+            uuid, intervals[uuid] = _parse_uuid_set(uuid_set)
+            segments[uuid] = uuid_set
+
+        self.intervals = intervals
+        self.segments = segments
+
+    @property
+    def gtids(self):
+
+        """Method:  gtids
+
+        Description:  Return the GTID set as a read-only mapping of UUIDs
+            and tuples of (start, end) tuples.  Use the gtids setter, or
+            the set methods, to change the set.
+
+        Arguments:
+            (output) -> Read-only mapping of UUIDs and tuples of ranges
+
+        """
+
+        return types.MappingProxyType(
+            {uuid: tuple(rngs) for uuid, rngs in self.intervals.items()})
+
+    @gtids.setter
+    def gtids(self, gtids):
+
+        """Method:  gtids
+
+        Description:  Replace the GTID set from a dictionary of UUIDs and
+            lists of (start, end) tuples.
+
+        Arguments:
+            (input) gtids -> Dictionary of UUIDs and lists of ranges
+
+        """
+
+        self.intervals = {uuid: GTIDIntervals(rngs)
+                          for uuid, rngs in gtids.items()}
+        self.segments = {}
+
+    def __str__(self):
+
+        """Method:  __str__
+
+        Description:  Combines and converts to a string all parts of the class.
+
+        Arguments:
+            (output) -> String of the GTID class combined together
+
+        """
+
+        sets = []
+
+        for uuid, rngs in sorted(self.intervals.items()):
+            uuid_set = ":".join([str(uuid)] + [f"{start}-{end}"
+                                               for start, end in rngs])
+
+            sets.append(uuid_set)
+
+        return ",".join(sets)
+
+    def __reduce__(self):
+
+        """Method:  __reduce__
+
+        Description:  Pickle the set in its binary format.
+
+        Arguments:
+            (output) -> Function and arguments to recreate the set
+
+        """
+
+        return (self.__class__.from_bytes, (self.to_bytes(),))
+
+    def to_bytes(self):
+
+        """Method:  to_bytes
+
+        Description:  Return the set in a compact binary format.  The format
+            is a version byte and the number of UUIDs followed, for each UUID,
+            by the UUID as a 128-bit big-endian integer and the number of
+            intervals and their gaps and lengths as varints.  UUIDs not in
+            the canonical lowercase format are stored as strings.
+
+        Arguments:
+            (output) -> Bytes of the GTID set
+
+        """
+
+        buf = bytearray((GTID_FORMAT,))
+        _write_varint(buf, len(self.intervals))
+
+        for uuid, rngs in sorted(self.intervals.items()):
+
+            # A zero length marks a 128-bit UUID, else the length of the
+            #   string plus one.
+            if UUID_FORMAT.fullmatch(uuid):
+                buf.append(0)
+                buf += bytes.fromhex(uuid.replace("-", ""))
+
+            else:
+                data = uuid.encode()
+                _write_varint(buf, len(data) + 1)
+                buf += data
+
+            _write_varint(buf, len(rngs))
+            last = 0
+
+            for start, end in rngs:
+                _write_varint(buf, start - last)
+                _write_varint(buf, end - start)
+                last = end
+
+        return bytes(buf)
+
+    @classmethod
+    def from_bytes(cls, data):
+
+        """Method:  from_bytes
+
+        Description:  Create a set from the binary format of to_bytes.  The
+            UUIDs are interned in a process-wide table.
+
+        Arguments:
+            (input) data -> Bytes of the GTID set
+            (output) -> GTIDSet instance of the class called on
+
+        """
+
+        if not data or data[0] != GTID_FORMAT:
+            raise ValueError("Unsupported GTID set binary format.")
+
+        intervals = {}
+
+        try:
+            cnt, pos = _read_varint(data, 1)
+
+            for _ in range(cnt):
+                size, pos = _read_varint(data, pos)
+
+                if size:
+                    uuid = sys.intern(data[pos:pos + size - 1].decode())
+                    pos += size - 1
+
+                else:
+                    packed = bytes(data[pos:pos + 16])
+
+                    if len(packed) != 16:
+                        raise IndexError("UUID past end of data")
+
+                    uuid = _intern_uuid(packed)
+                    pos += 16
+
+                rngs = GTIDIntervals()
+                num, pos = _read_varint(data, pos)
+                last = 0
+
+                for _ in range(num):
+                    gap, pos = _read_varint(data, pos)
+                    length, pos = _read_varint(data, pos)
+                    last += gap
+                    rngs.starts.append(last)
+                    last += length
+                    rngs.ends.append(last)
+
+                intervals[uuid] = rngs
+
+        except IndexError as err:
+            raise ValueError("Truncated GTID set binary data.") from err
+
+        if pos != len(data):
+            raise ValueError("Invalid GTID set binary data.")
+
+        gtidset = GTIDSet("")
+        gtidset.intervals = intervals
+
+        return gtidset if cls is GTIDSet else cls(gtidset)
+
+    def __contains__(self, gtid):
+
+        """Method:  __contains__
+
+        Description:  Is a single GTID (e.g. "uuid:gno") in the GTID set.
+
+        Arguments:
+            (input) gtid -> GTID string
+            (output) -> True | False
+
+        """
+
+        uuid, gno = gtid.rsplit(":", 1)
+
+        return self.contains(uuid, int(gno))
+
+    def contains(self, uuid, gno):
+
+        """Method:  contains
+
+        Description:  Is the transaction number for the UUID in the GTID set.
+
+        Arguments:
+            (input) uuid -> Universal Unique Identifier
+            (input) gno -> Transaction number
+            (output) -> True | False
+
+        """
+
+        return uuid in self.intervals and self.intervals[uuid].contains(gno)
+
+    def count(self):
+
+        """Method:  count
+
+        Description:  Return the total number of transactions in the set.
+
+        Arguments:
+            (output) -> Number of transactions
+
+        """
+
+        return sum(rngs.count() for rngs in self.intervals.values())
+
+    def advance(self, raw):
+
+        """Method:  advance
+
+        Description:  Update the GTID set in-place from a newer GTID set
+            string of the same server.  Only the UUID segments which changed
+            since the last parsed string are parsed again, the others keep
+            their interval lists.
+
+        Arguments:
+            (input) raw -> Raw GTID set string
+            (output) parsed -> Number of UUID segments parsed
+
+        """
+
+        intervals = {}
+        segments = {}
+        parsed = 0
+
+        for uuid_set in _split_gtid_str(raw):
+            uuid = uuid_set.partition(":")[0]
+
+            if self.segments.get(uuid) == uuid_set:
+                intervals[uuid] = self.intervals[uuid]
+
+            else:
+                uuid, intervals[uuid] = _parse_uuid_set(uuid_set)
+                parsed += 1
+
+            segments[uuid] = uuid_set
+
+        self.intervals = intervals
+        self.segments = segments
+
+        return parsed
+
+    def union(self, other):
+
+        """Method:  union
+
+        Description:  Compute the union of this GTID set and the GTID set in
+            the other.  The update of the GTID set is done in-place, so if you
+            want to compute the union of two sets 'lhs' and 'rhs' you have to
+            do something like:
+                data = GTIDSet(lhs)
+                data.union(rhs)
+
+        Arguments:
+            (input) other -> Second GTID set
+
+        """
+
+        # If it wasn't already a GTIDSet, try to make it one.
+        if not isinstance(other, GTIDSet):
+            other = GTIDSet(other)
+
+        intervals = self.intervals
+
+        # Merge the other GTID set into the first GTID set.
+        for uuid, rngs in other.intervals.items():
+            self.segments.pop(uuid, None)
+
+            if uuid not in intervals:
+                intervals[uuid] = rngs
+
+            else:
+                intervals[uuid] = intervals[uuid].union(rngs)
+
+    def difference(self, other):
+
+        """Method:  difference
+
+        Description:  Remove the transactions in the other GTID set from this
+            GTID set.  The update is done in-place, use the - operator to get
+            a new set.  Same as the GTID_SUBTRACT() function in MySQL.
+
+        Arguments:
+            (input) other -> Second GTID set
+
+        """
+
+        # If it wasn't already a GTIDSet, try to make it one.
+        if not isinstance(other, GTIDSet):
+            other = GTIDSet(other)
+
+        intervals = self.intervals
+
+        for uuid in list(intervals):
+            if uuid in other.intervals:
+                self.segments.pop(uuid, None)
+                rngs = intervals[uuid].difference(other.intervals[uuid])
+
+                if len(rngs):
+                    intervals[uuid] = rngs
+
+                else:
+                    del intervals[uuid]
+
+    def intersection(self, other):
+
+        """Method:  intersection
+
+        Description:  Keep only the transactions which are also in the other
+            GTID set.  The update is done in-place, use the & operator to get
+            a new set.
+
+        Arguments:
+            (input) other -> Second GTID set
+
+        """
+
+        # If it wasn't already a GTIDSet, try to make it one.
+        if not isinstance(other, GTIDSet):
+            other = GTIDSet(other)
+
+        intervals = self.intervals
+
+        for uuid in list(intervals):
+            self.segments.pop(uuid, None)
+            rngs = intervals[uuid].intersection(other.intervals[uuid]) \
+                if uuid in other.intervals else None
+
+            if rngs:
+                intervals[uuid] = rngs
+
+            else:
+                del intervals[uuid]
+
+    def __lt__(self, other):
+
+        """Method:  __lt__
+
+        Description:  Is first GTID set less than second GTID set.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        lhs, rhs = compare_sets(self, other)
+        return not lhs and rhs
+
+    def __le__(self, other):
+
+        """Method:  __le__
+
+        Description:  Is first GTID set less than or equal to second GTID set.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        lhs, _ = compare_sets(self, other)
+        return not lhs
+
+    def __eq__(self, other):
+
+        """Method:  __eq__
+
+        Description:  Is first GTID set equal to second GTID set.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        lhs, rhs = compare_sets(self, other)
+
+        return not (lhs or rhs)
+
+    def __ne__(self, other):
+
+        """Method:  __ne__
+
+        Description:  Is first GTID set not equal to second GTID set.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        return not self.__eq__(other)
+
+    def __ge__(self, other):
+
+        """Method:  __ge__
+
+        Description:  Is first GTID set greater than or equal to second GTID
+            set.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        return other.__le__(self)
+
+    def __gt__(self, other):
+
+        """Method:  __gt__
+
+        Description:  Is first GTID set greater than second GTID set.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        return other.__lt__(self)
+
+    def __or__(self, other):
+
+        """Method:  __or__
+
+        Description:  Return first set (self) with elements added from second
+            set (other).
+
+        Arguments:
+            (output) result -> First set with elements from second set
+
+        """
+
+        data = GTIDSet(self)
+        data.union(other)
+
+        return data
+
+    def __sub__(self, other):
+
+        """Method:  __sub__
+
+        Description:  Return first set (self) without the elements of the
+            second set (other).
+
+        Arguments:
+            (output) data -> First set without elements from second set
+
+        """
+
+        data = GTIDSet(self)
+        data.difference(other)
+
+        return data
+
+    def __and__(self, other):
+
+        """Method:  __and__
+
+        Description:  Return the elements that are in both the first set
+            (self) and second set (other).
+
+        Arguments:
+            (output) data -> Elements in both sets
+
+        """
+
+        data = GTIDSet(self)
+        data.intersection(other)
+
+        return data
+
+
+class FrozenGTIDSet(GTIDSet):
+
+    """Class:  FrozenGTIDSet
+
+    Description:  Class which is an immutable and hashable version of the
+        GTIDSet class.  The canonical string of the set is computed on first
+        use and cached.  Use the frozen_gtidset function to get instances
+        from the LRU parse cache.
+
+    Methods:
+        __init__
+        __setattr__
+        __delattr__
+        __copy__
+        __deepcopy__
+        __str__
+        __hash__
+        __eq__
+        __ne__
+        advance
+        union
+        difference
+        intersection
+        __or__
+        __sub__
+        __and__
+
+    """
+
+    __slots__ = ("_str", "_hash")
+
+    def __init__(self, obj, prev=None):                 # pylint:disable=W0231
+
+        """Method:  __init__
+
+        Description:  Initialization an instance of the FrozenGTIDSet class.
+            The interval lists are copied and the mappings are read-only, so
+            the cached string and hash can not go stale.  Interval lists
+            already owned by a frozen set, obj itself or prev, are shared.
+            UUIDs without intervals are dropped, so equal sets have the
+            same string and hash.
+
+        Arguments:
+            (input) obj -> Raw GTID name and range or GTIDSet instance
+            (input) prev -> FrozenGTIDSet whose interval lists can be shared
+
+        """
+
+        data = obj if isinstance(obj, GTIDSet) else GTIDSet(obj)
+        owned = data if isinstance(data, FrozenGTIDSet) else prev
+        owned = owned.intervals if isinstance(owned, FrozenGTIDSet) else {}
+
+        object.__setattr__(self, "intervals", types.MappingProxyType(
+            {uuid: rngs if owned.get(uuid) is rngs else rngs.copy()
+             for uuid, rngs in data.intervals.items() if rngs}))
+        object.__setattr__(self, "segments", types.MappingProxyType(
+            {uuid: uuid_set for uuid, uuid_set in data.segments.items()
+             if uuid in self.intervals}))
+        object.__setattr__(self, "_str", None)
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name, value):
+
+        """Method:  __setattr__
+
+        Description:  Attributes can not be changed.
+
+        Arguments:
+            (input) name -> Attribute name
+            (input) value -> Attribute value
+
+        """
+
+        raise AttributeError(f"FrozenGTIDSet is immutable, can't set {name}")
+
+    def __delattr__(self, name):
+
+        """Method:  __delattr__
+
+        Description:  Attributes can not be deleted.
+
+        Arguments:
+            (input) name -> Attribute name
+
+        """
+
+        raise AttributeError(
+            f"FrozenGTIDSet is immutable, can't delete {name}")
+
+    def __copy__(self):
+
+        """Method:  __copy__
+
+        Description:  Immutable, so a copy is the instance itself.
+
+        Arguments:
+            (output) self -> FrozenGTIDSet instance
+
+        """
+
+        return self
+
+    def __deepcopy__(self, memo):
+
+        """Method:  __deepcopy__
+
+        Description:  Immutable, so a copy is the instance itself.
+
+        Arguments:
+            (input) memo -> Deepcopy memo dictionary
+            (output) self -> FrozenGTIDSet instance
+
+        """
+
+        return self
+
+    def __str__(self):
+
+        """Method:  __str__
+
+        Description:  Return the cached canonical string of the set.
+
+        Arguments:
+            (output) -> String of the GTID class combined together
+
+        """
+
+        if self._str is None:
+            object.__setattr__(self, "_str", super().__str__())
+
+        return self._str
+
+    def __hash__(self):
+
+        """Method:  __hash__
+
+        Description:  Hash of the canonical string of the set.
+
+        Arguments:
+            (output) -> Hash value
+
+        """
+
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(str(self)))
+
+        return self._hash
+
+    def __eq__(self, other):
+
+        """Method:  __eq__
+
+        Description:  Is first GTID set equal to second GTID set.  Identical
+            instances, e.g. from the parse cache, are equal without comparing
+            the intervals.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        return self is other or super().__eq__(other)
+
+    def __ne__(self, other):
+
+        """Method:  __ne__
+
+        Description:  Is first GTID set not equal to second GTID set.
+
+        Arguments:
+            (output) -> True | False
+
+        """
+
+        return not self.__eq__(other)
+
+    def advance(self, raw):
+
+        """Method:  advance
+
+        Description:  In-place update is not allowed, use the frozen_gtidset
+            function with the previous set.
+
+        Arguments:
+            (input) raw -> Raw GTID set string
+
+        """
+
+        raise TypeError("FrozenGTIDSet is immutable, use frozen_gtidset()")
+
+    def union(self, other):
+
+        """Method:  union
+
+        Description:  In-place union is not allowed, use the | operator.
+
+        Arguments:
+            (input) other -> Second GTID set
+
+        """
+
+        raise TypeError("FrozenGTIDSet is immutable, use the | operator")
+
+    def difference(self, other):
+
+        """Method:  difference
+
+        Description:  In-place difference is not allowed, use the - operator.
+
+        Arguments:
+            (input) other -> Second GTID set
+
+        """
+
+        raise TypeError("FrozenGTIDSet is immutable, use the - operator")
+
+    def intersection(self, other):
+
+        """Method:  intersection
+
+        Description:  In-place intersection is not allowed, use the &
+            operator.
+
+        Arguments:
+            (input) other -> Second GTID set
+
+        """
+
+        raise TypeError("FrozenGTIDSet is immutable, use the & operator")
+
+    def __or__(self, other):
+
+        """Method:  __or__
+
+        Description:  Return a new frozen set with elements from the first set
+            (self) and the second set (other).
+
+        Arguments:
+            (output) -> FrozenGTIDSet with elements from both sets
+
+        """
+
+        return FrozenGTIDSet(super().__or__(other))
+
+    def __sub__(self, other):
+
+        """Method:  __sub__
+
+        Description:  Return a new frozen set with the elements of the first
+            set (self) which are not in the second set (other).
+
+        Arguments:
+            (output) -> FrozenGTIDSet without elements from second set
+
+        """
+
+        return FrozenGTIDSet(super().__sub__(other))
+
+    def __and__(self, other):
+
+        """Method:  __and__
+
+        Description:  Return a new frozen set with the elements that are in
+            both the first set (self) and second set (other).
+
+        Arguments:
+            (output) -> FrozenGTIDSet with elements in both sets
+
+        """
+
+        return FrozenGTIDSet(super().__and__(other))
+
+
+class ConnectionPool():
+
+    """Class:  ConnectionPool
+
+    Description:  Class which holds a bounded pool of connections to a
+        single MySQL server.  Connections are created on demand up to the
+        pool size and idle connections are reused most recently used first.
+        A connection returned after a failure is dropped, not reused.
+
+    Methods:
+        __init__
+        use
+        get
+        take
+        release
+        close
+
+    """
+
+    def __init__(self, connect, size):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ConnectionPool
+            class.
+
+        Arguments:
+            (input) connect -> Function which returns a new connection
+            (input) size -> Maximum number of connections
+
+        """
+
+        self.connect = connect
+        self.size = size
+        self.idle = queue.LifoQueue()
+        self.created = 0
+        self.lock = threading.Lock()
+        self.database = None
+        self.conn_dbs = weakref.WeakKeyDictionary()
+
+    def use(self, database):
+
+        """Method:  use
+
+        Description:  Set the database of the pooled connections.  Each
+            connection changes to it the next time it is returned by get.
+
+        Arguments:
+            (input) database -> Name of the database
+
+        """
+
+        self.database = database
+
+    def get(self, timeout=None):
+
+        """Method:  get
+
+        Description:  Return an idle connection, create a new connection if
+            the pool is not full or wait for a connection to be released.
+            The connection is changed to the pool's database, see use.
+
+        Arguments:
+            (input) timeout -> Seconds to wait for a connection or None
+            (output) conn -> Connection instance
+
+        """
+
+        conn = self.take(timeout)
+        database = self.database
+
+        if database is not None and self.conn_dbs.get(conn) != database:
+            try:
+                conn.database = database
+
+            except Exception:
+                self.release(conn, failed=True)
+                raise
+
+            self.conn_dbs[conn] = database
+
+        return conn
+
+    def take(self, timeout=None):
+
+        """Method:  take
+
+        Description:  Return an idle connection, create a new connection if
+            the pool is not full or wait for a connection to be released.
+
+        Arguments:
+            (input) timeout -> Seconds to wait for a connection or None
+            (output) -> Connection instance
+
+        """
+
+        try:
+            return self.idle.get_nowait()
+
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            create = self.created < self.size
+
+            if create:
+                self.created += 1
+
+        if create:
+            try:
+                return self.connect()
+
+            except Exception:
+                with self.lock:
+                    self.created -= 1
+
+                raise
+
+        try:
+            return self.idle.get(timeout=timeout)
+
+        except queue.Empty as err:
+            raise mysql.connector.errors.PoolError(
+                "Failed getting connection; pool exhausted") from err
+
+    def release(self, conn, failed=False):
+
+        """Method:  release
+
+        Description:  Return a connection to the pool.  A connection used in
+            a block which failed, or with an unread result, is disconnected
+            and dropped from the pool, as it may still hold a result, an
+            open transaction or changed session state.
+
+        Arguments:
+            (input) conn -> Connection instance
+            (input) failed -> True|False - The connection's block failed
+
+        """
+
+        if failed or conn.unread_result:
+            with self.lock:
+                self.created -= 1
+
+            conn.disconnect()
+
+        else:
+            self.idle.put(conn)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Disconnect the idle connections in the pool.
+
+        Arguments:
+
+        """
+
+        while True:
+            try:
+                conn = self.idle.get_nowait()
+
+            except queue.Empty:
+                break
+
+            with self.lock:
+                self.created -= 1
+
+            conn.disconnect()
+
+
+class Driver():
+
+    """Class:  Driver
+
+    Description:  Class which is the database driver used by a Server to
+        open its connections.  The default driver is mysql.connector, which
+        uses the C extension (CMySQLConnection) when it is installed.  The
+        driver can also be pinned to the pure Python connection or to the
+        C extension.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, use_pure=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Driver class.
+
+        Arguments:
+            (input) use_pure -> None|True|False - mysql.connector default,
+                pure Python or C extension connections
+
+        """
+
+        if use_pure is False and not mysql.connector.HAVE_CEXT:
+            raise ImportError(
+                "The mysql.connector C extension is not available.")
+
+        self.use_pure = use_pure
+        self.name = {None: "connector", True: "pure", False: "cext"}[use_pure]
+        self.error = mysql.connector.Error
+
+    def connect(self, **config):
+
+        """Method:  connect
+
+        Description:  Return a new connection.
+
+        Arguments:
+            (input) **config -> mysql.connector connection arguments
+            (output) -> MySQL connection instance
+
+        """
+
+        if self.use_pure is not None:
+            config["use_pure"] = self.use_pure
+
+        return mysql.connector.connect(**config)
+
+
+class DBAPIDriver(Driver):
+
+    """Class:  DBAPIDriver
+
+    Description:  Class which is a DB-API 2.0 database driver, such as
+        PyMySQL or MySQLdb, used by a Server to open its connections.  The
+        connections are wrapped in DBAPIConn, which provides the parts of
+        the mysql.connector connection used by the Server.
+        NOTE:  The driver must allow multi-statement requests for batch_sql
+            (e.g. PyMySQL client_flag=CLIENT.MULTI_STATEMENTS).
+        NOTE:  The raw and prepared statement modes need a mysql.connector
+            driver.
+        NOTE:  Server.stream needs the driver's unbuffered cursor class
+            (e.g. pymysql.cursors.SSCursor), the default cursor reads the
+            whole result set into memory.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, module, keys=None, unbuffered=None, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the DBAPIDriver class.
+
+        Arguments:
+            (input) module -> DB-API 2.0 driver module
+            (input) keys -> Dictionary of the mysql.connector connection
+                arguments to the driver's connection arguments
+            (input) unbuffered -> Unbuffered cursor class of the driver
+            (input) **kwargs -> Extra connection arguments of the driver
+
+        """
+
+        super().__init__()
+
+        self.module = module
+        self.name = module.__name__
+        self.error = module.Error
+        self.keys = DBAPI_KEYS if keys is None else keys
+        self.unbuffered = unbuffered
+        self.connect_args = kwargs
+
+    def connect(self, **config):
+
+        """Method:  connect
+
+        Description:  Return a new connection.  The connection arguments the
+            driver does not know are dropped.
+
+        Arguments:
+            (input) **config -> mysql.connector connection arguments
+            (output) -> DBAPIConn instance
+
+        """
+
+        args = {self.keys[key]: value for key, value in config.items()
+                if key in self.keys and value != ""}
+        args.update(self.connect_args)
+
+        return DBAPIConn(self.module, args, unbuffered=self.unbuffered)
+
+
+class DBAPIConn():
+
+    """Class:  DBAPIConn
+
+    Description:  Class which wraps a DB-API 2.0 connection in the parts of
+        the mysql.connector connection used by the Server:  cmd_query,
+        cmd_query_iter and get_rows for the column queries, cursor for the
+        cursor queries, and the connection management methods.
+
+    Methods:
+        __init__
+        database
+        scalar
+        cmd_query
+        cmd_query_iter
+        result
+        get_rows
+        cursor
+        get_server_version
+        is_connected
+        reconnect
+        disconnect
+
+    """
+
+    converter = None
+
+    def __init__(self, module, args, unbuffered=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the DBAPIConn class.
+
+        Arguments:
+            (input) module -> DB-API 2.0 driver module
+            (input) args -> Connection arguments of the driver
+            (input) unbuffered -> Unbuffered cursor class of the driver
+
+        """
+
+        self.module = module
+        self.args = args
+        self.unbuffered = unbuffered
+        self.conn = module.connect(**args)
+        self.cur = None
+        self.unread_result = False
+        self.connection_id = self.scalar("select connection_id()")
+
+    @property
+    def database(self):
+
+        """Method:  database
+
+        Description:  Return the current database.
+
+        Arguments:
+            (output) Name of the current database
+
+        """
+
+        return self.scalar("select database()")
+
+    @database.setter
+    def database(self, value):
+
+        """Method:  database
+
+        Description:  Change the current database.
+
+        Arguments:
+            (input) value -> Name of the database
+
+        """
+
+        self.cmd_query(f"use `{value}`")
+
+    def scalar(self, cmd):
+
+        """Method:  scalar
+
+        Description:  Return the first column of the first row of a query.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (output) Value of the first column
+
+        """
+
+        cur = self.conn.cursor()
+
+        try:
+            cur.execute(cmd)
+
+            return cur.fetchone()[0]
+
+        finally:
+            cur.close()
+
+    def cmd_query(self, cmd):
+
+        """Method:  cmd_query
+
+        Description:  Execute a command.  The rows of a result set are read
+            with get_rows.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (output) Column definitions or the status of the command
+
+        """
+
+        self.cur = self.conn.cursor()
+        self.cur.execute(cmd)
+
+        return self.result()
+
+    def cmd_query_iter(self, stmts):
+
+        """Method:  cmd_query_iter
+
+        Description:  Execute a multi-statement request and yield the result
+            of each statement in turn.
+
+        Arguments:
+            (input) stmts -> SQL commands separated by semicolons
+            (output) Column definitions or the status of each command
+
+        """
+
+        self.cur = self.conn.cursor()
+        self.cur.execute(stmts)
+
+        while True:
+            yield self.result()
+
+            if not self.cur.nextset():
+                break
+
+    def result(self):
+
+        """Method:  result
+
+        Description:  Return the column definitions or the status of the
+            current cursor's result.
+
+        Arguments:
+            (output) Column definitions or the status of the command
+
+        """
+
+        if self.cur.description:
+            self.unread_result = True
+
+            return {"columns": self.cur.description}
+
+        return {"affected_rows": self.cur.rowcount,
+                "insert_id": self.cur.lastrowid}
+
+    def get_rows(self, raw=False):
+
+        """Method:  get_rows
+
+        Description:  Return the rows of the current result set.
+
+        Arguments:
+            (input) raw -> Not supported
+            (output) List of rows and an empty end of file status
+
+        """
+
+        if raw:
+            raise mysql.connector.errors.NotSupportedError(
+                "Raw rows need a mysql.connector driver.")
+
+        self.unread_result = False
+
+        return list(self.cur.fetchall()), {}
+
+    def cursor(self, buffered=None, raw=False, prepared=False):
+
+        """Method:  cursor
+
+        Description:  Return a DB-API cursor which takes the params keyword
+            argument of the mysql.connector cursors.  An unbuffered cursor
+            is of the driver's unbuffered cursor class and its unread rows
+            are tracked in unread_result.
+
+        Arguments:
+            (input) buffered -> None|True|False - Driver's default cursor or
+                an unbuffered cursor when False
+            (input) raw -> Not supported
+            (input) prepared -> Not supported
+            (output) DBAPICursor instance
+
+        """
+
+        if raw or prepared:
+            raise mysql.connector.errors.NotSupportedError(
+                "Raw and prepared cursors need a mysql.connector driver.")
+
+        if buffered is not False:
+            return DBAPICursor(self.conn.cursor())
+
+        if self.unbuffered is None:
+            raise mysql.connector.errors.NotSupportedError(
+                "Unbuffered cursors need the driver's unbuffered cursor"
+                " class, see DBAPIDriver.")
+
+        return DBAPICursor(self.conn.cursor(self.unbuffered), conn=self)
+
+    def get_server_version(self):
+
+        """Method:  get_server_version
+
+        Description:  Return the server version.
+
+        Arguments:
+            (output) Tuple of the major, minor and patch version numbers
+
+        """
+
+        return tuple(int(item) for item in re.match(
+            r"(\d+)\.(\d+)\.(\d+)", self.scalar("select version()")).groups())
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Checks to see if the connection is still active.
+
+        Arguments:
+            (output) True|False - Connection is active
+
+        """
+
+        try:
+            self.scalar("select 1")
+
+        except self.module.Error:
+            return False
+
+        return True
+
+    def reconnect(self):
+
+        """Method:  reconnect
+
+        Description:  Open a new connection in place of the current one.
+
+        Arguments:
+
+        """
+
+        self.disconnect()
+        self.conn = self.module.connect(**self.args)
+        self.unread_result = False
+        self.connection_id = self.scalar("select connection_id()")
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Close the connection.
+
+        Arguments:
+
+        """
+
+        try:
+            self.conn.close()
+
+        except self.module.Error:
+            pass
+
+
+class DBAPICursor():
+
+    """Class:  DBAPICursor
+
+    Description:  Class which wraps a DB-API 2.0 cursor so execute takes the
+        params keyword argument of the mysql.connector cursors.  For an
+        unbuffered cursor, the connection's unread_result is set while the
+        result set has rows left to read.  The other cursor attributes are
+        passed through.
+
+    Methods:
+        __init__
+        __getattr__
+        __iter__
+        execute
+        fetchone
+        fetchmany
+        fetchall
+        close
+
+    """
+
+    def __init__(self, cur, conn=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the DBAPICursor class.
+
+        Arguments:
+            (input) cur -> DB-API 2.0 cursor
+            (input) conn -> DBAPIConn instance of an unbuffered cursor
+
+        """
+
+        self.cur = cur
+        self.conn = conn
+
+    def __getattr__(self, name):
+
+        """Method:  __getattr__
+
+        Description:  Return an attribute of the wrapped cursor.
+
+        Arguments:
+            (input) name -> Name of the attribute
+            (output) Attribute of the wrapped cursor
+
+        """
+
+        return getattr(self.cur, name)
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Iterate over the rows of the result set.
+
+        Arguments:
+            (output) Iterator of the rows
+
+        """
+
+        return iter(self.fetchone, None)
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Execute a SQL command.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (input) params -> Position arguments for the SQL command
+
+        """
+
+        self.cur.execute(cmd, params)
+
+        if self.conn is not None:
+            self.conn.unread_result = self.cur.description is not None
+
+    def fetchone(self):
+
+        """Method:  fetchone
+
+        Description:  Return the next row.
+
+        Arguments:
+            (output) row -> Row or None at the end of the result set
+
+        """
+
+        row = self.cur.fetchone()
+
+        if row is None and self.conn is not None:
+            self.conn.unread_result = False
+
+        return row
+
+    def fetchmany(self, size=1):
+
+        """Method:  fetchmany
+
+        Description:  Return the next rows.
+
+        Arguments:
+            (input) size -> Maximum number of rows
+            (output) rows -> List of rows, short at the end of the result set
+
+        """
+
+        rows = self.cur.fetchmany(size)
+
+        if len(rows) < size and self.conn is not None:
+            self.conn.unread_result = False
+
+        return rows
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Return the rest of the rows.
+
+        Arguments:
+            (output) rows -> List of rows
+
+        """
+
+        rows = self.cur.fetchall()
+
+        if self.conn is not None:
+            self.conn.unread_result = False
+
+        return rows
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the cursor, which discards the unread rows.
+
+        Arguments:
+
+        """
+
+        self.cur.close()
+
+        if self.conn is not None:
+            self.conn.unread_result = False
+
+
+class StatementCache():
+
+    """Class:  StatementCache
+
+    Description:  Class which holds the server-side prepared statements of
+        a single connection, keyed by the statement text, with least
+        recently used eviction.  The statements are dropped and prepared
+        again when the connection has reconnected.  A statement is only
+        prepared after it has run once with the text protocol and returned
+        no binary columns, as the binary protocol decodes binary strings
+        and BLOBs with the connection's character set.
+
+    Methods:
+        __init__
+        preparable
+        checked
+        cursor
+        execute
+        discard
+        clear
+
+    """
+
+    def __init__(self, size=100):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the StatementCache
+            class.
+
+        Arguments:
+            (input) size -> Maximum number of prepared statements
+
+        """
+
+        self.size = size
+        self.stmts = collections.OrderedDict()
+        self.binary = collections.OrderedDict()
+        self.conn_id = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def preparable(self, cmd):
+
+        """Method:  preparable
+
+        Description:  Return whether a command is run as a prepared
+            statement, which is once it has been checked, see checked, and
+            has no binary columns.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (output) True|False - Run as a prepared statement
+
+        """
+
+        return cmd in self.stmts or self.binary.get(cmd) is False
+
+    def checked(self, cmd, description):
+
+        """Method:  checked
+
+        Description:  Record whether the result of a command run with the
+            text protocol has binary columns.  Up to size commands are kept.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (input) description -> Column descriptions of the result
+
+        """
+
+        self.binary[cmd] = any(
+            len(col) > 8 and col[8] == BINARY_CHARSET
+            and col[1] in BINARY_TYPES for col in description or ())
+        self.binary.move_to_end(cmd)
+
+        if len(self.binary) > self.size:
+            self.binary.popitem(last=False)
+
+    def cursor(self, conn, cmd):
+
+        """Method:  cursor
+
+        Description:  Return the prepared statement cursor and the cached
+            statement text of a command, preparing a new cursor on a miss.
+            The prepared cursor only reuses its statement for the same text
+            object, so the cached text is the one to execute.
+
+        Arguments:
+            (input) conn -> MySQL connection instance
+            (input) cmd -> SQL command
+            (output) stmt -> Cached statement text
+            (output) cur -> Prepared statement cursor
+
+        """
+
+        # Statement handles do not survive a reconnect.
+        if conn.connection_id != self.conn_id:
+            self.clear(close=False)
+            self.conn_id = conn.connection_id
+
+        entry = self.stmts.get(cmd)
+
+        if entry is not None:
+            self.hits += 1
+            self.stmts.move_to_end(cmd)
+
+            return entry
+
+        self.misses += 1
+        entry = self.stmts[cmd] = (cmd, conn.cursor(prepared=True))
+
+        if len(self.stmts) > self.size:
+            self.evictions += 1
+            self.stmts.popitem(last=False)[1][1].close()
+
+        return entry
+
+    def execute(self, conn, cmd, params):
+
+        """Method:  execute
+
+        Description:  Execute a command as a prepared statement and return
+            its result, read in full so the cached cursor can be reused.  A
+            statement the server no longer knows is prepared again once.
+
+        Arguments:
+            (input) conn -> MySQL connection instance
+            (input) cmd -> SQL command
+            (input) params -> Position arguments for the SQL command
+            (output) FetchedCursor instance
+
+        """
+
+        stmt, cur = self.cursor(conn, cmd)
+
+        try:
+            cur.execute(stmt, params)
+
+        except mysql.connector.errors.DatabaseError as err:
+
+            # ER_UNKNOWN_STMT_HANDLER
+            if err.errno != 1243:
+                raise
+
+            self.discard(cmd)
+            stmt, cur = self.cursor(conn, cmd)
+            cur.execute(stmt, params)
+
+        return FetchedCursor(cur)
+
+    def discard(self, cmd):
+
+        """Method:  discard
+
+        Description:  Drop the prepared statement of a command without
+            closing it on the server.
+
+        Arguments:
+            (input) cmd -> SQL command
+
+        """
+
+        self.stmts.pop(cmd, None)
+
+    def clear(self, close=True):
+
+        """Method:  clear
+
+        Description:  Drop all the prepared statements.  The hit and miss
+            counters are kept.
+
+        Arguments:
+            (input) close -> True|False - Close the statements on the server
+
+        """
+
+        if close:
+            for _, cur in self.stmts.values():
+                cur.close()
+
+        self.stmts.clear()
+
+
+class FetchedCursor():
+
+    """Class:  FetchedCursor
+
+    Description:  Class which holds a result read in full from a cursor, with
+        the cursor's iteration, fetch methods and result attributes, so a
+        prepared statement returns the same shape as a text protocol
+        cursor.
+
+    Methods:
+        __init__
+        __iter__
+        fetchone
+        fetchmany
+        fetchall
+        close
+
+    """
+
+    def __init__(self, cur):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the FetchedCursor
+            class.
+
+        Arguments:
+            (input) cur -> mysql.connector cursor
+
+        """
+
+        self.description = cur.description
+        self.with_rows = cur.with_rows
+        self.rows = cur.fetchall() if cur.with_rows else []
+        self.rowcount = cur.rowcount
+        self.lastrowid = cur.lastrowid
+        self.column_names = tuple(col[0] for col in self.description or ())
+        self.pos = 0
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Iterate over the unread rows.
+
+        Arguments:
+            (output) Iterator of the rows
+
+        """
+
+        return iter(self.fetchone, None)
+
+    def fetchone(self):
+
+        """Method:  fetchone
+
+        Description:  Return the next row.
+
+        Arguments:
+            (output) Row or None at the end of the result set
+
+        """
+
+        rows = self.fetchmany()
+
+        return rows[0] if rows else None
+
+    def fetchmany(self, size=1):
+
+        """Method:  fetchmany
+
+        Description:  Return the next rows.
+
+        Arguments:
+            (input) size -> Maximum number of rows
+            (output) rows -> List of rows
+
+        """
+
+        rows = self.rows[self.pos:self.pos + size]
+        self.pos += len(rows)
+
+        return rows
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Return the rest of the rows.
+
+        Arguments:
+            (output) rows -> List of rows
+
+        """
+
+        return self.fetchmany(len(self.rows) - self.pos)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Drop the unread rows.
+
+        Arguments:
+
+        """
+
+        self.pos = len(self.rows)
+
+
+class RawHeader():
+
+    """Class:  RawHeader
+
+    Description:  Class which holds the column header of a raw result set.
+        All the rows of the result set share the header and the column
+        converters, which are looked up once per column on first use.
+
+    Methods:
+        __init__
+        decoder
+        row
+
+    """
+
+    __slots__ = ("keys", "index", "columns", "converter", "decoders")
+
+    def __init__(self, columns, converter):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the RawHeader class.
+
+        Arguments:
+            (input) columns -> List of column descriptions of the result set
+            (input) converter -> mysql.connector converter of the connection
+
+        """
+
+        self.keys = [str(column[0]) for column in columns]
+        self.index = {key: pos for pos, key in enumerate(self.keys)}
+        self.columns = columns
+        self.converter = converter
+        self.decoders = [None] * len(columns)
+
+    def decoder(self, pos):
+
+        """Method:  decoder
+
+        Description:  Return the cached converter function of a column.
+
+        Arguments:
+            (input) pos -> Position of the column
+            (output) func -> Function converting a raw value of the column
+
+        """
+
+        func = self.decoders[pos]
+
+        if func is None:
+            func = _column_decoder(self.converter, self.columns[pos])
+            self.decoders[pos] = func
+
+        return func
+
+    def row(self, values):
+
+        """Method:  row
+
+        Description:  Return a RawRow for the raw values of a row.
+
+        Arguments:
+            (input) values -> Sequence of the raw column values
+            (output) RawRow instance
+
+        """
+
+        return RawRow(self, values)
+
+
+class RawRow(collections.abc.Mapping):
+
+    """Class:  RawRow
+
+    Description:  Class which holds a row of a raw result set.  The column
+        values are kept as the bytes read off the connection and a column
+        is only converted to its Python type when it is accessed.  The
+        converted values are cached in the row.  Supports the read-only
+        dictionary methods of the col_sql rows.
+
+    Methods:
+        __init__
+        __getitem__
+        __iter__
+        __len__
+        __repr__
+        raw
+
+    """
+
+    __slots__ = ("header", "values", "cache")
+
+    def __init__(self, header, values):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the RawRow class.
+
+        Arguments:
+            (input) header -> RawHeader instance of the result set
+            (input) values -> Sequence of the raw column values
+
+        """
+
+        self.header = header
+        self.values = values
+        self.cache = None
+
+    def __getitem__(self, key):
+
+        """Method:  __getitem__
+
+        Description:  Return the converted value of a column.
+
+        Arguments:
+            (input) key -> Column name
+            (output) Python value of the column
+
+        """
+
+        pos = self.header.index[key]
+
+        if self.cache is None:
+            self.cache = {}
+
+        elif pos in self.cache:
+            return self.cache[pos]
+
+        value = self.header.decoder(pos)(self.values[pos])
+        self.cache[pos] = value
+
+        return value
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Iterate over the column names.
+
+        Arguments:
+            (output) Iterator of the column names
+
+        """
+
+        return iter(self.header.keys)
+
+    def __len__(self):
+
+        """Method:  __len__
+
+        Description:  Return the number of columns.
+
+        Arguments:
+            (output) Number of columns
+
+        """
+
+        return len(self.values)
+
+    def __repr__(self):
+
+        """Method:  __repr__
+
+        Description:  Return the raw values of the row by column name.
+
+        Arguments:
+            (output) String representation of the row
+
+        """
+
+        return f"RawRow({dict(zip(self.header.keys, self.values))!r})"
+
+    def raw(self, key):
+
+        """Method:  raw
+
+        Description:  Return the unconverted value of a column.
+
+        Arguments:
+            (input) key -> Column name
+            (output) Raw bytes of the column or None for NULL
+
+        """
+
+        return self.values[self.header.index[key]]
+
+
+def _conn_converter(conn):
+
+    """Function:  _conn_converter
+
+    Description:  Return the converter of a connection.  The C extension
+        connection converts in C and has no converter, so a converter for
+        the connection's character set is made.
+
+    Arguments:
+        (input) conn -> MySQL connection instance
+        (output) mysql.connector converter
+
+    """
+
+    if conn.converter is not None:
+        return conn.converter
+
+    return mysql.connector.conversion.MySQLConverter(conn.python_charset)
+
+
+def _query_iter(conn, stmts):
+
+    """Function:  _query_iter
+
+    Description:  Execute a multi-statement request and yield the result of
+        each statement in turn.  The C extension connection has no
+        cmd_query_iter, so the results after the first are read with
+        next_result.  The rows of each result must be read before the next
+        result is requested.
+
+    Arguments:
+        (input) conn -> MySQL connection instance
+        (input) stmts -> SQL commands separated by semicolons
+        (output) Column definitions or the status of each command
+
+    """
+
+    if hasattr(conn, "cmd_query_iter"):
+        yield from conn.cmd_query_iter(stmts)
+        return
+
+    yield conn.cmd_query(stmts)
+
+    while conn.next_result():
+        yield conn.fetch_eof_columns() if conn.unread_result \
+            else conn.fetch_eof_status()
+
+
+def _column_decoder(converter, column):
+
+    """Function:  _column_decoder
+
+    Description:  Return the function converting the raw values of a column,
+        resolved once from the field type of the column.  Field types
+        without a converter method use the generic to_python.
+
+    Arguments:
+        (input) converter -> mysql.connector converter of the connection
+        (input) column -> Column description
+        (output) func -> Function converting a raw value of the column
+
+    """
+
+    name = mysql.connector.constants.FieldType.get_info(column[1])
+    method = getattr(converter, f"_{name}_to_python", None) if name else None
+
+    if method is None:
+        return lambda value: converter.to_python(column, value)
+
+    return lambda value: None if value is None else method(value, column)
+
+
+class ServerSnapshot():
+
+    """Class:  ServerSnapshot
+
+    Description:  Class which holds a timestamped snapshot of the status and
+        variables used by Server.upd_srv_stat and Server.upd_srv_perf.  Only
+        the needed names are fetched, in a single round trip, and the
+        derived memory and buffer pool fields are computed from them.
+
+    Methods:
+        __init__
+        collect
+        srv_stat
+        srv_perf
+
+    """
+
+    STATUS = (
+        "Threads_connected", "Uptime", "Innodb_buffer_pool_pages_free",
+        "Innodb_buffer_pool_pages_data", "Innodb_buffer_pool_pages_total",
+        "Innodb_buffer_pool_pages_dirty", "Max_used_connections",
+        "Uptime_since_flush_status", "Binlog_cache_disk_use",
+        "Binlog_cache_use", "Innodb_buffer_pool_wait_free",
+        "Innodb_log_waits", "Innodb_row_lock_time_avg",
+        "Innodb_row_lock_time_max", "Innodb_buffer_pool_reads",
+        "Innodb_buffer_pool_read_requests",
+        "Innodb_buffer_pool_read_ahead_evicted",
+        "Innodb_buffer_pool_read_ahead", "Innodb_buffer_pool_write_requests",
+        "Created_tmp_disk_tables")
+    VARIABLES = (
+        "key_buffer_size", "innodb_buffer_pool_size", "innodb_log_buffer_size",
+        "query_cache_size", "read_buffer_size", "read_rnd_buffer_size",
+        "sort_buffer_size", "join_buffer_size", "thread_stack",
+        "max_allowed_packet", "net_buffer_length", "max_connections",
+        "max_heap_table_size", "tmp_table_size")
+
+    def __init__(self, status, variables, timestamp=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ServerSnapshot
+            class.
+
+        Arguments:
+            (input) status -> Status variables in dictionary format
+            (input) variables -> System variables in dictionary format
+            (input) timestamp -> Epoch time of the snapshot, default is now
+
+        """
+
+        self.status = status
+        self.variables = variables
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @classmethod
+    def collect(cls, server):
+
+        """Method:  collect
+
+        Description:  Fetch a snapshot of a server with one multi-statement
+            request.
+
+        Arguments:
+            (input) server -> Server instance
+            (output) -> ServerSnapshot instance
+
+        """
+
+        global SHOW                                 # pylint:disable=W0602
+
+        status, variables = server.multi_col_sql([
+            SHOW + "status where Variable_name in ("
+            + ", ".join(f"'{name}'" for name in cls.STATUS) + ")",
+            SHOW + "global variables where Variable_name in ("
+            + ", ".join(f"'{name}'" for name in cls.VARIABLES) + ")"])
+
+        return cls(
+            {item["Variable_name"]: item["Value"] for item in status},
+            {item["Variable_name"]: item["Value"] for item in variables})
+
+    def srv_stat(self):
+
+        """Method:  srv_stat
+
+        Description:  Return the memory and connection fields used by
+            Server.upd_srv_stat.
+
+        Arguments:
+            (output) stat -> Server attributes in dictionary format
+
+        """
+
+        data = self.variables
+        stat = {
+            "buf_size": int(data["key_buffer_size"]),
+            "indb_buf": int(data["innodb_buffer_pool_size"]),
+            "indb_log_buf": int(data["innodb_log_buffer_size"]),
+
+            # query_cache_size has been removed in MySQL 8.0
+            "qry_cache": int(data.get("query_cache_size", "0")),
+
+            "read_buf": int(data["read_buffer_size"]),
+            "read_rnd_buf": int(data["read_rnd_buffer_size"]),
+            "sort_buf": int(data["sort_buffer_size"]),
+            "join_buf": int(data["join_buffer_size"]),
+            "thrd_stack": int(data["thread_stack"]),
+            "max_pkt": int(data["max_allowed_packet"]),
+            "net_buf": int(data["net_buffer_length"]),
+            "max_conn": int(data["max_connections"]),
+            "max_heap_tbl": int(data["max_heap_table_size"]),
+            "tmp_tbl": int(data["tmp_table_size"]),
+            "cur_conn": int(self.status["Threads_connected"]),
+            "uptime": int(self.status["Uptime"])}
+
+        # Data derived from above status values.
+        # Days up since last recycle.
+        stat["days_up"] = int(stat["uptime"] / 3600.0 / 24)
+
+        # Base memory for database (in bytes).
+        stat["base_mem"] = stat["buf_size"] + stat["indb_buf"] \
+            + stat["indb_log_buf"] + stat["qry_cache"]
+
+        # Memory per thread connection (in bytes).
+        stat["thr_mem"] = stat["read_buf"] + stat["read_rnd_buf"] \
+            + stat["sort_buf"] + stat["join_buf"] + stat["thrd_stack"] \
+            + stat["max_pkt"] + stat["net_buf"]
+
+        # Set Maximum Memory usage and Current Memory usage.
+        stat["max_mem_usage"] = stat["base_mem"] \
+            + (stat["max_conn"] * stat["thr_mem"])
+        stat["cur_mem_usage"] = stat["base_mem"] \
+            + (stat["cur_conn"] * stat["thr_mem"])
+
+        # Convert memory from bytes to megabytes.
+        stat["max_mem_mb"] = int(
+            float(stat["max_mem_usage"]) / (1024 * 1024))
+        stat["cur_mem_mb"] = int(
+            float(stat["cur_mem_usage"]) / (1024 * 1024))
+
+        # Temp table memory size determined by Max Heap Table or Temp Table.
+        stat["tmp_tbl_size"] = max(stat["tmp_tbl"], stat["max_heap_tbl"])
+
+        # Percentage values:
+        # Current connections to Max connections
+        stat["prct_conn"] = gen_libs.pct_int(
+            stat["cur_conn"], stat["max_conn"])
+
+        # Current Memory to Max Memory
+        stat["prct_mem"] = gen_libs.pct_int(
+            stat["cur_mem_mb"], stat["max_mem_mb"])
+
+        return stat
+
+    def srv_perf(self):
+
+        """Method:  srv_perf
+
+        Description:  Return the performance fields used by
+            Server.upd_srv_perf.
+
+        Arguments:
+            (output) perf -> Server attributes in dictionary format
+
+        """
+
+        data = self.status
+        perf = {
+            "indb_buf_free": int(data["Innodb_buffer_pool_pages_free"]),
+            "indb_buf_data": int(data["Innodb_buffer_pool_pages_data"]),
+            "indb_buf_tot": int(data["Innodb_buffer_pool_pages_total"]),
+            "indb_buf_drty": int(data["Innodb_buffer_pool_pages_dirty"]),
+            "max_use_conn": int(data["Max_used_connections"]),
+            "uptime_flush": int(data["Uptime_since_flush_status"]),
+            "binlog_disk": int(data["Binlog_cache_disk_use"]),
+            "binlog_use": int(data["Binlog_cache_use"]),
+            "indb_buf_wait": int(data["Innodb_buffer_pool_wait_free"]),
+            "indb_log_wait": int(data["Innodb_log_waits"]),
+            "indb_lock_avg": int(data["Innodb_row_lock_time_avg"]),
+            "indb_lock_max": int(data["Innodb_row_lock_time_max"]),
+            "indb_buf_read": int(data["Innodb_buffer_pool_reads"]),
+            "indb_buf_reqt": int(data["Innodb_buffer_pool_read_requests"]),
+            "indb_buf_evt": int(data["Innodb_buffer_pool_read_ahead_evicted"]),
+            "indb_buf_ahd": int(data["Innodb_buffer_pool_read_ahead"]),
+            "indb_buf_write": int(data["Innodb_buffer_pool_write_requests"]),
+            "crt_tmp_tbls": int(data["Created_tmp_disk_tables"])}
+
+        # Percentage of dirty pages in data cache.
+        perf["indb_buf_data_pct"] = gen_libs.pct_int(
+            perf["indb_buf_data"], perf["indb_buf_tot"])
+
+        # Percentage of pool read requests in data cache.
+        perf["indb_buf_read_pct"] = gen_libs.pct_int(
+            perf["indb_buf_read"], perf["indb_buf_reqt"])
+
+        # Percentage of read ahead pages evicted from data cache.
+        perf["indb_buf_evt_pct"] = gen_libs.pct_int(
+            perf["indb_buf_evt"], perf["indb_buf_ahd"])
 
-    # Semantic change in MySQL 8.0.22
-    slave = "replica" if server.version >= (8, 0, 22) else "slave"
+        # Total binlog cache usage.
+        perf["binlog_tot"] = perf["binlog_disk"] + perf["binlog_use"]
 
-    server.cmd_sql("stop " + slave)
+        return perf
 
 
-class Position(collections.namedtuple("Position", "file, pos")):
+class StatusSampler():
 
-    """Class:  Position
+    """Class:  StatusSampler
 
-    Description:  Class which holds a binary log position for a specific
-        server.
+    Description:  Class which keeps a fixed size history of status snapshots
+        of a server and turns the cumulative status counters into deltas,
+        per second rates and percentages over a time window.  The history
+        is restarted when the counters are reset by a server restart or a
+        flush status.
 
     Methods:
-        cmp
+        __init__
+        add
+        clear
+        window
+        delta
+        rate
+        pct
+        _change
 
     """
 
-    def cmp(self, other):
+    def __init__(self, history=60):
 
-        """Method: cmp
+        """Method:  __init__
 
-        Description:  Compare two positions lexicographically.  Returns -1, 0
-            or 1.
-            Return values:
-                -1: self is before other
-                0: self and other are equal
-                1: self is after other
+        Description:  Initialization of an instance of the StatusSampler
+            class.
 
         Arguments:
-            (input) other -> Second server to be compared with
+            (input) history -> Maximum number of snapshots kept
 
         """
 
-        return (self > other) - (self < other)
-
-
-def compare_sets(lhs, rhs):
-
-    """Method:  compare_sets
+        self.samples = collections.deque(maxlen=history)
+        self.resets = 0
 
-    Description:  Compare two GTID sets.  Return a tuple (lhs, rhs) where lhs
-        is a boolean indication that the left hand side had at least one more
-        item than the right hand side and vice verse.
+    def add(self, snapshot):
 
-    Arguments:
-        (input) lhs -> Left hand side set
-        (input) rhs -> Right hand side set
-        (output) lcheck -> True | False for Left side check
-        (output) rcheck -> True | False for Right side check
+        """Method:  add
 
-    """
+        Description:  Add a snapshot to the history.  If the server's uptime
+            or the uptime since the last flush status went backwards, the
+            counters were reset and the history is cleared first.
 
-    lcheck, rcheck = False, False
+        Arguments:
+            (input) snapshot -> ServerSnapshot instance
 
-    # Create a union of the lhs and rhs for comparsion.
-    both = copy.deepcopy(lhs)
-    both.union(rhs)
+        """
 
-    for uuid, rngs in list(both.gtids.items()):
-        # They are incomparable.
-        if lcheck and rcheck:
-            return lcheck, rcheck
+        if self.samples:
+            last = self.samples[-1].status
 
-        if _inner_compare(lhs, uuid, rngs):
-            rcheck = True
+            for name in ("Uptime", "Uptime_since_flush_status"):
+                if name in last and name in snapshot.status \
+                        and int(snapshot.status[name]) < int(last[name]):
+                    self.clear()
+                    self.resets += 1
+                    break
 
-        if _inner_compare(rhs, uuid, rngs):
-            lcheck = True
+        self.samples.append(snapshot)
 
-    return lcheck, rcheck
+    def clear(self):
 
+        """Method:  clear
 
-def _inner_compare(gtid_set, uuid, rngs):
+        Description:  Clear the history.
 
-    """Method:  inner_compare
+        Arguments:
 
-    Description:  Checks to see if the UUID is in the GTID Set passed
-        to the method.
+        """
 
-    Arguments:
-        (input) gtid_set -> GTIDSet instance
-        (input) uuid -> Universal Unqiue Identifier
-        (input) rngs -> Set of ranges
-        (output) -> True|False on whether UUID was detected
+        self.samples.clear()
 
-    """
+    def window(self, seconds=None):
 
-    # UUID not in lhs ==> right hand side has more
-    if uuid not in gtid_set.gtids:
-        return True
+        """Method:  window
 
-    for rng1, rng2 in zip(rngs, gtid_set.gtids[uuid]):
-        if rng1 != rng2:
-            return True
+        Description:  Return the oldest and latest snapshots within a time
+            window ending at the latest snapshot.
 
-    return False
+        Arguments:
+            (input) seconds -> Length of the window, default is the history
+            (output) first -> Oldest snapshot in the window or None
+            (output) last -> Latest snapshot or None
 
+        """
 
-class GTIDSet():
+        # The poller thread may add a snapshot while the history is read.
+        samples = tuple(self.samples)
 
-    """Class:  GTIDSet
+        if len(samples) < 2:
+            return None, None
 
-    Description:  Class which is a representation of a GTID set within the
-        MySQL database.  The GTIDSet object is used to contain and process
-        GTIDs.  The basic methods and attributes include comparing two
-        GTIDs using the rich comparsion operator methods, combine
-        GTID sets and converting GTIDs to strings.
+        last = samples[-1]
+        first = samples[0]
 
-    Methods:
-        __init__
-        __str__
-        union
-        __lt__
-        __le__
-        __eq__
-        __ne__
-        __ge__
-        __gt__
-        __or__
+        if seconds is not None:
+            for snapshot in samples:
+                if snapshot.timestamp >= last.timestamp - seconds:
+                    first = snapshot
+                    break
 
-    """
+        return (first, last) if first is not last else (None, None)
 
-    def __init__(self, obj):
+    def delta(self, name, seconds=None):
 
-        """Method:  __init__
+        """Method:  delta
 
-        Description:  Initialization an instance of the GTIDSet class.
+        Description:  Return the change of a status counter over a time
+            window.  Returns None if there are not two samples in the window
+            or the counter went backwards.
 
         Arguments:
-            (input) obj -> Raw GTID name and range
+            (input) name -> Status variable name
+            (input) seconds -> Length of the window, default is the history
+            (output) -> Change of the counter or None
 
         """
 
-        gtids = {}
+        return self._change(name, *self.window(seconds))
 
-        # Convert to string to parse
-        if not isinstance(obj, str):
-            obj = str(obj)
+    def rate(self, name, seconds=None):
 
-        # Parse string and construct a GTID set.
-        for uuid_set in obj.split(","):
-            parts = uuid_set.split(":")
+        """Method:  rate
 
-            uuid = parts.pop(0)
+        Description:  Return the per second rate of a status counter over a
+            time window.
 
-            if len(parts) == 0 or not parts[0]:
-                raise ValueError("At least one range has to be provided.")
+        Arguments:
+            (input) name -> Status variable name
+            (input) seconds -> Length of the window, default is the history
+            (output) -> Rate per second or None
 
-            rngs = [tuple(int(x) for x in part.split("-")) for part in parts]
+        """
 
-            for rng in rngs:
-                if len(rng) > 2 or len(rng) == 2 and int(rng[0]) > int(rng[1]):
-                    rng2 = "-".join(str(i) for i in rng)
-                    raise ValueError(
-                        f"Range {rng2} in '{rng}' is not a valid range.")
+        first, last = self.window(seconds)
+        value = self._change(name, first, last)
 
-            gtids[uuid] = gen_libs.normalize(rngs)
+        if value is None or last.timestamp <= first.timestamp:
+            return None
 
-        self.gtids = gtids
+        return value / (last.timestamp - first.timestamp)
 
-    def __str__(self):
+    def pct(self, part, total, seconds=None):
 
-        """Method:  __str__
+        """Method:  pct
 
-        Description:  Combines and converts to a string all parts of the class.
+        Description:  Return the change of one status counter as a
+            percentage of the change of another over a time window, such as
+            the buffer pool reads to read requests.
 
         Arguments:
-            (output) -> String of the GTID class combined together
+            (input) part -> Status variable name of the part
+            (input) total -> Status variable name of the total
+            (input) seconds -> Length of the window, default is the history
+            (output) -> Percentage as an integer or None
 
         """
 
-        sets = []
-
-        for uuid, rngs in sorted(self.gtids.items()):
-            uuid_set = ":".join([str(uuid)] + ["-".join(str(i) for i in rng)
-                                               for rng in rngs])
+        first, last = self.window(seconds)
+        part_delta = self._change(part, first, last)
+        total_delta = self._change(total, first, last)
 
-            sets.append(uuid_set)
+        if part_delta is None or total_delta is None:
+            return None
 
-        return ",".join(sets)
+        return gen_libs.pct_int(part_delta, total_delta)
 
-    def union(self, other):
+    @staticmethod
+    def _change(name, first, last):
 
-        """Method:  union
+        """Method:  _change
 
-        Description:  Compute the union of this GTID set and the GTID set in
-            the other.  The update of the GTID set is done in-place, so if you
-            want to compute the union of two sets 'lhs' and 'rhs' you have to
-            do something like:
-                data = copy.deepcopy(lhs)
-                data.union(rhs)
+        Description:  Return the change of a status counter between two
+            snapshots of one window.  Returns None if there is no window or
+            the counter went backwards.
 
         Arguments:
-            (input) other -> Second GTID set
+            (input) name -> Status variable name
+            (input) first -> Oldest snapshot in the window or None
+            (input) last -> Latest snapshot or None
+            (output) -> Change of the counter or None
 
         """
 
-        # If it wasn't already a GTIDSet, try to make it one.
-        if not isinstance(other, GTIDSet):
-            other = GTIDSet(other)
+        if first is None:
+            return None
 
-        gtids = self.gtids
+        value = int(last.status[name]) - int(first.status[name])
 
-        # Parse the other GTID set and combine with the first GTID set.
-        for uuid, rngs in list(other.gtids.items()):
-            if uuid not in gtids:
-                gtids[uuid] = rngs
+        return value if value >= 0 else None
 
-            else:
-                gtids[uuid] = gen_libs.normalize(gtids[uuid] + rngs)
 
-        self.gtids = gtids
+class StatusPoller():
 
-    def __lt__(self, other):
+    """Class:  StatusPoller
 
-        """Method:  __lt__
+    Description:  Class which polls the status of one or more servers in a
+        background thread.  Each poll publishes a new dictionary of
+        snapshots, keyed by server name, by swapping the snapshots
+        reference, so readers get the latest snapshots without any network
+        I/O or locking.  The poller does not change the servers, other than
+        attaching a single connection pool to a server which is not pooled
+        when started, so the poller thread never shares the calling
+        thread's connection.
 
-        Description:  Is first GTID set less than second GTID set.
+    Methods:
+        __init__
+        start
+        stop
+        run
+        poll
+        latest
+        staleness
+
+    """
+
+    def __init__(self, servers, interval=10, collect=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the StatusPoller
+            class.
 
         Arguments:
-            (output) -> True | False
+            (input) servers -> List of Server instances
+            (input) interval -> Seconds between the start of each poll
+            (input) collect -> Function returning a snapshot of a server,
+                default is ServerSnapshot.collect
 
         """
 
-        lhs, rhs = compare_sets(self, other)
-        return not lhs and rhs
+        self.servers = list(servers)
+        names = [server.name for server in self.servers]
 
-    def __le__(self, other):
+        if len(set(names)) != len(names):
+            raise ValueError(f"Server names are not unique: {names}")
 
-        """Method:  __le__
+        self.interval = interval
+        self.collect = collect or ServerSnapshot.collect
+        self.snapshots = {}
+        self.poll_time = None
+        self.last_poll = None
+        self.polls = 0
+        self.errors = 0
+        self.last_error = None
+        self.stop_event = threading.Event()
+        self.thread = None
 
-        Description:  Is first GTID set less than or equal to second GTID set.
+    def start(self):
+
+        """Method:  start
+
+        Description:  Start the poller thread, if it is not running.  A
+            single connection pool is attached to each server which is not
+            pooled, so the poller thread has a connection of its own.
 
         Arguments:
-            (output) -> True | False
+            (output) self -> StatusPoller instance
 
         """
 
-        lhs, _ = compare_sets(self, other)
-        return not lhs
+        for server in self.servers:
+            if server.pool is None:
+                server.pooled(size=1)
 
-    def __eq__(self, other):
+        if self.thread is None or not self.thread.is_alive():
+            self.stop_event.clear()
+            self.thread = threading.Thread(
+                target=self.run, name="StatusPoller", daemon=True)
+            self.thread.start()
 
-        """Method:  __eq__
+        return self
 
-        Description:  Is first GTID set equal to second GTID set.
+    def stop(self, timeout=None):
+
+        """Method:  stop
+
+        Description:  Stop the poller thread and wait for it to finish.
 
         Arguments:
-            (output) -> True | False
+            (input) timeout -> Seconds to wait for the thread to finish
 
         """
 
-        lhs, rhs = compare_sets(self, other)
+        self.stop_event.set()
 
-        return not (lhs or rhs)
+        if self.thread is not None:
+            self.thread.join(timeout)
 
-    def __ne__(self, other):
+    def run(self):
 
-        """Method:  __ne__
+        """Method:  run
 
-        Description:  Is first GTID set not equal to second GTID set.
+        Description:  Poll the servers until stopped.
 
         Arguments:
-            (output) -> True | False
 
         """
 
-        return not self.__eq__(other)
+        while not self.stop_event.is_set():
+            start = time.monotonic()
+            self.poll()
+            self.stop_event.wait(
+                max(0, self.interval - (time.monotonic() - start)))
 
-    def __ge__(self, other):
+    def poll(self):
 
-        """Method:  __ge__
+        """Method:  poll
 
-        Description:  Is first GTID set greater than or equal to second GTID
-            set.
+        Description:  Take a snapshot of each server and publish them.  A
+            server which fails keeps its previous snapshot and the error is
+            kept in last_error.
 
         Arguments:
-            (output) -> True | False
 
         """
 
-        return other.__le__(self)
+        start = time.perf_counter()
+        snapshots = dict(self.snapshots)
 
-    def __gt__(self, other):
+        for server in self.servers:
+            try:
+                snapshot = self.collect(server)
 
-        """Method:  __gt__
+            # An uncaught error would end the poller thread.
+            except Exception as err:                # pylint:disable=W0718
+                self.errors += 1
+                self.last_error = err
+                continue
 
-        Description:  Is first GTID set greater than second GTID set.
+            snapshots[server.name] = snapshot
+
+        self.snapshots = snapshots
+        self.poll_time = time.perf_counter() - start
+        self.last_poll = time.time()
+        self.polls += 1
+
+    def latest(self, name):
+
+        """Method:  latest
+
+        Description:  Return the latest snapshot of a server.
 
         Arguments:
-            (output) -> True | False
+            (input) name -> Name of the server
+            (output) -> Snapshot of the server or None
 
         """
 
-        return other.__lt__(self)
+        return self.snapshots.get(name)
 
-    def __or__(self, other):
+    def staleness(self):
 
-        """Method:  __or__
+        """Method:  staleness
 
-        Description:  Return first set (self) with elements added from second
-            set (other).
+        Description:  Return the seconds since the last poll finished.
 
         Arguments:
-            (output) result -> First set with elements from second set
+            (output) -> Seconds since the last poll or None
 
         """
 
-        data = copy.deepcopy(self)
-        data.union(other)
-
-        return data
+        return None if self.last_poll is None else time.time() - self.last_poll
 
 
 class Server():                                 # pylint:disable=R0902,R0904
@@ -515,6 +4084,16 @@ class Server():                                 # pylint:disable=R0902,R0904
         set_srv_gtid
         upd_srv_perf
         upd_srv_stat
+        upd_snapshot
+        set_snapshot
+        sync_snapshot
+        sampled
+        polled
+        prepared
+        stmt_cache
+        stmt_stats
+        cached_sys_var
+        clear_var_cache
         upd_mst_rep_stat
         upd_slv_rep_stat
         fetch_mst_rep_cfg
@@ -523,10 +4102,17 @@ class Server():                                 # pylint:disable=R0902,R0904
         flush_logs
         fetch_log
         connect
+        new_conn
         disconnect
+        pooled
+        checkout
+        thread_conn
         sql
+        stream
         cmd_sql
         col_sql
+        multi_col_sql
+        batch_sql
         vert_sql
         is_connected
         reconnect
@@ -565,6 +4151,9 @@ class Server():                                 # pylint:disable=R0902,R0904
                 ssl_verify_id -> True|False - Validate the destination host
                 ssl_verify_cert -> True|False - Validate the CA certification
                 tls_versions -> List of TLS versions
+                var_ttl -> Dictionary of variable names and seconds cached
+                driver -> connector|pure|cext or Driver instance, see
+                    get_driver
 
         """
 
@@ -599,8 +4188,20 @@ class Server():                                 # pylint:disable=R0902,R0904
         self.set_tls_config()
 
         # SQL connection handler.
+        self.driver = get_driver(kwargs.get("driver", None))
         self.conn = None
         self.conn_msg = None
+        self.conn_time = None
+
+        # Connection pool for worker threads, see pooled.
+        self.pool = None
+        self.pool_owner = None
+        self.pool_local = None
+
+        # Prepared statement caches of the connections, see prepared.
+        self.stmt_size = 0
+        self.stmt_caches = weakref.WeakKeyDictionary()
+        self.stmt_lock = threading.Lock()
 
         # Binary log information.
         self.pos = None
@@ -675,163 +4276,305 @@ class Server():                                 # pylint:disable=R0902,R0904
         self.indb_buf_write = None
         self.crt_tmp_tbls = None
 
-        # Server's GTID mode.
-        self.gtid_mode = None
+        # Last status snapshot, see ServerSnapshot.
+        self.snapshot = None
+
+        # History of status snapshots, see sampled.
+        self.sampler = None
+
+        # Background status poller, see polled.
+        self.poller = None
+
+        # Cached static variables, see cached_sys_var.
+        self.var_ttl = dict(VAR_CACHE_TTL, **kwargs.get("var_ttl", {}))
+        self.var_cache = {}
+        self.last_uptime = None
+
+        # Server's GTID mode.
+        self.gtid_mode = None
+
+        # Server's Binlog checksum.
+        self.crc = None
+
+        # Server's version
+        self.version = None
+
+    def set_srv_binlog_crc(self):
+
+        """Method:  set_srv_binlog_crc
+
+        Description:  Set the Server's Binlog checksum attribute.
+
+        Arguments:
+
+        """
+
+        var = "binlog_checksum"
+        data = self.cached_sys_var(var)
+
+        if data:
+            self.crc = data[var]
+
+    def set_srv_gtid(self):
+
+        """Method:  set_srv_gtid
+
+        Description:  Set the Server's GTID mode attribute.
+
+        Arguments:
+
+        """
+
+        var = "gtid_mode"
+        data = self.cached_sys_var(var)
+        self.gtid_mode = bool(data) and data[var] == "ON"
+
+    def upd_srv_perf(self):
+
+        """Method:  upd_srv_perf
+
+        Description:  Updates the Server's performance attributes.
+
+        Arguments:
+
+        """
+
+        self.set_snapshot(ServerSnapshot.collect(self))
+
+        for key, value in self.snapshot.srv_perf().items():
+            setattr(self, key, value)
+
+    def upd_srv_stat(self):
+
+        """Method:  upd_srv_stat
+
+        Description:  Updates the Server's status attributes.
+
+        Arguments:
+
+        """
+
+        self.set_snapshot(ServerSnapshot.collect(self))
+
+        for key, value in self.snapshot.srv_stat().items():
+            setattr(self, key, value)
+
+    def upd_snapshot(self):
+
+        """Method:  upd_snapshot
+
+        Description:  Updates both the Server's status and performance
+            attributes from one snapshot.
+
+        Arguments:
+
+        """
+
+        self.set_snapshot(ServerSnapshot.collect(self))
+
+        for key, value in self.snapshot.srv_stat().items():
+            setattr(self, key, value)
+
+        for key, value in self.snapshot.srv_perf().items():
+            setattr(self, key, value)
+
+    def set_snapshot(self, snapshot):
+
+        """Method:  set_snapshot
+
+        Description:  Set the Server's last status snapshot and add it to
+            the sampler history.  The variable cache is cleared if the
+            server's uptime went backwards, as the server has been restarted.
+
+        Arguments:
+            (input) snapshot -> ServerSnapshot instance
+
+        """
+
+        self.snapshot = snapshot
+        uptime = snapshot.status.get("Uptime")
+
+        if uptime is not None:
+            uptime = int(uptime)
+
+            if self.last_uptime is not None and uptime < self.last_uptime:
+                self.clear_var_cache()
+
+            self.last_uptime = uptime
+
+        if self.sampler is not None:
+            self.sampler.add(snapshot)
+
+    def sync_snapshot(self):
+
+        """Method:  sync_snapshot
+
+        Description:  Set the latest snapshot of the status poller, see
+            polled, on the server.  The poller thread does not change the
+            server, so this is called from the thread using the server.
+
+        Arguments:
+            (output) -> Latest ServerSnapshot instance or None
+
+        """
+
+        snapshot = self.poller.latest(self.name) if self.poller else None
+
+        if snapshot is not None and snapshot is not self.snapshot:
+            self.set_snapshot(snapshot)
+
+        return self.snapshot
+
+    def sampled(self, history=60):
 
-        # Server's Binlog checksum.
-        self.crc = None
+        """Method:  sampled
 
-        # Server's version
-        self.version = None
+        Description:  Keep a history of the status snapshots taken by
+            upd_srv_stat, upd_srv_perf and upd_snapshot, to get the per
+            second rates and windowed percentages of the status counters.
 
-    def set_srv_binlog_crc(self):
+        Arguments:
+            (input) history -> Maximum number of snapshots kept
+            (output) self -> Server instance
 
-        """Method:  set_srv_binlog_crc
+        """
 
-        Description:  Set the Server's Binlog checksum attribute.
+        self.sampler = StatusSampler(history)
+
+        return self
+
+    def polled(self, interval=10):
+
+        """Method:  polled
+
+        Description:  Start a background thread which takes a status
+            snapshot of the server every interval seconds.  The latest
+            snapshot is set on the server by sync_snapshot, from the thread
+            using the server.  A single connection pool is attached if the
+            server is not pooled, so the poller thread has a connection of
+            its own.
 
         Arguments:
+            (input) interval -> Seconds between the start of each poll
+            (output) self -> Server instance
 
         """
 
-        var = "binlog_checksum"
-        data = fetch_sys_var(self, var)
+        if self.poller is None:
+            self.poller = StatusPoller([self], interval)
 
-        if data:
-            self.crc = data[var]
+        self.poller.start()
 
-    def set_srv_gtid(self):
+        return self
 
-        """Method:  set_srv_gtid
+    def prepared(self, size=100):
 
-        Description:  Set the Server's GTID mode attribute.
+        """Method:  prepared
+
+        Description:  Run the sql and vert_sql commands with parameters as
+            server-side prepared statements.  Each connection keeps up to
+            size prepared statements, keyed by the statement text, which are
+            prepared again after the connection reconnects.  A command is
+            prepared from its second run, if its first run returned no
+            binary columns.  SHOW commands cannot be prepared and commands
+            returning binary strings or BLOBs, which the binary protocol
+            decodes as text, still use the text protocol.
 
         Arguments:
+            (input) size -> Maximum number of prepared statements per
+                connection
+            (output) self -> Server instance
 
         """
 
-        var = "gtid_mode"
-        data = fetch_sys_var(self, var)
-        self.gtid_mode = bool(data) and data[var] == "ON"
+        self.stmt_size = size
 
-    def upd_srv_perf(self):
+        return self
 
-        """Method:  upd_srv_perf
+    def stmt_cache(self, conn):
 
-        Description:  Updates the Server's performance attributes.
+        """Method:  stmt_cache
+
+        Description:  Return the prepared statement cache of a connection.
 
         Arguments:
+            (input) conn -> MySQL connection instance
+            (output) cache -> StatementCache instance
 
         """
 
-        data = {}
+        with self.stmt_lock:
+            cache = self.stmt_caches.get(conn)
 
-        for item in self.col_sql("show status"):
-            data.update({item["Variable_name"]: item["Value"]})
-
-        self.indb_buf_free = int(data["Innodb_buffer_pool_pages_free"])
-        self.indb_buf_data = int(data["Innodb_buffer_pool_pages_data"])
-        self.indb_buf_tot = int(data["Innodb_buffer_pool_pages_total"])
-        self.indb_buf_drty = int(data["Innodb_buffer_pool_pages_dirty"])
-        self.max_use_conn = int(data["Max_used_connections"])
-        self.uptime_flush = int(data["Uptime_since_flush_status"])
-        self.binlog_disk = int(data["Binlog_cache_disk_use"])
-        self.binlog_use = int(data["Binlog_cache_use"])
-        self.indb_buf_wait = int(data["Innodb_buffer_pool_wait_free"])
-        self.indb_log_wait = int(data["Innodb_log_waits"])
-        self.indb_lock_avg = int(data["Innodb_row_lock_time_avg"])
-        self.indb_lock_max = int(data["Innodb_row_lock_time_max"])
-        self.indb_buf_read = int(data["Innodb_buffer_pool_reads"])
-        self.indb_buf_reqt = int(data["Innodb_buffer_pool_read_requests"])
-        self.indb_buf_evt = int(data["Innodb_buffer_pool_read_ahead_evicted"])
-        self.indb_buf_ahd = int(data["Innodb_buffer_pool_read_ahead"])
-        self.indb_buf_write = int(data["Innodb_buffer_pool_write_requests"])
-        self.crt_tmp_tbls = int(data["Created_tmp_disk_tables"])
+            if cache is None:
+                cache = self.stmt_caches[conn] = StatementCache(self.stmt_size)
 
-        # Percentage of dirty pages in data cache.
-        self.indb_buf_data_pct = gen_libs.pct_int(self.indb_buf_data,
-                                                  self.indb_buf_tot)
+        return cache
 
-        # Percentage of pool read requests in data cache.
-        self.indb_buf_read_pct = gen_libs.pct_int(self.indb_buf_read,
-                                                  self.indb_buf_reqt)
+    def stmt_stats(self):
 
-        # Percentage of read ahead pages evicted from data cache.
-        self.indb_buf_evt_pct = gen_libs.pct_int(self.indb_buf_evt,
-                                                 self.indb_buf_ahd)
+        """Method:  stmt_stats
 
-        # Total binlog cache usage.
-        self.binlog_tot = self.binlog_disk + self.binlog_use
+        Description:  Return the hits, misses and evictions of the prepared
+            statement caches and the number of statements prepared.
 
-    def upd_srv_stat(self):
+        Arguments:
+            (output) data -> Dictionary of the prepared statement counters
 
-        """Method:  upd_srv_stat
+        """
 
-        Description:  Updates the Server's status attributes.
+        data = {"hits": 0, "misses": 0, "evictions": 0, "statements": 0}
+
+        with self.stmt_lock:
+            caches = list(self.stmt_caches.values())
+
+        for cache in caches:
+            data["hits"] += cache.hits
+            data["misses"] += cache.misses
+            data["evictions"] += cache.evictions
+            data["statements"] += len(cache.stmts)
+
+        return data
+
+    def cached_sys_var(self, var):
+
+        """Method:  cached_sys_var
+
+        Description:  Returns a variable in the fetch_sys_var format.  The
+            variables with a time to live in var_ttl are returned from the
+            cache until it expires, any other variable is always fetched.
 
         Arguments:
+            (input) var -> Variable name
+            (output) data -> Variable returned in dictionary format
 
         """
 
-        data = {}
+        ttl = self.var_ttl.get(var)
+        entry = self.var_cache.get(var)
+        now = time.monotonic()
 
-        for item in self.col_sql("show global variables"):
-            data.update({item["Variable_name"]: item["Value"]})
-
-        self.buf_size = int(data["key_buffer_size"])
-        self.indb_buf = int(data["innodb_buffer_pool_size"])
-        self.indb_log_buf = int(data["innodb_log_buffer_size"])
-
-        # query_cache_size has been removed in MySQL 8.0
-        self.qry_cache = int(data.get("query_cache_size", "0"))
-
-        self.read_buf = int(data["read_buffer_size"])
-        self.read_rnd_buf = int(data["read_rnd_buffer_size"])
-        self.sort_buf = int(data["sort_buffer_size"])
-        self.join_buf = int(data["join_buffer_size"])
-        self.thrd_stack = int(data["thread_stack"])
-        self.max_pkt = int(data["max_allowed_packet"])
-        self.net_buf = int(data["net_buffer_length"])
-        self.max_conn = int(data["max_connections"])
-        self.max_heap_tbl = int(data["max_heap_table_size"])
-        self.tmp_tbl = int(data["tmp_table_size"])
-        self.cur_conn = int(fetch_global_var(
-            self, "Threads_connected")["Threads_connected"])
-        self.uptime = int(fetch_global_var(self, "Uptime")["Uptime"])
+        if entry and entry[1] > now:
+            return entry[0]
 
-        # Data derived from above status values.
-        # Days up since last recycle.
-        self.days_up = int(self.uptime / 3600.0 / 24)
+        data = fetch_sys_var(self, var)
 
-        # Base memory for database (in bytes).
-        self.base_mem = self.buf_size + self.indb_buf + self.indb_log_buf \
-            + self.qry_cache
+        if ttl:
+            self.var_cache[var] = (data, now + ttl)
 
-        # Memory per thread connection (in bytes).
-        self.thr_mem = self.read_buf + self.read_rnd_buf + self.sort_buf \
-            + self.join_buf + self.thrd_stack + self.max_pkt + self.net_buf
+        return data
 
-        # Set Maximum Memory usage and Current Memory usage.
-        self.max_mem_usage = self.base_mem + (self.max_conn * self.thr_mem)
-        self.cur_mem_usage = self.base_mem + (self.cur_conn * self.thr_mem)
+    def clear_var_cache(self):
 
-        # Convert memory from bytes to megabytes.
-        self.max_mem_mb = int(float(self.max_mem_usage) / (1024 * 1024))
-        self.cur_mem_mb = int(float(self.cur_mem_usage) / (1024 * 1024))
+        """Method:  clear_var_cache
 
-        # Temp table memory size determined by Max Heap Table or Temp Table.
-        if self.tmp_tbl > self.max_heap_tbl:
-            self.tmp_tbl_size = self.tmp_tbl
+        Description:  Clear the Server's cached variables.
 
-        else:
-            self.tmp_tbl_size = self.max_heap_tbl
+        Arguments:
 
-        # Percentage values:
-        # Current connections to Max connections
-        self.prct_conn = gen_libs.pct_int(self.cur_conn, self.max_conn)
+        """
 
-        # Current Memory to Max Memory
-        self.prct_mem = gen_libs.pct_int(self.cur_mem_mb, self.max_mem_mb)
+        self.var_cache.clear()
 
     def upd_mst_rep_stat(self):
 
@@ -843,17 +4586,17 @@ class Server():                                 # pylint:disable=R0902,R0904
 
         """
 
-        self.log_bin = fetch_sys_var(self, "log_bin")["log_bin"]
-        self.sync_log = fetch_sys_var(self, "sync_binlog")["sync_binlog"]
-        self.innodb_flush = fetch_sys_var(
-            self,
-            "innodb_flush_log_at_trx_commit")["innodb_flush_log_at_trx_commit"]
+        data = fetch_sys_vars(
+            self, ["log_bin", "sync_binlog", "innodb_flush_log_at_trx_commit",
+                   "innodb_support_xa", "binlog_format"])
+        self.log_bin = data["log_bin"]
+        self.sync_log = data["sync_binlog"]
+        self.innodb_flush = data["innodb_flush_log_at_trx_commit"]
 
         # innodb_support_xa has been removed in MySQL 8.0
-        self.innodb_xa = fetch_sys_var(
-            self, "innodb_support_xa").get("innodb_support_xa", None)
+        self.innodb_xa = data.get("innodb_support_xa", None)
 
-        self.log_format = fetch_sys_var(self, "binlog_format")["binlog_format"]
+        self.log_format = data["binlog_format"]
 
     def upd_slv_rep_stat(self):
 
@@ -865,20 +4608,16 @@ class Server():                                 # pylint:disable=R0902,R0904
 
         """
 
-        # Semantic change in MySQL 8.0.26
-        master = "source" if self.version >= (8, 0, 26) else "master"
-        slave = "replica" if self.version >= (8, 0, 26) else "slave"
-
-        self.log_bin = fetch_sys_var(self, "log_bin")["log_bin"]
-        self.read_only = fetch_sys_var(self, "read_only")["read_only"]
-        self.log_slv_upd = fetch_sys_var(
-            self, "log_" + slave + "_updates")["log_" + slave + "_updates"]
-        self.sync_mst = fetch_sys_var(
-            self, "sync_" + master + "_info")["sync_" + master + "_info"]
-        self.sync_relay = fetch_sys_var(
-            self, "sync_relay_log")["sync_relay_log"]
-        self.sync_rly_info = fetch_sys_var(
-            self, "sync_relay_log_info")["sync_relay_log_info"]
+        data = fetch_sys_vars(
+            self, ["log_bin", "read_only", "log_slave_updates",
+                   "sync_master_info", "sync_relay_log",
+                   "sync_relay_log_info"])
+        self.log_bin = data["log_bin"]
+        self.read_only = data["read_only"]
+        self.log_slv_upd = data["log_slave_updates"]
+        self.sync_mst = data["sync_master_info"]
+        self.sync_relay = data["sync_relay_log"]
+        self.sync_rly_info = data["sync_relay_log_info"]
 
     def fetch_mst_rep_cfg(self):
 
@@ -965,7 +4704,8 @@ class Server():                                 # pylint:disable=R0902,R0904
 
         """Method:  connect
 
-        Description:  Sets up a connection to a database.
+        Description:  Sets up a connection to a database.  The time taken to
+            connect is kept in conn_time.
 
         Arguments:
             (input) kwargs:
@@ -978,15 +4718,15 @@ class Server():                                 # pylint:disable=R0902,R0904
         silent = kwargs.get("silent", False)
 
         if not self.conn:
+            start = time.perf_counter()
 
             try:
-                self.conn = mysql.connector.connect(
-                    host=self.host, user=self.sql_user, port=self.port,
-                    database=database, **self.config)
+                self.conn = self.new_conn(database=database)
                 self.version = self.conn.get_server_version()
                 self.conn_msg = None
+                self.clear_var_cache()
 
-            except mysql.connector.Error as err:
+            except self.driver.error as err:
                 self.conn_msg = \
                     f"Couldn't connect to database. " \
                     f" MySQL error {err.args[0]}: {err.args[1]}"
@@ -994,41 +4734,277 @@ class Server():                                 # pylint:disable=R0902,R0904
                 if not silent:
                     print(self.conn_msg)
 
+            # Seconds taken to connect or fail to connect.
+            self.conn_time = time.perf_counter() - start
+
+    def new_conn(self, database=""):
+
+        """Method:  new_conn
+
+        Description:  Return a new connection to the server using the
+            server's password, SSL and TLS configuration.
+
+        Arguments:
+            (input) database -> Name of database to connect to
+            (output) -> MySQL connection instance
+
+        """
+
+        return self.driver.connect(
+            host=self.host, user=self.sql_user, port=self.port,
+            database=database, **self.config)
+
     def disconnect(self):
 
         """Method:  disconnect
 
-        Description:  Disconnects from a database connection.
+        Description:  Disconnects from a database connection and the idle
+            connections in the connection pool, after stopping the status
+            poller.
 
         Arguments:
 
         """
 
+        if self.poller:
+            self.poller.stop()
+
         self.conn.disconnect()
 
-    def sql(self, cmd, res_set="row", params=None):
+        if self.pool:
+            self.pool.close()
+
+    def pooled(self, size=5, **kwargs):
+
+        """Method:  pooled
+
+        Description:  Attach a connection pool to the server.  Worker threads
+            calling sql, cmd_sql, col_sql and vert_sql use a connection from
+            the pool, while the thread calling pooled keeps using the
+            server's own connection.  chg_db changes the database of the
+            pooled connections too, but other session state set on the
+            server's own connection, such as session variables, is not
+            applied to the pooled connections.
+
+        Arguments:
+            (input) size -> Maximum number of pooled connections
+            (input) **kwargs:
+                database -> Name of database to connect to
+            (output) self -> Server instance
+
+        """
+
+        database = kwargs.get("database", "")
+        self.pool = ConnectionPool(
+            lambda: self.new_conn(database=database), size)
+        self.pool_owner = threading.get_ident()
+        self.pool_local = threading.local()
+
+        return self
+
+    @contextlib.contextmanager
+    def checkout(self, timeout=None):
+
+        """Method:  checkout
+
+        Description:  Context manager which checks out a connection from the
+            connection pool for the current thread and returns it to the pool
+            at the end of the block.  The server's methods called in the
+            block from the same thread use the connection.  Without a pool,
+            the server's own connection is used.
+
+        Arguments:
+            (input) timeout -> Seconds to wait for a connection or None
+            (output) conn -> MySQL connection instance
+
+        """
+
+        held = getattr(self.pool_local, "conn", None)
+
+        if self.pool is None or held is not None:
+            yield held or self.conn
+            return
+
+        conn = self.pool.get(timeout)
+        self.pool_local.conn = conn
+        done = False
+
+        try:
+            yield conn
+            done = True
+
+        finally:
+            self.pool_local.conn = None
+            self.pool.release(conn, failed=not done)
+
+    @contextlib.contextmanager
+    def thread_conn(self):
+
+        """Method:  thread_conn
+
+        Description:  Context manager which returns the connection for the
+            current thread.  That is the server's own connection, unless the
+            server is pooled and called from a worker thread or from within
+            a checkout block.
+
+        Arguments:
+            (output) conn -> MySQL connection instance
+
+        """
+
+        if self.pool is None or (
+                threading.get_ident() == self.pool_owner
+                and getattr(self.pool_local, "conn", None) is None):
+            yield self.conn
+
+        else:
+            with self.checkout() as conn:
+                yield conn
+
+    def sql(self, cmd, res_set="row", params=None, raw=False):
 
         """Method:  sql
 
         Description:  Execute a SQL command in a cursor.  Returns the results
-            as either a cursor row iteration or single result set.
+            as either a cursor row iteration or single result set.  In raw
+            mode the rows are RawRow instances, which keep the column values
+            as bytes and only convert the columns which are accessed.  With
+            prepared statements on, see prepared, a command with parameters
+            is run as a cached prepared statement from its second run,
+            unless it is a SHOW command or returns binary columns, and its
+            rows are fetched with the execute.
 
         Arguments:
             (input) cmd -> SQL command
             (input) res_set -> row|all - determines the result set
             (input) params -> Position arguments for the SQL command
                 NOTE:  Arguments must be in a list or tuple
+            (input) raw -> True|False - Return RawRow rows
             (output) Returns cursor row iteration or single result set of data
 
         """
 
-        cur = self.conn.cursor()
-        cur.execute(cmd, params=params)
+        cur_args = {"raw": True} if raw else {}
+        prepare = self.stmt_size and params is not None and not raw \
+            and not NOT_PREPARED.match(cmd)
+
+        with self.thread_conn() as conn:
+            cache = self.stmt_cache(conn) if prepare else None
+
+            if cache is not None and cache.preparable(cmd):
+                cur = cache.execute(conn, cmd, params)
+
+                return cur if res_set == "row" else cur.fetchall()
+
+            # A pooled connection goes back to the pool before the rows are
+            #   read, so the rows are fetched with the execute.
+            if conn is self.conn:
+                cur = conn.cursor(**cur_args)
+
+            else:
+                cur = conn.cursor(buffered=True, **cur_args)
+
+            cur.execute(cmd, params=params)
+
+            if cache is not None:
+                cache.checked(cmd, cur.description)
+
+            if raw and cur.description:
+                header = RawHeader(cur.description, _conn_converter(conn))
+
+                if res_set == "row":
+                    return map(header.row, cur)
+
+                return list(map(header.row, cur.fetchall()))
+
+            if res_set == "row":
+                return cur
+
+            return cur.fetchall()
+
+    def stream(self, cmd, params=None, batch=1000, **kwargs):
 
-        if res_set == "row":
-            return cur
+        """Method:  stream
 
-        return cur.fetchall()
+        Description:  Generator which executes a SQL command in an unbuffered
+            cursor and yields the rows, or batches of rows, as they are
+            fetched.  Only one batch is held in memory at a time and the
+            cursor is always closed, including when the caller stops early,
+            in which case the rest of the rows are read off the connection
+            a batch at a time.
+            NOTE:  An early stop or a max_rows or max_bytes error still
+                reads, and discards, the rest of the result set before the
+                cursor is closed, which for an unbuffered query can be the
+                rest of the table.  Limit the query itself where possible.
+            NOTE:  A DB-API driver needs its unbuffered cursor class, see
+                DBAPIDriver.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (input) params -> Position arguments for the SQL command
+                NOTE:  Arguments must be in a list or tuple
+            (input) batch -> Number of rows fetched at a time
+            (input) **kwargs:
+                batches -> True|False - Yield lists of rows
+                max_rows -> Maximum number of rows returned
+                max_bytes -> Maximum estimated bytes of a batch.  The first
+                    batch is one row and each batch after is at most double
+                    the last, sized from the largest row so far.  A batch
+                    which still exceeds it raises DataError
+            (output) Row or list of rows
+
+        """
+
+        batches = kwargs.get("batches", False)
+        max_rows = kwargs.get("max_rows")
+        max_bytes = kwargs.get("max_bytes")
+        size = batch if max_bytes is None else 1
+        row_bytes = 1
+        count = 0
+
+        with self.thread_conn() as conn:
+            cur = conn.cursor(buffered=False)
+
+            try:
+                cur.execute(cmd, params=params)
+
+                while True:
+                    rows = cur.fetchmany(size)
+
+                    if not rows:
+                        break
+
+                    count += len(rows)
+
+                    if max_rows is not None and count > max_rows:
+                        raise mysql.connector.errors.DataError(
+                            msg=f"Result exceeds {max_rows} rows")
+
+                    if max_bytes is not None:
+                        sizes = [sum(sys.getsizeof(item) for item in row)
+                                 for row in rows]
+
+                        if sum(sizes) > max_bytes:
+                            raise mysql.connector.errors.DataError(
+                                msg=f"Batch of {len(rows)} rows exceeds"
+                                f" {max_bytes} bytes")
+
+                        row_bytes = max(row_bytes, *sizes)
+                        size = max(1, min(
+                            batch, size * 2, max_bytes // row_bytes))
+
+                    if batches:
+                        yield rows
+
+                    else:
+                        yield from rows
+
+            finally:
+                if conn.unread_result:
+                    while cur.fetchmany(size):
+                        pass
+
+                cur.close()
 
     def cmd_sql(self, cmd):
 
@@ -1043,28 +5019,109 @@ class Server():                                 # pylint:disable=R0902,R0904
 
         """
 
-        return self.conn.cmd_query(cmd)
+        with self.thread_conn() as conn:
+            data = conn.cmd_query(cmd)
+
+            # Read any rows so a pooled connection is returned clean.
+            if conn is not self.conn and "columns" in data:
+                conn.get_rows()
 
-    def col_sql(self, cmd):
+        return data
+
+    def col_sql(self, cmd, res_mode="dict", arrays=False, raw=False):
 
         """Method:  col_sql
 
         Description:  Execute a command sql with column definitions.  Takes the
             column definitions from the sql command standard output and
             combines them with the sql command data return to produce a list
-            of dictionaries key-values.
+            of dictionaries key-values.  See format_rows for the other
+            result modes.
 
         Arguments:
             (input) cmd -> Command SQL
+            (input) res_mode -> dict|row|column - determines the result format
+            (input) arrays -> True|False - NumPy arrays for numeric columns
+            (input) raw -> True|False - Return RawRow rows, which convert a
+                column only when it is accessed, res_mode is ignored
             (output) data -> Results of the sql executed in list format
 
         """
 
+        with self.thread_conn() as conn:
+            columns = conn.cmd_query(cmd)["columns"]
+
+            if raw:
+                header = RawHeader(columns, _conn_converter(conn))
+
+                return list(map(header.row, conn.get_rows(raw=True)[0]))
+
+            keys = [str(line[0]) for line in columns]
+            data = format_rows(
+                keys, conn.get_rows()[0], res_mode=res_mode, arrays=arrays)
+
+        return data
+
+    def multi_col_sql(self, cmds, res_mode="dict", arrays=False):
+
+        """Method:  multi_col_sql
+
+        Description:  Execute a list of sql commands as one multi-statement
+            request, in a single round trip to the server.  Each result set
+            is returned in the col_sql format.
+
+        Arguments:
+            (input) cmds -> List of SQL commands
+            (input) res_mode -> dict|row|column - determines the result format
+            (input) arrays -> True|False - NumPy arrays for numeric columns
+            (output) data -> List of results of the sql executed
+
+        """
+
+        return [data for data in self.batch_sql(
+            cmds, res_mode=res_mode, arrays=arrays) if data is not None]
+
+    def batch_sql(self, cmds, res_mode="dict", arrays=False):
+
+        """Method:  batch_sql
+
+        Description:  Execute a list of sql commands as one multi-statement
+            request, in a single round trip to the server.  Returns one
+            result per command:  the col_sql format by default or, for a
+            command passed as a (cmd, "vert") tuple, the vert_sql format.
+            Commands without a result set return None.
+            NOTE:  A stored procedure call returns a result for each of its
+                result sets plus one for the call itself.
+
+        Arguments:
+            (input) cmds -> List of SQL commands or (cmd, col|vert) tuples
+            (input) res_mode -> dict|row|column - col_sql result format
+            (input) arrays -> True|False - NumPy arrays for numeric columns
+            (output) data -> List of results of the sql executed
+
+        """
+
         data = []
-        keys = [str(line[0]) for line in self.conn.cmd_query(cmd)["columns"]]
+        cmds = [(cmd, "col") if isinstance(cmd, str) else cmd for cmd in cmds]
+        shapes = iter([shape for _, shape in cmds])
+
+        with self.thread_conn() as conn:
+            for result in _query_iter(conn, "; ".join(
+                    [cmd for cmd, _ in cmds])):
+                shape = next(shapes, "col")
 
-        for line in self.conn.get_rows()[0]:
-            data.append(dict(list(zip(keys, list(line)))))
+                if "columns" not in result:
+                    data.append(None)
+
+                elif shape == "vert":
+                    data.append(
+                        {line[0]: line[1] for line in conn.get_rows()[0]})
+
+                else:
+                    keys = [str(line[0]) for line in result["columns"]]
+                    data.append(format_rows(
+                        keys, conn.get_rows()[0], res_mode=res_mode,
+                        arrays=arrays))
 
         return data
 
@@ -1120,12 +5177,14 @@ class Server():                                 # pylint:disable=R0902,R0904
 
         if not self.is_connected():
             self.conn.reconnect()
+            self.clear_var_cache()
 
     def chg_db(self, dbn=None):
 
         """Method:  chg_db
 
-        Description:  Change to another database.
+        Description:  Change to another database, for the pooled
+            connections as well.
 
         Arguments:
             (input) dbn -> Name of database
@@ -1135,6 +5194,9 @@ class Server():                                 # pylint:disable=R0902,R0904
         if dbn:
             self.conn.database = dbn
 
+            if self.pool is not None:
+                self.pool.use(dbn)
+
     def get_name(self):
 
         """Method:  get_name
@@ -1250,9 +5312,15 @@ class Rep(Server):
         fetch_do_db
         fetch_ign_db
         verify_srv_id
+        __getattr__
+        defer_status
+        refresh
 
     """
 
+    # Status attributes loaded by refresh, deferred by a lazy connect.
+    STATUS_ATTRS = ("gtid_mode",)
+
     def __init__(                                       # pylint:disable=R0913
             self, name, server_id, sql_user, sql_pass, os_type, **kwargs):
 
@@ -1278,6 +5346,7 @@ class Rep(Server):
                 ssl_disabled -> True|False - Disable SSL.
                 ssl_verify_id -> True|False - Validate the destination host.
                 ssl_verify_cert -> True|False - Validate the CA certification.
+                driver -> connector|pure|cext or Driver instance.
 
         """
 
@@ -1295,7 +5364,8 @@ class Rep(Server):
             ssl_verify_cert=kwargs.get("ssl_verify_cert", False),
             ssl_client_cert=kwargs.get("ssl_client_cert", None),
             ssl_verify_id=kwargs.get("ssl_verify_id", False),
-            ssl_client_key=kwargs.get("ssl_client_key", None))
+            ssl_client_key=kwargs.get("ssl_client_key", None),
+            driver=kwargs.get("driver", None))
 
     def show_slv_hosts(self):
 
@@ -1341,7 +5411,7 @@ class Rep(Server):
 
         """Method:  get_serv_id
 
-        Description:  Calls the fetch_sys_var function with the class instance.
+        Description:  Returns the server's ID from the variable cache.
 
         Arguments:
             (output) Return the server's ID.
@@ -1350,13 +5420,13 @@ class Rep(Server):
 
         var = "server_id"
 
-        return int(fetch_sys_var(self, var)[var])
+        return int(self.cached_sys_var(var)[var])
 
     def get_serv_uuid(self):
 
         """Method:  get_serv_uuid
 
-        Description:  Calls the fetch_sys_var function with the class instance.
+        Description:  Returns the server's UUID from the variable cache.
 
         Arguments:
             (output) Return the server's UUID.
@@ -1365,7 +5435,7 @@ class Rep(Server):
 
         var = "server_uuid"
 
-        return fetch_sys_var(self, var)[var]
+        return self.cached_sys_var(var)[var]
 
     def fetch_do_db(self):
 
@@ -1407,6 +5477,57 @@ class Rep(Server):
 
         return self.server_id == self.get_serv_id()
 
+    def __getattr__(self, name):
+
+        """Method:  __getattr__
+
+        Description:  Called for attributes which are not set.  A status
+            attribute deferred by a lazy connect is loaded on first access.
+
+        Arguments:
+            (input) name -> Attribute name
+            (output) -> Attribute value
+
+        """
+
+        if name in type(self).STATUS_ATTRS:
+            self.refresh()
+
+            return self.__dict__[name]
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def defer_status(self):
+
+        """Method:  defer_status
+
+        Description:  Unset the status attributes, so they are loaded on
+            first access.
+
+        Arguments:
+
+        """
+
+        for name in type(self).STATUS_ATTRS:
+            self.__dict__.pop(name, None)
+
+    def refresh(self):
+
+        """Method:  refresh
+
+        Description:  Load the status attributes of the server.
+
+        Arguments:
+
+        """
+
+        # Deferred attributes are reset first, as loading them may read them.
+        for name in type(self).STATUS_ATTRS:
+            self.__dict__.setdefault(name, None)
+
+        self.set_srv_gtid()
+
 
 class MasterRep(Rep):                                   # pylint:disable=R0902
 
@@ -1422,10 +5543,16 @@ class MasterRep(Rep):                                   # pylint:disable=R0902
         connect
         show_slv_hosts
         get_log_info
+        get_log_sizes
+        exe_gtidset
         upd_mst_status
+        refresh
 
     """
 
+    STATUS_ATTRS = Rep.STATUS_ATTRS + (
+        "pos", "do_db", "file", "ign_db", "exe_gtid", "slaves")
+
     def __init__(                                       # pylint:disable=R0913
             self, name, server_id, sql_user, sql_pass, os_type, **kwargs):
 
@@ -1456,6 +5583,7 @@ class MasterRep(Rep):                                   # pylint:disable=R0902
                 ssl_disabled -> True|False - Disable SSL.
                 ssl_verify_id -> True|False - Validate the destination host.
                 ssl_verify_cert -> True|False - Validate the CA certification.
+                driver -> connector|pure|cext or Driver instance.
 
         """
 
@@ -1473,7 +5601,8 @@ class MasterRep(Rep):                                   # pylint:disable=R0902
             ssl_verify_cert=kwargs.get("ssl_verify_cert", False),
             ssl_client_key=kwargs.get("ssl_client_key", None),
             ssl_client_cert=kwargs.get("ssl_client_cert", None),
-            ssl_verify_id=kwargs.get("ssl_verify_id", False))
+            ssl_verify_id=kwargs.get("ssl_verify_id", False),
+            driver=kwargs.get("driver", None))
 
         self.pos = None
         self.do_db = None
@@ -1484,23 +5613,34 @@ class MasterRep(Rep):                                   # pylint:disable=R0902
         self.rep_japd = kwargs.get("rep_japd", None)
         self.slaves = []
 
+        # Last executed GTID set, used to parse only the changed segments.
+        self.last_gtidset = None
+
+        # Binary log sizes, see get_log_sizes.
+        self.log_sizes = None
+
     def connect(self, **kwargs):
 
         """Method:  connect
 
         Description:  Setups a connection to a replication server and updates
-            the replication attributes.
+            the replication attributes.  In lazy mode the replication
+            attributes are loaded on first access or by refresh.
 
         Arguments:
             (input) **kwargs:
                 silent -> True|False - Print connection error message.
+                lazy -> True|False - Defer loading the attributes.
 
         """
 
         super(                                          # pylint:disable=R1725
             MasterRep, self).connect(silent=kwargs.get("silent", False))
 
-        if self.conn:
+        if self.conn and kwargs.get("lazy", False):
+            self.defer_status()
+
+        elif self.conn:
             super(MasterRep, self).set_srv_gtid()       # pylint:disable=R1725
             self.upd_mst_status()
 
@@ -1531,6 +5671,45 @@ class MasterRep(Rep):                                   # pylint:disable=R0902
 
         return self.file, self.pos
 
+    def get_log_sizes(self, refresh=False):
+
+        """Method:  get_log_sizes
+
+        Description:  Return the sizes of the master's binary logs.  The
+            sizes are cached, as only the current log grows and new logs are
+            added when the logs rotate.
+
+        Arguments:
+            (input) refresh -> True|False - Fetch the sizes from the server.
+            (output) log_sizes -> Dictionary of binary log names and sizes
+
+        """
+
+        if refresh or self.log_sizes is None:
+            self.log_sizes = {row["Log_name"]: int(row["File_size"])
+                              for row in self.col_sql("show binary logs")}
+
+        return self.log_sizes
+
+    @property
+    def exe_gtidset(self):
+
+        """Method:  exe_gtidset
+
+        Description:  Return the executed GTID set of the master as a
+            FrozenGTIDSet, e.g. "mst.exe_gtidset - slv.exe_gtidset" are the
+            transactions the slave has not executed yet.
+
+        Arguments:
+            (output) -> FrozenGTIDSet of Executed_Gtid_Set
+
+        """
+
+        self.last_gtidset = frozen_gtidset(self.exe_gtid or "",
+                                           self.last_gtidset)
+
+        return self.last_gtidset
+
     def upd_mst_status(self):
 
         """Method:  upd_mst_status
@@ -1546,6 +5725,19 @@ class MasterRep(Rep):                                   # pylint:disable=R0902
         self.exe_gtid = data.get("Executed_Gtid_Set", None)
         self.slaves = self.show_slv_hosts()
 
+    def refresh(self):
+
+        """Method:  refresh
+
+        Description:  Load the GTID mode and status of the master.
+
+        Arguments:
+
+        """
+
+        super(MasterRep, self).refresh()                # pylint:disable=R1725
+        self.upd_mst_status()
+
 
 class SlaveRep(Rep):                                # pylint:disable=R0902
 
@@ -1576,9 +5768,24 @@ class SlaveRep(Rep):                                # pylint:disable=R0902
         get_others
         fetch_do_tbl
         fetch_ign_tbl
+        refresh
 
     """
 
+    STATUS_ATTRS = Rep.STATUS_ATTRS + (
+        "io_state", "mst_host", "mst_port", "conn_retry", "mst_log",
+        "mst_read_pos", "relay_log", "relay_pos", "relay_mst_log", "slv_io",
+        "slv_sql", "do_db", "ign_db", "do_tbl", "ign_tbl", "wild_do_tbl",
+        "wild_ign_tbl", "last_err", "err_msg", "skip_ctr", "exec_mst_pos",
+        "log_space", "until_cond", "until_log", "until_pos", "ssl_allow",
+        "ssl_file", "ssl_path", "ssl_cert", "ssl_cipher", "ssl_key",
+        "secs_behind", "ssl_verify", "io_err", "io_msg", "sql_err", "sql_msg",
+        "ign_ids", "mst_id", "mst_uuid", "mst_info", "sql_delay",
+        "sql_remain", "slv_sql_state", "mst_retry", "mst_bind", "io_err_time",
+        "sql_err_time", "ssl_crl", "ssl_crl_path", "retrieved_gtid",
+        "exe_gtid", "auto_pos", "run", "tran_retry", "tmp_tbl", "read_only",
+        "purged_gtidset", "retrieved_gtidset", "exe_gtidset", "slave_uuid")
+
     def __init__(                               # pylint:disable=R0915,R0913
             self, name, server_id, sql_user, sql_pass, os_type, **kwargs):
 
@@ -1609,6 +5816,7 @@ class SlaveRep(Rep):                                # pylint:disable=R0902
                 ssl_disabled -> True|False - Disable SSL.
                 ssl_verify_id -> True|False - Validate the destination host.
                 ssl_verify_cert -> True|False - Validate the CA certification.
+                driver -> connector|pure|cext or Driver instance.
 
         """
 
@@ -1626,7 +5834,8 @@ class SlaveRep(Rep):                                # pylint:disable=R0902
             ssl_verify_id=kwargs.get("ssl_verify_id", False),
             ssl_client_cert=kwargs.get("ssl_client_cert", None),
             ssl_verify_cert=kwargs.get("ssl_verify_cert", False),
-            ssl_client_key=kwargs.get("ssl_client_key", None))
+            ssl_client_key=kwargs.get("ssl_client_key", None),
+            driver=kwargs.get("driver", None))
 
         self.io_state = None
         self.mst_host = None
@@ -1699,18 +5908,23 @@ class SlaveRep(Rep):                                # pylint:disable=R0902
         """Method:  connect
 
         Description:  Setups a connection to a replication server and updates
-            the slave replication attributes.
+            the slave replication attributes.  In lazy mode the slave
+            replication attributes are loaded on first access or by refresh.
 
         Arguments:
             (input) **kwargs:
                 silent -> True|False - Print connection error message.
+                lazy -> True|False - Defer loading the attributes.
 
         """
 
         super(                                          # pylint:disable=R1725
             SlaveRep, self).connect(silent=kwargs.get("silent", False))
 
-        if self.conn:
+        if self.conn and kwargs.get("lazy", False):
+            self.defer_status()
+
+        elif self.conn:
             super(SlaveRep, self).set_srv_gtid()        # pylint:disable=R1725
             self.upd_slv_status()
 
@@ -1817,10 +6031,10 @@ class SlaveRep(Rep):                                # pylint:disable=R0902
         slave = "Replica" if self.version >= (8, 0, 22) else "Slave"
 
         # Semantic change in MySQL 8.0.26
-        slave2 = "replica" if self.version >= (8, 0, 26) else "slave"
         slave3 = "Replica" if self.version >= (8, 0, 26) else "Slave"
 
-        data = show_slave_stat(self)[0]
+        slv_stat, applier, status, sys_vars = fetch_slv_status(self)
+        data = slv_stat[0]
         self.io_state = data[slave + "_IO_State"]
         self.mst_host = data[master + "_Host"]
         self.mst_port = data[master + "_Port"]
@@ -1907,42 +6121,43 @@ class SlaveRep(Rep):                                # pylint:disable=R0902
         self.auto_pos = data.get("Auto_Position", None)
 
         # tran_retry
-        item = "SERVICE_STATE"
-        self.run = self.col_sql(
-            f"select {item} from"
-            f" performance_schema.replication_applier_status")[0][item]
-        ctr = "COUNT_TRANSACTIONS_RETRIES"
-        self.tran_retry = self.col_sql(
-            f"select {ctr} from"
-            f" performance_schema.replication_applier_status")[0][ctr]
+        self.run = applier[0]["SERVICE_STATE"]
+        self.tran_retry = applier[0]["COUNT_TRANSACTIONS_RETRIES"]
 
-        self.tmp_tbl = fetch_global_var(
-            self, slave2 + "_open_temp_tables")[slave3 + "_open_temp_tables"]
-        self.read_only = fetch_sys_var(self, "read_only")["read_only"]
+        self.tmp_tbl = status[slave3 + "_open_temp_tables"]
+        self.read_only = sys_vars["read_only"]
 
-        self.upd_gtid_pos()
-        self.slave_uuid = self.get_serv_uuid()
+        self.upd_gtid_pos(data=data, purged=sys_vars.get("gtid_purged"))
+        self.slave_uuid = sys_vars["server_uuid"]
 
-    def upd_gtid_pos(self):
+    def upd_gtid_pos(self, **kwargs):
 
         """Method:  upd_gtid_pos
 
-        Description:  Update the GTIDSet class GTID positions.
+        Description:  Update the GTIDSet class GTID positions.  The slave
+            status and purged GTID set already fetched by the caller can be
+            passed in, otherwise they are fetched from the server.
 
         Arguments:
+            (input) **kwargs:
+                data -> Row of the show slave status command
+                purged -> Value of the gtid_purged variable
 
         """
 
-        data = show_slave_stat(self)[0]
-        self.retrieved_gtidset = GTIDSet(data.get("Retrieved_Gtid_Set",
-                                                  "0:0") or "0:0")
-        self.exe_gtidset = GTIDSet(data.get("Executed_Gtid_Set", "0:0") or
-                                   "0:0")
+        data = kwargs.get("data") or show_slave_stat(self)[0]
+        self.retrieved_gtidset = frozen_gtidset(
+            data.get("Retrieved_Gtid_Set", "0:0") or "0:0",
+            self.retrieved_gtidset)
+        self.exe_gtidset = frozen_gtidset(
+            data.get("Executed_Gtid_Set", "0:0") or "0:0", self.exe_gtidset)
 
         # Handle MySQL 5.5 or 5.6 servers.
         if self.gtid_mode:
-            self.purged_gtidset = GTIDSet(fetch_sys_var(
-                self, "GTID_PURGED", level="global")["gtid_purged"] or "0:0")
+            purged = kwargs["purged"] if "purged" in kwargs else fetch_sys_var(
+                self, "GTID_PURGED", level="global")["gtid_purged"]
+            self.purged_gtidset = frozen_gtidset(
+                purged or "0:0", self.purged_gtidset)
 
     def is_slave_up(self):
 
@@ -2120,3 +6335,16 @@ class SlaveRep(Rep):                                # pylint:disable=R0902
 
         return gen_libs.list_2_dict(
             gen_libs.str_2_list(self.ign_tbl, ",")) if self.ign_tbl else []
+
+    def refresh(self):
+
+        """Method:  refresh
+
+        Description:  Load the GTID mode and status of the slave.
+
+        Arguments:
+
+        """
+
+        super(SlaveRep, self).refresh()                 # pylint:disable=R1725
+        self.upd_slv_status()
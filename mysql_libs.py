@@ -16,12 +16,16 @@
         crt_cmd
         disconnect
         fetch_db_dict
+        fetch_exe_gtidset
         fetch_logs
         fetch_slv
+        fleet_rep_chk
         fetch_tbl_dict
+        find_errant_trx
         find_name
         get_all_dbs_tbls
         get_db_tbl
+        gtid_inject_stmts
         is_cfg_valid
         is_logs_synced
         is_rep_delay
@@ -31,6 +35,7 @@
         purge_bin_logs
         reset_master
         reset_slave
+        rep_lag_bytes
         select_wait_until
         start_slave_until
         switch_to_master
@@ -46,6 +51,7 @@
 # Libraries and Global Variables
 
 # Standard
+import concurrent.futures
 import time
 import mysql.connector
 
@@ -269,17 +275,27 @@ def create_slv_array(cfg_array, add_down=True, **kwargs):
     """Function:  create_slv_array
 
     Description:  Creates an array of instances from a configuration array.
+        The slaves can be connected to concurrently by a bounded number of
+        worker threads, each connection attempt limited by a connect
+        timeout.  Each slave's connect latency is kept in its conn_time
+        attribute.  In lazy mode the slaves' replication attributes are
+        loaded on first access.
 
     Arguments:
         (input) cfg_array -> List of configurations.
         (input) add_down -> True|False - Add any down slaves to the array.
         (input) **kwargs:
             silent -> True|False - Print connection error message.
+            max_workers -> Number of slaves to connect to concurrently.
+            connect_timeout -> Seconds to wait for a slave to connect.
+            lazy -> True|False - Defer loading the replication attributes.
         (output) slaves -> List of slave replication instances.
 
     """
 
     cfg_array = list(cfg_array)
+    conn_args = {"silent": kwargs.get("silent", False)}
+    max_workers = kwargs.get("max_workers", 1)
     slaves = []
 
     for slv in cfg_array:
@@ -300,12 +316,26 @@ def create_slv_array(cfg_array, add_down=True, **kwargs):
             ssl_disabled=slv.get("ssl_disabled", False),
             ssl_verify_id=slv.get("ssl_verify_id", False),
             ssl_verify_cert=slv.get("ssl_verify_cert", False))
-        slv_inst.connect(silent=kwargs.get("silent", False))
 
-        if add_down or slv_inst.conn:
-            slaves.append(slv_inst)
+        if kwargs.get("connect_timeout"):
+            slv_inst.config["connection_timeout"] = kwargs["connect_timeout"]
 
-    return slaves
+        slaves.append(slv_inst)
+
+    if kwargs.get("lazy", False):
+        conn_args["lazy"] = True
+
+    if max_workers > 1 and len(slaves) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(slaves))) as pool:
+            list(pool.map(lambda slv_inst: slv_inst.connect(**conn_args),
+                          slaves))
+
+    else:
+        for slv_inst in slaves:
+            slv_inst.connect(**conn_args)
+
+    return [slv_inst for slv_inst in slaves if add_down or slv_inst.conn]
 
 
 def crt_cmd(server, prog_name):
@@ -376,6 +406,25 @@ def fetch_db_dict(server):
     return server.col_sql("show databases")
 
 
+def fetch_exe_gtidset(server):
+
+    """Function:  fetch_exe_gtidset
+
+    Description:  Return the executed GTID set of a server from the global
+        gtid_executed variable, which is the Executed_Gtid_Set of both
+        master and slave servers.
+
+    Arguments:
+        (input) server -> Server instance.
+        (output) FrozenGTIDSet of the executed GTID set.
+
+    """
+
+    data = mysql_class.fetch_sys_var(server, "gtid_executed", level="global")
+
+    return mysql_class.frozen_gtidset(data.get("gtid_executed") or "")
+
+
 def fetch_logs(server):
 
     """Function:  fetch_logs
@@ -422,6 +471,31 @@ def fetch_slv(slaves, slv_name):
     return slv, err_flag, err_msg
 
 
+def fleet_rep_chk(mst, slaves, opt="SQL"):
+
+    """Function:  fleet_rep_chk
+
+    Description:  Does an IO or SQL thread check of a list of slaves against
+        the master in one pass using GTID sets.  The slaves' retrieved (IO)
+        or executed (SQL) GTID sets are compared with the master's executed
+        GTID set.
+        NOTE:  Requires the NumPy package.
+
+    Arguments:
+        (input) mst -> Master instance.
+        (input) slaves -> List of Slave instances.
+        (input) opt -> IO|SQL - Determines which thread to check.
+        (output) FleetCompare instance with one entry per slave.
+
+    """
+
+    attr = "retrieved_gtid" if opt == "IO" else "exe_gtid"
+    gtidsets = [mysql_class.frozen_gtidset(getattr(slv, attr) or "")
+                for slv in slaves]
+
+    return mysql_class.compare_fleet(mst.exe_gtidset, gtidsets)
+
+
 def fetch_tbl_dict(server, dbn, tbl_type="BASE TABLE"):
 
     """Function:  fetch_tbl_dict
@@ -443,6 +517,64 @@ def fetch_tbl_dict(server, dbn, tbl_type="BASE TABLE"):
     return server.col_sql(qry)
 
 
+def find_errant_trx(mst, slaves, inject=False, **kwargs):
+
+    """Function:  find_errant_trx
+
+    Description:  Locates errant transactions in a replication set, i.e.
+        transactions executed on a slave which the master does not have.
+        The executed GTID sets of the master and slaves are fetched, up to
+        max_workers at a time, and each slave's errant set is the slave's
+        set minus the master's set.
+
+    Arguments:
+        (input) mst -> Master instance.
+        (input) slaves -> List of slave instances.
+        (input) inject -> True|False - Add the statements to inject empty
+            transactions on the master for the errant transactions.
+        (input) **kwargs:
+            max_workers -> Maximum number of concurrent fetches (default 1).
+        (output) errants -> List of dictionaries for the slaves with errant
+            transactions:
+                {"Name": slave name, "Errant": errant GTID set string,
+                 "Gtids": {UUID: [(start, end), ...]},
+                 "Count": number of errant transactions,
+                 "Statements": list of injection statements (if inject)}
+
+    """
+
+    slaves = list(slaves)
+    errants = []
+    servers = [mst] + slaves
+    max_workers = kwargs.get("max_workers", 1)
+
+    if max_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(servers))) as pool:
+            gtidsets = list(pool.map(fetch_exe_gtidset, servers))
+
+    else:
+        gtidsets = [fetch_exe_gtidset(server) for server in servers]
+
+    mst_gtidset = gtidsets.pop(0)
+
+    for slv, gtidset in zip(slaves, gtidsets):
+        errant = gtidset - mst_gtidset
+        cnt = errant.count()
+
+        if cnt:
+            data = {"Name": slv.name, "Errant": str(errant),
+                    "Gtids": {uuid: list(rngs) for uuid, rngs
+                              in errant.gtids.items()}, "Count": cnt}
+
+            if inject:
+                data["Statements"] = list(gtid_inject_stmts(errant))
+
+            errants.append(data)
+
+    return errants
+
+
 def find_name(slaves, name):
 
     """Function:  find_name
@@ -542,6 +674,33 @@ def get_db_tbl(server, db_list, **kwargs):
     return db_dict
 
 
+def gtid_inject_stmts(gtidset):
+
+    """Function:  gtid_inject_stmts
+
+    Description:  Generates the statements which inject an empty transaction
+        for each GTID in a GTID set.  Run on the master, they neutralize
+        errant transactions on a slave as the empty transactions replicate
+        to the rest of the replication set.
+        NOTE:  One transaction per GTID, large ranges generate a large
+            number of statements.
+
+    Arguments:
+        (input) gtidset -> GTIDSet instance.
+        (output) Generator of SQL statements.
+
+    """
+
+    for uuid, rngs in sorted(gtidset.intervals.items()):
+        for start, end in rngs:
+            for gno in range(start, end + 1):
+                yield f"SET GTID_NEXT='{uuid}:{gno}'"
+                yield "BEGIN"
+                yield "COMMIT"
+
+    yield "SET GTID_NEXT='AUTOMATIC'"
+
+
 def is_cfg_valid(servers):
 
     """Function:  is_cfg_valid
@@ -757,6 +916,40 @@ def reset_slave(server):
     server.cmd_sql("reset " + slave + " all")
 
 
+def rep_lag_bytes(mst, slv, opt="SQL"):
+
+    """Function:  rep_lag_bytes
+
+    Description:  Return the number of bytes of the master's binary logs the
+        slave has not read (IO) or executed (SQL) yet.  Uses the master's
+        cached binary log sizes, which are fetched again if the master's
+        current log is not in the cache.
+
+    Arguments:
+        (input) mst -> Master instance.
+        (input) slv -> Slave instance.
+        (input) opt -> IO|SQL - Determines which thread to check.
+        (output) Number of bytes the slave is behind the master.
+
+    """
+
+    if opt == "IO":
+        slv_pos = mysql_class.Position(slv.mst_log, slv.mst_read_pos)
+
+    else:
+        slv_pos = mysql_class.Position(slv.relay_mst_log, slv.exec_mst_pos)
+
+    mst_pos = mysql_class.Position(mst.file, mst.pos)
+    log_sizes = mst.get_log_sizes()
+
+    # The logs before the master's current log are closed, so their cached
+    #   sizes are final once the current log is in the cache.
+    if mst.file not in log_sizes:
+        log_sizes = mst.get_log_sizes(refresh=True)
+
+    return slv_pos.distance(mst_pos, log_sizes)
+
+
 def select_wait_until(server, gtid_pos, timeout=0):
 
     """Function:  select_wait_until
@@ -0,0 +1,239 @@
+# Classification (U)
+
+"""Program:  batch_sql.py
+
+    Description:  Benchmark of Server.batch_sql in mysql_class.py.  Times a
+        list of status commands sent as one batch_sql request against
+        sending them one at a time with col_sql and vert_sql, over a stub
+        connection which adds a fixed network round trip time to each
+        request.
+
+    Usage:
+        test/benchmark/mysql_class/batch_sql.py [commands] [rtt_ms]
+
+    Arguments:
+        commands -> Number of commands in the batch (default 10).
+        rtt_ms -> Round trip time per request in milliseconds (default 5).
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import timeit
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+KEYS = ["Variable_name", "Value"]
+ROWS = [(f"Status_{num}", str(num)) for num in range(20)]
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a mysql.connector cursor.
+
+    Methods:
+        __init__
+        __iter__
+        execute
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Iterate over the rows of the result set.
+
+        Arguments:
+
+        """
+
+        return iter(ROWS)
+
+    def execute(self, cmd, params=None):      # pylint:disable=W0613
+
+        """Method:  execute
+
+        Description:  Execute a command in one round trip.
+
+        Arguments:
+
+        """
+
+        self.conn.round_trip()
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection which
+        sleeps for the round trip time on each request.
+
+    Methods:
+        __init__
+        round_trip
+        cmd_query
+        cmd_query_iter
+        get_rows
+        cursor
+
+    """
+
+    def __init__(self, rtt):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) rtt -> Round trip time in seconds
+
+        """
+
+        self.rtt = rtt
+
+    def round_trip(self):
+
+        """Method:  round_trip
+
+        Description:  Wait for the round trip time.
+
+        Arguments:
+
+        """
+
+        time.sleep(self.rtt)
+
+    def cmd_query(self, cmd):                 # pylint:disable=W0613
+
+        """Method:  cmd_query
+
+        Description:  Execute a command in one round trip.
+
+        Arguments:
+
+        """
+
+        self.round_trip()
+
+        return {"columns": [(key,) for key in KEYS]}
+
+    def cmd_query_iter(self, stmts):
+
+        """Method:  cmd_query_iter
+
+        Description:  Execute a multi-statement request in one round trip.
+
+        Arguments:
+
+        """
+
+        self.round_trip()
+
+        for _ in stmts.split("; "):
+            yield {"columns": [(key,) for key in KEYS]}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Return the rows of the result set.
+
+        Arguments:
+
+        """
+
+        return ROWS, {}
+
+    def cursor(self):
+
+        """Method:  cursor
+
+        Description:  Return a cursor.
+
+        Arguments:
+
+        """
+
+        return Cursor(self)
+
+
+def sequential(server, cmds):
+
+    """Function:  sequential
+
+    Description:  Execute the commands one at a time.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) cmds -> List of SQL commands or (cmd, vert) tuples
+        (output) List of results of the sql executed
+
+    """
+
+    return [server.col_sql(cmd) if isinstance(cmd, str)
+            else server.vert_sql(cmd[0]) for cmd in cmds]
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the time per set of commands.
+
+    Variables:
+        commands -> Number of commands in the batch
+        rtt_ms -> Round trip time per request in milliseconds
+
+    Arguments:
+
+    """
+
+    commands = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    rtt_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+
+    server = mysql_class.Server(
+        "Server", 10, "user", "japd", getattr(machine, "Linux")())
+    server.conn = Conn(rtt_ms / 1e3)
+    cmds = [f"show status like 'Status_{num}%'" if num % 2
+            else (f"show global status like 'Status_{num}%'", "vert")
+            for num in range(commands)]
+
+    seq_tm = min(timeit.repeat(lambda: sequential(server, cmds),
+                               number=5, repeat=3)) / 5 * 1e3
+    batch_tm = min(timeit.repeat(lambda: server.batch_sql(cmds),
+                                 number=5, repeat=3)) / 5 * 1e3
+
+    print(f"{'commands':>10} {'rtt (ms)':>10} {'sequential (ms)':>16} "
+          f"{'batch (ms)':>12} {'speedup':>8}")
+    print(f"{commands:>10} {rtt_ms:>10.1f} {seq_tm:>16.2f} "
+          f"{batch_tm:>12.2f} {seq_tm / batch_tm:>7.2f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  compare_fleet.py
+
+    Description:  Benchmark of compare_fleet in mysql_class.py.  Times one
+        compare_fleet call against calling compare_sets and counting the
+        differences for each replica of a replica fleet.
+
+    Usage:
+        test/benchmark/mysql_class/compare_fleet.py [replicas]
+
+    Arguments:
+        replicas -> Number of replicas in the fleet (default 1000).
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import random
+import timeit
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+UUIDS = ["35588520-333d-11e8-a55d-005056a1b2c3",
+         "76012896-4e6a-11e8-8e2e-005056a1b2c3",
+         "a1c2e3f4-1111-11e8-8e2e-005056a1b2c3"]
+
+
+def make_fleet(replicas):
+
+    """Function:  make_fleet
+
+    Description:  Create a master GTID set and the GTID sets of a replica
+        fleet, with replicas behind, equal and with errant transactions.
+
+    Arguments:
+        (input) replicas -> Number of replicas
+        (output) master -> GTIDSet of the master
+        (output) fleet -> List of GTIDSets of the replicas
+
+    """
+
+    rnd = random.Random(20261018)
+    master = mysql_class.GTIDSet(
+        ",".join(f"{uuid}:1-2000000" for uuid in UUIDS))
+    fleet = []
+
+    for _ in range(replicas):
+        segs = [f"{uuid}:1-{rnd.randint(1999000, 2000000)}" for uuid in UUIDS]
+
+        if rnd.random() < 0.05:
+            segs.append(f"{rnd.choice(UUIDS)}:2000010-2000012")
+
+        fleet.append(mysql_class.GTIDSet(",".join(segs)))
+
+    return master, fleet
+
+
+def compare_loop(master, fleet):
+
+    """Function:  compare_loop
+
+    Description:  Compare the master with each replica in turn.
+
+    Arguments:
+        (input) master -> GTIDSet of the master
+        (input) fleet -> List of GTIDSets of the replicas
+        (output) List of (lcheck, rcheck, missing, extra) tuples
+
+    """
+
+    return [mysql_class.compare_sets(master, gtid)
+            + ((master - gtid).count(), (gtid - master).count())
+            for gtid in fleet]
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the time per sweep.
+
+    Variables:
+        replicas -> Number of replicas in the fleet
+
+    Arguments:
+
+    """
+
+    replicas = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    master, fleet = make_fleet(replicas)
+
+    loop_tm = min(timeit.repeat(lambda: compare_loop(master, fleet),
+                                number=5, repeat=3)) / 5 * 1e3
+    fleet_tm = min(timeit.repeat(
+        lambda: mysql_class.compare_fleet(master, fleet),
+        number=5, repeat=3)) / 5 * 1e3
+
+    print(f"{'replicas':>10} {'loop (ms)':>12} {'fleet (ms)':>12} "
+          f"{'speedup':>8}")
+    print(f"{replicas:>10} {loop_tm:>12.2f} {fleet_tm:>12.2f} "
+          f"{loop_tm / fleet_tm:>7.2f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  gtidset_bytes.py
+
+    Description:  Benchmark of the GTIDSet binary format in mysql_class.py.
+        Compares the pickled size and the loaded memory of the GTID sets of a
+        replica fleet in the previous dictionary of lists of tuples format
+        against the GTIDSet.to_bytes format.
+
+    Usage:
+        test/benchmark/mysql_class/gtidset_bytes.py [replicas]
+
+    Arguments:
+        replicas -> Number of replicas in the fleet (default 500).
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import pickle
+import random
+import tracemalloc
+import uuid
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def make_fleet(replicas):
+
+    """Function:  make_fleet
+
+    Description:  Create the executed GTID set strings of a replica fleet,
+        sharing one set of UUIDs with a few gaps in each set.
+
+    Arguments:
+        (input) replicas -> Number of replicas
+        (output) List of GTID set strings
+
+    """
+
+    rnd = random.Random(20261018)
+    uuids = [str(uuid.UUID(int=rnd.getrandbits(128))) for _ in range(8)]
+    fleet = []
+
+    for _ in range(replicas):
+        segs = []
+
+        for srv_uuid in uuids:
+            end = rnd.randint(1000000, 2000000)
+            gap = rnd.randint(10, end - 10)
+            segs.append(f"{srv_uuid}:1-{gap}:{gap + 2}-{end}")
+
+        fleet.append(",\n".join(segs))
+
+    return fleet
+
+
+def measure(loader, blobs):
+
+    """Function:  measure
+
+    Description:  Load the blobs and return the memory held by the results.
+
+    Arguments:
+        (input) loader -> Function to load a blob
+        (input) blobs -> List of blobs
+        (output) Bytes of memory allocated
+
+    """
+
+    tracemalloc.start()
+    data = [loader(blob) for blob in blobs]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del data
+
+    return size
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the sizes.
+
+    Variables:
+        replicas -> Number of replicas in the fleet
+
+    Arguments:
+
+    """
+
+    replicas = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    sets = [mysql_class.GTIDSet(raw) for raw in make_fleet(replicas)]
+
+    old_blobs = [pickle.dumps({uuid: list(rngs) for uuid, rngs
+                               in gtid.gtids.items()}) for gtid in sets]
+    new_blobs = [gtid.to_bytes() for gtid in sets]
+
+    old_ipc = sum(len(blob) for blob in old_blobs)
+    new_ipc = sum(len(blob) for blob in new_blobs)
+    old_mem = measure(pickle.loads, old_blobs)
+    new_mem = measure(mysql_class.GTIDSet.from_bytes, new_blobs)
+
+    print(f"{'':>12} {'dict (KiB)':>12} {'bytes (KiB)':>12} {'ratio':>8}")
+    print(f"{'ipc size':>12} {old_ipc / 1024:>12.1f} {new_ipc / 1024:>12.1f} "
+          f"{old_ipc / new_ipc:>7.1f}x")
+    print(f"{'memory':>12} {old_mem / 1024:>12.1f} {new_mem / 1024:>12.1f} "
+          f"{old_mem / new_mem:>7.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# Classification (U)
+
+"""Program:  gtidset_parse.py
+
+    Description:  Micro-benchmark of the GTID set string parser in
+        mysql_class.py.  Times GTIDSet.__init__ against the previous
+        split based parser for GTID sets of 1, 100 and 5000 intervals.
+
+    Usage:
+        test/benchmark/mysql_class/gtidset_parse.py [loops]
+
+    Arguments:
+        loops -> Number of times each GTID set is parsed (default 100).
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import timeit
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+UUIDS = ["35588520-333d-11e8-a55d-005056a1b2c3",
+         "76012896-4e6a-11e8-8e2e-005056a1b2c3"]
+
+
+def split_parse(obj):
+
+    """Function:  split_parse
+
+    Description:  Previous GTID set string parser, which splits each range
+        into a tuple and sorts and merges the ranges afterwards.
+
+    Arguments:
+        (input) obj -> GTID set string
+        (output) intervals -> Dictionary of UUIDs to GTIDIntervals
+
+    """
+
+    intervals = {}
+
+    for uuid_set in obj.split(","):
+        parts = uuid_set.split(":")
+        uuid = parts.pop(0)
+
+        if len(parts) == 0 or not parts[0]:
+            raise ValueError("At least one range has to be provided.")
+
+        rngs = [tuple(int(x) for x in part.split("-")) for part in parts]
+
+        for rng in rngs:
+            if len(rng) > 2 or len(rng) == 2 and int(rng[0]) > int(rng[1]):
+                raise ValueError(f"Range {rng} is not a valid range.")
+
+        intervals[uuid] = mysql_class.GTIDIntervals(rngs)
+
+    return intervals
+
+
+def make_gtid_str(count):
+
+    """Function:  make_gtid_str
+
+    Description:  Create a GTID set string, as returned by MySQL, with count
+        intervals spread across the UUIDs.
+
+    Arguments:
+        (input) count -> Number of intervals
+        (output) GTID set string
+
+    """
+
+    segs = []
+
+    for pos, uuid in enumerate(UUIDS):
+        num = count // len(UUIDS) + (1 if pos < count % len(UUIDS) else 0)
+
+        if num:
+            segs.append(uuid + ":" + ":".join(
+                f"{idx * 10 + 1}-{idx * 10 + 5}" for idx in range(num)))
+
+    return ",\n".join(segs)
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the time per parse.
+
+    Variables:
+        loops -> Number of times each GTID set is parsed
+
+    Arguments:
+
+    """
+
+    loops = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    print(f"{'intervals':>10} {'split (us)':>12} {'stream (us)':>12} "
+          f"{'speedup':>8}")
+
+    for count in (1, 100, 5000):
+        raw = make_gtid_str(count)
+        old = split_parse(raw.replace("\n", ""))
+        new = mysql_class.GTIDSet(raw)
+
+        if {uuid: tuple(rngs) for uuid, rngs in old.items()} != new.gtids:
+            print(f"Mismatch in results for {count} intervals")
+            sys.exit(1)
+
+        old_tm = min(timeit.repeat(
+            lambda raw=raw.replace("\n", ""): split_parse(raw),
+            number=loops, repeat=5)) / loops * 1e6
+        new_tm = min(timeit.repeat(
+            lambda raw=raw: mysql_class.GTIDSet(raw),
+            number=loops, repeat=5)) / loops * 1e6
+
+        print(f"{count:>10} {old_tm:>12.1f} {new_tm:>12.1f} "
+              f"{old_tm / new_tm:>7.2f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# Classification (U)
+
+"""Program:  row_decoding.py
+
+    Description:  Benchmark of the row decoding throughput of the database
+        drivers in mysql_class.py on a large result set.
+
+        Without a server, a result set in the MySQL text protocol format is
+        decoded with the pure Python mysql.connector converter, which is
+        the work done by the pure Python connection's get_rows, and in raw
+        mode with RawRow rows reading two of the columns.
+
+        With a server, the result set is generated by the server and read
+        with col_sql through each available driver:  pure, cext (when the
+        C extension is installed) and PyMySQL (when installed), and in raw
+        mode through the mysql.connector drivers.
+
+    Usage:
+        test/benchmark/mysql_class/row_decoding.py [rows] [host user japd]
+
+    Arguments:
+        rows -> Number of rows in the result set (default 100000).
+        host user japd -> MySQL server host, user and password for the
+            server benchmark.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+FIELD = mysql.connector.constants.FieldType
+COLUMNS = [
+    ("id", FIELD.LONGLONG, None, None, None, None, 0, 0, 63),
+    ("name", FIELD.VAR_STRING, None, None, None, None, 1, 0, 45),
+    ("amount", FIELD.NEWDECIMAL, None, None, None, None, 1, 0, 63),
+    ("ratio", FIELD.DOUBLE, None, None, None, None, 1, 0, 63),
+    ("created", FIELD.DATETIME, None, None, None, None, 1, 0, 63),
+    ("state", FIELD.VAR_STRING, None, None, None, None, 1, 0, 45),
+    ("cnt", FIELD.LONG, None, None, None, None, 1, 0, 63),
+    ("note", FIELD.VAR_STRING, None, None, None, None, 1, 0, 45)]
+QUERY = (
+    "with recursive seq (n) as (select 1 union all select n + 1 from seq"
+    " where n < {rows}) select n id, concat('name', n) name,"
+    " cast(n * 1.25 as decimal(12, 2)) amount, n / 7 ratio,"
+    " now() + interval n second created, elt(n % 3 + 1, 'ON', 'OFF', 'NA')"
+    " state, n % 1000 cnt, repeat('x', 40) note from seq")
+
+
+def text_rows(rows):
+
+    """Function:  text_rows
+
+    Description:  Create a result set in the MySQL text protocol format.
+
+    Arguments:
+        (input) rows -> Number of rows
+        (output) List of rows of bytes values
+
+    """
+
+    return [(str(num).encode(), f"name{num}".encode(),
+             f"{num * 1.25:.2f}".encode(), str(num / 7).encode(),
+             b"2026-10-18 12:00:00", (b"ON", b"OFF", b"NA")[num % 3],
+             str(num % 1000).encode(), b"x" * 40) for num in range(rows)]
+
+
+def rate(func, rows):
+
+    """Function:  rate
+
+    Description:  Return the rows per second of a decoding function, best
+        of three runs.
+
+    Arguments:
+        (input) func -> Function which decodes the result set
+        (input) rows -> Number of rows in the result set
+        (output) Rows decoded per second
+
+    """
+
+    best = None
+
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return rows / best
+
+
+def offline(rows):
+
+    """Function:  offline
+
+    Description:  Return the decoding rates of a text protocol result set.
+
+    Arguments:
+        (input) rows -> Number of rows in the result set
+        (output) List of (backend, rows per second) tuples
+
+    """
+
+    data = text_rows(rows)
+    converter = mysql.connector.conversion.MySQLConverter("utf8")
+
+    def pure():
+        return [converter.row_to_python(row, COLUMNS) for row in data]
+
+    def raw():
+        header = mysql_class.RawHeader(COLUMNS, converter)
+
+        return [(row["id"], row["state"]) for row in map(header.row, data)]
+
+    return [("pure converter", rate(pure, rows)),
+            ("raw, 2 of 8 columns", rate(raw, rows))]
+
+
+def drivers():
+
+    """Function:  drivers
+
+    Description:  Return the available drivers.
+
+    Arguments:
+        (output) List of (name, Driver instance) tuples
+
+    """
+
+    data = [("pure", mysql_class.get_driver("pure"))]
+
+    if mysql.connector.HAVE_CEXT:
+        data.append(("cext", mysql_class.get_driver("cext")))
+
+    try:
+        import pymysql                          # pylint:disable=C0415
+
+        data.append(("pymysql", mysql_class.DBAPIDriver(pymysql)))
+
+    except ImportError:
+        pass
+
+    return data
+
+
+def online(rows, host, user, japd):
+
+    """Function:  online
+
+    Description:  Return the rates of reading a server generated result set
+        with col_sql through each driver.
+
+    Arguments:
+        (input) rows -> Number of rows in the result set
+        (input) host -> MySQL server host
+        (input) user -> MySQL user
+        (input) japd -> MySQL user's password
+        (output) List of (backend, rows per second) tuples
+
+    """
+
+    data = []
+    cmd = QUERY.format(rows=rows)
+
+    for name, driver in drivers():
+        server = mysql_class.Server(
+            "Server", 1, user, japd, getattr(machine, "Linux")(), host=host,
+            driver=driver)
+        server.set_pass_config()
+        server.connect()
+        server.cmd_sql(f"set session cte_max_recursion_depth = {rows}")
+        data.append((name, rate(lambda: server.col_sql(cmd), rows)))
+
+        if not isinstance(driver, mysql_class.DBAPIDriver):
+            data.append((f"{name} raw, 2 of 8 columns", rate(
+                lambda: [(row["id"], row["state"])
+                         for row in server.col_sql(cmd, raw=True)], rows)))
+
+        server.disconnect()
+
+    return data
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the rows decoded per second.
+
+    Variables:
+        rows -> Number of rows in the result set
+
+    Arguments:
+
+    """
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print(f"{'backend':>30} {'rows':>10} {'rows/s':>12}")
+
+    for name, value in offline(rows):
+        print(f"{name:>30} {rows:>10} {value:>12.0f}")
+
+    if len(sys.argv) > 4:
+        for name, value in online(rows, *sys.argv[2:5]):
+            print(f"{'server ' + name:>30} {rows:>10} {value:>12.0f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,29 +9,87 @@ coverage erase
 echo ""
 echo "Running unit test modules in conjunction with coverage"
 coverage run -a --source=mysql_class test/unit/mysql_class/fetch_global_var.py
+coverage run -a --source=mysql_class test/unit/mysql_class/fetch_slv_status.py
 coverage run -a --source=mysql_class test/unit/mysql_class/fetch_sys_var.py
+coverage run -a --source=mysql_class test/unit/mysql_class/fetch_sys_vars.py
 coverage run -a --source=mysql_class test/unit/mysql_class/flush_logs.py
+coverage run -a --source=mysql_class test/unit/mysql_class/format_rows.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozen_gtidset.py
+coverage run -a --source=mysql_class test/unit/mysql_class/get_driver.py
 coverage run -a --source=mysql_class test/unit/mysql_class/show_master_stat.py
 coverage run -a --source=mysql_class test/unit/mysql_class/show_slave_hosts.py
 coverage run -a --source=mysql_class test/unit/mysql_class/show_slave_stat.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slave_start.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slave_stop.py
+coverage run -a --source=mysql_class test/unit/mysql_class/sys_var_name.py
+coverage run -a --source=mysql_class test/unit/mysql_class/compare_sets.py
+coverage run -a --source=mysql_class test/unit/mysql_class/compare_fleet.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_or.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_init.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_str.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_union.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_eq.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_frombytes.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_ge.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_gt.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_le.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_lt.py
 coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_ne.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_contains.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_count.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_advance.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_difference.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_intersection.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_sub.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_tobytes.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidset_and.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidintervals_init.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidintervals_append.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidintervals_contains.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidintervals_count.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidintervals_union.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidintervals_difference.py
+coverage run -a --source=mysql_class test/unit/mysql_class/gtidintervals_intersection.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozengtidset_init.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozengtidset_str.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozengtidset_hash.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozengtidset_union.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozengtidset_or.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozengtidset_sub.py
+coverage run -a --source=mysql_class test/unit/mysql_class/frozengtidset_and.py
+coverage run -a --source=mysql_class test/unit/mysql_class/connectionpool_get.py
+coverage run -a --source=mysql_class test/unit/mysql_class/connectionpool_release.py
+coverage run -a --source=mysql_class test/unit/mysql_class/connectionpool_close.py
+coverage run -a --source=mysql_class test/unit/mysql_class/dbapidriver_connect.py
+coverage run -a --source=mysql_class test/unit/mysql_class/dbapiconn_cmdquery.py
+coverage run -a --source=mysql_class test/unit/mysql_class/dbapiconn_cursor.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statementcache_cursor.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statementcache_checked.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statementcache_execute.py
+coverage run -a --source=mysql_class test/unit/mysql_class/rawheader_decoder.py
+coverage run -a --source=mysql_class test/unit/mysql_class/rawrow_getitem.py
+coverage run -a --source=mysql_class test/unit/mysql_class/serversnapshot_init.py
+coverage run -a --source=mysql_class test/unit/mysql_class/serversnapshot_collect.py
+coverage run -a --source=mysql_class test/unit/mysql_class/serversnapshot_srvstat.py
+coverage run -a --source=mysql_class test/unit/mysql_class/serversnapshot_srvperf.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statussampler_add.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statussampler_delta.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statussampler_rate.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statussampler_pct.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statuspoller_init.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statuspoller_poll.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statuspoller_start.py
+coverage run -a --source=mysql_class test/unit/mysql_class/statuspoller_staleness.py
 coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_connect.py
 coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_init.py
 coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_showslvhosts.py
 coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_getloginfo.py
+coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_getlogsizes.py
+coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_exegtidset.py
 coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_updmststatus.py
+coverage run -a --source=mysql_class test/unit/mysql_class/masterrep_refresh.py
 coverage run -a --source=mysql_class test/unit/mysql_class/position_cmp.py
+coverage run -a --source=mysql_class test/unit/mysql_class/position_distance.py
 coverage run -a --source=mysql_class test/unit/mysql_class/rep_fetchdodb.py
 coverage run -a --source=mysql_class test/unit/mysql_class/rep_fetchigndb.py
 coverage run -a --source=mysql_class test/unit/mysql_class/rep_getservid.py
@@ -44,6 +102,11 @@ coverage run -a --source=mysql_class test/unit/mysql_class/rep_stopslave.py
 coverage run -a --source=mysql_class test/unit/mysql_class/rep_verify_srv_id.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_chg_db.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_connect.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_pooled.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_checkout.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_threadconn.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_stream.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_sql.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_disconnect.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_fetchlogs.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_fetchmstrepcfg.py
@@ -64,7 +127,18 @@ coverage run -a --source=mysql_class test/unit/mysql_class/server_updslvrepstat.
 coverage run -a --source=mysql_class test/unit/mysql_class/server_updmstrepstat.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_updsrvperf.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_updsrvstat.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_updsnapshot.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_setsnapshot.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_syncsnapshot.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_sampled.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_polled.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_prepared.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_cachedsysvar.py
 coverage run -a --source=mysql_class test/unit/mysql_class/server_vertsql.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_multicolsql.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_batchsql.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_driver.py
+coverage run -a --source=mysql_class test/unit/mysql_class/server_colsql.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_connect.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_init.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_fetchdotbl.py
@@ -84,6 +158,7 @@ coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_stopslave.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_updslvstate.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_updslvtime.py
 coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_updgtidpos.py
+coverage run -a --source=mysql_class test/unit/mysql_class/slaverep_refresh.py
 
 echo ""
 echo "Producing code coverage report"
@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  compare_fleet.py
+
+    Description:  Unit testing of compare_fleet in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/compare_fleet.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_states
+        test_counts
+        test_no_replicas
+        test_matches_compare_sets
+        test_no_numpy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = mysql_class.GTIDSet("35588520:1-100,76012896:1-50")
+        self.replicas = [
+            mysql_class.GTIDSet("35588520:1-100,76012896:1-50"),
+            mysql_class.GTIDSet("35588520:1-90,76012896:1-50"),
+            mysql_class.GTIDSet("35588520:1-100,76012896:1-50,12345678:1-3"),
+            mysql_class.GTIDSet("35588520:1-90:101-105,76012896:1-50"),
+            mysql_class.GTIDSet("")]
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_states(self):
+
+        """Function:  test_states
+
+        Description:  Test the replication state of each replica.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.compare_fleet(self.master, self.replicas)
+
+        self.assertEqual(
+            (data.equal.tolist(), data.behind.tolist(), data.ahead.tolist(),
+             data.diverged.tolist()),
+            ([True, False, False, False, False],
+             [False, True, False, False, True],
+             [False, False, True, False, False],
+             [False, False, False, True, False]))
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_counts(self):
+
+        """Function:  test_counts
+
+        Description:  Test the missing and extra transaction counts.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.compare_fleet(self.master, self.replicas)
+
+        self.assertEqual((data.missing.tolist(), data.extra.tolist()),
+                         ([0, 10, 0, 10, 150], [0, 0, 3, 5, 0]))
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_no_replicas(self):
+
+        """Function:  test_no_replicas
+
+        Description:  Test with no replicas.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.compare_fleet(self.master, [])
+
+        self.assertEqual((len(data.equal), len(data.missing)), (0, 0))
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_matches_compare_sets(self):
+
+        """Function:  test_matches_compare_sets
+
+        Description:  Test the results match compare_sets.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.compare_fleet(self.master, self.replicas)
+
+        for pos, gtidset in enumerate(self.replicas):
+            lcheck, rcheck = mysql_class.compare_sets(self.master, gtidset)
+
+            self.assertEqual((bool(data.missing[pos]), bool(data.extra[pos])),
+                             (lcheck, rcheck))
+
+    @mock.patch("mysql_class.numpy", None)
+    def test_no_numpy(self):
+
+        """Function:  test_no_numpy
+
+        Description:  Test with numpy not installed.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ImportError):
+            mysql_class.compare_fleet(self.master, self.replicas)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+# Classification (U)
+
+"""Program:  compare_sets.py
+
+    Description:  Unit testing of compare_sets in mysql_class.py.  Includes a
+        randomized corpus which checks compare_sets against the set semantics
+        of MySQL's GTID_SUBSET() using sets of (uuid, gno) pairs.
+
+    Usage:
+        test/unit/mysql_class/compare_sets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import random
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def gen_gtid_str(rnd, uuids, max_gno):
+
+    """Function:  gen_gtid_str
+
+    Description:  Generate a random GTID set string.
+
+    Arguments:
+        (input) rnd -> Random instance
+        (input) uuids -> List of UUIDs to pick from
+        (input) max_gno -> Highest transaction number
+        (output) -> GTID set string
+
+    """
+
+    sets = []
+
+    for uuid in rnd.sample(uuids, rnd.randint(1, len(uuids))):
+        rngs = []
+
+        for _ in range(rnd.randint(1, 4)):
+            start = rnd.randint(1, max_gno)
+            end = min(start + rnd.randint(0, 6), max_gno)
+            rngs.append(str(start) if start == end else f"{start}-{end}")
+
+        sets.append(":".join([uuid] + rngs))
+
+    return ",".join(sets)
+
+
+def to_pairs(gtid_str):
+
+    """Function:  to_pairs
+
+    Description:  Expand a GTID set string into a set of (uuid, gno) pairs.
+
+    Arguments:
+        (input) gtid_str -> GTID set string
+        (output) pairs -> Set of (uuid, gno) tuples
+
+    """
+
+    pairs = set()
+
+    for uuid_set in gtid_str.split(","):
+        uuid, *rngs = uuid_set.split(":")
+
+        for rng in rngs:
+            bounds = [int(item) for item in rng.split("-")]
+            pairs.update(
+                (uuid, gno) for gno in range(bounds[0], bounds[-1] + 1))
+
+    return pairs
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_equal
+        test_lhs_subset
+        test_rhs_subset
+        test_incomparable
+        test_partial_range
+        test_split_range
+        test_uuid_missing
+        test_random_corpus
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:333217-740055"
+        self.gtidset2 = "35588520:1-740055,76012896:1-502108"
+        self.gtidset3 = "35588520:1-5:10-20"
+        self.gtidset4 = "35588520:1-20"
+        self.gtidset5 = "35588520:1-5"
+        self.uuids = ["35588520", "76012896", "a1b2c3d4", "ffffffff"]
+
+    def test_equal(self):
+
+        """Function:  test_equal
+
+        Description:  Test with equal sets.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.compare_sets(mysql_class.GTIDSet(self.gtidset2),
+                                     mysql_class.GTIDSet(self.gtidset2)),
+            (False, False))
+
+    def test_lhs_subset(self):
+
+        """Function:  test_lhs_subset
+
+        Description:  Test with left hand side a subset of right hand side.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.compare_sets(mysql_class.GTIDSet(self.gtidset1),
+                                     mysql_class.GTIDSet(self.gtidset2)),
+            (False, True))
+
+    def test_rhs_subset(self):
+
+        """Function:  test_rhs_subset
+
+        Description:  Test with right hand side a subset of left hand side.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.compare_sets(mysql_class.GTIDSet(self.gtidset2),
+                                     mysql_class.GTIDSet(self.gtidset1)),
+            (True, False))
+
+    def test_incomparable(self):
+
+        """Function:  test_incomparable
+
+        Description:  Test with sets having items not in the other set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.compare_sets(
+                mysql_class.GTIDSet("35588520:1-10,76012896:1-5"),
+                mysql_class.GTIDSet("35588520:1-12")),
+            (True, True))
+
+    def test_partial_range(self):
+
+        """Function:  test_partial_range
+
+        Description:  Test with the first ranges equal and extra ranges in
+            one of the sets.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.compare_sets(mysql_class.GTIDSet(self.gtidset5),
+                                     mysql_class.GTIDSet(self.gtidset3)),
+            (False, True))
+
+    def test_split_range(self):
+
+        """Function:  test_split_range
+
+        Description:  Test with a range split by a gap in the other set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.compare_sets(mysql_class.GTIDSet(self.gtidset4),
+                                     mysql_class.GTIDSet(self.gtidset3)),
+            (True, False))
+
+    def test_uuid_missing(self):
+
+        """Function:  test_uuid_missing
+
+        Description:  Test with a UUID only in the right hand side.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.compare_sets(
+                mysql_class.GTIDSet(self.gtidset4),
+                mysql_class.GTIDSet(self.gtidset4 + ",76012896:1")),
+            (False, True))
+
+    def test_random_corpus(self):
+
+        """Function:  test_random_corpus
+
+        Description:  Test against set semantics with random GTID sets.
+
+        Arguments:
+
+        """
+
+        rnd = random.Random(20260101)
+
+        for _ in range(2000):
+            lhs = gen_gtid_str(rnd, self.uuids, 40)
+            rhs = gen_gtid_str(rnd, self.uuids, 40)
+            lpairs, rpairs = to_pairs(lhs), to_pairs(rhs)
+
+            self.assertEqual(
+                mysql_class.compare_sets(mysql_class.GTIDSet(lhs),
+                                         mysql_class.GTIDSet(rhs)),
+                (not lpairs <= rpairs, not rpairs <= lpairs),
+                f"lhs={lhs} rhs={rhs}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  connectionpool_close.py
+
+    Description:  Unit testing of ConnectionPool.close in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/connectionpool_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for mysql.connector connection class.
+
+    Methods:
+        __init__
+        is_connected
+        disconnect
+
+    """
+
+    def __init__(self, connected=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.connected = connected
+        self.unread_result = False
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub holder for is_connected method.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Stub holder for disconnect method.
+
+        Arguments:
+
+        """
+
+        self.connected = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_close
+        test_empty
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pool = mysql_class.ConnectionPool(mock.Mock(side_effect=Conn), 2)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test closing the idle connections.
+
+        Arguments:
+
+        """
+
+        conn1 = self.pool.get()
+        conn2 = self.pool.get()
+        self.pool.release(conn1)
+        self.pool.close()
+
+        self.assertEqual(
+            (conn1.connected, conn2.connected, self.pool.idle.qsize(),
+             self.pool.created), (False, True, 0, 1))
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test closing an empty pool.
+
+        Arguments:
+
+        """
+
+        self.pool.close()
+
+        self.assertEqual(self.pool.created, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+# Classification (U)
+
+"""Program:  connectionpool_get.py
+
+    Description:  Unit testing of ConnectionPool.get in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/connectionpool_get.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for mysql.connector connection class.
+
+    Methods:
+        __init__
+        is_connected
+        disconnect
+
+    """
+
+    def __init__(self, connected=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.connected = connected
+        self.unread_result = False
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub holder for is_connected method.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Stub holder for disconnect method.
+
+        Arguments:
+
+        """
+
+        self.connected = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_create
+        test_reuse
+        test_exhausted
+        test_connect_error
+        test_database
+        test_database_set
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.connect = mock.Mock(side_effect=Conn)
+
+    def test_create(self):
+
+        """Function:  test_create
+
+        Description:  Test a connection is created on demand.
+
+        Arguments:
+
+        """
+
+        pool = mysql_class.ConnectionPool(self.connect, 2)
+        conn = pool.get()
+
+        self.assertEqual((isinstance(conn, Conn), pool.created), (True, 1))
+
+    def test_reuse(self):
+
+        """Function:  test_reuse
+
+        Description:  Test an idle connection is reused.
+
+        Arguments:
+
+        """
+
+        pool = mysql_class.ConnectionPool(self.connect, 2)
+        conn = pool.get()
+        pool.release(conn)
+
+        self.assertEqual((pool.get() is conn, self.connect.call_count),
+                         (True, 1))
+
+    def test_exhausted(self):
+
+        """Function:  test_exhausted
+
+        Description:  Test with the pool exhausted.
+
+        Arguments:
+
+        """
+
+        pool = mysql_class.ConnectionPool(self.connect, 1)
+        pool.get()
+
+        with self.assertRaises(mysql_class.mysql.connector.errors.PoolError):
+            pool.get(timeout=0.01)
+
+    def test_connect_error(self):
+
+        """Function:  test_connect_error
+
+        Description:  Test a failed connection is not counted.
+
+        Arguments:
+
+        """
+
+        self.connect.side_effect = mysql_class.mysql.connector.Error("Failed")
+        pool = mysql_class.ConnectionPool(self.connect, 1)
+
+        with self.assertRaises(mysql_class.mysql.connector.Error):
+            pool.get()
+
+        self.assertEqual(pool.created, 0)
+
+    def test_database(self):
+
+        """Function:  test_database
+
+        Description:  Test the connection is changed to the pool's
+            database.
+
+        Arguments:
+
+        """
+
+        pool = mysql_class.ConnectionPool(self.connect, 2)
+        pool.use("db2")
+
+        self.assertEqual(pool.get().database, "db2")
+
+    def test_database_set(self):
+
+        """Function:  test_database_set
+
+        Description:  Test the database is only changed once per connection.
+
+        Arguments:
+
+        """
+
+        pool = mysql_class.ConnectionPool(self.connect, 2)
+        pool.use("db2")
+        conn = pool.get()
+        conn.database = None
+        pool.release(conn)
+
+        self.assertIsNone(pool.get().database)
+
+
+if __name__ == "__main__":
+    unittest.main()
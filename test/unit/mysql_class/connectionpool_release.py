@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  connectionpool_release.py
+
+    Description:  Unit testing of ConnectionPool.release in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/connectionpool_release.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for mysql.connector connection class.
+
+    Methods:
+        __init__
+        is_connected
+        disconnect
+
+    """
+
+    def __init__(self, connected=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.connected = connected
+        self.unread_result = False
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub holder for is_connected method.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Stub holder for disconnect method.
+
+        Arguments:
+
+        """
+
+        self.connected = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_release
+        test_unread_result
+        test_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pool = mysql_class.ConnectionPool(mock.Mock(side_effect=Conn), 2)
+
+    def test_release(self):
+
+        """Function:  test_release
+
+        Description:  Test releasing a connection.
+
+        Arguments:
+
+        """
+
+        conn = self.pool.get()
+        self.pool.release(conn)
+
+        self.assertEqual((self.pool.idle.qsize(), self.pool.created), (1, 1))
+
+    def test_unread_result(self):
+
+        """Function:  test_unread_result
+
+        Description:  Test releasing a connection with an unread result.
+
+        Arguments:
+
+        """
+
+        conn = self.pool.get()
+        conn.unread_result = True
+        self.pool.release(conn)
+
+        self.assertEqual((self.pool.idle.qsize(), self.pool.created), (0, 0))
+        self.assertFalse(conn.connected)
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test releasing a connection after a failure.
+
+        Arguments:
+
+        """
+
+        conn = self.pool.get()
+        self.pool.release(conn, failed=True)
+
+        self.assertEqual((self.pool.idle.qsize(), self.pool.created), (0, 0))
+        self.assertFalse(conn.connected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,344 @@
+# Classification (U)
+
+"""Program:  dbapiconn_cmdquery.py
+
+    Description:  Unit testing of DBAPIConn.cmd_query, DBAPIConn.cmd_query_iter
+        and DBAPIConn.get_rows in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/dbapiconn_cmdquery.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Error(Exception):
+
+    """Class:  Error
+
+    Description:  Class stub holder for the DB-API Error exception.
+
+    Methods:
+
+    """
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a DB-API cursor.
+
+    Methods:
+        __init__
+        execute
+        nextset
+        fetchone
+        fetchall
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.results = []
+        self.description = None
+        self.rows = []
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        if self.conn.closed:
+            raise Error("closed")
+
+        self.conn.stmts.append((cmd, params))
+        self.results = [RESULTS.get(stmt, (None, [])) for stmt
+                        in cmd.split("; ")]
+        self.nextset()
+
+    def nextset(self):
+
+        """Method:  nextset
+
+        Description:  Stub holder for the nextset method.
+
+        Arguments:
+
+        """
+
+        if not self.results:
+            return None
+
+        keys, rows = self.results.pop(0)
+        self.description = [(key, 253) for key in keys] if keys else None
+        self.rows = list(rows)
+        self.rowcount = len(self.rows) if keys else 1
+
+        return True
+
+    def fetchone(self):
+
+        """Method:  fetchone
+
+        Description:  Stub holder for the fetchone method.
+
+        Arguments:
+
+        """
+
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        rows, self.rows = self.rows, []
+
+        return tuple(rows)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a DB-API connection.
+
+    Methods:
+        __init__
+        cursor
+        close
+
+    """
+
+    def __init__(self, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args = kwargs
+        self.stmts = []
+        self.closed = False
+
+    def cursor(self):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        return Cursor(self)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Module():
+
+    """Class:  Module
+
+    Description:  Class stub holder for a DB-API driver module.
+
+    Methods:
+        connect
+
+    """
+
+    __name__ = "dbapi"
+    Error = Error
+
+    @staticmethod
+    def connect(**kwargs):
+
+        """Method:  connect
+
+        Description:  Stub holder for the connect function.
+
+        Arguments:
+
+        """
+
+        return Conn(**kwargs)
+
+
+RESULTS = {
+    "select connection_id()": (["id"], [(21,)]),
+    "select version()": (["version"], [("8.0.28-log",)]),
+    "select database()": (["db"], [("db1",)]),
+    "select 1": (["1"], [(1,)]),
+    "select1": (["Col1", "Col2"], [(1, "a"), (2, "b")]),
+    "show status": (["Variable_name", "Value"], [("Uptime", "10")])}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_columns
+        test_get_rows
+        test_status
+        test_raw
+        test_query_iter
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mysql_class.DBAPIDriver(Module()).connect(host="host1")
+
+    def test_columns(self):
+
+        """Function:  test_columns
+
+        Description:  Test with a result set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.conn.cmd_query("select1"),
+                         {"columns": [("Col1", 253), ("Col2", 253)]})
+        self.assertTrue(self.conn.unread_result)
+
+    def test_get_rows(self):
+
+        """Function:  test_get_rows
+
+        Description:  Test the rows of the result set.
+
+        Arguments:
+
+        """
+
+        self.conn.cmd_query("select1")
+
+        self.assertEqual(self.conn.get_rows(), ([(1, "a"), (2, "b")], {}))
+        self.assertFalse(self.conn.unread_result)
+
+    def test_status(self):
+
+        """Function:  test_status
+
+        Description:  Test with a command without a result set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.conn.cmd_query("set @a = 1"),
+                         {"affected_rows": 1, "insert_id": None})
+
+    def test_raw(self):
+
+        """Function:  test_raw
+
+        Description:  Test raw rows are not supported.
+
+        Arguments:
+
+        """
+
+        self.conn.cmd_query("select1")
+
+        with self.assertRaises(mysql.connector.errors.NotSupportedError):
+            self.conn.get_rows(raw=True)
+
+    def test_query_iter(self):
+
+        """Function:  test_query_iter
+
+        Description:  Test with a multi-statement request.
+
+        Arguments:
+
+        """
+
+        results = []
+
+        for result in self.conn.cmd_query_iter("select1; set @a = 1"):
+            results.append(
+                self.conn.get_rows()[0] if "columns" in result else None)
+
+        self.assertEqual(results, [[(1, "a"), (2, "b")], None])
+
+
+if __name__ == "__main__":
+    unittest.main()
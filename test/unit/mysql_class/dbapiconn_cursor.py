@@ -0,0 +1,431 @@
+# Classification (U)
+
+"""Program:  dbapiconn_cursor.py
+
+    Description:  Unit testing of DBAPIConn.cursor and the DBAPIConn
+        connection methods in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/dbapiconn_cursor.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Error(Exception):
+
+    """Class:  Error
+
+    Description:  Class stub holder for the DB-API Error exception.
+
+    Methods:
+
+    """
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a DB-API cursor.
+
+    Methods:
+        __init__
+        execute
+        nextset
+        fetchone
+        fetchmany
+        fetchall
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.results = []
+        self.description = None
+        self.rows = []
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        if self.conn.closed:
+            raise Error("closed")
+
+        self.conn.stmts.append((cmd, params))
+        self.results = [RESULTS.get(stmt, (None, [])) for stmt
+                        in cmd.split("; ")]
+        self.nextset()
+
+    def nextset(self):
+
+        """Method:  nextset
+
+        Description:  Stub holder for the nextset method.
+
+        Arguments:
+
+        """
+
+        if not self.results:
+            return None
+
+        keys, rows = self.results.pop(0)
+        self.description = [(key, 253) for key in keys] if keys else None
+        self.rows = list(rows)
+        self.rowcount = len(self.rows) if keys else 1
+
+        return True
+
+    def fetchone(self):
+
+        """Method:  fetchone
+
+        Description:  Stub holder for the fetchone method.
+
+        Arguments:
+
+        """
+
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchmany(self, size=1):
+
+        """Method:  fetchmany
+
+        Description:  Stub holder for the fetchmany method.
+
+        Arguments:
+
+        """
+
+        rows, self.rows = self.rows[:size], self.rows[size:]
+
+        return rows
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        rows, self.rows = self.rows, []
+
+        return tuple(rows)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a DB-API connection.
+
+    Methods:
+        __init__
+        cursor
+        close
+
+    """
+
+    def __init__(self, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args = kwargs
+        self.stmts = []
+        self.closed = False
+        self.cursor_class = None
+
+    def cursor(self, cursor_class=None):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        self.cursor_class = cursor_class
+
+        return Cursor(self)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Module():
+
+    """Class:  Module
+
+    Description:  Class stub holder for a DB-API driver module.
+
+    Methods:
+        connect
+
+    """
+
+    __name__ = "dbapi"
+    Error = Error
+
+    @staticmethod
+    def connect(**kwargs):
+
+        """Method:  connect
+
+        Description:  Stub holder for the connect function.
+
+        Arguments:
+
+        """
+
+        return Conn(**kwargs)
+
+
+RESULTS = {
+    "select connection_id()": (["id"], [(21,)]),
+    "select version()": (["version"], [("8.0.28-log",)]),
+    "select database()": (["db"], [("db1",)]),
+    "select 1": (["1"], [(1,)]),
+    "select1": (["Col1", "Col2"], [(1, "a"), (2, "b")]),
+    "show status": (["Variable_name", "Value"], [("Uptime", "10")])}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cursor
+        test_prepared
+        test_no_unbuffered
+        test_unbuffered
+        test_unread_result
+        test_version
+        test_database
+        test_is_connected
+        test_reconnect
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mysql_class.DBAPIDriver(Module()).connect(host="host1")
+
+    def test_cursor(self):
+
+        """Function:  test_cursor
+
+        Description:  Test the cursor takes the params keyword argument.
+
+        Arguments:
+
+        """
+
+        cur = self.conn.cursor(buffered=True)
+        cur.execute("select1", params=(1,))
+
+        self.assertEqual(self.conn.conn.stmts[-1], ("select1", (1,)))
+        self.assertEqual(list(cur), [(1, "a"), (2, "b")])
+
+    def test_prepared(self):
+
+        """Function:  test_prepared
+
+        Description:  Test prepared cursors are not supported.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(mysql.connector.errors.NotSupportedError):
+            self.conn.cursor(prepared=True)
+
+    def test_no_unbuffered(self):
+
+        """Function:  test_no_unbuffered
+
+        Description:  Test an unbuffered cursor without the driver's
+            unbuffered cursor class.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(mysql.connector.errors.NotSupportedError):
+            self.conn.cursor(buffered=False)
+
+    def test_unbuffered(self):
+
+        """Function:  test_unbuffered
+
+        Description:  Test the unbuffered cursor class of the driver is used.
+
+        Arguments:
+
+        """
+
+        conn = mysql_class.DBAPIDriver(
+            Module(), unbuffered="SSCursor").connect(host="host1")
+        conn.cursor(buffered=False)
+
+        self.assertEqual(conn.conn.cursor_class, "SSCursor")
+
+    def test_unread_result(self):
+
+        """Function:  test_unread_result
+
+        Description:  Test the unread rows of an unbuffered cursor are
+            tracked.
+
+        Arguments:
+
+        """
+
+        conn = mysql_class.DBAPIDriver(
+            Module(), unbuffered="SSCursor").connect(host="host1")
+        cur = conn.cursor(buffered=False)
+        cur.execute("select1")
+
+        self.assertTrue(conn.unread_result)
+        self.assertEqual(cur.fetchmany(2), [(1, "a"), (2, "b")])
+        self.assertTrue(conn.unread_result)
+        self.assertEqual(cur.fetchmany(2), [])
+        self.assertFalse(conn.unread_result)
+
+    def test_version(self):
+
+        """Function:  test_version
+
+        Description:  Test the server version.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.conn.get_server_version(), (8, 0, 28))
+
+    def test_database(self):
+
+        """Function:  test_database
+
+        Description:  Test the current database.
+
+        Arguments:
+
+        """
+
+        self.conn.database = "db2"
+
+        self.assertEqual(self.conn.conn.stmts[-1], ("use `db2`", None))
+        self.assertEqual(self.conn.database, "db1")
+
+    def test_is_connected(self):
+
+        """Function:  test_is_connected
+
+        Description:  Test the connection check.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.conn.is_connected())
+        self.conn.disconnect()
+
+        self.assertFalse(self.conn.is_connected())
+
+    def test_reconnect(self):
+
+        """Function:  test_reconnect
+
+        Description:  Test the reconnect opens a new connection.
+
+        Arguments:
+
+        """
+
+        conn = self.conn.conn
+        self.conn.reconnect()
+
+        self.assertTrue(conn.closed)
+        self.assertIsNot(self.conn.conn, conn)
+        self.assertTrue(self.conn.is_connected())
+
+
+if __name__ == "__main__":
+    unittest.main()
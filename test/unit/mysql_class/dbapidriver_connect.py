@@ -0,0 +1,316 @@
+# Classification (U)
+
+"""Program:  dbapidriver_connect.py
+
+    Description:  Unit testing of DBAPIDriver.connect in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/dbapidriver_connect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Error(Exception):
+
+    """Class:  Error
+
+    Description:  Class stub holder for the DB-API Error exception.
+
+    Methods:
+
+    """
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a DB-API cursor.
+
+    Methods:
+        __init__
+        execute
+        nextset
+        fetchone
+        fetchall
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.results = []
+        self.description = None
+        self.rows = []
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        if self.conn.closed:
+            raise Error("closed")
+
+        self.conn.stmts.append((cmd, params))
+        self.results = [RESULTS.get(stmt, (None, [])) for stmt
+                        in cmd.split("; ")]
+        self.nextset()
+
+    def nextset(self):
+
+        """Method:  nextset
+
+        Description:  Stub holder for the nextset method.
+
+        Arguments:
+
+        """
+
+        if not self.results:
+            return None
+
+        keys, rows = self.results.pop(0)
+        self.description = [(key, 253) for key in keys] if keys else None
+        self.rows = list(rows)
+        self.rowcount = len(self.rows) if keys else 1
+
+        return True
+
+    def fetchone(self):
+
+        """Method:  fetchone
+
+        Description:  Stub holder for the fetchone method.
+
+        Arguments:
+
+        """
+
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        rows, self.rows = self.rows, []
+
+        return tuple(rows)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a DB-API connection.
+
+    Methods:
+        __init__
+        cursor
+        close
+
+    """
+
+    def __init__(self, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args = kwargs
+        self.stmts = []
+        self.closed = False
+
+    def cursor(self):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        return Cursor(self)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Module():
+
+    """Class:  Module
+
+    Description:  Class stub holder for a DB-API driver module.
+
+    Methods:
+        connect
+
+    """
+
+    __name__ = "dbapi"
+    Error = Error
+
+    @staticmethod
+    def connect(**kwargs):
+
+        """Method:  connect
+
+        Description:  Stub holder for the connect function.
+
+        Arguments:
+
+        """
+
+        return Conn(**kwargs)
+
+
+RESULTS = {
+    "select connection_id()": (["id"], [(21,)]),
+    "select version()": (["version"], [("8.0.28-log",)]),
+    "select database()": (["db"], [("db1",)]),
+    "select 1": (["1"], [(1,)]),
+    "select1": (["Col1", "Col2"], [(1, "a"), (2, "b")]),
+    "show status": (["Variable_name", "Value"], [("Uptime", "10")])}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect
+        test_connect_args
+        test_driver
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.config = {"host": "host1", "user": "user1", "port": 3306,
+                       "database": "", "passwd": "japd", "ssl_disabled": True}
+
+    def test_connect(self):
+
+        """Function:  test_connect
+
+        Description:  Test the connection arguments passed to the driver.
+
+        Arguments:
+
+        """
+
+        conn = mysql_class.DBAPIDriver(Module()).connect(**self.config)
+
+        self.assertEqual(
+            conn.conn.args,
+            {"host": "host1", "user": "user1", "port": 3306,
+             "password": "japd"})
+        self.assertEqual(conn.connection_id, 21)
+
+    def test_connect_args(self):
+
+        """Function:  test_connect_args
+
+        Description:  Test with extra driver connection arguments.
+
+        Arguments:
+
+        """
+
+        conn = mysql_class.DBAPIDriver(
+            Module(), keys={"host": "host"}, client_flag=65536).connect(
+                **self.config)
+
+        self.assertEqual(
+            conn.conn.args, {"host": "host1", "client_flag": 65536})
+
+    def test_driver(self):
+
+        """Function:  test_driver
+
+        Description:  Test the driver name and error class.
+
+        Arguments:
+
+        """
+
+        driver = mysql_class.DBAPIDriver(Module())
+
+        self.assertEqual((driver.name, driver.error), ("dbapi", Error))
+
+
+if __name__ == "__main__":
+    unittest.main()
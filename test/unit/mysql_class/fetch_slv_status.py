@@ -0,0 +1,166 @@
+# Classification (U)
+
+"""Program:  fetch_slv_status.py
+
+    Description:  Unit testing of fetch_slv_status in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/fetch_slv_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+        multi_col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = None
+        self.version = (8, 0, 28)
+        self.results = [
+            [{"Replica_IO_State": "up"}], [{"SERVICE_STATE": "ON"}],
+            [{"Variable_name": "Replica_open_temp_tables", "Value": "1"}],
+            [{"Variable_name": "read_only", "Value": "ON"},
+             {"Variable_name": "server_uuid", "Value": "uuid"}]]
+
+    def multi_col_sql(self, cmds):
+
+        """Method:  multi_col_sql
+
+        Description:  Stub holder for Server.multi_col_sql method.
+
+        Arguments:
+            (input) cmds
+
+        """
+
+        self.cmds = cmds
+
+        return self.results
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_post_8026
+        test_pre_8026
+        test_pre_8022
+        test_fetch_slv_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_post_8026(self):
+
+        """Function:  test_post_8026
+
+        Description:  Test with post-MySQL 8.0.26.
+
+        Arguments:
+
+        """
+
+        mysql_class.fetch_slv_status(self.server)
+
+        self.assertEqual(self.server.cmds[0], "show replica status")
+        self.assertIn("'replica_open_temp_tables'", self.server.cmds[2])
+
+    def test_pre_8026(self):
+
+        """Function:  test_pre_8026
+
+        Description:  Test with pre-MySQL 8.0.26.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 23)
+        mysql_class.fetch_slv_status(self.server)
+
+        self.assertEqual(self.server.cmds[0], "show replica status")
+        self.assertIn("'slave_open_temp_tables'", self.server.cmds[2])
+
+    def test_pre_8022(self):
+
+        """Function:  test_pre_8022
+
+        Description:  Test with pre-MySQL 8.0.22.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 21)
+        mysql_class.fetch_slv_status(self.server)
+
+        self.assertEqual(self.server.cmds[0], "show slave status")
+
+    def test_fetch_slv_status(self):
+
+        """Function:  test_fetch_slv_status
+
+        Description:  Test with the results returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.fetch_slv_status(self.server),
+            ([{"Replica_IO_State": "up"}], [{"SERVICE_STATE": "ON"}],
+             {"Replica_open_temp_tables": "1"},
+             {"read_only": "ON", "server_uuid": "uuid"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+# Classification (U)
+
+"""Program:  fetch_sys_vars.py
+
+    Description:  Unit testing of fetch_sys_vars in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/fetch_sys_vars.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+        vert_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.params = None
+        self.version = (8, 0, 28)
+        self.data = {}
+
+    def vert_sql(self, cmd, params):
+
+        """Method:  vert_sql
+
+        Description:  Stub holder for Server.vert_sql method.
+
+        Arguments:
+            (input) cmd
+            (input) params
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one_query
+        test_session
+        test_global
+        test_pre_57
+        test_post_8026
+        test_pre_8026
+        test_name_case
+        test_missing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_one_query(self):
+
+        """Function:  test_one_query
+
+        Description:  Test the variables are fetched in one query.
+
+        Arguments:
+
+        """
+
+        self.server.data = {"log_bin": "ON", "read_only": "OFF"}
+
+        self.assertEqual(
+            mysql_class.fetch_sys_vars(self.server, ["log_bin", "read_only"]),
+            {"log_bin": "ON", "read_only": "OFF"})
+        self.assertEqual(self.server.params, ["log_bin", "read_only"])
+        self.assertIn("VARIABLE_NAME in (%s, %s)", self.server.cmd)
+
+    def test_session(self):
+
+        """Function:  test_session
+
+        Description:  Test with the default session level.
+
+        Arguments:
+
+        """
+
+        mysql_class.fetch_sys_vars(self.server, ["log_bin"])
+
+        self.assertIn("performance_schema.session_variables", self.server.cmd)
+
+    def test_global(self):
+
+        """Function:  test_global
+
+        Description:  Test with the global level.
+
+        Arguments:
+
+        """
+
+        mysql_class.fetch_sys_vars(self.server, ["log_bin"], level="global")
+
+        self.assertIn("performance_schema.global_variables", self.server.cmd)
+
+    def test_pre_57(self):
+
+        """Function:  test_pre_57
+
+        Description:  Test with pre-MySQL 5.7.
+
+        Arguments:
+
+        """
+
+        self.server.version = (5, 6, 40)
+        mysql_class.fetch_sys_vars(self.server, ["log_bin"], level="global")
+
+        self.assertEqual(
+            self.server.cmd,
+            "show global variables where Variable_name in (%s)")
+
+    def test_post_8026(self):
+
+        """Function:  test_post_8026
+
+        Description:  Test with the renamed variables in MySQL 8.0.26.
+
+        Arguments:
+
+        """
+
+        self.server.data = {"log_replica_updates": "ON"}
+
+        self.assertEqual(
+            mysql_class.fetch_sys_vars(self.server, ["log_slave_updates"]),
+            {"log_slave_updates": "ON"})
+        self.assertEqual(self.server.params, ["log_replica_updates"])
+
+    def test_pre_8026(self):
+
+        """Function:  test_pre_8026
+
+        Description:  Test with the new variable names in pre-MySQL 8.0.26.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 23)
+        self.server.data = {"sync_master_info": "10000"}
+
+        self.assertEqual(
+            mysql_class.fetch_sys_vars(self.server, ["sync_source_info"]),
+            {"sync_source_info": "10000"})
+        self.assertEqual(self.server.params, ["sync_master_info"])
+
+    def test_name_case(self):
+
+        """Function:  test_name_case
+
+        Description:  Test the requested names are kept in the results.
+
+        Arguments:
+
+        """
+
+        self.server.data = {"GTID_PURGED": "uuid:1-5"}
+
+        self.assertEqual(
+            mysql_class.fetch_sys_vars(self.server, ["gtid_purged"]),
+            {"gtid_purged": "uuid:1-5"})
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with a variable not on the server.
+
+        Arguments:
+
+        """
+
+        self.server.data = {"log_bin": "ON"}
+
+        self.assertEqual(
+            mysql_class.fetch_sys_vars(
+                self.server, ["log_bin", "innodb_support_xa"]),
+            {"log_bin": "ON"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+# Classification (U)
+
+"""Program:  format_rows.py
+
+    Description:  Unit testing of format_rows in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/format_rows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import decimal
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dict
+        test_row
+        test_row_shared
+        test_row_rename
+        test_column
+        test_column_empty
+        test_arrays
+        test_arrays_decimal
+        test_arrays_null
+        test_arrays_overflow
+        test_no_numpy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.keys = ["Name", "Cnt", "Avg"]
+        self.rows = [("a", 1, 1.5), ("b", 2, 2.5)]
+
+    def test_dict(self):
+
+        """Function:  test_dict
+
+        Description:  Test with the default dict mode.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.format_rows(self.keys, self.rows),
+            [{"Name": "a", "Cnt": 1, "Avg": 1.5},
+             {"Name": "b", "Cnt": 2, "Avg": 2.5}])
+
+    def test_row(self):
+
+        """Function:  test_row
+
+        Description:  Test with the row mode.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.format_rows(self.keys, self.rows, res_mode="row")
+
+        self.assertEqual(
+            (data[1].Name, data[1].Cnt, data[1].Avg), ("b", 2, 2.5))
+
+    def test_row_shared(self):
+
+        """Function:  test_row_shared
+
+        Description:  Test the rows share one row type per header.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.format_rows(self.keys, self.rows, res_mode="row")
+        data2 = mysql_class.format_rows(
+            self.keys, self.rows[:1], res_mode="row")
+
+        self.assertIs(type(data[0]), type(data2[0]))
+
+    def test_row_rename(self):
+
+        """Function:  test_row_rename
+
+        Description:  Test with column names which are not identifiers.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.format_rows(
+            ["count(*)", "Name"], [(3, "a")], res_mode="row")
+
+        self.assertEqual(data[0]._fields, ("_0", "Name"))
+
+    def test_column(self):
+
+        """Function:  test_column
+
+        Description:  Test with the column mode.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.format_rows(self.keys, self.rows, res_mode="column"),
+            {"Name": ["a", "b"], "Cnt": [1, 2], "Avg": [1.5, 2.5]})
+
+    def test_column_empty(self):
+
+        """Function:  test_column_empty
+
+        Description:  Test with the column mode and no rows.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.format_rows(self.keys, [], res_mode="column"),
+            {"Name": [], "Cnt": [], "Avg": []})
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_arrays(self):
+
+        """Function:  test_arrays
+
+        Description:  Test with NumPy arrays for the numeric columns.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.format_rows(
+            self.keys, self.rows, res_mode="column", arrays=True)
+
+        self.assertEqual(data["Name"], ["a", "b"])
+        self.assertEqual(str(data["Cnt"].dtype), "int64")
+        self.assertEqual(str(data["Avg"].dtype), "float64")
+        self.assertEqual(data["Avg"].sum(), 4.0)
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_arrays_decimal(self):
+
+        """Function:  test_arrays_decimal
+
+        Description:  Test with NumPy arrays for a decimal column.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.format_rows(
+            ["Sum"], [(decimal.Decimal("1.5"),), (2,)], res_mode="column",
+            arrays=True)
+
+        self.assertEqual(str(data["Sum"].dtype), "float64")
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_arrays_null(self):
+
+        """Function:  test_arrays_null
+
+        Description:  Test a column with NULLs is left as a list.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.format_rows(
+            ["Cnt"], [(1,), (None,)], res_mode="column", arrays=True)
+
+        self.assertEqual(data["Cnt"], [1, None])
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_arrays_overflow(self):
+
+        """Function:  test_arrays_overflow
+
+        Description:  Test a column out of the int64 range is left as a list.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.format_rows(
+            ["Cnt"], [(2 ** 64 - 1,)], res_mode="column", arrays=True)
+
+        self.assertEqual(data["Cnt"], [2 ** 64 - 1])
+
+    @mock.patch("mysql_class.numpy", None)
+    def test_no_numpy(self):
+
+        """Function:  test_no_numpy
+
+        Description:  Test with arrays and numpy not installed.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ImportError):
+            mysql_class.format_rows(
+                self.keys, self.rows, res_mode="column", arrays=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  frozen_gtidset.py
+
+    Description:  Unit testing of frozen_gtidset in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/frozen_gtidset.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_frozen
+        test_cache_hit
+        test_cache_miss
+        test_invalid
+        test_prev
+        test_cache_bounded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:333217-740055"
+        self.gtidset2 = "35588520:1-740055,76012896:1-502108"
+
+    def test_frozen(self):
+
+        """Function:  test_frozen
+
+        Description:  Test that a FrozenGTIDSet is returned.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.frozen_gtidset(self.gtidset1)
+
+        self.assertIsInstance(gtid, mysql_class.FrozenGTIDSet)
+
+    def test_cache_hit(self):
+
+        """Function:  test_cache_hit
+
+        Description:  Test that the same raw string returns the cached
+            instance.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.frozen_gtidset(self.gtidset2)
+        gtid2 = mysql_class.frozen_gtidset(self.gtidset2)
+
+        self.assertIs(gtid1, gtid2)
+
+    def test_cache_miss(self):
+
+        """Function:  test_cache_miss
+
+        Description:  Test that a different raw string returns a new instance.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.frozen_gtidset(self.gtidset1)
+        gtid2 = mysql_class.frozen_gtidset(self.gtidset2)
+
+        self.assertIsNot(gtid1, gtid2)
+
+    def test_invalid(self):
+
+        """Function:  test_invalid
+
+        Description:  Test that an invalid string raises an exception.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_class.frozen_gtidset("35588520")
+
+    def test_prev(self):
+
+        """Function:  test_prev
+
+        Description:  Test with the previous set of the server passed.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.frozen_gtidset("35588520:1-5,76012896:1-10")
+        gtid2 = mysql_class.frozen_gtidset("35588520:1-5,76012896:1-11", gtid1)
+
+        self.assertEqual((str(gtid2), gtid2.intervals["35588520"] is
+                          gtid1.intervals["35588520"]),
+                         ("35588520:1-5,76012896:1-11", True))
+
+    @mock.patch("mysql_class.GTID_CACHE_SIZE", 2)
+    def test_cache_bounded(self):
+
+        """Function:  test_cache_bounded
+
+        Description:  Test that the cache does not grow past its size.
+
+        Arguments:
+
+        """
+
+        for gno in range(1, 6):
+            mysql_class.frozen_gtidset(f"35588520:1-{gno}")
+
+        self.assertEqual(len(mysql_class.GTID_CACHE), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  frozengtidset_hash.py
+
+    Description:  Unit testing of FrozenGTIDSet.__hash__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/frozengtidset_hash.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_equal_sets
+        test_dict_key
+        test_empty_intervals
+        test_from_bytes
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:1-10:11-20"
+        self.gtidset2 = "35588520:1-20"
+
+    def test_equal_sets(self):
+
+        """Function:  test_equal_sets
+
+        Description:  Test that equal sets have the same hash.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.FrozenGTIDSet(self.gtidset1)
+        gtid2 = mysql_class.FrozenGTIDSet(self.gtidset2)
+
+        self.assertEqual(hash(gtid1), hash(gtid2))
+
+    def test_dict_key(self):
+
+        """Function:  test_dict_key
+
+        Description:  Test the set as a dictionary key.
+
+        Arguments:
+
+        """
+
+        data = {mysql_class.FrozenGTIDSet(self.gtidset1): "slave1"}
+
+        self.assertEqual(
+            data[mysql_class.FrozenGTIDSet(self.gtidset2)], "slave1")
+
+    def test_empty_intervals(self):
+
+        """Function:  test_empty_intervals
+
+        Description:  Test a set with a UUID without intervals has the hash
+            of the equal set without the UUID.
+
+        Arguments:
+
+        """
+
+        gtidset = mysql_class.GTIDSet(self.gtidset2)
+        gtidset.gtids = {"35588520": [(1, 20)], "35588521": []}
+        gtid1 = mysql_class.FrozenGTIDSet(gtidset)
+        gtid2 = mysql_class.FrozenGTIDSet(self.gtidset2)
+
+        self.assertEqual(gtid1, gtid2)
+        self.assertEqual(hash(gtid1), hash(gtid2))
+        self.assertEqual(str(gtid1), str(gtid2))
+
+    def test_from_bytes(self):
+
+        """Function:  test_from_bytes
+
+        Description:  Test a set from the binary format with a UUID without
+            intervals.
+
+        Arguments:
+
+        """
+
+        gtidset = mysql_class.GTIDSet(self.gtidset2)
+        gtidset.gtids = {"35588520": [(1, 20)], "35588521": []}
+        gtid1 = mysql_class.FrozenGTIDSet.from_bytes(gtidset.to_bytes())
+        gtid2 = mysql_class.FrozenGTIDSet(self.gtidset2)
+
+        self.assertEqual(gtid1, gtid2)
+        self.assertEqual(hash(gtid1), hash(gtid2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  frozengtidset_init.py
+
+    Description:  Unit testing of FrozenGTIDSet.__init__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/frozengtidset_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_string
+        test_gtidset
+        test_setattr
+        test_shared_intervals
+        test_read_only
+        test_prev
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset = "35588520:333217-740055"
+        self.results = {"35588520": ((333217, 740055),)}
+
+    def test_string(self):
+
+        """Function:  test_string
+
+        Description:  Test with a raw GTID string.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.FrozenGTIDSet(self.gtidset)
+
+        self.assertEqual(gtid.gtids, self.results)
+
+    def test_gtidset(self):
+
+        """Function:  test_gtidset
+
+        Description:  Test with a GTIDSet instance.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet(self.gtidset)
+        gtid = mysql_class.FrozenGTIDSet(data)
+        data.union("76012896:1-5")
+
+        self.assertEqual(gtid.gtids, self.results)
+
+    def test_setattr(self):
+
+        """Function:  test_setattr
+
+        Description:  Test that attributes can not be changed.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.FrozenGTIDSet(self.gtidset)
+
+        with self.assertRaises(AttributeError):
+            gtid.gtids = {}
+
+    def test_shared_intervals(self):
+
+        """Function:  test_shared_intervals
+
+        Description:  Test changes to the source set's interval lists do not
+            change the frozen set.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet(self.gtidset)
+        gtid = mysql_class.FrozenGTIDSet(data)
+        hash_val = hash(gtid)
+        data.intervals["35588520"].append(800000, 800010)
+
+        self.assertEqual(gtid.gtids, self.results)
+        self.assertEqual(hash(mysql_class.FrozenGTIDSet(self.gtidset)),
+                         hash_val)
+
+    def test_read_only(self):
+
+        """Function:  test_read_only
+
+        Description:  Test the intervals mapping can not be changed.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.FrozenGTIDSet(self.gtidset)
+
+        with self.assertRaises(TypeError):
+            gtid.intervals["76012896"] = mysql_class.GTIDIntervals([(1, 5)])
+
+    def test_prev(self):
+
+        """Function:  test_prev
+
+        Description:  Test the interval lists of a previous frozen set are
+            shared.
+
+        Arguments:
+
+        """
+
+        prev = mysql_class.FrozenGTIDSet(self.gtidset)
+        data = mysql_class.GTIDSet(prev)
+        data.union("76012896:1-5")
+        gtid = mysql_class.FrozenGTIDSet(data, prev=prev)
+
+        self.assertIs(gtid.intervals["35588520"], prev.intervals["35588520"])
+
+
+if __name__ == "__main__":
+    unittest.main()
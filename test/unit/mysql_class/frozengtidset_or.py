@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  frozengtidset_or.py
+
+    Description:  Unit testing of FrozenGTIDSet.__or__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/frozengtidset_or.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_frozen_or
+        test_not_modified
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:333217-740055"
+        self.gtidset2 = "35588520:1-740055,76012896:1-502108"
+        self.results = {"35588520": ((1, 740055),), "76012896": ((1, 502108),)}
+
+    def test_frozen_or(self):
+
+        """Function:  test_frozen_or
+
+        Description:  Test the | operator with two frozen sets.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.FrozenGTIDSet(self.gtidset1)
+        gtid2 = mysql_class.FrozenGTIDSet(self.gtidset2)
+        data = gtid1 | gtid2
+
+        self.assertEqual(
+            (data.gtids, isinstance(data, mysql_class.FrozenGTIDSet)),
+            (self.results, True))
+
+    def test_not_modified(self):
+
+        """Function:  test_not_modified
+
+        Description:  Test that the first set is not changed.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.FrozenGTIDSet(self.gtidset1)
+        _ = gtid1 | self.gtidset2
+
+        self.assertEqual(str(gtid1), self.gtidset1)
+
+
+if __name__ == "__main__":
+    unittest.main()
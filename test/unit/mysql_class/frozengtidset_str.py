@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  frozengtidset_str.py
+
+    Description:  Unit testing of FrozenGTIDSet.__str__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/frozengtidset_str.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_frozen_str
+        test_cached_str
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset = "76012896:1-502108,35588520:333217-740055"
+        self.results = "35588520:333217-740055,76012896:1-502108"
+
+    def test_frozen_str(self):
+
+        """Function:  test_frozen_str
+
+        Description:  Test conversion to a canonical string.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.FrozenGTIDSet(self.gtidset)
+
+        self.assertEqual(str(gtid), self.results)
+
+    def test_cached_str(self):
+
+        """Function:  test_cached_str
+
+        Description:  Test that the string is only built once.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.FrozenGTIDSet(self.gtidset)
+
+        self.assertIs(str(gtid), str(gtid))
+
+
+if __name__ == "__main__":
+    unittest.main()
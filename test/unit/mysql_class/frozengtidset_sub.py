@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  frozengtidset_sub.py
+
+    Description:  Unit testing of FrozenGTIDSet.__sub__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/frozengtidset_sub.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_frozen_sub
+        test_difference
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:1-740055"
+        self.gtidset2 = "35588520:1-740000"
+
+    def test_frozen_sub(self):
+
+        """Function:  test_frozen_sub
+
+        Description:  Test the - operator returns a frozen set.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.FrozenGTIDSet(self.gtidset1) - self.gtidset2
+
+        self.assertEqual(
+            (str(data), isinstance(data, mysql_class.FrozenGTIDSet)),
+            ("35588520:740001-740055", True))
+
+    def test_difference(self):
+
+        """Function:  test_difference
+
+        Description:  Test that an in-place difference raises an exception.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.FrozenGTIDSet(self.gtidset1)
+
+        with self.assertRaises(TypeError):
+            gtid.difference(self.gtidset2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# Classification (U)
+
+"""Program:  frozengtidset_union.py
+
+    Description:  Unit testing of FrozenGTIDSet.union in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/frozengtidset_union.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_union
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:333217-740055"
+        self.gtidset2 = "76012896:1-502108"
+
+    def test_union(self):
+
+        """Function:  test_union
+
+        Description:  Test that an in-place union raises an exception.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.FrozenGTIDSet(self.gtidset1)
+
+        with self.assertRaises(TypeError):
+            gtid.union(self.gtidset2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  get_driver.py
+
+    Description:  Unit testing of get_driver in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/get_driver.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default
+        test_pure
+        test_cext
+        test_no_cext
+        test_instance
+        test_unknown
+        test_connect
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        pass
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test the default mysql.connector driver.
+
+        Arguments:
+
+        """
+
+        driver = mysql_class.get_driver()
+
+        self.assertEqual((driver.name, driver.use_pure), ("connector", None))
+
+    def test_pure(self):
+
+        """Function:  test_pure
+
+        Description:  Test the pure Python driver.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_class.get_driver("pure").use_pure)
+
+    @mock.patch("mysql_class.mysql.connector.HAVE_CEXT", True)
+    def test_cext(self):
+
+        """Function:  test_cext
+
+        Description:  Test the C extension driver.
+
+        Arguments:
+
+        """
+
+        self.assertIs(mysql_class.get_driver("cext").use_pure, False)
+
+    @mock.patch("mysql_class.mysql.connector.HAVE_CEXT", False)
+    def test_no_cext(self):
+
+        """Function:  test_no_cext
+
+        Description:  Test the C extension driver when it is not installed.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ImportError):
+            mysql_class.get_driver("cext")
+
+    def test_instance(self):
+
+        """Function:  test_instance
+
+        Description:  Test a Driver instance is returned as is.
+
+        Arguments:
+
+        """
+
+        driver = mysql_class.Driver(use_pure=True)
+
+        self.assertIs(mysql_class.get_driver(driver), driver)
+
+    def test_unknown(self):
+
+        """Function:  test_unknown
+
+        Description:  Test with an unknown driver name.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_class.get_driver("other")
+
+    @mock.patch("mysql_class.mysql.connector.connect")
+    def test_connect(self, mock_conn):
+
+        """Function:  test_connect
+
+        Description:  Test the use_pure connection argument.
+
+        Arguments:
+
+        """
+
+        mysql_class.get_driver("pure").connect(host="host1")
+        mysql_class.get_driver().connect(host="host1")
+
+        self.assertEqual(
+            mock_conn.call_args_list,
+            [mock.call(host="host1", use_pure=True), mock.call(host="host1")])
+
+
+if __name__ == "__main__":
+    unittest.main()
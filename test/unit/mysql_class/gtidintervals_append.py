@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  gtidintervals_append.py
+
+    Description:  Unit testing of GTIDIntervals.append in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidintervals_append.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_interval
+        test_adjacent
+        test_overlap
+        test_inside
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rngs = mysql_class.GTIDIntervals([(1, 10)])
+
+    def test_new_interval(self):
+
+        """Function:  test_new_interval
+
+        Description:  Test appending a separate interval.
+
+        Arguments:
+
+        """
+
+        self.rngs.append(12, 15)
+
+        self.assertEqual(self.rngs.to_list(), [(1, 10), (12, 15)])
+
+    def test_adjacent(self):
+
+        """Function:  test_adjacent
+
+        Description:  Test appending an adjacent interval.
+
+        Arguments:
+
+        """
+
+        self.rngs.append(11, 15)
+
+        self.assertEqual(self.rngs.to_list(), [(1, 15)])
+
+    def test_overlap(self):
+
+        """Function:  test_overlap
+
+        Description:  Test appending an overlapping interval.
+
+        Arguments:
+
+        """
+
+        self.rngs.append(5, 15)
+
+        self.assertEqual(self.rngs.to_list(), [(1, 15)])
+
+    def test_inside(self):
+
+        """Function:  test_inside
+
+        Description:  Test appending an interval inside the last interval.
+
+        Arguments:
+
+        """
+
+        self.rngs.append(3, 5)
+
+        self.assertEqual(self.rngs.to_list(), [(1, 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
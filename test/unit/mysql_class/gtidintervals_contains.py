@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  gtidintervals_contains.py
+
+    Description:  Unit testing of GTIDIntervals.contains in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidintervals_contains.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_before_first
+        test_after_last
+        test_in_gap
+        test_boundaries
+        test_empty
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rngs = mysql_class.GTIDIntervals([(5, 10), (20, 30), (40, 40)])
+
+    def test_before_first(self):
+
+        """Function:  test_before_first
+
+        Description:  Test with transaction before the first interval.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.rngs.contains(4))
+
+    def test_after_last(self):
+
+        """Function:  test_after_last
+
+        Description:  Test with transaction after the last interval.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.rngs.contains(41))
+
+    def test_in_gap(self):
+
+        """Function:  test_in_gap
+
+        Description:  Test with transaction between two intervals.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.rngs.contains(15))
+
+    def test_boundaries(self):
+
+        """Function:  test_boundaries
+
+        Description:  Test with transactions on the interval boundaries.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(all(self.rngs.contains(gno)
+                            for gno in [5, 10, 20, 25, 30, 40]))
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no intervals.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_class.GTIDIntervals().contains(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# Classification (U)
+
+"""Program:  gtidintervals_count.py
+
+    Description:  Unit testing of GTIDIntervals.count in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidintervals_count.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_count
+        test_empty
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rngs = [(1, 10), (20, 20), (30, 39)]
+
+    def test_count(self):
+
+        """Function:  test_count
+
+        Description:  Test number of transactions in the intervals.
+
+        Arguments:
+
+        """
+
+        rngs = mysql_class.GTIDIntervals(self.rngs)
+
+        self.assertEqual(rngs.count(), 21)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no intervals.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_class.GTIDIntervals().count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
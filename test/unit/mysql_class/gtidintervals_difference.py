@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  gtidintervals_difference.py
+
+    Description:  Unit testing of GTIDIntervals.difference in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidintervals_difference.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_overlap
+        test_holes
+        test_spanning
+        test_all
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rngs1 = mysql_class.GTIDIntervals([(1, 10), (20, 30), (40, 50)])
+
+    def test_no_overlap(self):
+
+        """Function:  test_no_overlap
+
+        Description:  Test with no overlapping intervals.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.difference(
+            mysql_class.GTIDIntervals([(11, 19), (60, 70)]))
+
+        self.assertEqual(data, self.rngs1)
+
+    def test_holes(self):
+
+        """Function:  test_holes
+
+        Description:  Test with intervals cut out of the middle.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.difference(
+            mysql_class.GTIDIntervals([(3, 4), (7, 7)]))
+
+        self.assertEqual(
+            data.to_list(), [(1, 2), (5, 6), (8, 10), (20, 30), (40, 50)])
+
+    def test_spanning(self):
+
+        """Function:  test_spanning
+
+        Description:  Test with an interval spanning several intervals.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.difference(mysql_class.GTIDIntervals([(5, 45)]))
+
+        self.assertEqual(data.to_list(), [(1, 4), (46, 50)])
+
+    def test_all(self):
+
+        """Function:  test_all
+
+        Description:  Test with all transactions removed.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.difference(mysql_class.GTIDIntervals([(1, 50)]))
+
+        self.assertEqual(data.to_list(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  gtidintervals_init.py
+
+    Description:  Unit testing of GTIDIntervals.__init__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidintervals_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_single_gno
+        test_merge
+        test_unsorted
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rngs = [(1, 5), (6, 10), (20, 30), (25, 40)]
+        self.results = [(1, 10), (20, 40)]
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no ranges.
+
+        Arguments:
+
+        """
+
+        rngs = mysql_class.GTIDIntervals()
+
+        self.assertEqual(rngs.to_list(), [])
+
+    def test_single_gno(self):
+
+        """Function:  test_single_gno
+
+        Description:  Test with a single transaction number range.
+
+        Arguments:
+
+        """
+
+        rngs = mysql_class.GTIDIntervals([(7,)])
+
+        self.assertEqual(rngs.to_list(), [(7, 7)])
+
+    def test_merge(self):
+
+        """Function:  test_merge
+
+        Description:  Test merging of overlapping and adjacent ranges.
+
+        Arguments:
+
+        """
+
+        rngs = mysql_class.GTIDIntervals(self.rngs)
+
+        self.assertEqual(rngs.to_list(), self.results)
+
+    def test_unsorted(self):
+
+        """Function:  test_unsorted
+
+        Description:  Test with ranges out of order.
+
+        Arguments:
+
+        """
+
+        rngs = mysql_class.GTIDIntervals(list(reversed(self.rngs)))
+
+        self.assertEqual(rngs.to_list(), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  gtidintervals_intersection.py
+
+    Description:  Unit testing of GTIDIntervals.intersection in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidintervals_intersection.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_overlap
+        test_spanning
+        test_inside
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rngs1 = mysql_class.GTIDIntervals([(1, 10), (20, 30), (40, 50)])
+
+    def test_no_overlap(self):
+
+        """Function:  test_no_overlap
+
+        Description:  Test with no overlapping intervals.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.intersection(
+            mysql_class.GTIDIntervals([(11, 19), (60, 70)]))
+
+        self.assertEqual(data.to_list(), [])
+
+    def test_spanning(self):
+
+        """Function:  test_spanning
+
+        Description:  Test with an interval spanning several intervals.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.intersection(
+            mysql_class.GTIDIntervals([(5, 45)]))
+
+        self.assertEqual(data.to_list(), [(5, 10), (20, 30), (40, 45)])
+
+    def test_inside(self):
+
+        """Function:  test_inside
+
+        Description:  Test with intervals inside an interval.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.intersection(
+            mysql_class.GTIDIntervals([(2, 3), (5, 6), (25, 25)]))
+
+        self.assertEqual(data.to_list(), [(2, 3), (5, 6), (25, 25)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  gtidintervals_union.py
+
+    Description:  Unit testing of GTIDIntervals.union in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidintervals_union.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_interleaved
+        test_bridging
+        test_empty
+        test_not_modified
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rngs1 = mysql_class.GTIDIntervals([(1, 5), (20, 25), (40, 50)])
+        self.rngs2 = mysql_class.GTIDIntervals([(10, 12), (26, 30)])
+
+    def test_interleaved(self):
+
+        """Function:  test_interleaved
+
+        Description:  Test with interleaved and adjacent intervals.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.union(self.rngs2)
+
+        self.assertEqual(
+            data.to_list(), [(1, 5), (10, 12), (20, 30), (40, 50)])
+
+    def test_bridging(self):
+
+        """Function:  test_bridging
+
+        Description:  Test with an interval spanning several intervals.
+
+        Arguments:
+
+        """
+
+        data = self.rngs1.union(mysql_class.GTIDIntervals([(3, 45)]))
+
+        self.assertEqual(data.to_list(), [(1, 50)])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty interval list.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDIntervals().union(self.rngs1)
+
+        self.assertEqual(data, self.rngs1)
+
+    def test_not_modified(self):
+
+        """Function:  test_not_modified
+
+        Description:  Test that the original intervals are not changed.
+
+        Arguments:
+
+        """
+
+        self.rngs1.union(self.rngs2)
+
+        self.assertEqual(self.rngs1.to_list(), [(1, 5), (20, 25), (40, 50)])
+
+
+if __name__ == "__main__":
+    unittest.main()
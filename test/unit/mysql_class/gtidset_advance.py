@@ -0,0 +1,140 @@
+# Classification (U)
+
+"""Program:  gtidset_advance.py
+
+    Description:  Unit testing of GTIDSet.advance in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidset_advance.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_unchanged
+        test_changed_segment
+        test_removed_segment
+        test_after_union
+        test_newline
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:1-740055,76012896:1-502108"
+        self.gtidset2 = "35588520:1-740060,76012896:1-502108"
+        self.gtidset3 = "35588520:1-740060"
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with an unchanged GTID set string.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset1)
+
+        self.assertEqual((gtid.advance(self.gtidset1), str(gtid)),
+                         (0, self.gtidset1))
+
+    def test_changed_segment(self):
+
+        """Function:  test_changed_segment
+
+        Description:  Test that only the changed UUID segment is parsed.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset1)
+        rngs = gtid.intervals["76012896"]
+
+        self.assertEqual((gtid.advance(self.gtidset2), str(gtid),
+                          gtid.intervals["76012896"] is rngs),
+                         (1, self.gtidset2, True))
+
+    def test_removed_segment(self):
+
+        """Function:  test_removed_segment
+
+        Description:  Test with a UUID segment removed.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset1)
+        gtid.advance(self.gtidset3)
+
+        self.assertEqual(str(gtid), self.gtidset3)
+
+    def test_after_union(self):
+
+        """Function:  test_after_union
+
+        Description:  Test that a union forces the changed UUID to be parsed.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset1)
+        gtid.union("76012896:600000")
+
+        self.assertEqual((gtid.advance(self.gtidset1), str(gtid)),
+                         (1, self.gtidset1))
+
+    def test_newline(self):
+
+        """Function:  test_newline
+
+        Description:  Test with newlines after the commas.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset1)
+
+        self.assertEqual(
+            (gtid.advance(self.gtidset2.replace(",", ",\n")), str(gtid)),
+            (1, self.gtidset2))
+
+
+if __name__ == "__main__":
+    unittest.main()
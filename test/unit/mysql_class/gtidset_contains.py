@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  gtidset_contains.py
+
+    Description:  Unit testing of GTIDSet.contains and GTIDSet.__contains__ in
+        mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidset_contains.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_contains_true
+        test_contains_false
+        test_uuid_missing
+        test_in_operator
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtid = mysql_class.GTIDSet(
+            "35588520:1-740055,76012896:1-502108:502110-502200")
+
+    def test_contains_true(self):
+
+        """Function:  test_contains_true
+
+        Description:  Test with transaction in the set.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.gtid.contains("76012896", 502150))
+
+    def test_contains_false(self):
+
+        """Function:  test_contains_false
+
+        Description:  Test with transaction in a gap of the set.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.gtid.contains("76012896", 502109))
+
+    def test_uuid_missing(self):
+
+        """Function:  test_uuid_missing
+
+        Description:  Test with UUID not in the set.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.gtid.contains("11111111", 1))
+
+    def test_in_operator(self):
+
+        """Function:  test_in_operator
+
+        Description:  Test with the "in" operator.
+
+        Arguments:
+
+        """
+
+        self.assertTrue("35588520:740055" in self.gtid)
+
+
+if __name__ == "__main__":
+    unittest.main()
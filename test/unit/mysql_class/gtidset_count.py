@@ -0,0 +1,82 @@
+# Classification (U)
+
+"""Program:  gtidset_count.py
+
+    Description:  Unit testing of GTIDSet.count in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidset_count.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_count
+        test_empty
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset = "35588520:1-100:201-300,76012896:1-50"
+
+    def test_count(self):
+
+        """Function:  test_count
+
+        Description:  Test total number of transactions in the set.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset)
+
+        self.assertEqual(gtid.count(), 250)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_class.GTIDSet("").count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  gtidset_difference.py
+
+    Description:  Unit testing of GTIDSet.difference in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidset_difference.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_gtidset
+        test_uuid_removed
+        test_uuid_missing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:1-740055,76012896:1-502108"
+        self.gtidset2 = "35588520:333217-740055"
+
+    def test_not_gtidset(self):
+
+        """Function:  test_not_gtidset
+
+        Description:  Test GTIDSet.difference method with non-GTIDSet.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.GTIDSet(self.gtidset1)
+        gtid1.difference(self.gtidset2)
+
+        self.assertEqual(
+            gtid1.gtids,
+            {"35588520": ((1, 333216),), "76012896": ((1, 502108),)})
+
+    def test_uuid_removed(self):
+
+        """Function:  test_uuid_removed
+
+        Description:  Test that UUIDs without transactions left are removed.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.GTIDSet(self.gtidset2)
+        gtid1.difference(mysql_class.GTIDSet(self.gtidset1))
+
+        self.assertEqual(gtid1.gtids, {})
+
+    def test_uuid_missing(self):
+
+        """Function:  test_uuid_missing
+
+        Description:  Test with a UUID not in the second set.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.GTIDSet(self.gtidset1)
+        gtid1.difference(mysql_class.GTIDSet("11111111:1-5"))
+
+        self.assertEqual(str(gtid1), self.gtidset1)
+
+
+if __name__ == "__main__":
+    unittest.main()
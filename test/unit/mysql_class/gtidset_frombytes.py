@@ -0,0 +1,190 @@
+# Classification (U)
+
+"""Program:  gtidset_frombytes.py
+
+    Description:  Unit testing of GTIDSet.from_bytes in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidset_frombytes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import pickle
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_round_trip
+        test_string_uuid
+        test_interned
+        test_frozen
+        test_pickle
+        test_bad_format
+        test_truncated
+        test_trailing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid1 = "35588520-333d-11e8-a55d-005056a1b2c3"
+        self.uuid2 = "76012896-4e6a-11e8-8e2e-005056a1b2c3"
+        self.gtidset = f"{self.uuid1}:1-5:7,{self.uuid2}:1-502108"
+
+    def test_round_trip(self):
+
+        """Function:  test_round_trip
+
+        Description:  Test a set loaded from its binary format.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset)
+        gtid2 = mysql_class.GTIDSet.from_bytes(gtid.to_bytes())
+
+        self.assertEqual((type(gtid2), gtid2.gtids),
+                         (mysql_class.GTIDSet, gtid.gtids))
+
+    def test_string_uuid(self):
+
+        """Function:  test_string_uuid
+
+        Description:  Test with a UUID not in the canonical format.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet("ABC:3:5-300,foo:0")
+        gtid2 = mysql_class.GTIDSet.from_bytes(gtid.to_bytes())
+
+        self.assertEqual(gtid2.gtids, gtid.gtids)
+
+    def test_interned(self):
+
+        """Function:  test_interned
+
+        Description:  Test the UUIDs of sets loaded are the same objects.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet(self.gtidset).to_bytes()
+        gtid1 = mysql_class.GTIDSet.from_bytes(data)
+        gtid2 = mysql_class.GTIDSet.from_bytes(bytearray(data))
+
+        self.assertTrue(all(uuid1 is uuid2 for uuid1, uuid2 in
+                            zip(gtid1.intervals, gtid2.intervals)))
+
+    def test_frozen(self):
+
+        """Function:  test_frozen
+
+        Description:  Test loading a FrozenGTIDSet.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet(self.gtidset).to_bytes()
+        gtid = mysql_class.FrozenGTIDSet.from_bytes(data)
+
+        self.assertEqual((type(gtid), gtid),
+                         (mysql_class.FrozenGTIDSet,
+                          mysql_class.FrozenGTIDSet(self.gtidset)))
+
+    def test_pickle(self):
+
+        """Function:  test_pickle
+
+        Description:  Test pickling uses the binary format.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset)
+        frozen = mysql_class.FrozenGTIDSet(self.gtidset)
+
+        self.assertEqual((pickle.loads(pickle.dumps(gtid)),
+                          type(pickle.loads(pickle.dumps(frozen)))),
+                         (gtid, mysql_class.FrozenGTIDSet))
+
+    def test_bad_format(self):
+
+        """Function:  test_bad_format
+
+        Description:  Test with an unsupported format version.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_class.GTIDSet.from_bytes(b"\x02\x00")
+
+    def test_truncated(self):
+
+        """Function:  test_truncated
+
+        Description:  Test with truncated data.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet(self.gtidset).to_bytes()
+
+        with self.assertRaises(ValueError):
+            mysql_class.GTIDSet.from_bytes(data[:10])
+
+    def test_trailing(self):
+
+        """Function:  test_trailing
+
+        Description:  Test with trailing data.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet(self.gtidset).to_bytes()
+
+        with self.assertRaises(ValueError):
+            mysql_class.GTIDSet.from_bytes(data + b"\x00")
+
+
+if __name__ == "__main__":
+    unittest.main()
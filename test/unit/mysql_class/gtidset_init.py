@@ -37,6 +37,16 @@ class UnitTest(unittest.TestCase):
         setUp
         test_gtidset_basestring
         test_gtidset_init
+        test_gtidset_copy
+        test_gtidset_empty
+        test_gtidset_newline
+        test_gtidset_single
+        test_gtidset_unordered
+        test_gtidset_merge
+        test_gtidset_no_range
+        test_gtidset_bad_range
+        test_gtidset_reversed
+        test_gtids_read_only
 
     """
 
@@ -51,7 +61,7 @@ class UnitTest(unittest.TestCase):
         """
 
         self.gtidset = "35588520:333217-740055"
-        self.results = {"35588520": [(333217, 740055)]}
+        self.results = {"35588520": ((333217, 740055),)}
 
     @mock.patch("mysql_class.isinstance", mock.Mock(return_value=False))
     def test_gtidset_basestring(self):
@@ -82,6 +92,154 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(gtid.gtids, self.results)
 
+    def test_gtidset_copy(self):
+
+        """Function:  test_gtidset_copy
+
+        Description:  Test with a GTIDSet instance.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.GTIDSet(self.gtidset)
+        gtid2 = mysql_class.GTIDSet(gtid1)
+        gtid1.union("76012896:1-5")
+
+        self.assertEqual(gtid2.gtids, self.results)
+
+    def test_gtidset_empty(self):
+
+        """Function:  test_gtidset_empty
+
+        Description:  Test with an empty string.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet("")
+
+        self.assertEqual((gtid.gtids, str(gtid)), ({}, ""))
+
+    def test_gtidset_newline(self):
+
+        """Function:  test_gtidset_newline
+
+        Description:  Test with newlines after the commas.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet("35588520:333217-740055,\n76012896:1-5")
+
+        self.assertEqual(
+            (gtid.gtids, str(gtid)),
+            ({"35588520": ((333217, 740055),), "76012896": ((1, 5),)},
+             "35588520:333217-740055,76012896:1-5"))
+
+    def test_gtidset_single(self):
+
+        """Function:  test_gtidset_single
+
+        Description:  Test with single transaction ranges.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet("35588520:3:5-7:9")
+
+        self.assertEqual(gtid.gtids, {"35588520": ((3, 3), (5, 7), (9, 9))})
+
+    def test_gtidset_unordered(self):
+
+        """Function:  test_gtidset_unordered
+
+        Description:  Test with ranges out of order.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet("35588520:10-12:1-5:6")
+
+        self.assertEqual(gtid.gtids, {"35588520": ((1, 6), (10, 12))})
+
+    def test_gtidset_merge(self):
+
+        """Function:  test_gtidset_merge
+
+        Description:  Test with adjacent and overlapping ranges.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet("35588520:1-5:6-8:7-10:12")
+
+        self.assertEqual(gtid.gtids, {"35588520": ((1, 10), (12, 12))})
+
+    def test_gtidset_no_range(self):
+
+        """Function:  test_gtidset_no_range
+
+        Description:  Test with no range.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_class.GTIDSet("35588520:")
+
+    def test_gtidset_bad_range(self):
+
+        """Function:  test_gtidset_bad_range
+
+        Description:  Test with an invalid range.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_class.GTIDSet("35588520:1-5-7")
+
+    def test_gtidset_reversed(self):
+
+        """Function:  test_gtidset_reversed
+
+        Description:  Test with start of range after end of range.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_class.GTIDSet("35588520:7-5")
+
+    def test_gtids_read_only(self):
+
+        """Function:  test_gtids_read_only
+
+        Description:  Test the gtids mapping can not be changed in place.
+
+        Arguments:
+
+        """
+
+        gtid = mysql_class.GTIDSet(self.gtidset)
+
+        with self.assertRaises(TypeError):
+            gtid.gtids["35588520"] = [(1, 5)]
+
+        with self.assertRaises(AttributeError):
+            gtid.gtids["35588520"].append((1, 5))
+
+        self.assertEqual(gtid.gtids, self.results)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  gtidset_intersection.py
+
+    Description:  Unit testing of GTIDSet.intersection in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidset_intersection.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_gtidset
+        test_no_common
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset1 = "35588520:1-740055,76012896:1-502108"
+        self.gtidset2 = "35588520:333217-750000,11111111:1-5"
+
+    def test_not_gtidset(self):
+
+        """Function:  test_not_gtidset
+
+        Description:  Test GTIDSet.intersection method with non-GTIDSet.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.GTIDSet(self.gtidset1)
+        gtid1.intersection(self.gtidset2)
+
+        self.assertEqual(gtid1.gtids, {"35588520": ((333217, 740055),)})
+
+    def test_no_common(self):
+
+        """Function:  test_no_common
+
+        Description:  Test with sets without common transactions.
+
+        Arguments:
+
+        """
+
+        gtid1 = mysql_class.GTIDSet(self.gtidset1)
+        gtid1.intersection(mysql_class.GTIDSet("35588520:740056-740060"))
+
+        self.assertEqual(gtid1.gtids, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  gtidset_tobytes.py
+
+    Description:  Unit testing of GTIDSet.to_bytes in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/gtidset_tobytes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_uuid
+        test_string_uuid
+        test_empty
+        test_size
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid1 = "35588520-333d-11e8-a55d-005056a1b2c3"
+        self.uuid2 = "76012896-4e6a-11e8-8e2e-005056a1b2c3"
+        self.gtidset = f"{self.uuid1}:1-5:7,{self.uuid2}:1-502108"
+
+    def test_uuid(self):
+
+        """Function:  test_uuid
+
+        Description:  Test with a UUID packed as a 128-bit integer.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet(self.uuid1 + ":1-5").to_bytes()
+
+        self.assertEqual(
+            data, b"\x01\x01\x00" + bytes.fromhex(self.uuid1.replace("-", ""))
+            + b"\x01\x01\x04")
+
+    def test_string_uuid(self):
+
+        """Function:  test_string_uuid
+
+        Description:  Test with a UUID not in the canonical format.
+
+        Arguments:
+
+        """
+
+        data = mysql_class.GTIDSet("ABC:3:5-300").to_bytes()
+
+        self.assertEqual(data, b"\x01\x01\x04ABC\x02\x03\x00\x02\xa7\x02")
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_class.GTIDSet("").to_bytes(), b"\x01\x00")
+
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test the binary format is smaller than the string.
+
+        Arguments:
+
+        """
+
+        self.assertLess(len(mysql_class.GTIDSet(self.gtidset).to_bytes()),
+                        len(self.gtidset))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,7 +51,7 @@ class UnitTest(unittest.TestCase):
 
         self.gtidset1 = "35588520:333217-740055"
         self.gtidset2 = "35588520:1-740055,76012896:1-502108"
-        self.results = {"35588520": [(1, 740055)], "76012896": [(1, 502108)]}
+        self.results = {"35588520": ((1, 740055),), "76012896": ((1, 502108),)}
 
     def test_not_gtidset(self):
 
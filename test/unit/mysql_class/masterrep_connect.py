@@ -41,6 +41,7 @@ class UnitTest(unittest.TestCase):
         test_silent_default
         test_db_up
         test_db_down
+        test_lazy
 
     """
 
@@ -152,5 +153,27 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(self.mysqlrep.connect())
 
 
+    @mock.patch("mysql_class.MasterRep.upd_mst_status")
+    @mock.patch("mysql_class.Server.set_srv_gtid")
+    @mock.patch("mysql_class.Server.connect")
+    def test_lazy(self, mock_conn, mock_set, mock_update):
+
+        """Function:  test_lazy
+
+        Description:  Test with lazy connect deferring the status load.
+
+        Arguments:
+
+        """
+
+        mock_conn.return_value = True
+
+        self.mysqlrep.conn = True
+        self.mysqlrep.connect(lazy=True)
+
+        self.assertFalse(mock_set.called or mock_update.called)
+        self.assertNotIn("file", self.mysqlrep.__dict__)
+
+
 if __name__ == "__main__":
     unittest.main()
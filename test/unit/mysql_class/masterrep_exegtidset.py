@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  masterrep_exegtidset.py
+
+    Description:  Unit testing of MasterRep.exe_gtidset in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/masterrep_exegtidset.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exe_gtidset
+        test_no_gtid
+        test_backlog
+        test_incremental
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+        self.mysqldb = mysql_class.MasterRep(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.gtidset1 = "35588520:1-740055"
+        self.gtidset2 = "35588520:1-740000"
+
+    def test_exe_gtidset(self):
+
+        """Function:  test_exe_gtidset
+
+        Description:  Test with an executed GTID set.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.exe_gtid = self.gtidset1
+
+        self.assertEqual(str(self.mysqldb.exe_gtidset), self.gtidset1)
+
+    def test_no_gtid(self):
+
+        """Function:  test_no_gtid
+
+        Description:  Test with no executed GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.mysqldb.exe_gtidset.count(), 0)
+
+    def test_backlog(self):
+
+        """Function:  test_backlog
+
+        Description:  Test transactions missing on a slave.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.exe_gtid = self.gtidset1
+        slv_gtidset = mysql_class.frozen_gtidset(self.gtidset2)
+
+        self.assertEqual(
+            (self.mysqldb.exe_gtidset - slv_gtidset).count(), 55)
+
+    def test_incremental(self):
+
+        """Function:  test_incremental
+
+        Description:  Test that unchanged UUID segments are not parsed again.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.exe_gtid = self.gtidset1 + ",76012896:1-5"
+        gtid1 = self.mysqldb.exe_gtidset
+        self.mysqldb.exe_gtid = self.gtidset1 + ",76012896:1-6"
+        gtid2 = self.mysqldb.exe_gtidset
+
+        self.assertIs(gtid1.intervals["35588520"], gtid2.intervals["35588520"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  masterrep_getlogsizes.py
+
+    Description:  Unit testing of MasterRep.get_log_sizes in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/masterrep_getlogsizes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sizes
+        test_cached
+        test_refresh
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+        self.logs = [{"Log_name": "mysql-bin.000001", "File_size": 1000},
+                     {"Log_name": "mysql-bin.000002", "File_size": 200}]
+        self.mysqldb = mysql_class.MasterRep(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+
+    @mock.patch("mysql_class.Server.col_sql")
+    def test_sizes(self, mock_sql):
+
+        """Function:  test_sizes
+
+        Description:  Test the binary log sizes.
+
+        Arguments:
+
+        """
+
+        mock_sql.return_value = self.logs
+
+        self.assertEqual(self.mysqldb.get_log_sizes(),
+                         {"mysql-bin.000001": 1000, "mysql-bin.000002": 200})
+
+    @mock.patch("mysql_class.Server.col_sql")
+    def test_cached(self, mock_sql):
+
+        """Function:  test_cached
+
+        Description:  Test the sizes are cached.
+
+        Arguments:
+
+        """
+
+        mock_sql.return_value = self.logs
+        self.mysqldb.get_log_sizes()
+        self.mysqldb.get_log_sizes()
+
+        self.assertEqual(mock_sql.call_count, 1)
+
+    @mock.patch("mysql_class.Server.col_sql")
+    def test_refresh(self, mock_sql):
+
+        """Function:  test_refresh
+
+        Description:  Test refreshing the cached sizes.
+
+        Arguments:
+
+        """
+
+        mock_sql.return_value = self.logs
+        self.mysqldb.get_log_sizes()
+        mock_sql.return_value = self.logs + [
+            {"Log_name": "mysql-bin.000003", "File_size": 50}]
+
+        data = self.mysqldb.get_log_sizes(refresh=True)
+
+        self.assertEqual((len(data), mock_sql.call_count), (3, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
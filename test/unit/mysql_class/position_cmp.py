@@ -41,6 +41,8 @@ class UnitTest(unittest.TestCase):
         test_pos_after
         test_pos_before
         test_file_pos_equal
+        test_rollover
+        test_sorted
 
     """
 
@@ -154,6 +156,37 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(self.master.cmp(self.slave2), 0)
 
+    def test_rollover(self):
+
+        """Function:  test_rollover
+
+        Description:  Test with log numbering past six digits.
+
+        Arguments:
+
+        """
+
+        pos1 = mysql_class.Position("mysql-bin.999999", 500)
+        pos2 = mysql_class.Position("mysql-bin.1000000", 4)
+
+        self.assertEqual((pos1.cmp(pos2), pos2.cmp(pos1)), (-1, 1))
+
+    def test_sorted(self):
+
+        """Function:  test_sorted
+
+        Description:  Test sorting positions across the log rollover.
+
+        Arguments:
+
+        """
+
+        pos1 = mysql_class.Position("mysql-bin.999999", 500)
+        pos2 = mysql_class.Position("mysql-bin.1000000", 4)
+        pos3 = mysql_class.Position("mysql-bin.1000000", 10)
+
+        self.assertEqual(sorted([pos3, pos2, pos1]), [pos1, pos2, pos3])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  position_distance.py
+
+    Description:  Unit testing of Position.distance in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/position_distance.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_file
+        test_across_logs
+        test_negative
+        test_log_list
+        test_missing_log
+        test_other_sequence
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.log_sizes = {"mysql-bin.999998": 1000, "mysql-bin.999999": 2000,
+                          "mysql-bin.1000000": 3000}
+        self.pos1 = mysql_class.Position("mysql-bin.999998", 400)
+        self.pos2 = mysql_class.Position("mysql-bin.1000000", 100)
+
+    def test_same_file(self):
+
+        """Function:  test_same_file
+
+        Description:  Test with positions in the same log.
+
+        Arguments:
+
+        """
+
+        pos = mysql_class.Position("mysql-bin.999998", 900)
+
+        self.assertEqual(self.pos1.distance(pos, self.log_sizes), 500)
+
+    def test_across_logs(self):
+
+        """Function:  test_across_logs
+
+        Description:  Test with positions in different logs.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.pos1.distance(self.pos2, self.log_sizes), 2700)
+
+    def test_negative(self):
+
+        """Function:  test_negative
+
+        Description:  Test with the other position before the position.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.pos2.distance(self.pos1, self.log_sizes), -2700)
+
+    def test_log_list(self):
+
+        """Function:  test_log_list
+
+        Description:  Test with the output of show binary logs.
+
+        Arguments:
+
+        """
+
+        log_sizes = [{"Log_name": name, "File_size": size, "Encrypted": "No"}
+                     for name, size in self.log_sizes.items()]
+
+        self.assertEqual(self.pos1.distance(self.pos2, log_sizes), 2700)
+
+    def test_missing_log(self):
+
+        """Function:  test_missing_log
+
+        Description:  Test with a log size missing.
+
+        Arguments:
+
+        """
+
+        del self.log_sizes["mysql-bin.999999"]
+
+        with self.assertRaises(ValueError):
+            self.pos1.distance(self.pos2, self.log_sizes)
+
+    def test_other_sequence(self):
+
+        """Function:  test_other_sequence
+
+        Description:  Test with logs from a different sequence.
+
+        Arguments:
+
+        """
+
+        pos = mysql_class.Position("relay-bin.1000000", 100)
+
+        with self.assertRaises(ValueError):
+            self.pos1.distance(pos, self.log_sizes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  rawheader_decoder.py
+
+    Description:  Unit testing of RawHeader.decoder in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/rawheader_decoder.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_decoder
+        test_null
+        test_cached
+        test_fallback
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.long = mysql.connector.constants.FieldType.LONG
+        self.converter = mysql.connector.conversion.MySQLConverter()
+        self.header = mysql_class.RawHeader(
+            [("Cnt", self.long, None, None, None, None, 1, 0, 63),
+             ("Geo", 255, None, None, None, None, 1, 0, 63)], self.converter)
+
+    def test_decoder(self):
+
+        """Function:  test_decoder
+
+        Description:  Test the converter function of a column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.header.decoder(0)(b"12"), 12)
+
+    def test_null(self):
+
+        """Function:  test_null
+
+        Description:  Test the converter function with a NULL value.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.header.decoder(0)(None))
+
+    def test_cached(self):
+
+        """Function:  test_cached
+
+        Description:  Test the converter function is cached.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.header.decoder(0), self.header.decoder(0))
+
+    def test_fallback(self):
+
+        """Function:  test_fallback
+
+        Description:  Test with a field type without a converter method.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.header.decoder(1)(b"abc"), "abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
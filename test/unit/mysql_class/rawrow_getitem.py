@@ -0,0 +1,157 @@
+# Classification (U)
+
+"""Program:  rawrow_getitem.py
+
+    Description:  Unit testing of RawRow.__getitem__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/rawrow_getitem.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_getitem
+        test_lazy
+        test_cached
+        test_null
+        test_missing
+        test_raw
+        test_mapping
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        field = mysql.connector.constants.FieldType
+        self.header = mysql_class.RawHeader(
+            [("Name", field.VAR_STRING, None, None, None, None, 1, 0, 45),
+             ("Cnt", field.LONG, None, None, None, None, 1, 0, 63),
+             ("Avg", field.DOUBLE, None, None, None, None, 1, 0, 63)],
+            mysql.connector.conversion.MySQLConverter())
+        self.row = self.header.row((b"abc", b"12", None))
+
+    def test_getitem(self):
+
+        """Function:  test_getitem
+
+        Description:  Test the conversion of a column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.row["Cnt"], 12)
+
+    def test_lazy(self):
+
+        """Function:  test_lazy
+
+        Description:  Test only the accessed column is converted.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.row["Name"], "abc")
+        self.assertEqual(self.row.cache, {0: "abc"})
+
+    def test_cached(self):
+
+        """Function:  test_cached
+
+        Description:  Test the converted value is cached in the row.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.row["Name"], "abc")
+        self.row.values = (b"xyz", b"12", None)
+
+        self.assertEqual(self.row["Name"], "abc")
+
+    def test_null(self):
+
+        """Function:  test_null
+
+        Description:  Test with a NULL column.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.row["Avg"])
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with a column not in the row.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(KeyError):
+            self.row["Other"]                   # pylint:disable=W0104
+
+    def test_raw(self):
+
+        """Function:  test_raw
+
+        Description:  Test the unconverted value of a column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.row.raw("Cnt"), b"12")
+
+    def test_mapping(self):
+
+        """Function:  test_mapping
+
+        Description:  Test the row compares equal to the col_sql row.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.row, {"Name": "abc", "Cnt": 12, "Avg": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
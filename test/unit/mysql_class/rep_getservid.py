@@ -37,6 +37,7 @@ class UnitTest(unittest.TestCase):
     Methods:
         setUp
         test_default
+        test_cached
 
     """
 
@@ -79,5 +80,26 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(mysqlrep.get_serv_id(), 11)
 
 
+    @mock.patch("mysql_class.fetch_sys_var")
+    def test_cached(self, mock_fetch):
+
+        """Function:  test_cached
+
+        Description:  Test repeated calls use the variable cache.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = {"server_id": 11}
+        mysqlrep = mysql_class.Rep(self.name, self.server_id, self.sql_user,
+                                   self.sql_pass, self.machine,
+                                   defaults_file=self.defaults_file)
+        mysqlrep.get_serv_id()
+
+        self.assertEqual(mysqlrep.get_serv_id(), 11)
+        self.assertEqual(mock_fetch.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
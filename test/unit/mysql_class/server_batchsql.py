@@ -0,0 +1,331 @@
+# Classification (U)
+
+"""Program:  server_batchsql.py
+
+    Description:  Unit testing of Server.batch_sql in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_batchsql.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cmd_query_iter
+        get_rows
+
+    """
+
+    def __init__(self, results):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.results = results
+        self.rows = []
+        self.stmts = []
+
+    def cmd_query_iter(self, stmt):
+
+        """Method:  cmd_query_iter
+
+        Description:  Stub holder for the cmd_query_iter method.
+
+        Arguments:
+
+        """
+
+        self.stmts.append(stmt)
+
+        for keys, rows in self.results:
+            self.rows = rows
+
+            yield {"columns": [(key,) for key in keys]} if keys else {}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for the get_rows method.
+
+        Arguments:
+
+        """
+
+        return self.rows, {}
+
+
+class CConn():
+
+    """Class:  CConn
+
+    Description:  Class stub holder for a mysql.connector C extension
+        connection, which has no cmd_query_iter.
+
+    Methods:
+        __init__
+        _next
+        cmd_query
+        next_result
+        fetch_eof_columns
+        fetch_eof_status
+        get_rows
+
+    """
+
+    def __init__(self, results):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.results = list(results)
+        self.keys = None
+        self.rows = []
+        self.stmts = []
+        self.unread_result = False
+
+    def _next(self):
+
+        """Method:  _next
+
+        Description:  Move to the next result.
+
+        Arguments:
+
+        """
+
+        self.keys, self.rows = self.results.pop(0)
+        self.unread_result = bool(self.keys)
+
+    def cmd_query(self, stmt):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for the cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.stmts.append(stmt)
+        self._next()
+
+        return self.fetch_eof_columns() if self.keys \
+            else self.fetch_eof_status()
+
+    def next_result(self):
+
+        """Method:  next_result
+
+        Description:  Stub holder for the next_result method.
+
+        Arguments:
+
+        """
+
+        if not self.results:
+            return False
+
+        self._next()
+
+        return True
+
+    def fetch_eof_columns(self):
+
+        """Method:  fetch_eof_columns
+
+        Description:  Stub holder for the fetch_eof_columns method.
+
+        Arguments:
+
+        """
+
+        return {"columns": [(key,) for key in self.keys]}
+
+    def fetch_eof_status(self):
+
+        """Method:  fetch_eof_status
+
+        Description:  Stub holder for the fetch_eof_status method.
+
+        Arguments:
+
+        """
+
+        return {"affected_rows": 0}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for the get_rows method.
+
+        Arguments:
+
+        """
+
+        self.unread_result = False
+
+        return self.rows, {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one_request
+        test_results
+        test_res_mode
+        test_extra_results
+        test_cext
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.conn = Conn([
+            (["Col1", "Col2"], [(1, "a"), (2, "b")]), (None, []),
+            (["Variable_name", "Value"],
+             [("Uptime", "10"), ("Threads", "2")])])
+        self.cmds = ["select1", "set @a = 1",
+                     ("show status where Variable_name in (...)", "vert")]
+
+    def test_one_request(self):
+
+        """Function:  test_one_request
+
+        Description:  Test the commands are sent in one request.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.batch_sql(self.cmds)
+
+        self.assertEqual(
+            self.mysqldb.conn.stmts,
+            ["select1; set @a = 1; show status where Variable_name in (...)"])
+
+    def test_results(self):
+
+        """Function:  test_results
+
+        Description:  Test the col_sql and vert_sql formats.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.batch_sql(self.cmds),
+            [[{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}], None,
+             {"Uptime": "10", "Threads": "2"}])
+
+    def test_res_mode(self):
+
+        """Function:  test_res_mode
+
+        Description:  Test with a col_sql result mode.
+
+        Arguments:
+
+        """
+
+        data = self.mysqldb.batch_sql(self.cmds, res_mode="column")
+
+        self.assertEqual(data[0], {"Col1": [1, 2], "Col2": ["a", "b"]})
+        self.assertEqual(data[2], {"Uptime": "10", "Threads": "2"})
+
+    def test_extra_results(self):
+
+        """Function:  test_extra_results
+
+        Description:  Test with more results than commands.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.batch_sql(["call proc1"]),
+            [[{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}], None,
+             [{"Variable_name": "Uptime", "Value": "10"},
+              {"Variable_name": "Threads", "Value": "2"}]])
+
+    def test_cext(self):
+
+        """Function:  test_cext
+
+        Description:  Test with a C extension connection.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn = CConn(self.mysqldb.conn.results)
+
+        self.assertEqual(
+            self.mysqldb.batch_sql(self.cmds),
+            [[{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}], None,
+             {"Uptime": "10", "Threads": "2"}])
+        self.assertEqual(len(self.mysqldb.conn.stmts), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
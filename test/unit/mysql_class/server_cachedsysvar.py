@@ -0,0 +1,173 @@
+# Classification (U)
+
+"""Program:  server_cachedsysvar.py
+
+    Description:  Unit testing of Server.cached_sys_var in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_cachedsysvar.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cached
+        test_expired
+        test_no_ttl
+        test_var_ttl
+        test_cleared
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+
+    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.time.monotonic")
+    def test_cached(self, mock_time, mock_fetch):
+
+        """Function:  test_cached
+
+        Description:  Test with a cached variable within its time to live.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100.0
+        mock_fetch.return_value = {"server_uuid": "uuid1"}
+        self.mysqldb.cached_sys_var("server_uuid")
+        mock_time.return_value = 3699.0
+
+        self.assertEqual(
+            self.mysqldb.cached_sys_var("server_uuid"),
+            {"server_uuid": "uuid1"})
+        self.assertEqual(mock_fetch.call_count, 1)
+
+    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.time.monotonic")
+    def test_expired(self, mock_time, mock_fetch):
+
+        """Function:  test_expired
+
+        Description:  Test with a cached variable past its time to live.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100.0
+        mock_fetch.return_value = {"server_uuid": "uuid1"}
+        self.mysqldb.cached_sys_var("server_uuid")
+        mock_time.return_value = 3701.0
+        mock_fetch.return_value = {"server_uuid": "uuid2"}
+
+        self.assertEqual(
+            self.mysqldb.cached_sys_var("server_uuid"),
+            {"server_uuid": "uuid2"})
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    @mock.patch("mysql_class.fetch_sys_var")
+    def test_no_ttl(self, mock_fetch):
+
+        """Function:  test_no_ttl
+
+        Description:  Test with a variable which is not cached.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = {"read_only": "OFF"}
+        self.mysqldb.cached_sys_var("read_only")
+        self.mysqldb.cached_sys_var("read_only")
+
+        self.assertEqual(mock_fetch.call_count, 2)
+        self.assertEqual(self.mysqldb.var_cache, {})
+
+    @mock.patch("mysql_class.fetch_sys_var")
+    def test_var_ttl(self, mock_fetch):
+
+        """Function:  test_var_ttl
+
+        Description:  Test with the time to live set for the instance.
+
+        Arguments:
+
+        """
+
+        mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file,
+            var_ttl={"read_only": 10, "server_id": 0})
+        mock_fetch.return_value = {"read_only": "OFF"}
+        mysqldb.cached_sys_var("read_only")
+        mysqldb.cached_sys_var("read_only")
+
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertEqual(mysqldb.var_ttl["server_id"], 0)
+
+    @mock.patch("mysql_class.fetch_sys_var")
+    def test_cleared(self, mock_fetch):
+
+        """Function:  test_cleared
+
+        Description:  Test with the cache cleared.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = {"server_id": "10"}
+        self.mysqldb.cached_sys_var("server_id")
+        self.mysqldb.clear_var_cache()
+        self.mysqldb.cached_sys_var("server_id")
+
+        self.assertEqual(mock_fetch.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
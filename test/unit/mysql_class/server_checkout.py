@@ -0,0 +1,315 @@
+# Classification (U)
+
+"""Program:  server_checkout.py
+
+    Description:  Unit testing of Server.checkout in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_checkout.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for mysql.connector cursor class.
+
+    Methods:
+        __init__
+        execute
+        fetchall
+
+    """
+
+    def __init__(self, conn, buffered):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.buffered = buffered
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for execute method.
+
+        Arguments:
+
+        """
+
+        self.conn.cmds.append((cmd, params))
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for fetchall method.
+
+        Arguments:
+
+        """
+
+        return [(self.conn.name,)]
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for mysql.connector connection class.
+
+    Methods:
+        __init__
+        cursor
+        cmd_query
+        get_rows
+        is_connected
+        disconnect
+
+    """
+
+    def __init__(self, name="pooled"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.cmds = []
+        self.read = False
+        self.connected = True
+        self.unread_result = False
+
+    def cursor(self, buffered=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for cursor method.
+
+        Arguments:
+
+        """
+
+        return Cursor(self, buffered)
+
+    def cmd_query(self, cmd):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, None))
+        self.read = False
+
+        return {"columns": [("Name",)]}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for get_rows method.
+
+        Arguments:
+
+        """
+
+        self.read = True
+
+        return [(self.name,)], {}
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub holder for is_connected method.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Stub holder for disconnect method.
+
+        Arguments:
+
+        """
+
+        self.connected = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_pool
+        test_checkout
+        test_nested
+        test_block_sql
+        test_exception
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.conn = Conn("main")
+
+    def test_no_pool(self):
+
+        """Function:  test_no_pool
+
+        Description:  Test checkout without a pool.
+
+        Arguments:
+
+        """
+
+        with self.mysqldb.checkout() as conn:
+            self.assertIs(conn, self.mysqldb.conn)
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_checkout(self):
+
+        """Function:  test_checkout
+
+        Description:  Test a pooled connection is checked out and returned.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+
+        with self.mysqldb.checkout() as conn:
+            idle = self.mysqldb.pool.idle.qsize()
+
+        self.assertEqual((conn.name, idle, self.mysqldb.pool.idle.qsize()),
+                         ("pooled", 0, 1))
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_nested(self):
+
+        """Function:  test_nested
+
+        Description:  Test a nested checkout returns the same connection.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+
+        with self.mysqldb.checkout() as conn1:
+            with self.mysqldb.checkout() as conn2:
+                self.assertIs(conn1, conn2)
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_block_sql(self):
+
+        """Function:  test_block_sql
+
+        Description:  Test the server's methods in the block use the
+            connection.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+
+        with self.mysqldb.checkout() as conn:
+            self.mysqldb.cmd_sql("flush logs")
+
+        self.assertEqual((conn.cmds, self.mysqldb.conn.cmds),
+                         ([("flush logs", None)], []))
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test a connection is dropped after an exception, even
+            when it is still connected.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+
+        with self.assertRaises(ValueError):
+            with self.mysqldb.checkout() as conn:
+                raise ValueError("Query failed")
+
+        self.assertEqual(
+            (self.mysqldb.pool.idle.qsize(), self.mysqldb.pool.created),
+            (0, 0))
+        self.assertFalse(conn.connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import mock
 
 # Local
 sys.path.append(os.getcwd())
@@ -36,6 +37,8 @@ class UnitTest(unittest.TestCase):
     Methods:
         setUp
         test_chg_db_none
+        test_chg_db
+        test_chg_db_pooled
 
     """
 
@@ -75,6 +78,42 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysqldb.chg_db())
 
+    def test_chg_db(self):
+
+        """Function:  test_chg_db
+
+        Description:  Test the database of the server's connection.
+
+        Arguments:
+
+        """
+
+        mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            os_type=self.machine, defaults_file=self.defaults_file)
+        mysqldb.conn = mock.Mock()
+        mysqldb.chg_db("db2")
+
+        self.assertEqual(mysqldb.conn.database, "db2")
+
+    def test_chg_db_pooled(self):
+
+        """Function:  test_chg_db_pooled
+
+        Description:  Test the database of the pooled connections.
+
+        Arguments:
+
+        """
+
+        mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            os_type=self.machine, defaults_file=self.defaults_file)
+        mysqldb.conn = mock.Mock()
+        mysqldb.pooled().chg_db("db2")
+
+        self.assertEqual(mysqldb.pool.database, "db2")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,207 @@
+# Classification (U)
+
+"""Program:  server_colsql.py
+
+    Description:  Unit testing of Server.col_sql in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_colsql.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cmd_query
+        get_rows
+
+    """
+
+    def __init__(self, keys, rows):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.keys = keys
+        self.rows = rows
+        self.cmd = None
+        self.converter = mysql.connector.conversion.MySQLConverter()
+
+    def cmd_query(self, cmd):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for the cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return {"columns": [
+            (key, mysql.connector.constants.FieldType.VAR_STRING, None, None,
+             None, None, 1, 0, 45) for key in self.keys]}
+
+    def get_rows(self, raw=False):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for the get_rows method.
+
+        Arguments:
+
+        """
+
+        if raw:
+            return [tuple(str(item).encode() for item in row)
+                    for row in self.rows], {}
+
+        return self.rows, {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default
+        test_row
+        test_column
+        test_arrays
+        test_raw
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.conn = Conn(["Col1", "Col2"], [(1, "a"), (2, "b")])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default dict mode.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.col_sql("select1"),
+            [{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}])
+
+    def test_row(self):
+
+        """Function:  test_row
+
+        Description:  Test with the row mode.
+
+        Arguments:
+
+        """
+
+        data = self.mysqldb.col_sql("select1", res_mode="row")
+
+        self.assertEqual([(row.Col1, row.Col2) for row in data],
+                         [(1, "a"), (2, "b")])
+
+    def test_column(self):
+
+        """Function:  test_column
+
+        Description:  Test with the column mode.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.col_sql("select1", res_mode="column"),
+            {"Col1": [1, 2], "Col2": ["a", "b"]})
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_arrays(self):
+
+        """Function:  test_arrays
+
+        Description:  Test with the column mode and NumPy arrays.
+
+        Arguments:
+
+        """
+
+        data = self.mysqldb.col_sql("select1", res_mode="column", arrays=True)
+
+        self.assertEqual(data["Col1"].tolist(), [1, 2])
+        self.assertEqual(data["Col2"], ["a", "b"])
+
+    def test_raw(self):
+
+        """Function:  test_raw
+
+        Description:  Test with the raw mode.
+
+        Arguments:
+
+        """
+
+        data = self.mysqldb.col_sql("select1", raw=True)
+
+        self.assertEqual(data[1].raw("Col2"), b"b")
+        self.assertEqual(data, [{"Col1": "1", "Col2": "a"},
+                                {"Col1": "2", "Col2": "b"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,6 +81,7 @@ class UnitTest(unittest.TestCase):
         test_config
         test_connect_exception
         test_connect
+        test_conn_time
 
     """
 
@@ -218,6 +219,25 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysqldb.connect())
 
+    @mock.patch("mysql_class.mysql.connector.connect")
+    def test_conn_time(self, mock_connect):
+
+        """Function:  test_conn_time
+
+        Description:  Test the connect latency is kept.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = self.mysql
+        mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        mysqldb.connect()
+
+        self.assertGreaterEqual(mysqldb.conn_time, 0)
+
     def test_connect_exception(self):
 
         """Function:  test_connect_exception
@@ -254,5 +274,26 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(mysqldb.connect())
 
 
+    @mock.patch("mysql_class.mysql.connector.connect")
+    def test_var_cache(self, mock_connect):
+
+        """Function:  test_var_cache
+
+        Description:  Test the variable cache is cleared on connect.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = self.mysql
+        mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        mysqldb.var_cache["server_id"] = ({"server_id": "10"}, 0)
+        mysqldb.connect()
+
+        self.assertEqual(mysqldb.var_cache, {})
+
+
 if __name__ == "__main__":
     unittest.main()
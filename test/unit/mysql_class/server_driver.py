@@ -0,0 +1,386 @@
+# Classification (U)
+
+"""Program:  server_driver.py
+
+    Description:  Unit testing of the Server query methods with a DB-API
+        driver in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_driver.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Error(Exception):
+
+    """Class:  Error
+
+    Description:  Class stub holder for the DB-API Error exception.
+
+    Methods:
+
+    """
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a DB-API cursor.
+
+    Methods:
+        __init__
+        execute
+        nextset
+        fetchone
+        fetchall
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.results = []
+        self.description = None
+        self.rows = []
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        if self.conn.closed:
+            raise Error("closed")
+
+        self.conn.stmts.append((cmd, params))
+        self.results = [RESULTS.get(stmt, (None, [])) for stmt
+                        in cmd.split("; ")]
+        self.nextset()
+
+    def nextset(self):
+
+        """Method:  nextset
+
+        Description:  Stub holder for the nextset method.
+
+        Arguments:
+
+        """
+
+        if not self.results:
+            return None
+
+        keys, rows = self.results.pop(0)
+        self.description = [(key, 253) for key in keys] if keys else None
+        self.rows = list(rows)
+        self.rowcount = len(self.rows) if keys else 1
+
+        return True
+
+    def fetchone(self):
+
+        """Method:  fetchone
+
+        Description:  Stub holder for the fetchone method.
+
+        Arguments:
+
+        """
+
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        rows, self.rows = self.rows, []
+
+        return tuple(rows)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a DB-API connection.
+
+    Methods:
+        __init__
+        cursor
+        close
+
+    """
+
+    def __init__(self, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args = kwargs
+        self.stmts = []
+        self.closed = False
+
+    def cursor(self):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        return Cursor(self)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Module():
+
+    """Class:  Module
+
+    Description:  Class stub holder for a DB-API driver module.
+
+    Methods:
+        connect
+
+    """
+
+    __name__ = "dbapi"
+    Error = Error
+
+    @staticmethod
+    def connect(**kwargs):
+
+        """Method:  connect
+
+        Description:  Stub holder for the connect function.
+
+        Arguments:
+
+        """
+
+        return Conn(**kwargs)
+
+
+RESULTS = {
+    "select connection_id()": (["id"], [(21,)]),
+    "select version()": (["version"], [("8.0.28-log",)]),
+    "select database()": (["db"], [("db1",)]),
+    "select 1": (["1"], [(1,)]),
+    "select1": (["Col1", "Col2"], [(1, "a"), (2, "b")]),
+    "show status": (["Variable_name", "Value"], [("Uptime", "10")])}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect
+        test_connect_error
+        test_col_sql
+        test_vert_sql
+        test_sql
+        test_cmd_sql
+        test_batch_sql
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file,
+            driver=mysql_class.DBAPIDriver(Module()))
+        self.mysqldb.set_pass_config()
+        self.mysqldb.connect()
+
+    def test_connect(self):
+
+        """Function:  test_connect
+
+        Description:  Test the connection through the driver.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.mysqldb.version, (8, 0, 28))
+        self.assertEqual(self.mysqldb.conn.conn.args["password"], "my_japd")
+
+    def test_connect_error(self):
+
+        """Function:  test_connect_error
+
+        Description:  Test with a driver connection error.
+
+        Arguments:
+
+        """
+
+        server = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file,
+            driver=mysql_class.DBAPIDriver(Module()))
+        server.driver.module = mock.Mock(
+            Error=Error, connect=mock.Mock(side_effect=Error(2003, "Down")))
+        server.connect(silent=True)
+
+        self.assertIsNone(server.conn)
+        self.assertIn("2003: Down", server.conn_msg)
+
+    def test_col_sql(self):
+
+        """Function:  test_col_sql
+
+        Description:  Test col_sql.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.col_sql("select1"),
+            [{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}])
+
+    def test_vert_sql(self):
+
+        """Function:  test_vert_sql
+
+        Description:  Test vert_sql.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.vert_sql("show status"), {"Uptime": "10"})
+
+    def test_sql(self):
+
+        """Function:  test_sql
+
+        Description:  Test sql.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.mysqldb.sql("select1", res_set="all"),
+                         ((1, "a"), (2, "b")))
+
+    def test_cmd_sql(self):
+
+        """Function:  test_cmd_sql
+
+        Description:  Test cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.mysqldb.cmd_sql("set @a = 1"),
+                         {"affected_rows": 1, "insert_id": None})
+
+    def test_batch_sql(self):
+
+        """Function:  test_batch_sql
+
+        Description:  Test batch_sql.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.batch_sql(["select1", ("show status", "vert")]),
+            [[{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}],
+             {"Uptime": "10"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
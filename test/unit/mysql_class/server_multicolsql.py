@@ -0,0 +1,330 @@
+# Classification (U)
+
+"""Program:  server_multicolsql.py
+
+    Description:  Unit testing of Server.multi_col_sql in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_multicolsql.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cmd_query_iter
+        get_rows
+
+    """
+
+    def __init__(self, results):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.results = results
+        self.rows = []
+        self.stmts = []
+
+    def cmd_query_iter(self, stmt):
+
+        """Method:  cmd_query_iter
+
+        Description:  Stub holder for the cmd_query_iter method.
+
+        Arguments:
+
+        """
+
+        self.stmts.append(stmt)
+
+        for keys, rows in self.results:
+            self.rows = rows
+
+            yield {"columns": [(key,) for key in keys]} if keys else {}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for the get_rows method.
+
+        Arguments:
+
+        """
+
+        return self.rows, {}
+
+
+class CConn():
+
+    """Class:  CConn
+
+    Description:  Class stub holder for a mysql.connector C extension
+        connection, which has no cmd_query_iter.
+
+    Methods:
+        __init__
+        _next
+        cmd_query
+        next_result
+        fetch_eof_columns
+        fetch_eof_status
+        get_rows
+
+    """
+
+    def __init__(self, results):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.results = list(results)
+        self.keys = None
+        self.rows = []
+        self.stmts = []
+        self.unread_result = False
+
+    def _next(self):
+
+        """Method:  _next
+
+        Description:  Move to the next result.
+
+        Arguments:
+
+        """
+
+        self.keys, self.rows = self.results.pop(0)
+        self.unread_result = bool(self.keys)
+
+    def cmd_query(self, stmt):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for the cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.stmts.append(stmt)
+        self._next()
+
+        return self.fetch_eof_columns() if self.keys \
+            else self.fetch_eof_status()
+
+    def next_result(self):
+
+        """Method:  next_result
+
+        Description:  Stub holder for the next_result method.
+
+        Arguments:
+
+        """
+
+        if not self.results:
+            return False
+
+        self._next()
+
+        return True
+
+    def fetch_eof_columns(self):
+
+        """Method:  fetch_eof_columns
+
+        Description:  Stub holder for the fetch_eof_columns method.
+
+        Arguments:
+
+        """
+
+        return {"columns": [(key,) for key in self.keys]}
+
+    def fetch_eof_status(self):
+
+        """Method:  fetch_eof_status
+
+        Description:  Stub holder for the fetch_eof_status method.
+
+        Arguments:
+
+        """
+
+        return {"affected_rows": 0}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for the get_rows method.
+
+        Arguments:
+
+        """
+
+        self.unread_result = False
+
+        return self.rows, {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one_request
+        test_results
+        test_no_result_set
+        test_cext
+        test_cext_no_result_set
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+
+    def test_one_request(self):
+
+        """Function:  test_one_request
+
+        Description:  Test the commands are sent in one request.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn = Conn([(["Col1"], [(1,)]), (["Col2"], [(2,)])])
+        self.mysqldb.multi_col_sql(["select 1 Col1", "select 2 Col2"])
+
+        self.assertEqual(
+            self.mysqldb.conn.stmts, ["select 1 Col1; select 2 Col2"])
+
+    def test_results(self):
+
+        """Function:  test_results
+
+        Description:  Test with a result set for each command.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn = Conn([
+            (["Col1", "Col2"], [(1, "a"), (2, "b")]), (["Col3"], [])])
+
+        self.assertEqual(
+            self.mysqldb.multi_col_sql(["select1", "select2"]),
+            [[{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}], []])
+
+    def test_no_result_set(self):
+
+        """Function:  test_no_result_set
+
+        Description:  Test with a command without a result set.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn = Conn([(None, []), (["Col1"], [(1,)])])
+
+        self.assertEqual(
+            self.mysqldb.multi_col_sql(["set @a = 1", "select1"]),
+            [[{"Col1": 1}]])
+
+    def test_cext(self):
+
+        """Function:  test_cext
+
+        Description:  Test with a C extension connection.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn = CConn([
+            (["Col1", "Col2"], [(1, "a"), (2, "b")]), (["Col3"], [])])
+
+        self.assertEqual(
+            self.mysqldb.multi_col_sql(["select1", "select2"]),
+            [[{"Col1": 1, "Col2": "a"}, {"Col1": 2, "Col2": "b"}], []])
+        self.assertEqual(self.mysqldb.conn.stmts, ["select1; select2"])
+
+    def test_cext_no_result_set(self):
+
+        """Function:  test_cext_no_result_set
+
+        Description:  Test with a C extension connection and a command
+            without a result set.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn = CConn([
+            (["Col1"], [(1,)]), (None, []), (["Col2"], [(2,)])])
+
+        self.assertEqual(
+            self.mysqldb.multi_col_sql(["select1", "set @a = 1", "select2"]),
+            [[{"Col1": 1}], [{"Col2": 2}]])
+
+
+if __name__ == "__main__":
+    unittest.main()
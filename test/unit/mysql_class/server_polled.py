@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  server_polled.py
+
+    Description:  Unit testing of Server.polled in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_polled.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pool
+        test_pooled
+        test_disconnect
+        test_polled
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+
+    @mock.patch("mysql_class.StatusPoller.run")
+    def test_pool(self, mock_run):
+
+        """Function:  test_pool
+
+        Description:  Test a single connection pool is attached.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.polled()
+
+        self.assertEqual(self.mysqldb.pool.size, 1)
+
+    @mock.patch("mysql_class.StatusPoller.run")
+    def test_pooled(self, mock_run):
+
+        """Function:  test_pooled
+
+        Description:  Test an existing connection pool is kept.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled(size=3).polled()
+
+        self.assertEqual(self.mysqldb.pool.size, 3)
+
+    @mock.patch("mysql_class.StatusPoller.stop")
+    @mock.patch("mysql_class.StatusPoller.start")
+    def test_disconnect(self, mock_start, mock_stop):
+
+        """Function:  test_disconnect
+
+        Description:  Test the poller is stopped on disconnect.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.polled()
+        self.mysqldb.conn = mock.Mock()
+        self.mysqldb.disconnect()
+
+        self.assertTrue(mock_stop.called)
+
+    @mock.patch("mysql_class.StatusPoller.start")
+    def test_polled(self, mock_start):
+
+        """Function:  test_polled
+
+        Description:  Test the poller is started.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.mysqldb.polled(interval=5), self.mysqldb)
+        self.assertEqual(
+            (self.mysqldb.poller.servers, self.mysqldb.poller.interval),
+            ([self.mysqldb], 5))
+        self.assertTrue(mock_start.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,269 @@
+# Classification (U)
+
+"""Program:  server_pooled.py
+
+    Description:  Unit testing of Server.pooled in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_pooled.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for mysql.connector cursor class.
+
+    Methods:
+        __init__
+        execute
+        fetchall
+
+    """
+
+    def __init__(self, conn, buffered):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.buffered = buffered
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for execute method.
+
+        Arguments:
+
+        """
+
+        self.conn.cmds.append((cmd, params))
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for fetchall method.
+
+        Arguments:
+
+        """
+
+        return [(self.conn.name,)]
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for mysql.connector connection class.
+
+    Methods:
+        __init__
+        cursor
+        cmd_query
+        get_rows
+        is_connected
+        disconnect
+
+    """
+
+    def __init__(self, name="pooled"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.cmds = []
+        self.read = False
+        self.connected = True
+        self.unread_result = False
+
+    def cursor(self, buffered=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for cursor method.
+
+        Arguments:
+
+        """
+
+        return Cursor(self, buffered)
+
+    def cmd_query(self, cmd):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, None))
+        self.read = False
+
+        return {"columns": [("Name",)]}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for get_rows method.
+
+        Arguments:
+
+        """
+
+        self.read = True
+
+        return [(self.name,)], {}
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub holder for is_connected method.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Stub holder for disconnect method.
+
+        Arguments:
+
+        """
+
+        self.connected = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pooled
+        test_database
+        test_disconnect
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.conn = Conn("main")
+
+    def test_pooled(self):
+
+        """Function:  test_pooled
+
+        Description:  Test attaching a connection pool.
+
+        Arguments:
+
+        """
+
+        mysqldb = self.mysqldb.pooled(size=3)
+
+        self.assertEqual(
+            (mysqldb is self.mysqldb, mysqldb.pool.size, mysqldb.pool.created),
+            (True, 3, 0))
+
+    @mock.patch("mysql_class.Server.new_conn")
+    def test_database(self, mock_conn):
+
+        """Function:  test_database
+
+        Description:  Test the pooled connections use the database.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled(database="mydb")
+        self.mysqldb.pool.get()
+
+        mock_conn.assert_called_once_with(database="mydb")
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_disconnect(self):
+
+        """Function:  test_disconnect
+
+        Description:  Test disconnect closes the idle pooled connections.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+        conn = self.mysqldb.pool.get()
+        self.mysqldb.pool.release(conn)
+        self.mysqldb.disconnect()
+
+        self.assertEqual((conn.connected, self.mysqldb.pool.created),
+                         (False, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
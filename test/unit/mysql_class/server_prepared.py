@@ -0,0 +1,349 @@
+# Classification (U)
+
+"""Program:  server_prepared.py
+
+    Description:  Unit testing of Server.prepared, Server.stmt_cache and
+        Server.stmt_stats in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_prepared.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a prepared statement cursor.
+
+    Methods:
+        __init__
+        __iter__
+        execute
+        fetchall
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.stmts = []
+        self.with_rows = True
+        self.closed = False
+        self.description = conn.description
+        self.rowcount = 1
+        self.lastrowid = None
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Stub holder for the __iter__ method.
+
+        Arguments:
+
+        """
+
+        return iter(self.fetchall())
+
+    def execute(self, stmt, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        if self.conn.errors:
+            raise self.conn.errors.pop(0)
+
+        self.stmts.append((stmt, params))
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        return [("Var", self.stmts[-1][1][0])]
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cursor
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.connection_id = 10
+        self.cursors = []
+        self.errors = []
+        self.description = [("Var", 253, None, None, None, None, 1, 0, 45)]
+
+    def cursor(self, prepared=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        cur = Cursor(self)
+        cur.prepared = prepared
+        self.cursors.append(cur)
+
+        return cur
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_prepared
+        test_sql
+        test_row
+        test_vert_sql
+        test_stmt_stats
+        test_blob
+        test_no_params
+        test_show
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.conn = Conn()
+        self.cmd = "select * from performance_schema.global_variables" \
+            " where variable_name = %s"
+
+    def test_prepared(self):
+
+        """Function:  test_prepared
+
+        Description:  Test prepared returns the server.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.mysqldb.prepared(size=10), self.mysqldb)
+        self.assertEqual(self.mysqldb.stmt_cache(self.mysqldb.conn).size, 10)
+
+    def test_sql(self):
+
+        """Function:  test_sql
+
+        Description:  Test sql runs a prepared statement from the second
+            run.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.prepared()
+        self.mysqldb.sql(self.cmd, res_set="all", params=("var1",))
+
+        self.assertEqual(
+            self.mysqldb.sql(self.cmd, res_set="all", params=("var2",)),
+            [("Var", "var2")])
+        self.assertEqual([cur.prepared for cur in self.mysqldb.conn.cursors],
+                         [False, True])
+
+    def test_row(self):
+
+        """Function:  test_row
+
+        Description:  Test a prepared statement returns a cursor.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.prepared()
+        self.mysqldb.sql(self.cmd, params=("var1",))
+        cur = self.mysqldb.sql(self.cmd, params=("var2",))
+
+        self.assertEqual((cur.column_names, cur.rowcount), (("Var",), 1))
+        self.assertEqual(list(cur), [("Var", "var2")])
+        cur.close()
+
+    def test_vert_sql(self):
+
+        """Function:  test_vert_sql
+
+        Description:  Test vert_sql reuses the prepared statement.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.prepared()
+        self.mysqldb.vert_sql(self.cmd, ("var1",))
+        self.mysqldb.vert_sql(self.cmd, ("var2",))
+
+        self.assertEqual(self.mysqldb.vert_sql(self.cmd, ("var3",)),
+                         {"Var": "var3"})
+        self.assertEqual(len(self.mysqldb.conn.cursors), 2)
+
+    def test_stmt_stats(self):
+
+        """Function:  test_stmt_stats
+
+        Description:  Test the prepared statement counters.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.prepared()
+        self.mysqldb.vert_sql(self.cmd, ("var1",))
+        self.mysqldb.vert_sql(self.cmd, ("var2",))
+        self.mysqldb.vert_sql(self.cmd, ("var3",))
+        self.mysqldb.vert_sql("select %s", (1,))
+
+        self.assertEqual(
+            self.mysqldb.stmt_stats(),
+            {"hits": 1, "misses": 1, "evictions": 0, "statements": 1})
+
+    def test_blob(self):
+
+        """Function:  test_blob
+
+        Description:  Test a command returning a BLOB column is not
+            prepared, so the column stays bytes.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn.description = [
+            ("Data", 252, None, None, None, None, 1, 144, 63)]
+        self.mysqldb.prepared()
+        self.mysqldb.sql(self.cmd, res_set="all", params=(b"\xff",))
+
+        self.assertEqual(
+            self.mysqldb.sql(self.cmd, res_set="all", params=(b"\xff",)),
+            [("Var", b"\xff")])
+        self.assertFalse(
+            any(cur.prepared for cur in self.mysqldb.conn.cursors))
+
+    def test_no_params(self):
+
+        """Function:  test_no_params
+
+        Description:  Test a command without parameters is not prepared.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.prepared()
+
+        self.assertFalse(self.mysqldb.sql("select 1").prepared)
+        self.assertEqual(self.mysqldb.stmt_stats()["misses"], 0)
+
+    def test_show(self):
+
+        """Function:  test_show
+
+        Description:  Test a show command with parameters is not prepared.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.prepared()
+
+        self.assertEqual(
+            self.mysqldb.sql("show variables like %s", res_set="all",
+                             params=("var1",)), [("Var", "var1")])
+        self.assertFalse(self.mysqldb.conn.cursors[0].prepared)
+        self.assertEqual(self.mysqldb.stmt_stats()["misses"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,7 @@ class UnitTest(unittest.TestCase):
     Methods:
         setUp
         test_is_connected_false
+        test_var_cache
 
     """
 
@@ -80,5 +81,29 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(mysqldb.reconnect())
 
 
+    @mock.patch("mysql_class.Server.is_connected")
+    def test_var_cache(self, mock_conn):
+
+        """Function:  test_var_cache
+
+        Description:  Test the variable cache is cleared on reconnect.
+
+        Arguments:
+
+        """
+
+        mock_conn.return_value = False
+
+        mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            os_type=self.machine, defaults_file=self.defaults_file)
+        mysqldb.conn = mock.Mock()
+        mysqldb.var_cache["server_id"] = ({"server_id": "10"}, 0)
+        mysqldb.reconnect()
+
+        self.assertEqual(mysqldb.var_cache, {})
+        self.assertTrue(mysqldb.conn.reconnect.called)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  server_sampled.py
+
+    Description:  Unit testing of Server.sampled in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_sampled.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_sampled
+        test_history
+        test_sampled
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+
+    def test_not_sampled(self):
+
+        """Function:  test_not_sampled
+
+        Description:  Test snapshots are not kept by default.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.set_snapshot(
+            mysql_class.ServerSnapshot({"Uptime": "1"}, {}))
+
+        self.assertIsNone(self.mysqldb.sampler)
+
+    def test_history(self):
+
+        """Function:  test_history
+
+        Description:  Test with the history length set.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.mysqldb.sampled(history=10), self.mysqldb)
+        self.assertEqual(self.mysqldb.sampler.samples.maxlen, 10)
+
+    def test_sampled(self):
+
+        """Function:  test_sampled
+
+        Description:  Test the snapshots are added to the sampler.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.sampled()
+        self.mysqldb.set_snapshot(
+            mysql_class.ServerSnapshot({"Uptime": "1"}, {}))
+        self.mysqldb.set_snapshot(
+            mysql_class.ServerSnapshot({"Uptime": "2"}, {}))
+
+        self.assertEqual(len(self.mysqldb.sampler.samples), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
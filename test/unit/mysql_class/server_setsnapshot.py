@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  server_setsnapshot.py
+
+    Description:  Unit testing of Server.set_snapshot in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_setsnapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_uptime_forward
+        test_restart
+        test_no_uptime
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.var_cache["server_id"] = ({"server_id": "10"}, 0)
+
+    def test_uptime_forward(self):
+
+        """Function:  test_uptime_forward
+
+        Description:  Test with the uptime going forward.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.set_snapshot(
+            mysql_class.ServerSnapshot({"Uptime": "10"}, {}))
+        self.mysqldb.set_snapshot(
+            mysql_class.ServerSnapshot({"Uptime": "20"}, {}))
+
+        self.assertEqual(self.mysqldb.last_uptime, 20)
+        self.assertIn("server_id", self.mysqldb.var_cache)
+
+    def test_restart(self):
+
+        """Function:  test_restart
+
+        Description:  Test with the uptime going backwards after a restart.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.set_snapshot(
+            mysql_class.ServerSnapshot({"Uptime": "10"}, {}))
+        self.mysqldb.set_snapshot(
+            mysql_class.ServerSnapshot({"Uptime": "5"}, {}))
+
+        self.assertEqual(self.mysqldb.last_uptime, 5)
+        self.assertEqual(self.mysqldb.var_cache, {})
+
+    def test_no_uptime(self):
+
+        """Function:  test_no_uptime
+
+        Description:  Test with no uptime in the snapshot.
+
+        Arguments:
+
+        """
+
+        snap = mysql_class.ServerSnapshot({}, {})
+        self.mysqldb.set_snapshot(snap)
+
+        self.assertIs(self.mysqldb.snapshot, snap)
+        self.assertIsNone(self.mysqldb.last_uptime)
+
+
+if __name__ == "__main__":
+    unittest.main()
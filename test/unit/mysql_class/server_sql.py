@@ -0,0 +1,276 @@
+# Classification (U)
+
+"""Program:  server_sql.py
+
+    Description:  Unit testing of Server.sql in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_sql.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a mysql.connector cursor.
+
+    Methods:
+        __init__
+        __iter__
+        execute
+        fetchall
+
+    """
+
+    def __init__(self, rows, description, raw):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.rows = rows
+        self.description = description
+        self.raw = raw
+        self.cmd = None
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Stub holder for the __iter__ method.
+
+        Arguments:
+
+        """
+
+        return iter(self.rows)
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        self.cmd = (cmd, params)
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        return self.rows
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cursor
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.converter = mysql.connector.conversion.MySQLConverter()
+        self.description = [
+            ("Name", mysql.connector.constants.FieldType.VAR_STRING, None,
+             None, None, None, 1, 0, 45),
+            ("Cnt", mysql.connector.constants.FieldType.LONG, None, None,
+             None, None, 1, 0, 63)]
+        self.raw_rows = [(b"a", b"1"), (b"b", b"2")]
+        self.rows = [("a", 1), ("b", 2)]
+        self.cur = None
+
+    def cursor(self, raw=False, buffered=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        self.cur = Cursor(
+            self.raw_rows if raw else self.rows, self.description, raw)
+        self.cur.buffered = buffered
+
+        return self.cur
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_row
+        test_all
+        test_raw_all
+        test_raw_row
+        test_raw_no_result
+        test_raw_no_converter
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.conn = Conn()
+
+    def test_row(self):
+
+        """Function:  test_row
+
+        Description:  Test with a cursor row iteration.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.mysqldb.sql("select1"), self.mysqldb.conn.cur)
+
+    def test_all(self):
+
+        """Function:  test_all
+
+        Description:  Test with a single result set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.mysqldb.sql("select1", res_set="all", params=(1,)),
+            [("a", 1), ("b", 2)])
+        self.assertEqual(self.mysqldb.conn.cur.cmd, ("select1", (1,)))
+
+    def test_raw_all(self):
+
+        """Function:  test_raw_all
+
+        Description:  Test with a raw single result set.
+
+        Arguments:
+
+        """
+
+        data = self.mysqldb.sql("select1", res_set="all", raw=True)
+
+        self.assertTrue(self.mysqldb.conn.cur.raw)
+        self.assertEqual(data[1].raw("Cnt"), b"2")
+        self.assertEqual(data[1]["Cnt"], 2)
+
+    def test_raw_row(self):
+
+        """Function:  test_raw_row
+
+        Description:  Test with a raw row iteration.
+
+        Arguments:
+
+        """
+
+        data = self.mysqldb.sql("select1", raw=True)
+
+        self.assertEqual([row["Name"] for row in data], ["a", "b"])
+
+    def test_raw_no_result(self):
+
+        """Function:  test_raw_no_result
+
+        Description:  Test raw mode with a command without a result set.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn.description = None
+
+        self.assertEqual(
+            self.mysqldb.sql("update1", res_set="all", raw=True),
+            [(b"a", b"1"), (b"b", b"2")])
+
+    def test_raw_no_converter(self):
+
+        """Function:  test_raw_no_converter
+
+        Description:  Test raw mode with a connection without a converter.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn.converter = None
+        self.mysqldb.conn.python_charset = "utf8"
+        data = self.mysqldb.sql("select1", res_set="all", raw=True)
+
+        self.assertEqual(data[0], {"Name": "a", "Cnt": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
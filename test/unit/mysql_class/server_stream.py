@@ -0,0 +1,308 @@
+# Classification (U)
+
+"""Program:  server_stream.py
+
+    Description:  Unit testing of Server.stream in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for an unbuffered mysql.connector cursor.
+
+    Methods:
+        __init__
+        execute
+        fetchmany
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.cmd = None
+        self.params = None
+        self.sizes = []
+        self.closed = False
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+        self.conn.unread_result = True
+
+    def fetchmany(self, size=1):
+
+        """Method:  fetchmany
+
+        Description:  Stub holder for the fetchmany method.
+
+        Arguments:
+
+        """
+
+        self.sizes.append(size)
+        rows = self.conn.rows[:size]
+        self.conn.rows = self.conn.rows[size:]
+        self.conn.unread_result = bool(rows)
+
+        return rows
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        if self.conn.unread_result:
+            raise AssertionError("Unread result found")
+
+        self.closed = True
+
+
+class Conn():                               # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cursor
+
+    """
+
+    def __init__(self, rows):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.rows = list(rows)
+        self.unread_result = False
+        self.cur = None
+        self.buffered = None
+
+    def cursor(self, buffered=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        self.buffered = buffered
+        self.cur = Cursor(self)
+
+        return self.cur
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_unbuffered
+        test_batches
+        test_early_exit
+        test_max_rows
+        test_max_bytes
+        test_max_bytes_exceeded
+        test_stream
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.rows = [(num, "name" + str(num)) for num in range(10)]
+        self.mysqldb.conn = Conn(self.rows)
+
+    def test_unbuffered(self):
+
+        """Function:  test_unbuffered
+
+        Description:  Test the command runs in an unbuffered cursor.
+
+        Arguments:
+
+        """
+
+        list(self.mysqldb.stream("select1", params=(1,), batch=4))
+        cur = self.mysqldb.conn.cur
+
+        self.assertFalse(self.mysqldb.conn.buffered)
+        self.assertEqual((cur.cmd, cur.params), ("select1", (1,)))
+        self.assertEqual(cur.sizes, [4, 4, 4, 4])
+
+    def test_batches(self):
+
+        """Function:  test_batches
+
+        Description:  Test with batches of rows.
+
+        Arguments:
+
+        """
+
+        data = list(self.mysqldb.stream("select1", batch=4, batches=True))
+
+        self.assertEqual(data, [self.rows[:4], self.rows[4:8], self.rows[8:]])
+
+    def test_early_exit(self):
+
+        """Function:  test_early_exit
+
+        Description:  Test the cursor is closed when stopped early.
+
+        Arguments:
+
+        """
+
+        stream = self.mysqldb.stream("select1", batch=3)
+        next(stream)
+        stream.close()
+
+        self.assertTrue(self.mysqldb.conn.cur.closed)
+        self.assertEqual(self.mysqldb.conn.rows, [])
+
+    def test_max_rows(self):
+
+        """Function:  test_max_rows
+
+        Description:  Test with more rows than the row budget.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(mysql_class.mysql.connector.errors.DataError):
+            list(self.mysqldb.stream("select1", batch=4, max_rows=6))
+
+        self.assertTrue(self.mysqldb.conn.cur.closed)
+
+    def test_max_bytes(self):
+
+        """Function:  test_max_bytes
+
+        Description:  Test the batches start small and grow within the byte
+            budget.
+
+        Arguments:
+
+        """
+
+        data = list(self.mysqldb.stream(
+            "select1", batch=8, batches=True, max_bytes=400))
+        row_bytes = sum(mysql_class.sys.getsizeof(item)
+                        for item in self.rows[-1])
+
+        self.assertEqual([row for rows in data for row in rows], self.rows)
+        self.assertEqual(self.mysqldb.conn.cur.sizes[:3], [1, 2, 4])
+        self.assertTrue(
+            all(len(rows) * row_bytes <= 400 for rows in data))
+
+    def test_max_bytes_exceeded(self):
+
+        """Function:  test_max_bytes_exceeded
+
+        Description:  Test with a row larger than the byte budget.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.conn = Conn(self.rows[:2] + [(10, "x" * 1000)])
+
+        with self.assertRaises(mysql_class.mysql.connector.errors.DataError):
+            list(self.mysqldb.stream("select1", batch=8, max_bytes=400))
+
+        self.assertTrue(self.mysqldb.conn.cur.closed)
+
+    def test_stream(self):
+
+        """Function:  test_stream
+
+        Description:  Test with the rows returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(self.mysqldb.stream("select1", batch=4)), self.rows)
+        self.assertTrue(self.mysqldb.conn.cur.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  server_syncsnapshot.py
+
+    Description:  Unit testing of Server.sync_snapshot in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_syncsnapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_polled
+        test_no_snapshot
+        test_same_snapshot
+        test_sync_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.sampled()
+        self.poller = mysql_class.StatusPoller([self.mysqldb])
+        self.snapshot = mysql_class.ServerSnapshot({"Uptime": "16"}, {})
+
+    def test_not_polled(self):
+
+        """Function:  test_not_polled
+
+        Description:  Test with a server which is not polled.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.mysqldb.sync_snapshot())
+
+    def test_no_snapshot(self):
+
+        """Function:  test_no_snapshot
+
+        Description:  Test with a poller which has not polled yet.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.poller = self.poller
+
+        self.assertIsNone(self.mysqldb.sync_snapshot())
+
+    def test_same_snapshot(self):
+
+        """Function:  test_same_snapshot
+
+        Description:  Test the same snapshot is only added to the history
+            once.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.poller = self.poller
+        self.poller.snapshots = {self.name: self.snapshot}
+        self.mysqldb.sync_snapshot()
+        self.mysqldb.sync_snapshot()
+
+        self.assertEqual(len(self.mysqldb.sampler.samples), 1)
+
+    def test_sync_snapshot(self):
+
+        """Function:  test_sync_snapshot
+
+        Description:  Test the latest snapshot is set on the server.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.poller = self.poller
+        self.poller.snapshots = {self.name: self.snapshot}
+
+        self.assertIs(self.mysqldb.sync_snapshot(), self.snapshot)
+        self.assertEqual(self.mysqldb.last_uptime, 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
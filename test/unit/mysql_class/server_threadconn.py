@@ -0,0 +1,321 @@
+# Classification (U)
+
+"""Program:  server_threadconn.py
+
+    Description:  Unit testing of Server.thread_conn in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_threadconn.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import concurrent.futures
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for mysql.connector cursor class.
+
+    Methods:
+        __init__
+        execute
+        fetchall
+
+    """
+
+    def __init__(self, conn, buffered):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.buffered = buffered
+
+    def execute(self, cmd, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for execute method.
+
+        Arguments:
+
+        """
+
+        self.conn.cmds.append((cmd, params))
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for fetchall method.
+
+        Arguments:
+
+        """
+
+        return [(self.conn.name,)]
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for mysql.connector connection class.
+
+    Methods:
+        __init__
+        cursor
+        cmd_query
+        get_rows
+        is_connected
+        disconnect
+
+    """
+
+    def __init__(self, name="pooled"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.cmds = []
+        self.read = False
+        self.connected = True
+        self.unread_result = False
+
+    def cursor(self, buffered=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for cursor method.
+
+        Arguments:
+
+        """
+
+        return Cursor(self, buffered)
+
+    def cmd_query(self, cmd):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append((cmd, None))
+        self.read = False
+
+        return {"columns": [("Name",)]}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for get_rows method.
+
+        Arguments:
+
+        """
+
+        self.read = True
+
+        return [(self.name,)], {}
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub holder for is_connected method.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def disconnect(self):
+
+        """Method:  disconnect
+
+        Description:  Stub holder for disconnect method.
+
+        Arguments:
+
+        """
+
+        self.connected = False
+
+
+def in_thread(func):
+
+    """Function:  in_thread
+
+    Description:  Run a function in a worker thread and return its result.
+
+    Arguments:
+
+    """
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(func).result()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_pool
+        test_owner
+        test_sql
+        test_col_sql
+        test_cmd_sql
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        self.mysqldb.conn = Conn("main")
+
+    def test_no_pool(self):
+
+        """Function:  test_no_pool
+
+        Description:  Test worker threads use the server's connection without a
+            pool.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            in_thread(lambda: self.mysqldb.sql("select 1", res_set="all")),
+            [("main",)])
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_owner(self):
+
+        """Function:  test_owner
+
+        Description:  Test the pool's owner thread uses the server's
+            connection.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+
+        self.assertEqual(self.mysqldb.sql("select 1", res_set="all"),
+                         [("main",)])
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_sql(self):
+
+        """Function:  test_sql
+
+        Description:  Test sql from a worker thread uses a buffered pooled
+            cursor.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+        cur = in_thread(lambda: self.mysqldb.sql("select 1"))
+
+        self.assertEqual((cur.conn.name, cur.buffered, self.mysqldb.conn.cmds),
+                         ("pooled", True, []))
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_col_sql(self):
+
+        """Function:  test_col_sql
+
+        Description:  Test col_sql from a worker thread.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+
+        self.assertEqual(in_thread(lambda: self.mysqldb.col_sql("show logs")),
+                         [{"Name": "pooled"}])
+
+    @mock.patch("mysql_class.Server.new_conn",
+                mock.Mock(side_effect=lambda database="": Conn()))
+    def test_cmd_sql(self):
+
+        """Function:  test_cmd_sql
+
+        Description:  Test cmd_sql from a worker thread reads the rows.
+
+        Arguments:
+
+        """
+
+        self.mysqldb.pooled()
+        in_thread(lambda: self.mysqldb.cmd_sql("show logs"))
+        conn = self.mysqldb.pool.get()
+
+        self.assertEqual((conn.cmds, conn.read), ([("show logs", None)], True))
+
+
+if __name__ == "__main__":
+    unittest.main()
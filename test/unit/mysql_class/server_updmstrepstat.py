@@ -61,16 +61,15 @@ class UnitTest(unittest.TestCase):
         self.port = 3307
         self.defaults_file = "def_cfg_file"
         self.extra_def_file = "extra_cfg_file"
-        self.fetch_vars = [{"log_bin": "ON"}, {"sync_binlog": "YES"},
-                           {"innodb_flush_log_at_trx_commit": "YES"},
-                           {"innodb_support_xa": "ON"},
-                           {"binlog_format": "BIN"}]
-        self.fetch_vars2 = [{"log_bin": "ON"}, {"sync_binlog": "YES"},
-                            {"innodb_flush_log_at_trx_commit": "YES"},
-                            {},
-                            {"binlog_format": "BIN"}]
-
-    @mock.patch("mysql_class.fetch_sys_var")
+        self.fetch_vars = {"log_bin": "ON", "sync_binlog": "YES",
+                           "innodb_flush_log_at_trx_commit": "YES",
+                           "innodb_support_xa": "ON",
+                           "binlog_format": "BIN"}
+        self.fetch_vars2 = {"log_bin": "ON", "sync_binlog": "YES",
+                            "innodb_flush_log_at_trx_commit": "YES",
+                            "binlog_format": "BIN"}
+
+    @mock.patch("mysql_class.fetch_sys_vars")
     def test_version2(self, mock_sysvar):
 
         """Function:  test_version2
@@ -81,7 +80,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sysvar.side_effect = self.fetch_vars
+        mock_sysvar.return_value = self.fetch_vars
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -89,7 +88,7 @@ class UnitTest(unittest.TestCase):
         mysqldb.upd_mst_rep_stat()
         self.assertEqual(mysqldb.innodb_xa, "ON")
 
-    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.fetch_sys_vars")
     def test_version(self, mock_sysvar):
 
         """Function:  test_version
@@ -100,7 +99,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sysvar.side_effect = self.fetch_vars2
+        mock_sysvar.return_value = self.fetch_vars2
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -108,7 +107,7 @@ class UnitTest(unittest.TestCase):
         mysqldb.upd_mst_rep_stat()
         self.assertIsNone(mysqldb.innodb_xa)
 
-    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.fetch_sys_vars")
     def test_value(self, mock_sysvar):
 
         """Function:  test_value
@@ -119,7 +118,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sysvar.side_effect = self.fetch_vars
+        mock_sysvar.return_value = self.fetch_vars
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -62,7 +62,7 @@ class UnitTest(unittest.TestCase):
         self.defaults_file = "def_cfg_file"
         self.extra_def_file = "extra_cfg_file"
 
-    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.Server.vert_sql")
     def test_post_8026(self, mock_sysvar):
 
         """Function:  test_post_8026
@@ -73,10 +73,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sysvar.side_effect = [
-            {"log_bin": "ON"}, {"read_only": "YES"},
-            {"log_replica_updates": "YES"}, {"sync_source_info": "NO"},
-            {"sync_relay_log": "ON"}, {"sync_relay_log_info": "YES"}]
+        mock_sysvar.return_value = {
+            "log_bin": "ON", "read_only": "YES", "log_replica_updates": "YES",
+            "sync_source_info": "NO", "sync_relay_log": "ON",
+            "sync_relay_log_info": "YES"}
 
         mysqldb = mysql_class.Server(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -86,9 +86,10 @@ class UnitTest(unittest.TestCase):
         mysqldb.upd_slv_rep_stat()
 
         self.assertEqual(
-            (mysqldb.log_bin, mysqldb.sync_rly_info), ("ON", "YES"))
+            (mysqldb.log_bin, mysqldb.sync_rly_info, mysqldb.log_slv_upd,
+             mysqldb.sync_mst), ("ON", "YES", "YES", "NO"))
 
-    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.Server.vert_sql")
     def test_pre_8026(self, mock_sysvar):
 
         """Function:  test_pre_8026
@@ -99,10 +100,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sysvar.side_effect = [
-            {"log_bin": "ON"}, {"read_only": "YES"},
-            {"log_slave_updates": "YES"}, {"sync_master_info": "NO"},
-            {"sync_relay_log": "ON"}, {"sync_relay_log_info": "YES"}]
+        mock_sysvar.return_value = {
+            "log_bin": "ON", "read_only": "YES", "log_slave_updates": "YES",
+            "sync_master_info": "NO", "sync_relay_log": "ON",
+            "sync_relay_log_info": "YES"}
 
         mysqldb = mysql_class.Server(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -112,9 +113,10 @@ class UnitTest(unittest.TestCase):
         mysqldb.upd_slv_rep_stat()
 
         self.assertEqual(
-            (mysqldb.log_bin, mysqldb.sync_rly_info), ("ON", "YES"))
+            (mysqldb.log_bin, mysqldb.sync_rly_info, mysqldb.log_slv_upd,
+             mysqldb.sync_mst), ("ON", "YES", "YES", "NO"))
 
-    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.Server.vert_sql")
     def test_value(self, mock_sysvar):
 
         """Function:  test_value
@@ -125,10 +127,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sysvar.side_effect = [
-            {"log_bin": "ON"}, {"read_only": "YES"},
-            {"log_slave_updates": "YES"}, {"sync_master_info": "NO"},
-            {"sync_relay_log": "ON"}, {"sync_relay_log_info": "YES"}]
+        mock_sysvar.return_value = {
+            "log_bin": "ON", "read_only": "YES", "log_slave_updates": "YES",
+            "sync_master_info": "NO", "sync_relay_log": "ON",
+            "sync_relay_log_info": "YES"}
 
         mysqldb = mysql_class.Server(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -138,7 +140,8 @@ class UnitTest(unittest.TestCase):
         mysqldb.upd_slv_rep_stat()
 
         self.assertEqual(
-            (mysqldb.log_bin, mysqldb.sync_rly_info), ("ON", "YES"))
+            (mysqldb.log_bin, mysqldb.sync_rly_info, mysqldb.log_slv_upd,
+             mysqldb.sync_mst), ("ON", "YES", "YES", "NO"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  server_updsnapshot.py
+
+    Description:  Unit testing of Server.upd_snapshot in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/server_updsnapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one_collect
+        test_upd_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+        self.variables = {
+            "key_buffer_size": "10000000", "innodb_buffer_pool_size": "2",
+            "innodb_log_buffer_size": "4", "query_cache_size": "5",
+            "read_buffer_size": "5", "read_rnd_buffer_size": "6",
+            "sort_buffer_size": "7", "join_buffer_size": "8",
+            "thread_stack": "9",
+            "max_allowed_packet": "10", "net_buffer_length": "11",
+            "max_connections": "12", "max_heap_table_size": "13",
+            "tmp_table_size": "14"}
+        self.status = {
+            "Threads_connected": "15", "Uptime": "172800",
+            "Innodb_buffer_pool_pages_free": "1",
+            "Innodb_buffer_pool_pages_data": "2",
+            "Innodb_buffer_pool_pages_total": "4",
+            "Innodb_buffer_pool_pages_dirty": "4", "Max_used_connections": "5",
+            "Uptime_since_flush_status": "5", "Binlog_cache_disk_use": "6",
+            "Binlog_cache_use": "7", "Innodb_buffer_pool_wait_free": "8",
+            "Innodb_log_waits": "9", "Innodb_row_lock_time_avg": "10",
+            "Innodb_row_lock_time_max": "11", "Innodb_buffer_pool_reads": "12",
+            "Innodb_buffer_pool_read_requests": "24",
+            "Innodb_buffer_pool_read_ahead_evicted": "14",
+            "Innodb_buffer_pool_read_ahead": "28",
+            "Innodb_buffer_pool_write_requests": "17",
+            "Created_tmp_disk_tables": "16"}
+
+        self.snap = mysql_class.ServerSnapshot(
+            self.status, self.variables, 1.0)
+        self.mysqldb = mysql_class.Server(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+
+    @mock.patch("mysql_class.ServerSnapshot.collect")
+    def test_one_collect(self, mock_collect):
+
+        """Function:  test_one_collect
+
+        Description:  Test with one snapshot for both sets of attributes.
+
+        Arguments:
+
+        """
+
+        mock_collect.return_value = self.snap
+        self.mysqldb.upd_snapshot()
+
+        self.assertEqual(mock_collect.call_count, 1)
+        self.assertIs(self.mysqldb.snapshot, self.snap)
+
+    @mock.patch("mysql_class.ServerSnapshot.collect")
+    def test_upd_snapshot(self, mock_collect):
+
+        """Function:  test_upd_snapshot
+
+        Description:  Test with values returned.
+
+        Arguments:
+
+        """
+
+        mock_collect.return_value = self.snap
+        self.mysqldb.upd_snapshot()
+
+        self.assertEqual(
+            (self.mysqldb.cur_conn, self.mysqldb.prct_mem,
+             self.mysqldb.indb_buf_write, self.mysqldb.indb_buf_read_pct),
+            (15, 100, 17, 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -99,7 +99,7 @@ class UnitTest(unittest.TestCase):
             {"Variable_name": "Created_tmp_disk_tables",
              "Value": "16"}]
 
-    @mock.patch("mysql_class.Server.col_sql")
+    @mock.patch("mysql_class.Server.multi_col_sql")
     def test_pool_write(self, mock_sql):
 
         """Function:  test_pool_write
@@ -110,7 +110,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sql.return_value = self.show_status
+        mock_sql.return_value = [self.show_status, []]
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -119,7 +119,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(mysqldb.indb_buf_write, 17)
 
-    @mock.patch("mysql_class.Server.col_sql")
+    @mock.patch("mysql_class.Server.multi_col_sql")
     def test_value(self, mock_sql):
 
         """Function:  test_value
@@ -130,7 +130,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_sql.return_value = self.show_status
+        mock_sql.return_value = [self.show_status, []]
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -64,6 +64,8 @@ class UnitTest(unittest.TestCase):
         self.version = (5, 7, 33)
         self.version2 = (8, 0, 3)
 
+        self.status = [{"Variable_name": "Threads_connected", "Value": "15"},
+                       {"Variable_name": "Uptime", "Value": "16"}]
         self.show_status = [
             {"Variable_name": "key_buffer_size",
              "Value": "10000000"},
@@ -156,9 +158,8 @@ class UnitTest(unittest.TestCase):
             {"Variable_name": "tmp_table_size",
              "Value": "14"}]
 
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.Server.col_sql")
-    def test_version2(self, mock_sql, mock_var):
+    @mock.patch("mysql_class.Server.multi_col_sql")
+    def test_version2(self, mock_sql):
 
         """Function:  test_version2
 
@@ -168,9 +169,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.side_effect = [{"Threads_connected": "15"},
-                                {"Uptime": "16"}]
-        mock_sql.return_value = self.show_status3
+        mock_sql.return_value = [self.status, self.show_status3]
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -180,9 +179,8 @@ class UnitTest(unittest.TestCase):
         self.assertEqual((mysqldb.version, mysqldb.qry_cache),
                          (self.version2, 0))
 
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.Server.col_sql")
-    def test_version(self, mock_sql, mock_var):
+    @mock.patch("mysql_class.Server.multi_col_sql")
+    def test_version(self, mock_sql):
 
         """Function:  test_version
 
@@ -192,9 +190,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.side_effect = [{"Threads_connected": "15"},
-                                {"Uptime": "16"}]
-        mock_sql.return_value = self.show_status
+        mock_sql.return_value = [self.status, self.show_status]
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -204,9 +200,8 @@ class UnitTest(unittest.TestCase):
         self.assertEqual((mysqldb.version, mysqldb.qry_cache),
                          (self.version, 5))
 
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.Server.col_sql")
-    def test_value2(self, mock_sql, mock_var):
+    @mock.patch("mysql_class.Server.multi_col_sql")
+    def test_value2(self, mock_sql):
 
         """Function:  test_value2
 
@@ -216,9 +211,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.side_effect = [{"Threads_connected": "15"},
-                                {"Uptime": "16"}]
-        mock_sql.return_value = self.show_status2
+        mock_sql.return_value = [self.status, self.show_status2]
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
@@ -229,9 +222,8 @@ class UnitTest(unittest.TestCase):
                           mysqldb.tmp_tbl_size, mysqldb.prct_mem),
                          (10000000, 15, 56, 13, 100))
 
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.Server.col_sql")
-    def test_value(self, mock_sql, mock_var):
+    @mock.patch("mysql_class.Server.multi_col_sql")
+    def test_value(self, mock_sql):
 
         """Function:  test_value
 
@@ -241,9 +233,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.side_effect = [{"Threads_connected": "15"},
-                                {"Uptime": "16"}]
-        mock_sql.return_value = self.show_status
+        mock_sql.return_value = [self.status, self.show_status]
         mysqldb = mysql_class.Server(self.name, self.server_id, self.sql_user,
                                      self.sql_pass, self.machine,
                                      defaults_file=self.defaults_file)
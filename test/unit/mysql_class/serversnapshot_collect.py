@@ -0,0 +1,294 @@
+# Classification (U)
+
+"""Program:  serversnapshot_collect.py
+
+    Description:  Unit testing of ServerSnapshot.collect in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/serversnapshot_collect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+        multi_col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.results = [
+            [{"Variable_name": "Uptime", "Value": "16"}],
+            [{"Variable_name": "max_connections", "Value": "12"}]]
+
+    def multi_col_sql(self, cmds):
+
+        """Method:  multi_col_sql
+
+        Description:  Stub holder for Server.multi_col_sql method.
+
+        Arguments:
+            (input) cmds
+
+        """
+
+        self.cmds.append(cmds)
+
+        return self.results
+
+
+class CConn():
+
+    """Class:  CConn
+
+    Description:  Class stub holder for a mysql.connector C extension
+        connection, which has no cmd_query_iter.
+
+    Methods:
+        __init__
+        _next
+        cmd_query
+        next_result
+        fetch_eof_columns
+        fetch_eof_status
+        get_rows
+
+    """
+
+    def __init__(self, results):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.results = list(results)
+        self.keys = None
+        self.rows = []
+        self.stmts = []
+        self.unread_result = False
+
+    def _next(self):
+
+        """Method:  _next
+
+        Description:  Move to the next result.
+
+        Arguments:
+
+        """
+
+        self.keys, self.rows = self.results.pop(0)
+        self.unread_result = bool(self.keys)
+
+    def cmd_query(self, stmt):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for the cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.stmts.append(stmt)
+        self._next()
+
+        return self.fetch_eof_columns() if self.keys \
+            else self.fetch_eof_status()
+
+    def next_result(self):
+
+        """Method:  next_result
+
+        Description:  Stub holder for the next_result method.
+
+        Arguments:
+
+        """
+
+        if not self.results:
+            return False
+
+        self._next()
+
+        return True
+
+    def fetch_eof_columns(self):
+
+        """Method:  fetch_eof_columns
+
+        Description:  Stub holder for the fetch_eof_columns method.
+
+        Arguments:
+
+        """
+
+        return {"columns": [(key,) for key in self.keys]}
+
+    def fetch_eof_status(self):
+
+        """Method:  fetch_eof_status
+
+        Description:  Stub holder for the fetch_eof_status method.
+
+        Arguments:
+
+        """
+
+        return {"affected_rows": 0}
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for the get_rows method.
+
+        Arguments:
+
+        """
+
+        self.unread_result = False
+
+        return self.rows, {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one_request
+        test_names
+        test_collect
+        test_cext
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_one_request(self):
+
+        """Function:  test_one_request
+
+        Description:  Test the snapshot is fetched in one request.
+
+        Arguments:
+
+        """
+
+        mysql_class.ServerSnapshot.collect(self.server)
+
+        self.assertEqual(len(self.server.cmds), 1)
+        self.assertTrue(
+            self.server.cmds[0][0].startswith("show status where"))
+        self.assertTrue(self.server.cmds[0][1].startswith(
+            "show global variables where Variable_name"))
+
+    def test_names(self):
+
+        """Function:  test_names
+
+        Description:  Test only the needed names are fetched.
+
+        Arguments:
+
+        """
+
+        mysql_class.ServerSnapshot.collect(self.server)
+
+        self.assertIn("'Innodb_buffer_pool_reads'", self.server.cmds[0][0])
+        self.assertIn("'tmp_table_size'", self.server.cmds[0][1])
+
+    def test_collect(self):
+
+        """Function:  test_collect
+
+        Description:  Test with the results returned.
+
+        Arguments:
+
+        """
+
+        snap = mysql_class.ServerSnapshot.collect(self.server)
+
+        self.assertEqual(
+            (snap.status, snap.variables),
+            ({"Uptime": "16"}, {"max_connections": "12"}))
+        self.assertIsNotNone(snap.timestamp)
+
+    def test_cext(self):
+
+        """Function:  test_cext
+
+        Description:  Test with a Server on a C extension connection.
+
+        Arguments:
+
+        """
+
+        server = mysql_class.Server(
+            "Mysql_Server", 10, "mysql_user", "my_japd",
+            getattr(machine, "Linux")())
+        server.conn = CConn([
+            (["Variable_name", "Value"], [("Uptime", "16")]),
+            (["Variable_name", "Value"], [("max_connections", "12")])])
+        snap = mysql_class.ServerSnapshot.collect(server)
+
+        self.assertEqual(
+            (snap.status, snap.variables),
+            ({"Uptime": "16"}, {"max_connections": "12"}))
+        self.assertEqual(len(server.conn.stmts), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
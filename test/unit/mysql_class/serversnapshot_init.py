@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  serversnapshot_init.py
+
+    Description:  Unit testing of ServerSnapshot.__init__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/serversnapshot_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timestamp
+        test_default_timestamp
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.status = {"Uptime": "1"}
+        self.variables = {"max_connections": "2"}
+
+    def test_timestamp(self):
+
+        """Function:  test_timestamp
+
+        Description:  Test with the timestamp passed.
+
+        Arguments:
+
+        """
+
+        snap = mysql_class.ServerSnapshot(self.status, self.variables, 100.5)
+
+        self.assertEqual(
+            (snap.status, snap.variables, snap.timestamp),
+            (self.status, self.variables, 100.5))
+
+    @mock.patch("mysql_class.time.time")
+    def test_default_timestamp(self, mock_time):
+
+        """Function:  test_default_timestamp
+
+        Description:  Test with the default timestamp.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 200.5
+        snap = mysql_class.ServerSnapshot(self.status, self.variables)
+
+        self.assertEqual(snap.timestamp, 200.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  serversnapshot_srvperf.py
+
+    Description:  Unit testing of ServerSnapshot.srv_perf in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/serversnapshot_srvperf.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_srv_perf
+        test_percentages
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.variables = {
+            "key_buffer_size": "10000000", "innodb_buffer_pool_size": "2",
+            "innodb_log_buffer_size": "4", "query_cache_size": "5",
+            "read_buffer_size": "5", "read_rnd_buffer_size": "6",
+            "sort_buffer_size": "7", "join_buffer_size": "8",
+            "thread_stack": "9",
+            "max_allowed_packet": "10", "net_buffer_length": "11",
+            "max_connections": "12", "max_heap_table_size": "13",
+            "tmp_table_size": "14"}
+        self.status = {
+            "Threads_connected": "15", "Uptime": "172800",
+            "Innodb_buffer_pool_pages_free": "1",
+            "Innodb_buffer_pool_pages_data": "2",
+            "Innodb_buffer_pool_pages_total": "4",
+            "Innodb_buffer_pool_pages_dirty": "4", "Max_used_connections": "5",
+            "Uptime_since_flush_status": "5", "Binlog_cache_disk_use": "6",
+            "Binlog_cache_use": "7", "Innodb_buffer_pool_wait_free": "8",
+            "Innodb_log_waits": "9", "Innodb_row_lock_time_avg": "10",
+            "Innodb_row_lock_time_max": "11", "Innodb_buffer_pool_reads": "12",
+            "Innodb_buffer_pool_read_requests": "24",
+            "Innodb_buffer_pool_read_ahead_evicted": "14",
+            "Innodb_buffer_pool_read_ahead": "28",
+            "Innodb_buffer_pool_write_requests": "17",
+            "Created_tmp_disk_tables": "16"}
+
+    def test_srv_perf(self):
+
+        """Function:  test_srv_perf
+
+        Description:  Test with values returned.
+
+        Arguments:
+
+        """
+
+        perf = mysql_class.ServerSnapshot(
+            self.status, self.variables).srv_perf()
+
+        self.assertEqual(
+            (perf["indb_buf_free"], perf["indb_buf_write"],
+             perf["binlog_tot"]), (1, 17, 13))
+
+    def test_percentages(self):
+
+        """Function:  test_percentages
+
+        Description:  Test with the buffer pool percentages.
+
+        Arguments:
+
+        """
+
+        perf = mysql_class.ServerSnapshot(
+            self.status, self.variables).srv_perf()
+
+        self.assertEqual(
+            (perf["indb_buf_data_pct"], perf["indb_buf_read_pct"],
+             perf["indb_buf_evt_pct"]), (50, 50, 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  slaverep_refresh.py
+
+    Description:  Unit testing of SlaveRep.refresh method in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/slaverep_refresh.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import lib.machine as machine               # pylint:disable=E0401,R0402,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_refresh
+        test_first_access
+        test_unloaded
+        test_no_attr
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "Mysql_Server"
+        self.server_id = 10
+        self.sql_user = "mysql_user"
+        self.sql_pass = "my_japd"
+        self.machine = getattr(machine, "Linux")()
+        self.defaults_file = "def_cfg_file"
+        self.mysqlrep = mysql_class.SlaveRep(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            os_type=self.machine, defaults_file=self.defaults_file)
+        self.mysqlrep.defer_status()
+
+    @mock.patch("mysql_class.SlaveRep.upd_slv_status")
+    @mock.patch("mysql_class.Server.set_srv_gtid")
+    def test_refresh(self, mock_set, mock_update):
+
+        """Function:  test_refresh
+
+        Description:  Test with an explicit refresh.
+
+        Arguments:
+
+        """
+
+        def upd_status():
+            self.mysqlrep.secs_behind = 10
+
+        mock_update.side_effect = upd_status
+
+        self.mysqlrep.refresh()
+
+        self.assertEqual(self.mysqlrep.secs_behind, 10)
+        self.assertEqual(mock_update.call_count, 1)
+        self.assertEqual(mock_set.call_count, 1)
+
+    @mock.patch("mysql_class.SlaveRep.upd_slv_status")
+    @mock.patch("mysql_class.Server.set_srv_gtid")
+    def test_first_access(self, mock_set, mock_update):
+
+        """Function:  test_first_access
+
+        Description:  Test with first access loading the status.
+
+        Arguments:
+
+        """
+
+        def upd_status():
+            self.mysqlrep.secs_behind = 10
+
+        mock_update.side_effect = upd_status
+
+        self.assertEqual(self.mysqlrep.secs_behind, 10)
+        self.assertEqual(self.mysqlrep.gtid_mode, None)
+        self.assertEqual(mock_update.call_count, 1)
+
+    @mock.patch("mysql_class.SlaveRep.upd_slv_status")
+    @mock.patch("mysql_class.Server.set_srv_gtid")
+    def test_unloaded(self, mock_set, mock_update):
+
+        """Function:  test_unloaded
+
+        Description:  Test with status attributes not set by the load.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.mysqlrep.secs_behind, None)
+        self.assertEqual(mock_update.call_count, 1)
+
+    @mock.patch("mysql_class.SlaveRep.upd_slv_status")
+    @mock.patch("mysql_class.Server.set_srv_gtid")
+    def test_no_attr(self, mock_set, mock_update):
+
+        """Function:  test_no_attr
+
+        Description:  Test with an unknown attribute.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(AttributeError):
+            self.mysqlrep.no_such_attr              # pylint:disable=W0104
+
+
+if __name__ == "__main__":
+    unittest.main()
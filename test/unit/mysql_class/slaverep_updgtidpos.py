@@ -38,6 +38,8 @@ class UnitTest(unittest.TestCase):
         setUp
         test_gtid_mode
         test_value
+        test_cached
+        test_passed_status
 
     """
 
@@ -117,6 +119,57 @@ class UnitTest(unittest.TestCase):
                          (self.gtidset1, self.gtidset2,
                           "None"))
 
+    @mock.patch("mysql_class.show_slave_stat")
+    def test_cached(self, mock_stat):
+
+        """Function:  test_cached
+
+        Description:  Test that unchanged GTID strings reuse the frozen sets.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = self.show_stat
+        mysqlrep = mysql_class.SlaveRep(self.name, self.server_id,
+                                        self.sql_user, self.sql_pass,
+                                        self.machine,
+                                        defaults_file=self.defaults_file)
+
+        mysqlrep.upd_gtid_pos()
+        exe_gtidset = mysqlrep.exe_gtidset
+        mysqlrep.upd_gtid_pos()
+
+        self.assertIs(mysqlrep.exe_gtidset, exe_gtidset)
+
+
+    @mock.patch("mysql_class.fetch_sys_var")
+    @mock.patch("mysql_class.show_slave_stat")
+    def test_passed_status(self, mock_stat, mock_var):
+
+        """Function:  test_passed_status
+
+        Description:  Test with the slave status and purged set passed in.
+
+        Arguments:
+
+        """
+
+        mysqlrep = mysql_class.SlaveRep(self.name, self.server_id,
+                                        self.sql_user, self.sql_pass,
+                                        self.machine,
+                                        defaults_file=self.defaults_file)
+        mysqlrep.gtid_mode = True
+
+        mysqlrep.upd_gtid_pos(
+            data=self.show_stat[0], purged="35588520:333220-333227")
+        self.assertFalse(mock_stat.called or mock_var.called)
+        self.assertEqual((str(mysqlrep.retrieved_gtidset),
+                          str(mysqlrep.exe_gtidset),
+                          str(mysqlrep.purged_gtidset)),
+                         (self.gtidset1, self.gtidset2,
+                          "35588520:333220-333227"))
+
 
 if __name__ == "__main__":
     unittest.main()
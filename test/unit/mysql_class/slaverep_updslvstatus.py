@@ -28,6 +28,97 @@ import version                              # pylint:disable=E0401,C0413
 __version__ = version.__version__
 
 
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection which
+        counts the round trips to the server.
+
+    Methods:
+        __init__
+        cmd_query_iter
+        cmd_query
+        cursor
+        get_rows
+
+    """
+
+    def __init__(self, results):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.results = results
+        self.rows = []
+        self.stmts = []
+        self.round_trips = 0
+
+    def cmd_query_iter(self, stmt):
+
+        """Method:  cmd_query_iter
+
+        Description:  Stub holder for the cmd_query_iter method.
+
+        Arguments:
+
+        """
+
+        self.round_trips += 1
+        self.stmts.append(stmt)
+
+        for keys, rows in self.results:
+            self.rows = rows
+
+            yield {"columns": [(key,) for key in keys]}
+
+    def cmd_query(self, stmt):
+
+        """Method:  cmd_query
+
+        Description:  Stub holder for the cmd_query method.
+
+        Arguments:
+
+        """
+
+        self.round_trips += 1
+        self.stmts.append(stmt)
+
+        raise AssertionError("Unexpected query")
+
+    def cursor(self, buffered=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        self.round_trips += 1
+
+        raise AssertionError("Unexpected cursor query")
+
+    def get_rows(self):
+
+        """Method:  get_rows
+
+        Description:  Stub holder for the get_rows method.
+
+        Arguments:
+
+        """
+
+        return self.rows, {}
+
+
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -36,6 +127,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_round_trips
+        test_server_uuid
         test_post_8026
         test_pre_8026
         test_post_8022
@@ -86,14 +179,10 @@ class UnitTest(unittest.TestCase):
         self.version3 = (8, 0, 21)
         self.version4 = (8, 0, 23)
         self.version5 = (8, 0, 28)
-        self.fetch_vars = [
-            {"Slave_running": "ON"}, {"Slave_retried_transactions": 0},
-            {"Slave_open_temp_tables": "1"}]
-        self.fetch_vars2 = [{"Slave_open_temp_tables": "1"}]
-        self.fetch_vars3 = [{"Replica_open_temp_tables": "1"}]
-        self.query = [
-            [{"SERVICE_STATE": "ON"}], [{"COUNT_TRANSACTIONS_RETRIES": 0}]]
-        self.read_only = {"read_only": "ON"}
+        self.fetch_vars2 = {"Slave_open_temp_tables": "1"}
+        self.fetch_vars3 = {"Replica_open_temp_tables": "1"}
+        self.query = [{"SERVICE_STATE": "ON", "COUNT_TRANSACTIONS_RETRIES": 0}]
+        self.sys_vars = {"read_only": "ON", "server_uuid": "ServerUUID"}
 
         self.show_stat = [
             {"Slave_IO_State": "up",
@@ -205,15 +294,49 @@ class UnitTest(unittest.TestCase):
              "Executed_Gtid_Set": "exegtid",
              "Auto_Position": "autopos"}]
 
+    def test_round_trips(self):
+
+        """Function:  test_round_trips
+
+        Description:  Test the status is fetched in a single round trip.
+
+        Arguments:
+
+        """
+
+        self.show_stat[0]["Retrieved_Gtid_Set"] = "uuid1:1-10"
+        self.show_stat[0]["Executed_Gtid_Set"] = "uuid1:1-8"
+        keys = list(self.show_stat[0].keys())
+        conn = Conn([
+            (keys, [tuple(self.show_stat[0][key] for key in keys)]),
+            (["SERVICE_STATE", "COUNT_TRANSACTIONS_RETRIES"], [("ON", 0)]),
+            (["Variable_name", "Value"], [("Slave_open_temp_tables", "1")]),
+            (["Variable_name", "Value"],
+             [("gtid_purged", "uuid1:1-2"), ("read_only", "ON"),
+              ("server_uuid", "ServerUUID")])])
+
+        mysqlrep = mysql_class.SlaveRep(
+            self.name, self.server_id, self.sql_user, self.sql_pass,
+            self.machine, defaults_file=self.defaults_file)
+        mysqlrep.version = self.version
+        mysqlrep.gtid_mode = True
+        mysqlrep.conn = conn
+        mysqlrep.upd_slv_status()
+
+        self.assertEqual(conn.round_trips, 1)
+        self.assertEqual(
+            (mysqlrep.run, mysqlrep.tran_retry, mysqlrep.tmp_tbl,
+             mysqlrep.read_only, mysqlrep.slave_uuid, mysqlrep.io_state),
+            ("ON", 0, "1", "ON", "ServerUUID", "up"))
+        self.assertEqual(
+            (str(mysqlrep.retrieved_gtidset), str(mysqlrep.exe_gtidset),
+             str(mysqlrep.purged_gtidset)),
+            ("uuid1:1-10", "uuid1:1-8", "uuid1:1-2"))
+
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_server_uuid(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_server_uuid(self, mock_stat):
 
         """Function:  test_server_uuid
 
@@ -223,10 +346,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -238,13 +359,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_post_8026(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_post_8026(self, mock_stat):
 
         """Function:  test_post_8026
 
@@ -254,10 +370,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars3
-        mock_stat.return_value = self.show_stat2
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat2, self.query, self.fetch_vars3, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -270,13 +384,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_pre_8026(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_pre_8026(self, mock_stat):
 
         """Function:  test_pre_8026
 
@@ -286,10 +395,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat2
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat2, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -302,13 +409,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_post_8022(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_post_8022(self, mock_stat):
 
         """Function:  test_post_8022
 
@@ -318,10 +420,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat2
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat2, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -334,13 +434,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_pre_8022(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_pre_8022(self, mock_stat):
 
         """Function:  test_pre_8022
 
@@ -350,10 +445,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -366,13 +459,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_run(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_run(self, mock_stat):
 
         """Function:  test_run
 
@@ -382,10 +470,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -397,13 +483,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_run_pre(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_run_pre(self, mock_stat):
 
         """Function:  test_run_pre
 
@@ -413,10 +494,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -428,13 +507,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_none_secsbehind(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_none_secsbehind(self, mock_stat):
 
         """Function:  test_none_secsbehind
 
@@ -446,10 +520,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Seconds_Behind_Master"] = None
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -461,13 +533,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_int_secsbehind(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_int_secsbehind(self, mock_stat):
 
         """Function:  test_int_secsbehind
 
@@ -479,10 +546,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Seconds_Behind_Master"] = 1
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -494,14 +559,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_string_secsbehind(self, mock_stat, mock_global, mock_var,
-                               mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_string_secsbehind(self, mock_stat):
 
         """Function:  test_string_secsbehind
 
@@ -513,10 +572,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Seconds_Behind_Master"] = "1"
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -528,14 +585,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_except_secsbehind(self, mock_stat, mock_global, mock_var,
-                               mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_except_secsbehind(self, mock_stat):
 
         """Function:  test_except_secsbehind
 
@@ -545,10 +596,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -560,13 +609,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_int_skipcounter(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_int_skipcounter(self, mock_stat):
 
         """Function:  test_int_skipcounter
 
@@ -578,10 +622,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Skip_Counter"] = 1
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -593,14 +635,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_string_skipcounter(self, mock_stat, mock_global, mock_var,
-                                mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_string_skipcounter(self, mock_stat):
 
         """Function:  test_string_skipcounter
 
@@ -612,10 +648,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Skip_Counter"] = "1"
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -627,14 +661,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_except_skipcounter(self, mock_stat, mock_global, mock_var,
-                                mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_except_skipcounter(self, mock_stat):
 
         """Function:  test_except_skipcounter
 
@@ -644,10 +672,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -659,14 +685,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_int_masterserverid(self, mock_stat, mock_global, mock_var,
-                                mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_int_masterserverid(self, mock_stat):
 
         """Function:  test_int_masterserverid
 
@@ -678,10 +698,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Master_Server_Id"] = 11
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -693,14 +711,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_string_masterserverid(self, mock_stat, mock_global, mock_var,
-                                   mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_string_masterserverid(self, mock_stat):
 
         """Function:  test_string_masterserverid
 
@@ -712,10 +724,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Master_Server_Id"] = "11"
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -727,14 +737,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_except_masterserverid(self, mock_stat, mock_global, mock_var,
-                                   mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_except_masterserverid(self, mock_stat):
 
         """Function:  test_except_masterserverid
 
@@ -744,10 +748,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -759,14 +761,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_int_lastsqlerror(self, mock_stat, mock_global, mock_var,
-                              mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_int_lastsqlerror(self, mock_stat):
 
         """Function:  test_int_lastsqlerror
 
@@ -778,10 +774,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Last_SQL_Errno"] = 1
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -793,14 +787,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_string_lastsqlerror(self, mock_stat, mock_global, mock_var,
-                                 mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_string_lastsqlerror(self, mock_stat):
 
         """Function:  test_string_lastsqlerror
 
@@ -812,10 +800,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Last_SQL_Errno"] = "1"
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -827,14 +813,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_except_lastsqlerror(self, mock_stat, mock_global, mock_var,
-                                 mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_except_lastsqlerror(self, mock_stat):
 
         """Function:  test_except_lastsqlerror
 
@@ -844,10 +824,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -859,13 +837,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_int_lastioerror(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_int_lastioerror(self, mock_stat):
 
         """Function:  test_int_lastioerror
 
@@ -877,10 +850,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Last_IO_Errno"] = 1
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -892,14 +863,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_string_lastioerror(self, mock_stat, mock_global, mock_var,
-                                mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_string_lastioerror(self, mock_stat):
 
         """Function:  test_string_lastioerror
 
@@ -911,10 +876,8 @@ class UnitTest(unittest.TestCase):
 
         self.show_stat[0]["Last_IO_Errno"] = "1"
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -926,14 +889,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_except_lastioerror(self, mock_stat, mock_global, mock_var,
-                                mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_except_lastioerror(self, mock_stat):
 
         """Function:  test_except_lastioerror
 
@@ -943,10 +900,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -958,13 +913,8 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch(
         "mysql_class.SlaveRep.upd_gtid_pos", mock.Mock(return_value=True))
-    @mock.patch(
-        "mysql_class.Rep.get_serv_uuid", mock.Mock(return_value="ServerUUID"))
-    @mock.patch("mysql_class.Server.col_sql")
-    @mock.patch("mysql_class.fetch_sys_var")
-    @mock.patch("mysql_class.fetch_global_var")
-    @mock.patch("mysql_class.show_slave_stat")
-    def test_value(self, mock_stat, mock_global, mock_var, mock_qry):
+    @mock.patch("mysql_class.fetch_slv_status")
+    def test_value(self, mock_stat):
 
         """Function:  test_value
 
@@ -974,10 +924,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_var.return_value = self.read_only
-        mock_global.side_effect = self.fetch_vars2
-        mock_stat.return_value = self.show_stat
-        mock_qry.side_effect = self.query
+        mock_stat.return_value = (
+            self.show_stat, self.query, self.fetch_vars2, self.sys_vars)
 
         mysqlrep = mysql_class.SlaveRep(
             self.name, self.server_id, self.sql_user, self.sql_pass,
@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  statementcache_checked.py
+
+    Description:  Unit testing of StatementCache.checked and
+        StatementCache.preparable in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statementcache_checked.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_unchecked
+        test_text
+        test_blob
+        test_binary_string
+        test_numeric
+        test_no_result
+        test_size
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cache = mysql_class.StatementCache(size=2)
+        self.cmd = "select * from t1 where id = %s"
+        self.text = ("Name", 253, None, None, None, None, 1, 0, 255)
+
+    def test_unchecked(self):
+
+        """Function:  test_unchecked
+
+        Description:  Test a command which has not run is not prepared.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.cache.preparable(self.cmd))
+
+    def test_text(self):
+
+        """Function:  test_text
+
+        Description:  Test with text columns.
+
+        Arguments:
+
+        """
+
+        self.cache.checked(self.cmd, [self.text])
+
+        self.assertTrue(self.cache.preparable(self.cmd))
+
+    def test_blob(self):
+
+        """Function:  test_blob
+
+        Description:  Test with a BLOB column.
+
+        Arguments:
+
+        """
+
+        self.cache.checked(self.cmd, [
+            self.text, ("Data", 252, None, None, None, None, 1, 144, 63)])
+
+        self.assertFalse(self.cache.preparable(self.cmd))
+
+    def test_binary_string(self):
+
+        """Function:  test_binary_string
+
+        Description:  Test with a VARBINARY column.
+
+        Arguments:
+
+        """
+
+        self.cache.checked(
+            self.cmd, [("Data", 253, None, None, None, None, 1, 128, 63)])
+
+        self.assertFalse(self.cache.preparable(self.cmd))
+
+    def test_numeric(self):
+
+        """Function:  test_numeric
+
+        Description:  Test with a numeric column, which has the binary
+            character set.
+
+        Arguments:
+
+        """
+
+        self.cache.checked(
+            self.cmd, [("Id", 3, None, None, None, None, 0, 1, 63)])
+
+        self.assertTrue(self.cache.preparable(self.cmd))
+
+    def test_no_result(self):
+
+        """Function:  test_no_result
+
+        Description:  Test with a command without a result set.
+
+        Arguments:
+
+        """
+
+        self.cache.checked(self.cmd, None)
+
+        self.assertTrue(self.cache.preparable(self.cmd))
+
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test only size commands are kept.
+
+        Arguments:
+
+        """
+
+        for num in range(3):
+            self.cache.checked(f"select {num} from t1 where id = %s", None)
+
+        self.assertEqual(list(self.cache.binary), [
+            "select 1 from t1 where id = %s",
+            "select 2 from t1 where id = %s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+# Classification (U)
+
+"""Program:  statementcache_cursor.py
+
+    Description:  Unit testing of StatementCache.cursor in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statementcache_cursor.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a prepared statement cursor.
+
+    Methods:
+        __init__
+        execute
+        fetchall
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.stmts = []
+        self.with_rows = True
+        self.closed = False
+
+    def execute(self, stmt, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        if self.conn.errors:
+            raise self.conn.errors.pop(0)
+
+        self.stmts.append((stmt, params))
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        return [("Var", self.stmts[-1][1][0])]
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cursor
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.connection_id = 10
+        self.cursors = []
+        self.errors = []
+
+    def cursor(self, prepared=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        cur = Cursor(self)
+        cur.prepared = prepared
+        self.cursors.append(cur)
+
+        return cur
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_miss
+        test_hit
+        test_evict
+        test_reconnect
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = Conn()
+        self.cache = mysql_class.StatementCache(size=2)
+        self.cmd = "select * from performance_schema.global_variables" \
+            " where variable_name = %s"
+
+    def test_miss(self):
+
+        """Function:  test_miss
+
+        Description:  Test a statement not in the cache is prepared.
+
+        Arguments:
+
+        """
+
+        stmt, cur = self.cache.cursor(self.conn, self.cmd)
+
+        self.assertEqual(stmt, self.cmd)
+        self.assertTrue(cur.prepared)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+    def test_hit(self):
+
+        """Function:  test_hit
+
+        Description:  Test a cached statement is reused.
+
+        Arguments:
+
+        """
+
+        stmt, cur = self.cache.cursor(self.conn, self.cmd)
+        stmt2, cur2 = self.cache.cursor(self.conn, "".join(self.cmd))
+
+        self.assertIs(stmt2, stmt)
+        self.assertIs(cur2, cur)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_evict(self):
+
+        """Function:  test_evict
+
+        Description:  Test the least recently used statement is evicted.
+
+        Arguments:
+
+        """
+
+        _, cur = self.cache.cursor(self.conn, "select1")
+        self.cache.cursor(self.conn, "select2")
+        self.cache.cursor(self.conn, "select1")
+        _, cur3 = self.cache.cursor(self.conn, "select3")
+        self.cache.cursor(self.conn, "select3")
+
+        self.assertEqual(list(self.cache.stmts), ["select1", "select3"])
+        self.assertTrue(self.conn.cursors[1].closed)
+        self.assertFalse(cur.closed or cur3.closed)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_reconnect(self):
+
+        """Function:  test_reconnect
+
+        Description:  Test the statements are prepared again after a reconnect.
+
+        Arguments:
+
+        """
+
+        _, cur = self.cache.cursor(self.conn, self.cmd)
+        self.conn.connection_id = 11
+        _, cur2 = self.cache.cursor(self.conn, self.cmd)
+
+        self.assertIsNot(cur2, cur)
+        self.assertFalse(cur.closed)
+        self.assertEqual(self.cache.misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
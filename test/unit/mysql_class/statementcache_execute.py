@@ -0,0 +1,261 @@
+# Classification (U)
+
+"""Program:  statementcache_execute.py
+
+    Description:  Unit testing of StatementCache.execute in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statementcache_execute.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mysql.connector
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a prepared statement cursor.
+
+    Methods:
+        __init__
+        execute
+        fetchall
+        close
+
+    """
+
+    def __init__(self, conn):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = conn
+        self.stmts = []
+        self.with_rows = True
+        self.closed = False
+        self.description = conn.description
+        self.rowcount = 1
+        self.lastrowid = None
+
+    def execute(self, stmt, params=None):
+
+        """Method:  execute
+
+        Description:  Stub holder for the execute method.
+
+        Arguments:
+
+        """
+
+        if self.conn.errors:
+            raise self.conn.errors.pop(0)
+
+        self.stmts.append((stmt, params))
+
+    def fetchall(self):
+
+        """Method:  fetchall
+
+        Description:  Stub holder for the fetchall method.
+
+        Arguments:
+
+        """
+
+        return [("Var", self.stmts[-1][1][0])]
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for the close method.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Conn():
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql.connector connection.
+
+    Methods:
+        __init__
+        cursor
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.connection_id = 10
+        self.cursors = []
+        self.errors = []
+        self.description = [("Var", 253, None, None, None, None, 1, 0, 45)]
+
+    def cursor(self, prepared=False):
+
+        """Method:  cursor
+
+        Description:  Stub holder for the cursor method.
+
+        Arguments:
+
+        """
+
+        cur = Cursor(self)
+        cur.prepared = prepared
+        self.cursors.append(cur)
+
+        return cur
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_execute
+        test_no_rows
+        test_unknown_stmt
+        test_error
+        test_cursor
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = Conn()
+        self.cache = mysql_class.StatementCache()
+        self.cmd = "select * from performance_schema.global_variables" \
+            " where variable_name = %s"
+
+    def test_execute(self):
+
+        """Function:  test_execute
+
+        Description:  Test the rows of the prepared statement.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.cache.execute(self.conn, self.cmd, ("var1",)).fetchall(),
+            [("Var", "var1")])
+
+    def test_no_rows(self):
+
+        """Function:  test_no_rows
+
+        Description:  Test with a statement without a result set.
+
+        Arguments:
+
+        """
+
+        stmt, cur = self.cache.cursor(self.conn, self.cmd)
+        cur.with_rows = False
+
+        self.assertEqual(
+            self.cache.execute(self.conn, stmt, ("var1",)).fetchall(), [])
+
+    def test_unknown_stmt(self):
+
+        """Function:  test_unknown_stmt
+
+        Description:  Test a statement unknown to the server is prepared again.
+
+        Arguments:
+
+        """
+
+        self.cache.execute(self.conn, self.cmd, ("var1",))
+        self.conn.errors.append(
+            mysql.connector.errors.DatabaseError(errno=1243))
+
+        self.assertEqual(
+            self.cache.execute(self.conn, self.cmd, ("var2",)).fetchall(),
+            [("Var", "var2")])
+        self.assertEqual(len(self.conn.cursors), 2)
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test other errors are raised.
+
+        Arguments:
+
+        """
+
+        self.conn.errors.append(
+            mysql.connector.errors.DatabaseError(errno=1146))
+
+        with self.assertRaises(mysql.connector.errors.DatabaseError):
+            self.cache.execute(self.conn, self.cmd, ("var1",))
+
+    def test_cursor(self):
+
+        """Function:  test_cursor
+
+        Description:  Test the result has the cursor attributes.
+
+        Arguments:
+
+        """
+
+        cur = self.cache.execute(self.conn, self.cmd, ("var1",))
+
+        self.assertEqual((cur.column_names, cur.rowcount, cur.lastrowid),
+                         (("Var",), 1, None))
+        self.assertEqual(cur.fetchone(), ("Var", "var1"))
+        self.assertIsNone(cur.fetchone())
+
+
+if __name__ == "__main__":
+    unittest.main()
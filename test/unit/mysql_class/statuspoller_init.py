@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  statuspoller_init.py
+
+    Description:  Unit testing of StatusPoller.__init__ in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statuspoller_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_duplicate_names
+        test_init
+
+    """
+
+    def test_duplicate_names(self):
+
+        """Function:  test_duplicate_names
+
+        Description:  Test with two servers of the same name.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_class.StatusPoller([Server("server1"), Server("server1")])
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test with servers of unique names.
+
+        Arguments:
+
+        """
+
+        poller = mysql_class.StatusPoller(
+            (Server("server1"), Server("server2")), interval=5)
+
+        self.assertEqual(
+            ([server.name for server in poller.servers], poller.interval),
+            (["server1", "server2"], 5))
+        self.assertEqual(poller.snapshots, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+# Classification (U)
+
+"""Program:  statuspoller_poll.py
+
+    Description:  Unit testing of StatusPoller.poll in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statuspoller_poll.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class DriverError(Exception):
+
+    """Class:  DriverError
+
+    Description:  Class stub holder for the error of a DB-API driver.
+
+    Methods:
+
+    """
+
+
+class Module():                             # pylint:disable=R0903
+
+    """Class:  Module
+
+    Description:  Class stub holder for a DB-API driver module.
+
+    Methods:
+
+    """
+
+    __name__ = "dbapi"
+    Error = DriverError
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, is_up=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.is_up = is_up
+        self.snapshot = None
+        self.driver = mysql_class.get_driver()
+
+
+def collect(server):
+
+    """Function:  collect
+
+    Description:  Return a snapshot of a server stub.
+
+    Arguments:
+
+    """
+
+    if not server.is_up:
+        raise server.driver.error("Server down")
+
+    return mysql_class.ServerSnapshot({"Uptime": "1"}, {})
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_swap
+        test_error
+        test_driver_error
+        test_other_error
+        test_metrics
+        test_poll
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server1 = Server("server1")
+        self.server2 = Server("server2")
+        self.poller = mysql_class.StatusPoller(
+            [self.server1, self.server2], interval=0.01, collect=collect)
+
+    def test_swap(self):
+
+        """Function:  test_swap
+
+        Description:  Test a new snapshots dictionary is published.
+
+        Arguments:
+
+        """
+
+        self.poller.poll()
+        first = self.poller.snapshots
+        self.poller.poll()
+
+        self.assertIsNot(self.poller.snapshots, first)
+        self.assertEqual(len(first), 2)
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test a failed server keeps its previous snapshot.
+
+        Arguments:
+
+        """
+
+        self.poller.poll()
+        snapshot = self.poller.latest("server2")
+        self.server2.is_up = False
+        self.poller.poll()
+
+        self.assertIs(self.poller.latest("server2"), snapshot)
+        self.assertEqual(self.poller.errors, 1)
+        self.assertIsInstance(
+            self.poller.last_error, mysql_class.mysql.connector.Error)
+
+    def test_driver_error(self):
+
+        """Function:  test_driver_error
+
+        Description:  Test with the error of a DB-API driver.
+
+        Arguments:
+
+        """
+
+        self.server2.driver = mysql_class.DBAPIDriver(Module())
+        self.server2.is_up = False
+        self.poller.poll()
+
+        self.assertEqual(self.poller.errors, 1)
+        self.assertIsInstance(self.poller.last_error, DriverError)
+        self.assertEqual(len(self.poller.snapshots), 1)
+
+    def test_other_error(self):
+
+        """Function:  test_other_error
+
+        Description:  Test an error which is not a driver error is kept and
+            the other servers are still polled.
+
+        Arguments:
+
+        """
+
+        def fail(server):
+
+            """Function:  fail
+
+            Description:  Fail for the first server.
+
+            Arguments:
+
+            """
+
+            if server is self.server1:
+                raise KeyError("Uptime")
+
+            return collect(server)
+
+        self.poller.collect = fail
+        self.poller.poll()
+
+        self.assertEqual(self.poller.errors, 1)
+        self.assertIsInstance(self.poller.last_error, KeyError)
+        self.assertIsNotNone(self.poller.latest("server2"))
+
+    def test_metrics(self):
+
+        """Function:  test_metrics
+
+        Description:  Test the poll metrics.
+
+        Arguments:
+
+        """
+
+        self.poller.poll()
+
+        self.assertEqual(self.poller.polls, 1)
+        self.assertGreaterEqual(self.poller.poll_time, 0)
+        self.assertGreaterEqual(self.poller.staleness(), 0)
+
+    def test_poll(self):
+
+        """Function:  test_poll
+
+        Description:  Test the snapshots are only published by the poller.
+
+        Arguments:
+
+        """
+
+        self.poller.poll()
+
+        self.assertEqual(list(self.poller.snapshots), ["server1", "server2"])
+        self.assertIsNone(self.server1.snapshot)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  statuspoller_staleness.py
+
+    Description:  Unit testing of StatusPoller.staleness in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statuspoller_staleness.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, is_up=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.is_up = is_up
+
+
+def collect(server):
+
+    """Function:  collect
+
+    Description:  Return a snapshot of a server stub.
+
+    Arguments:
+
+    """
+
+    if not server.is_up:
+        raise mysql_class.mysql.connector.Error(msg="Server down")
+
+    return mysql_class.ServerSnapshot({"Uptime": "1"}, {})
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_polled
+        test_staleness
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server1 = Server("server1")
+        self.server2 = Server("server2")
+        self.poller = mysql_class.StatusPoller(
+            [self.server1, self.server2], interval=0.01, collect=collect)
+
+    def test_not_polled(self):
+
+        """Function:  test_not_polled
+
+        Description:  Test with no poll yet.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.poller.staleness())
+
+    @mock.patch("mysql_class.time.time")
+    def test_staleness(self, mock_time):
+
+        """Function:  test_staleness
+
+        Description:  Test with the seconds since the last poll.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100.0
+        self.poller.poll()
+        mock_time.return_value = 112.5
+
+        self.assertEqual(self.poller.staleness(), 12.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
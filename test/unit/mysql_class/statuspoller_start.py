@@ -0,0 +1,209 @@
+# Classification (U)
+
+"""Program:  statuspoller_start.py
+
+    Description:  Unit testing of StatusPoller.start and StatusPoller.stop
+        in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statuspoller_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+        pooled
+
+    """
+
+    def __init__(self, name, is_up=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.is_up = is_up
+        self.pool = None
+
+    def pooled(self, size=5):
+
+        """Method:  pooled
+
+        Description:  Stub holder for Server.pooled method.
+
+        Arguments:
+
+        """
+
+        self.pool = size
+
+
+def collect(server):
+
+    """Function:  collect
+
+    Description:  Return a snapshot of a server stub.
+
+    Arguments:
+
+    """
+
+    if not server.is_up:
+        raise mysql_class.mysql.connector.Error(msg="Server down")
+
+    return mysql_class.ServerSnapshot({"Uptime": "1"}, {})
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_running
+        test_stop
+        test_start
+        test_pool
+        test_pooled
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server1 = Server("server1")
+        self.server2 = Server("server2")
+        self.poller = mysql_class.StatusPoller(
+            [self.server1, self.server2], interval=0.01, collect=collect)
+
+    def test_running(self):
+
+        """Function:  test_running
+
+        Description:  Test starting a running poller keeps its thread.
+
+        Arguments:
+
+        """
+
+        self.poller.start()
+        thread = self.poller.thread
+        self.poller.start()
+
+        self.assertIs(self.poller.thread, thread)
+        self.poller.stop()
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test the poller thread is stopped.
+
+        Arguments:
+
+        """
+
+        self.poller.start()
+        self.poller.stop(timeout=5)
+
+        self.assertFalse(self.poller.thread.is_alive())
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test the poller thread polls on a schedule.
+
+        Arguments:
+
+        """
+
+        self.poller.start()
+        deadline = time.monotonic() + 5
+
+        while self.poller.polls < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.poller.stop()
+
+        self.assertGreaterEqual(self.poller.polls, 3)
+        self.assertIsNotNone(self.poller.latest("server1"))
+
+    @mock.patch("mysql_class.StatusPoller.run")
+    def test_pool(self, mock_run):
+
+        """Function:  test_pool
+
+        Description:  Test a single connection pool is attached to a server
+            which is not pooled.
+
+        Arguments:
+
+        """
+
+        self.poller.start()
+        self.poller.stop()
+
+        self.assertEqual((self.server1.pool, self.server2.pool), (1, 1))
+        self.assertTrue(mock_run.called)
+
+    @mock.patch("mysql_class.StatusPoller.run")
+    def test_pooled(self, mock_run):
+
+        """Function:  test_pooled
+
+        Description:  Test an existing connection pool is kept.
+
+        Arguments:
+
+        """
+
+        self.server1.pool = 3
+        self.poller.start()
+        self.poller.stop()
+
+        self.assertEqual(self.server1.pool, 3)
+        self.assertTrue(mock_run.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
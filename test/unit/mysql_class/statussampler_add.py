@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  statussampler_add.py
+
+    Description:  Unit testing of StatusSampler.add in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statussampler_add.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def snap(timestamp, uptime, reads, requests):
+
+    """Function:  snap
+
+    Description:  Return a status snapshot.
+
+    Arguments:
+
+    """
+
+    return mysql_class.ServerSnapshot(
+        {"Uptime": str(uptime), "Uptime_since_flush_status": str(uptime),
+         "Innodb_buffer_pool_reads": str(reads),
+         "Innodb_buffer_pool_read_requests": str(requests)}, {}, timestamp)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_history
+        test_restart
+        test_flush_status
+        test_add
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sampler = mysql_class.StatusSampler(history=5)
+        self.reads = "Innodb_buffer_pool_reads"
+        self.requests = "Innodb_buffer_pool_read_requests"
+
+    def test_history(self):
+
+        """Function:  test_history
+
+        Description:  Test the history is capped at its length.
+
+        Arguments:
+
+        """
+
+        for second in range(10):
+            self.sampler.add(snap(100.0 + second, 10 + second, 0, 0))
+
+        self.assertEqual(len(self.sampler.samples), 5)
+        self.assertEqual(self.sampler.samples[0].timestamp, 105.0)
+
+    def test_restart(self):
+
+        """Function:  test_restart
+
+        Description:  Test with the uptime going backwards after a restart.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+        self.sampler.add(snap(130.0, 5, 1, 10))
+
+        self.assertEqual(len(self.sampler.samples), 1)
+        self.assertEqual(self.sampler.resets, 1)
+
+    def test_flush_status(self):
+
+        """Function:  test_flush_status
+
+        Description:  Test with the counters reset by a flush status.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+        last = snap(130.0, 40, 1, 10)
+        last.status["Uptime_since_flush_status"] = "2"
+        self.sampler.add(last)
+
+        self.assertEqual(len(self.sampler.samples), 1)
+        self.assertEqual(self.sampler.resets, 1)
+
+    def test_add(self):
+
+        """Function:  test_add
+
+        Description:  Test with snapshots added.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+
+        self.assertEqual(len(self.sampler.samples), 3)
+        self.assertEqual(self.sampler.resets, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+# Classification (U)
+
+"""Program:  statussampler_delta.py
+
+    Description:  Unit testing of StatusSampler.delta in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statussampler_delta.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def snap(timestamp, uptime, reads, requests):
+
+    """Function:  snap
+
+    Description:  Return a status snapshot.
+
+    Arguments:
+
+    """
+
+    return mysql_class.ServerSnapshot(
+        {"Uptime": str(uptime), "Uptime_since_flush_status": str(uptime),
+         "Innodb_buffer_pool_reads": str(reads),
+         "Innodb_buffer_pool_read_requests": str(requests)}, {}, timestamp)
+
+
+class Snapshot():                           # pylint:disable=R0903
+
+    """Class:  Snapshot
+
+    Description:  Class stub holder for a ServerSnapshot which adds a
+        snapshot to the sampler when its timestamp is read, as the poller
+        thread can while the history is read.
+
+    Methods:
+        __init__
+        timestamp
+
+    """
+
+    def __init__(self, sampler, data):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sampler = sampler
+        self.data = data
+        self.status = data.status
+
+    @property
+    def timestamp(self):
+
+        """Method:  timestamp
+
+        Description:  Add a snapshot to the sampler and return the
+            timestamp.
+
+        Arguments:
+
+        """
+
+        self.sampler.samples.append(snap(200.0, 100, 50, 1000))
+
+        return self.data.timestamp
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one_sample
+        test_window
+        test_short_window
+        test_backwards
+        test_delta
+        test_concurrent_add
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sampler = mysql_class.StatusSampler(history=5)
+        self.reads = "Innodb_buffer_pool_reads"
+        self.requests = "Innodb_buffer_pool_read_requests"
+
+    def test_one_sample(self):
+
+        """Function:  test_one_sample
+
+        Description:  Test with a single snapshot.
+
+        Arguments:
+
+        """
+
+        self.sampler.add(snap(100.0, 10, 5, 100))
+
+        self.assertIsNone(self.sampler.delta(self.reads))
+
+    def test_window(self):
+
+        """Function:  test_window
+
+        Description:  Test with a time window.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+
+        self.assertEqual(self.sampler.delta(self.reads, seconds=10), 5)
+
+    def test_short_window(self):
+
+        """Function:  test_short_window
+
+        Description:  Test with a window holding one snapshot.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+
+        self.assertIsNone(self.sampler.delta(self.reads, seconds=5))
+
+    def test_backwards(self):
+
+        """Function:  test_backwards
+
+        Description:  Test with a counter going backwards.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+        self.sampler.add(snap(130.0, 40, 1, 900))
+
+        self.assertIsNone(self.sampler.delta(self.reads))
+
+    def test_delta(self):
+
+        """Function:  test_delta
+
+        Description:  Test with the delta over the history.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+
+        self.assertEqual(self.sampler.delta(self.reads), 25)
+
+    def test_concurrent_add(self):
+
+        """Function:  test_concurrent_add
+
+        Description:  Test with a snapshot added while the window is read.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.samples.append(
+                Snapshot(self.sampler, snap(*item)))
+
+        self.assertEqual(self.sampler.delta(self.reads, seconds=10), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
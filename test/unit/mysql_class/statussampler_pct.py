@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  statussampler_pct.py
+
+    Description:  Unit testing of StatusSampler.pct in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/statussampler_pct.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def snap(timestamp, uptime, reads, requests):
+
+    """Function:  snap
+
+    Description:  Return a status snapshot.
+
+    Arguments:
+
+    """
+
+    return mysql_class.ServerSnapshot(
+        {"Uptime": str(uptime), "Uptime_since_flush_status": str(uptime),
+         "Innodb_buffer_pool_reads": str(reads),
+         "Innodb_buffer_pool_read_requests": str(requests)}, {}, timestamp)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_samples
+        test_window
+        test_pct
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sampler = mysql_class.StatusSampler(history=5)
+        self.reads = "Innodb_buffer_pool_reads"
+        self.requests = "Innodb_buffer_pool_read_requests"
+
+    def test_no_samples(self):
+
+        """Function:  test_no_samples
+
+        Description:  Test with no snapshots.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.sampler.pct(self.reads, self.requests))
+
+    def test_window(self):
+
+        """Function:  test_window
+
+        Description:  Test with a time window.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+
+        self.assertEqual(
+            self.sampler.pct(self.reads, self.requests, seconds=10), 1)
+
+    def test_pct(self):
+
+        """Function:  test_pct
+
+        Description:  Test with the percentage over the history.
+
+        Arguments:
+
+        """
+
+        for item in ((100.0, 10, 5, 100), (110.0, 20, 25, 300),
+                     (120.0, 30, 30, 800)):
+            self.sampler.add(snap(*item))
+
+        self.assertEqual(self.sampler.pct(self.reads, self.requests), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
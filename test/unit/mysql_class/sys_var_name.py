@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  sys_var_name.py
+
+    Description:  Unit testing of sys_var_name in mysql_class.py.
+
+    Usage:
+        test/unit/mysql_class/sys_var_name.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for Server class.
+
+    Methods:
+        __init__
+        vert_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.params = None
+        self.version = (8, 0, 28)
+        self.data = {}
+
+    def vert_sql(self, cmd, params):
+
+        """Method:  vert_sql
+
+        Description:  Stub holder for Server.vert_sql method.
+
+        Arguments:
+            (input) cmd
+            (input) params
+
+        """
+
+        self.cmd = cmd
+        self.params = params
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_post_8026
+        test_post_8026_new
+        test_pre_8026
+        test_not_renamed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_post_8026(self):
+
+        """Function:  test_post_8026
+
+        Description:  Test with post-MySQL 8.0.26.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.sys_var_name(self.server, "sync_master_info"),
+            "sync_source_info")
+
+    def test_post_8026_new(self):
+
+        """Function:  test_post_8026_new
+
+        Description:  Test with a new name in post-MySQL 8.0.26.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.sys_var_name(self.server, "sync_source_info"),
+            "sync_source_info")
+
+    def test_pre_8026(self):
+
+        """Function:  test_pre_8026
+
+        Description:  Test with pre-MySQL 8.0.26.
+
+        Arguments:
+
+        """
+
+        self.server.version = (8, 0, 22)
+
+        self.assertEqual(
+            mysql_class.sys_var_name(self.server, "log_replica_updates"),
+            "log_slave_updates")
+
+    def test_not_renamed(self):
+
+        """Function:  test_not_renamed
+
+        Description:  Test with a variable which was not renamed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_class.sys_var_name(self.server, "log_bin"), "log_bin")
+
+
+if __name__ == "__main__":
+    unittest.main()
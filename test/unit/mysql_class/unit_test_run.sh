@@ -6,29 +6,87 @@
 
 echo "Unit test: mysql_class"  
 /usr/bin/python ./test/unit/mysql_class/fetch_global_var.py
+/usr/bin/python ./test/unit/mysql_class/fetch_slv_status.py
 /usr/bin/python ./test/unit/mysql_class/fetch_sys_var.py
+/usr/bin/python ./test/unit/mysql_class/fetch_sys_vars.py
 /usr/bin/python ./test/unit/mysql_class/flush_logs.py
+/usr/bin/python ./test/unit/mysql_class/format_rows.py
+/usr/bin/python ./test/unit/mysql_class/frozen_gtidset.py
+/usr/bin/python ./test/unit/mysql_class/get_driver.py
 /usr/bin/python ./test/unit/mysql_class/show_master_stat.py
 /usr/bin/python ./test/unit/mysql_class/show_slave_hosts.py
 /usr/bin/python ./test/unit/mysql_class/show_slave_stat.py
 /usr/bin/python ./test/unit/mysql_class/slave_start.py
 /usr/bin/python ./test/unit/mysql_class/slave_stop.py
+/usr/bin/python ./test/unit/mysql_class/sys_var_name.py
+/usr/bin/python ./test/unit/mysql_class/compare_sets.py
+/usr/bin/python ./test/unit/mysql_class/compare_fleet.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_or.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_init.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_str.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_union.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_eq.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_frombytes.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_ge.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_gt.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_le.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_lt.py
 /usr/bin/python ./test/unit/mysql_class/gtidset_ne.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_contains.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_count.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_advance.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_difference.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_intersection.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_sub.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_tobytes.py
+/usr/bin/python ./test/unit/mysql_class/gtidset_and.py
+/usr/bin/python ./test/unit/mysql_class/gtidintervals_init.py
+/usr/bin/python ./test/unit/mysql_class/gtidintervals_append.py
+/usr/bin/python ./test/unit/mysql_class/gtidintervals_contains.py
+/usr/bin/python ./test/unit/mysql_class/gtidintervals_count.py
+/usr/bin/python ./test/unit/mysql_class/gtidintervals_union.py
+/usr/bin/python ./test/unit/mysql_class/gtidintervals_difference.py
+/usr/bin/python ./test/unit/mysql_class/gtidintervals_intersection.py
+/usr/bin/python ./test/unit/mysql_class/frozengtidset_init.py
+/usr/bin/python ./test/unit/mysql_class/frozengtidset_str.py
+/usr/bin/python ./test/unit/mysql_class/frozengtidset_hash.py
+/usr/bin/python ./test/unit/mysql_class/frozengtidset_union.py
+/usr/bin/python ./test/unit/mysql_class/frozengtidset_or.py
+/usr/bin/python ./test/unit/mysql_class/frozengtidset_sub.py
+/usr/bin/python ./test/unit/mysql_class/frozengtidset_and.py
+/usr/bin/python ./test/unit/mysql_class/connectionpool_get.py
+/usr/bin/python ./test/unit/mysql_class/connectionpool_release.py
+/usr/bin/python ./test/unit/mysql_class/connectionpool_close.py
+/usr/bin/python ./test/unit/mysql_class/dbapidriver_connect.py
+/usr/bin/python ./test/unit/mysql_class/dbapiconn_cmdquery.py
+/usr/bin/python ./test/unit/mysql_class/dbapiconn_cursor.py
+/usr/bin/python ./test/unit/mysql_class/statementcache_cursor.py
+/usr/bin/python ./test/unit/mysql_class/statementcache_checked.py
+/usr/bin/python ./test/unit/mysql_class/statementcache_execute.py
+/usr/bin/python ./test/unit/mysql_class/rawheader_decoder.py
+/usr/bin/python ./test/unit/mysql_class/rawrow_getitem.py
+/usr/bin/python ./test/unit/mysql_class/serversnapshot_init.py
+/usr/bin/python ./test/unit/mysql_class/serversnapshot_collect.py
+/usr/bin/python ./test/unit/mysql_class/serversnapshot_srvstat.py
+/usr/bin/python ./test/unit/mysql_class/serversnapshot_srvperf.py
+/usr/bin/python ./test/unit/mysql_class/statussampler_add.py
+/usr/bin/python ./test/unit/mysql_class/statussampler_delta.py
+/usr/bin/python ./test/unit/mysql_class/statussampler_rate.py
+/usr/bin/python ./test/unit/mysql_class/statussampler_pct.py
+/usr/bin/python ./test/unit/mysql_class/statuspoller_init.py
+/usr/bin/python ./test/unit/mysql_class/statuspoller_poll.py
+/usr/bin/python ./test/unit/mysql_class/statuspoller_start.py
+/usr/bin/python ./test/unit/mysql_class/statuspoller_staleness.py
 /usr/bin/python ./test/unit/mysql_class/masterrep_connect.py
 /usr/bin/python ./test/unit/mysql_class/masterrep_init.py
 /usr/bin/python ./test/unit/mysql_class/masterrep_showslvhosts.py
 /usr/bin/python ./test/unit/mysql_class/masterrep_getloginfo.py
+/usr/bin/python ./test/unit/mysql_class/masterrep_getlogsizes.py
+/usr/bin/python ./test/unit/mysql_class/masterrep_exegtidset.py
 /usr/bin/python ./test/unit/mysql_class/masterrep_updmststatus.py
+/usr/bin/python ./test/unit/mysql_class/masterrep_refresh.py
 /usr/bin/python ./test/unit/mysql_class/position_cmp.py
+/usr/bin/python ./test/unit/mysql_class/position_distance.py
 /usr/bin/python ./test/unit/mysql_class/rep_fetchdodb.py
 /usr/bin/python ./test/unit/mysql_class/rep_fetchigndb.py
 /usr/bin/python ./test/unit/mysql_class/rep_getservid.py
@@ -41,6 +99,11 @@ echo "Unit test: mysql_class"
 /usr/bin/python ./test/unit/mysql_class/rep_verify_srv_id.py
 /usr/bin/python ./test/unit/mysql_class/server_chg_db.py
 /usr/bin/python ./test/unit/mysql_class/server_connect.py
+/usr/bin/python ./test/unit/mysql_class/server_pooled.py
+/usr/bin/python ./test/unit/mysql_class/server_checkout.py
+/usr/bin/python ./test/unit/mysql_class/server_threadconn.py
+/usr/bin/python ./test/unit/mysql_class/server_stream.py
+/usr/bin/python ./test/unit/mysql_class/server_sql.py
 /usr/bin/python ./test/unit/mysql_class/server_disconnect.py
 /usr/bin/python ./test/unit/mysql_class/server_fetchlogs.py
 /usr/bin/python ./test/unit/mysql_class/server_fetchmstrepcfg.py
@@ -61,7 +124,18 @@ echo "Unit test: mysql_class"
 /usr/bin/python ./test/unit/mysql_class/server_updsrvperf.py
 /usr/bin/python ./test/unit/mysql_class/server_updslvrepstat.py
 /usr/bin/python ./test/unit/mysql_class/server_updsrvstat.py
+/usr/bin/python ./test/unit/mysql_class/server_updsnapshot.py
+/usr/bin/python ./test/unit/mysql_class/server_setsnapshot.py
+/usr/bin/python ./test/unit/mysql_class/server_syncsnapshot.py
+/usr/bin/python ./test/unit/mysql_class/server_sampled.py
+/usr/bin/python ./test/unit/mysql_class/server_polled.py
+/usr/bin/python ./test/unit/mysql_class/server_prepared.py
+/usr/bin/python ./test/unit/mysql_class/server_cachedsysvar.py
 /usr/bin/python ./test/unit/mysql_class/server_vertsql.py
+/usr/bin/python ./test/unit/mysql_class/server_multicolsql.py
+/usr/bin/python ./test/unit/mysql_class/server_batchsql.py
+/usr/bin/python ./test/unit/mysql_class/server_driver.py
+/usr/bin/python ./test/unit/mysql_class/server_colsql.py
 /usr/bin/python ./test/unit/mysql_class/slaverep_connect.py
 /usr/bin/python ./test/unit/mysql_class/slaverep_init.py
 /usr/bin/python ./test/unit/mysql_class/slaverep_fetchdotbl.py
@@ -81,4 +155,5 @@ echo "Unit test: mysql_class"
 /usr/bin/python ./test/unit/mysql_class/slaverep_updslvstate.py
 /usr/bin/python ./test/unit/mysql_class/slaverep_updslvtime.py
 /usr/bin/python ./test/unit/mysql_class/slaverep_updgtidpos.py
+/usr/bin/python ./test/unit/mysql_class/slaverep_refresh.py
 
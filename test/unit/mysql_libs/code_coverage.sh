@@ -18,19 +18,24 @@ coverage run -a --source=mysql_libs test/unit/mysql_libs/chg_slv_state.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/create_instance.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/disconnect.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/fetch_db_dict.py
+coverage run -a --source=mysql_libs test/unit/mysql_libs/fetch_exe_gtidset.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/fetch_logs.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/fetch_tbl_dict.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/get_all_dbs_tbls.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/get_db_tbl.py
+coverage run -a --source=mysql_libs test/unit/mysql_libs/gtid_inject_stmts.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/optimize_tbl.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/purge_bin_logs.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/reset_master.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/reset_slave.py
+coverage run -a --source=mysql_libs test/unit/mysql_libs/rep_lag_bytes.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/select_wait_until.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/create_slv_array.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/crt_cmd.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/fetch_slv.py
+coverage run -a --source=mysql_libs test/unit/mysql_libs/fleet_rep_chk.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/find_name.py
+coverage run -a --source=mysql_libs test/unit/mysql_libs/find_errant_trx.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/is_cfg_valid.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/is_logs_synced.py
 coverage run -a --source=mysql_libs test/unit/mysql_libs/is_rep_delay.py
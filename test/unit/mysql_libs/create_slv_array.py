@@ -16,6 +16,8 @@
 # Standard
 import sys
 import os
+import threading
+import time
 import unittest
 import mock
 
@@ -107,6 +109,60 @@ class SlaveRep():                           # pylint:disable=R0903
         return True
 
 
+class SlaveRep3():                          # pylint:disable=R0903
+
+    """Class:  SlaveRep3
+
+    Description:  Class stub holder for mysql_class.SlaveRep class which
+        takes time to connect and tracks the concurrent connects.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, name, delay, is_up=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.delay = delay
+        self.is_up = is_up
+        self.conn = None
+        self.config = {}
+
+    def connect(self, silent):
+
+        """Method:  upd_slv_status
+
+        Description:  Stub holder for mysql_class.SlaveRep.connect method.
+
+        Arguments:
+
+        """
+
+        with SlaveRep3.lock:
+            SlaveRep3.active += 1
+            SlaveRep3.peak = max(SlaveRep3.peak, SlaveRep3.active)
+
+        time.sleep(self.delay)
+        self.conn = self.is_up and not silent
+
+        with SlaveRep3.lock:
+            SlaveRep3.active -= 1
+
+
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -115,6 +171,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_concurrent_order
+        test_concurrent_add_down
+        test_max_workers
+        test_connect_timeout
+        test_lazy_option
         test_silent_option
         test_ssl_flag2
         test_ssl_flag
@@ -144,6 +205,10 @@ class UnitTest(unittest.TestCase):
 
         self.slave = SlaveRep()
         self.slave2 = SlaveRep2()
+        SlaveRep3.peak = 0
+        self.slaves3 = [SlaveRep3("name1", 0.05), SlaveRep3("name2", 0.01),
+                        SlaveRep3("name3", 0.03, is_up=False),
+                        SlaveRep3("name4", 0.02)]
         self.cfg_array = {
             "name": "name", "sid": "sid", "user": "user", "japd": None,
             "serv_os": "Linux", "host": "hostname", "port": 3306,
@@ -213,6 +278,93 @@ class UnitTest(unittest.TestCase):
              "ssl_disabled": False, "ssl_verify_id": False,
              "ssl_verify_cert": False}]
 
+    @mock.patch("mysql_libs.mysql_class.SlaveRep")
+    def test_concurrent_order(self, mock_rep):
+
+        """Function:  test_concurrent_order
+
+        Description:  Test concurrent connects keep the configuration order.
+
+        Arguments:
+
+        """
+
+        mock_rep.side_effect = self.slaves3
+        slaves = mysql_libs.create_slv_array(
+            self.cfg_array2 * 2, max_workers=4)
+
+        self.assertEqual([slv.name for slv in slaves],
+                         ["name1", "name2", "name3", "name4"])
+
+    @mock.patch("mysql_libs.mysql_class.SlaveRep")
+    def test_concurrent_add_down(self, mock_rep):
+
+        """Function:  test_concurrent_add_down
+
+        Description:  Test concurrent connects do not add down slaves.
+
+        Arguments:
+
+        """
+
+        mock_rep.side_effect = self.slaves3
+        slaves = mysql_libs.create_slv_array(
+            self.cfg_array2 * 2, add_down=False, max_workers=4)
+
+        self.assertEqual([slv.name for slv in slaves],
+                         ["name1", "name2", "name4"])
+
+    @mock.patch("mysql_libs.mysql_class.SlaveRep")
+    def test_max_workers(self, mock_rep):
+
+        """Function:  test_max_workers
+
+        Description:  Test the number of concurrent connects is bounded.
+
+        Arguments:
+
+        """
+
+        mock_rep.side_effect = self.slaves3
+        mysql_libs.create_slv_array(self.cfg_array2 * 2, max_workers=2)
+
+        self.assertEqual(SlaveRep3.peak, 2)
+
+    @mock.patch("mysql_libs.mysql_class.SlaveRep")
+    def test_connect_timeout(self, mock_rep):
+
+        """Function:  test_connect_timeout
+
+        Description:  Test the connect timeout is passed to the connection.
+
+        Arguments:
+
+        """
+
+        mock_rep.side_effect = self.slaves3
+        slaves = mysql_libs.create_slv_array(
+            self.cfg_array2, connect_timeout=5)
+
+        self.assertEqual([slv.config for slv in slaves],
+                         [{"connection_timeout": 5}] * 2)
+
+    @mock.patch("mysql_libs.mysql_class.SlaveRep")
+    def test_lazy_option(self, mock_rep):
+
+        """Function:  test_lazy_option
+
+        Description:  Test with the lazy option passed to the connect.
+
+        Arguments:
+
+        """
+
+        mock_rep.return_value.conn = True
+        mysql_libs.create_slv_array([self.cfg_array], lazy=True)
+
+        mock_rep.return_value.connect.assert_called_once_with(
+            silent=False, lazy=True)
+
     @mock.patch("mysql_libs.mysql_class.SlaveRep")
     def test_silent_option(self, mock_rep):
 
@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  fetch_exe_gtidset.py
+
+    Description:  Unit testing of fetch_exe_gtidset in mysql_libs.py.
+
+    Usage:
+        test/unit/mysql_libs/fetch_exe_gtidset.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_libs                           # pylint:disable=E0401,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gtid
+        test_empty
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "ServerInstance"
+
+    @mock.patch("mysql_libs.mysql_class.fetch_sys_var")
+    def test_gtid(self, mock_var):
+
+        """Function:  test_gtid
+
+        Description:  Test with an executed GTID set.
+
+        Arguments:
+
+        """
+
+        mock_var.return_value = {"gtid_executed": "35588520:1-5,\n76012896:1"}
+
+        self.assertEqual(
+            (str(mysql_libs.fetch_exe_gtidset(self.server)),
+             mock_var.call_args),
+            ("35588520:1-5,76012896:1-1",
+             mock.call(self.server, "gtid_executed", level="global")))
+
+    @mock.patch("mysql_libs.mysql_class.fetch_sys_var")
+    def test_empty(self, mock_var):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty executed GTID set.
+
+        Arguments:
+
+        """
+
+        mock_var.return_value = {"gtid_executed": ""}
+
+        self.assertEqual(mysql_libs.fetch_exe_gtidset(self.server).count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
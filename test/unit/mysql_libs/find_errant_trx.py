@@ -0,0 +1,193 @@
+# Classification (U)
+
+"""Program:  find_errant_trx.py
+
+    Description:  Unit testing of find_errant_trx in mysql_libs.py.
+
+    Usage:
+        test/unit/mysql_libs/find_errant_trx.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_libs                           # pylint:disable=E0401,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                             # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtid):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.exe_gtid = exe_gtid
+
+
+def fetch_exe_gtidset(server):
+
+    """Function:  fetch_exe_gtidset
+
+    Description:  Stub holder for mysql_libs.fetch_exe_gtidset function.
+
+    Arguments:
+
+    """
+
+    return mysql_class.FrozenGTIDSet(server.exe_gtid)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_errant
+        test_errant
+        test_inject
+        test_no_slaves
+        test_max_workers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "35588520-333d-11e8-a55d-005056a1b2c3"
+        self.mst = Server("master", "35588520:1-100")
+        self.slaves = [Server("slave1", "35588520:1-90"),
+                       Server("slave2",
+                              "35588520:1-100," + self.uuid + ":1-2"),
+                       Server("slave3", "35588520:1-101")]
+
+    @mock.patch("mysql_libs.fetch_exe_gtidset",
+                mock.Mock(side_effect=fetch_exe_gtidset))
+    def test_no_errant(self):
+
+        """Function:  test_no_errant
+
+        Description:  Test with no errant transactions.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_libs.find_errant_trx(self.mst, self.slaves[:1]), [])
+
+    @mock.patch("mysql_libs.fetch_exe_gtidset",
+                mock.Mock(side_effect=fetch_exe_gtidset))
+    def test_errant(self):
+
+        """Function:  test_errant
+
+        Description:  Test with errant transactions.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_libs.find_errant_trx(self.mst, self.slaves),
+            [{"Name": "slave2", "Errant": self.uuid + ":1-2",
+              "Gtids": {self.uuid: [(1, 2)]}, "Count": 2},
+             {"Name": "slave3", "Errant": "35588520:101-101",
+              "Gtids": {"35588520": [(101, 101)]}, "Count": 1}])
+
+    @mock.patch("mysql_libs.fetch_exe_gtidset",
+                mock.Mock(side_effect=fetch_exe_gtidset))
+    def test_inject(self):
+
+        """Function:  test_inject
+
+        Description:  Test with the injection statements.
+
+        Arguments:
+
+        """
+
+        data = mysql_libs.find_errant_trx(
+            self.mst, self.slaves[2:], inject=True, max_workers=1)
+
+        self.assertEqual(data[0]["Statements"],
+                         ["SET GTID_NEXT='35588520:101'", "BEGIN", "COMMIT",
+                          "SET GTID_NEXT='AUTOMATIC'"])
+
+    @mock.patch("mysql_libs.fetch_exe_gtidset",
+                mock.Mock(side_effect=fetch_exe_gtidset))
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_libs.find_errant_trx(self.mst, []), [])
+
+    @mock.patch("mysql_libs.concurrent.futures.ThreadPoolExecutor",
+                wraps=mysql_libs.concurrent.futures.ThreadPoolExecutor)
+    @mock.patch("mysql_libs.fetch_exe_gtidset",
+                mock.Mock(side_effect=fetch_exe_gtidset))
+    def test_max_workers(self, mock_pool):
+
+        """Function:  test_max_workers
+
+        Description:  Test the fetches run concurrently with max_workers,
+            capped at the number of servers.
+
+        Arguments:
+
+        """
+
+        data = mysql_libs.find_errant_trx(
+            self.mst, self.slaves, max_workers=50)
+
+        mock_pool.assert_called_once_with(max_workers=4)
+        self.assertEqual([item["Name"] for item in data],
+                         ["slave2", "slave3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  fleet_rep_chk.py
+
+    Description:  Unit testing of fleet_rep_chk in mysql_libs.py.
+
+    Usage:
+        test/unit/mysql_libs/fleet_rep_chk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_libs                           # pylint:disable=E0401,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                          # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, exe_gtid):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.exe_gtidset = mysql_class.GTIDSet(exe_gtid)
+
+
+class SlaveRep():                           # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, ret_gtid, exe_gtid):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.retrieved_gtid = ret_gtid
+        self.exe_gtid = exe_gtid
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sql
+        test_io
+        test_results
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mst = MasterRep("35588520:1-100")
+        self.slaves = [SlaveRep("35588520:1-100", "35588520:1-90"),
+                      SlaveRep(None, None)]
+
+    @mock.patch("mysql_libs.mysql_class.compare_fleet")
+    def test_sql(self, mock_cmp):
+
+        """Function:  test_sql
+
+        Description:  Test with SQL thread check.
+
+        Arguments:
+
+        """
+
+        mysql_libs.fleet_rep_chk(self.mst, self.slaves)
+        args = mock_cmp.call_args[0]
+
+        self.assertEqual((args[0], [str(gtid) for gtid in args[1]]),
+                         (self.mst.exe_gtidset, ["35588520:1-90", ""]))
+
+    @mock.patch("mysql_libs.mysql_class.compare_fleet")
+    def test_io(self, mock_cmp):
+
+        """Function:  test_io
+
+        Description:  Test with IO thread check.
+
+        Arguments:
+
+        """
+
+        mysql_libs.fleet_rep_chk(self.mst, self.slaves, opt="IO")
+        args = mock_cmp.call_args[0]
+
+        self.assertEqual([str(gtid) for gtid in args[1]],
+                         ["35588520:1-100", ""])
+
+    @unittest.skipIf(mysql_class.numpy is None, "numpy not installed")
+    def test_results(self):
+
+        """Function:  test_results
+
+        Description:  Test the results of the check.
+
+        Arguments:
+
+        """
+
+        data = mysql_libs.fleet_rep_chk(self.mst, self.slaves)
+
+        self.assertEqual((data.equal.tolist(), data.missing.tolist()),
+                         ([False, False], [10, 100]))
+
+
+if __name__ == "__main__":
+    unittest.main()
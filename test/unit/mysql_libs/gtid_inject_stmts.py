@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  gtid_inject_stmts.py
+
+    Description:  Unit testing of gtid_inject_stmts in mysql_libs.py.
+
+    Usage:
+        test/unit/mysql_libs/gtid_inject_stmts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_libs                           # pylint:disable=E0401,C0413
+import mysql_class                          # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_inject
+        test_empty
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtidset = mysql_class.GTIDSet("76012896:5,35588520:1-2")
+
+    def test_inject(self):
+
+        """Function:  test_inject
+
+        Description:  Test the statements for a GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_libs.gtid_inject_stmts(self.gtidset)),
+            ["SET GTID_NEXT='35588520:1'", "BEGIN", "COMMIT",
+             "SET GTID_NEXT='35588520:2'", "BEGIN", "COMMIT",
+             "SET GTID_NEXT='76012896:5'", "BEGIN", "COMMIT",
+             "SET GTID_NEXT='AUTOMATIC'"])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_libs.gtid_inject_stmts(mysql_class.GTIDSet(""))),
+            ["SET GTID_NEXT='AUTOMATIC'"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+# Classification (U)
+
+"""Program:  rep_lag_bytes.py
+
+    Description:  Unit testing of rep_lag_bytes in mysql_libs.py.
+
+    Usage:
+        test/unit/mysql_libs/rep_lag_bytes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_libs                           # pylint:disable=E0401,C0413
+import version                              # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                          # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        get_log_sizes
+
+    """
+
+    def __init__(self, filename, pos):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.file = filename
+        self.pos = pos
+        self.log_sizes = {"mysql-bin.000001": 1000}
+        self.refreshed = False
+
+    def get_log_sizes(self, refresh=False):
+
+        """Method:  get_log_sizes
+
+        Description:  Stub holder for MasterRep.get_log_sizes method.
+
+        Arguments:
+
+        """
+
+        if refresh:
+            self.refreshed = True
+            self.log_sizes = {"mysql-bin.000001": 1000,
+                              "mysql-bin.000002": 2000,
+                              "mysql-bin.000003": 3000}
+
+        return self.log_sizes
+
+
+class SlaveRep():                           # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, mst_log, mst_read_pos, relay_mst_log, exec_mst_pos):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.mst_log = mst_log
+        self.mst_read_pos = mst_read_pos
+        self.relay_mst_log = relay_mst_log
+        self.exec_mst_pos = exec_mst_pos
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sql
+        test_io
+        test_refresh
+        test_caught_up
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mst = MasterRep("mysql-bin.000002", 500)
+        self.slv = SlaveRep("mysql-bin.000002", 400, "mysql-bin.000001", 600)
+
+    def test_sql(self):
+
+        """Function:  test_sql
+
+        Description:  Test with SQL thread check.
+
+        Arguments:
+
+        """
+
+        self.mst.log_sizes["mysql-bin.000002"] = 2000
+
+        self.assertEqual(
+            (mysql_libs.rep_lag_bytes(self.mst, self.slv), self.mst.refreshed),
+            (900, False))
+
+    def test_io(self):
+
+        """Function:  test_io
+
+        Description:  Test with IO thread check.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_libs.rep_lag_bytes(self.mst, self.slv, opt="IO"), 100)
+
+    def test_refresh(self):
+
+        """Function:  test_refresh
+
+        Description:  Test the sizes are refreshed after the logs rotated.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_libs.rep_lag_bytes(self.mst, self.slv), self.mst.refreshed),
+            (900, True))
+
+    def test_caught_up(self):
+
+        """Function:  test_caught_up
+
+        Description:  Test with the slave at the master's position.
+
+        Arguments:
+
+        """
+
+        slv = SlaveRep("mysql-bin.000002", 500, "mysql-bin.000002", 500)
+
+        self.assertEqual(mysql_libs.rep_lag_bytes(self.mst, slv), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
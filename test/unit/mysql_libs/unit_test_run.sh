@@ -15,19 +15,24 @@ echo "Unit test: mysql_libs"
 /usr/bin/python ./test/unit/mysql_libs/create_instance.py
 /usr/bin/python ./test/unit/mysql_libs/disconnect.py
 /usr/bin/python ./test/unit/mysql_libs/fetch_db_dict.py
+/usr/bin/python ./test/unit/mysql_libs/fetch_exe_gtidset.py
 /usr/bin/python ./test/unit/mysql_libs/fetch_logs.py
 /usr/bin/python ./test/unit/mysql_libs/fetch_tbl_dict.py
 /usr/bin/python ./test/unit/mysql_libs/get_all_dbs_tbls.py
 /usr/bin/python ./test/unit/mysql_libs/get_db_tbl.py
+/usr/bin/python ./test/unit/mysql_libs/gtid_inject_stmts.py
 /usr/bin/python ./test/unit/mysql_libs/optimize_tbl.py
 /usr/bin/python ./test/unit/mysql_libs/purge_bin_logs.py
 /usr/bin/python ./test/unit/mysql_libs/reset_master.py
 /usr/bin/python ./test/unit/mysql_libs/reset_slave.py
+/usr/bin/python ./test/unit/mysql_libs/rep_lag_bytes.py
 /usr/bin/python ./test/unit/mysql_libs/select_wait_until.py
 /usr/bin/python ./test/unit/mysql_libs/create_slv_array.py
 /usr/bin/python ./test/unit/mysql_libs/crt_cmd.py
 /usr/bin/python ./test/unit/mysql_libs/fetch_slv.py
+/usr/bin/python ./test/unit/mysql_libs/fleet_rep_chk.py
 /usr/bin/python ./test/unit/mysql_libs/find_name.py
+/usr/bin/python ./test/unit/mysql_libs/find_errant_trx.py
 /usr/bin/python ./test/unit/mysql_libs/is_cfg_valid.py
 /usr/bin/python ./test/unit/mysql_libs/is_logs_synced.py
 /usr/bin/python ./test/unit/mysql_libs/is_rep_delay.py
@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "5.5.0"
+__version__ = "5.6.0"